@@ -5,9 +5,13 @@ This module handles loading and validation of YAML/JSON recipe files,
 with friendly error reporting and structure validation.
 """
 
+import os
 import json
 import yaml
+import pickle
+import hashlib
 import logging
+import tempfile
 import re
 
 from pathlib import Path
@@ -20,6 +24,8 @@ from excel_recipe_processor.core.base_processor import (
 )
 from excel_recipe_processor.core.pipeline import registry
 from excel_recipe_processor.core.interactive_variables import validate_external_variable_config
+from excel_recipe_processor.utils.introspection_cache import get_cached, get_cache_directory
+from excel_recipe_processor._version import __version__
 
 
 logger = logging.getLogger(__name__)
@@ -27,17 +33,26 @@ logger = logging.getLogger(__name__)
 step_desc = 'step_description'
 proc_type = 'processor_type'
 
+# Set to 1 to keep a compiled copy of each validated recipe in the per-user cache directory
+RECIPE_CACHE_ENV_VAR = 'EXCEL_RECIPE_PROCESSOR_RECIPE_CACHE'
+
+# Use the libyaml parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as BaseYAMLLoader
+except ImportError:
+    from yaml import SafeLoader as BaseYAMLLoader
+
 class RecipeValidationError(Exception):
     """Raised when a recipe file has invalid structure or content."""
     pass
 
 
-class OrderedYAMLLoader(yaml.SafeLoader):
+class OrderedYAMLLoader(BaseYAMLLoader):
     """Custom YAML loader that preserves section order for validation."""
     pass
 
 
-def construct_mapping(loader: yaml.SafeLoader, node):
+def construct_mapping(loader: BaseYAMLLoader, node):
     """Preserve order of sections in YAML."""
     loader.flatten_mapping(node)
     return OrderedDict(loader.construct_pairs(node))
@@ -54,11 +69,22 @@ class RecipeLoader:
     and structure validation.
     """
     
-    def __init__(self):
-        """Initialize the recipe loader."""
+    def __init__(self, use_compiled_cache: bool = None):
+        """
+        Initialize the recipe loader.
+        
+        Args:
+            use_compiled_cache: Reuse a parsed and validated copy of each recipe stored in
+                                the per-user cache directory (defaults to the
+                                EXCEL_RECIPE_PROCESSOR_RECIPE_CACHE environment variable)
+        """
         self.recipe_data = None
         self.recipe_path = None
         self._original_section_order = []
+        
+        if use_compiled_cache is None:
+            use_compiled_cache = os.environ.get(RECIPE_CACHE_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes')
+        self.use_compiled_cache = use_compiled_cache
     
     def load_recipe_file(self, recipe_path) -> dict:  # ✅ RENAMED from load_file
         """
@@ -86,20 +112,30 @@ class RecipeLoader:
         
         # Load based on file extension
         try:
-            with open(self.recipe_path, 'r', encoding='utf-8') as f:
-                if self.recipe_path.suffix.lower() in ['.yaml', '.yml']:
-                    # Use custom loader to preserve section order
-                    self.recipe_data = yaml.load(f, Loader=OrderedYAMLLoader)
-                    # Extract original section order
-                    if isinstance(self.recipe_data, OrderedDict):
-                        self._original_section_order = list(self.recipe_data.keys())
-                elif self.recipe_path.suffix.lower() == '.json':
-                    self.recipe_data = json.load(f)
-                else:
-                    raise RecipeValidationError(
-                        f"Unsupported file format: {self.recipe_path.suffix}. "
-                        f"Supported formats: .yaml, .yml, .json"
-                    )
+            with open(self.recipe_path, 'rb') as f:
+                recipe_bytes = f.read()
+            
+            cache_key = None
+            if self.use_compiled_cache:
+                cache_key = self._compiled_cache_key(recipe_bytes)
+                if self._load_compiled_recipe(cache_key):
+                    return self.recipe_data
+            
+            recipe_text = recipe_bytes.decode('utf-8')
+            
+            if self.recipe_path.suffix.lower() in ['.yaml', '.yml']:
+                # Use custom loader to preserve section order
+                self.recipe_data = yaml.load(recipe_text, Loader=OrderedYAMLLoader)
+                # Extract original section order
+                if isinstance(self.recipe_data, OrderedDict):
+                    self._original_section_order = list(self.recipe_data.keys())
+            elif self.recipe_path.suffix.lower() == '.json':
+                self.recipe_data = json.loads(recipe_text)
+            else:
+                raise RecipeValidationError(
+                    f"Unsupported file format: {self.recipe_path.suffix}. "
+                    f"Supported formats: .yaml, .yml, .json"
+                )
                     
         except yaml.YAMLError as e:
             raise RecipeValidationError(f"YAML syntax error in {self.recipe_path}: {e}")
@@ -128,8 +164,107 @@ class RecipeLoader:
         # Validate external variables if present
         self._validate_external_variables()
         
+        if cache_key is not None:
+            self._save_compiled_recipe(cache_key, validation_result.get('warnings', []))
+        
         logger.info(f"Successfully loaded recipe: {self.summary()}")
         return self.recipe_data
+    
+    def get_compiled_cache_path(self, recipe_path=None):
+        """
+        Get the path of a recipe's compiled copy.
+        
+        Compiled copies are pickled, so they live in the per-user cache
+        directory (never next to a possibly shared recipe file), named by a
+        hash of the recipe's absolute path.
+        
+        Args:
+            recipe_path: Recipe file path (defaults to the last loaded recipe)
+            
+        Returns:
+            Path like '~/.cache/excel_recipe_processor/recipes/<hash>.pickle',
+            or None when disk caches are turned off
+        """
+        cache_dir = get_cache_directory()
+        if cache_dir is None:
+            return None
+        
+        recipe_path = Path(recipe_path) if recipe_path else self.recipe_path
+        path_hash = hashlib.sha256(str(recipe_path.resolve()).encode()).hexdigest()
+        return cache_dir / 'recipes' / f'{path_hash}.pickle'
+    
+    def _compiled_cache_key(self, recipe_bytes: bytes) -> str:
+        """Key a compiled recipe on its content, the package version and the registered step types."""
+        digest = hashlib.sha256(recipe_bytes)
+        digest.update(__version__.encode())
+        digest.update(self.recipe_path.suffix.lower().encode())
+        digest.update('\0'.join(registry.get_registered_types()).encode())
+        return digest.hexdigest()
+    
+    def _load_compiled_recipe(self, cache_key: str) -> bool:
+        """
+        Restore the recipe from its compiled copy if the copy matches the key.
+        
+        Returns:
+            True if the recipe was restored, False to parse and validate normally
+        """
+        cache_path = self.get_compiled_cache_path()
+        if cache_path is None or not cache_path.exists():
+            return False
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                compiled = pickle.load(f)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable compiled recipe {cache_path}: {e}")
+            return False
+        
+        if not isinstance(compiled, dict) or compiled.get('cache_key') != cache_key:
+            return False
+        
+        self.recipe_data = compiled['recipe_data']
+        self._original_section_order = compiled['section_order']
+        
+        # Replay the non-fatal findings of the original validation
+        for warning in compiled['warnings']:
+            logger.warning(f"⚠️  {warning}")
+        self._validate_external_variables()
+        
+        logger.info(f"Loaded compiled recipe from: {cache_path}")
+        logger.info(f"Successfully loaded recipe: {self.summary()}")
+        return True
+    
+    def _save_compiled_recipe(self, cache_key: str, warnings: list) -> None:
+        """
+        Store the validated recipe in the per-user cache directory; failures are only logged.
+        
+        The copy is pickled, so it must never be written next to the recipe: anyone
+        who can write to a shared recipe folder could then run code in this process.
+        """
+        cache_path = self.get_compiled_cache_path()
+        if cache_path is None:
+            return
+        
+        compiled = {
+            'cache_key': cache_key,
+            'recipe_data': self.recipe_data,
+            'section_order': self._original_section_order,
+            'warnings': warnings,
+        }
+        
+        try:
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            temp_fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(temp_fd, 'wb') as f:
+                    pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, cache_path)
+            except Exception:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+        except Exception as e:
+            logger.debug(f"Could not write compiled recipe {cache_path}: {e}")
 
     # # Optional: Keep old method for backward compatibility (with deprecation warning)
     # def load_file(self, recipe_path) -> dict:
@@ -335,22 +470,26 @@ class RecipeLoader:
         errors = []
         warnings = []
         
-        # Get the processor class without instantiating
-        processor_class = registry.get_processor_class(processor_type)
+        # Kind comes from the introspection cache, so the processor module is
+        # only imported the first time a step type is seen
+        processor_kind = get_cached(
+            f'processor_kind:{processor_type}',
+            lambda: self._get_processor_kind(processor_type)
+        )
         
-        if issubclass(processor_class, ImportBaseProcessor):
+        if processor_kind == 'import':
             # Import processors only need save_to_stage
             if 'save_to_stage' not in step:
                 errors.append(f"Step '{step_name}': missing required field 'save_to_stage'")
                 errors.append("💡 Import steps must specify where to save imported data")
         
-        elif issubclass(processor_class, ExportBaseProcessor):
+        elif processor_kind == 'export':
             # Export processors only need source_stage
             if 'source_stage' not in step:
                 errors.append(f"Step '{step_name}': missing required field 'source_stage'")
                 errors.append("💡 Export steps must specify which stage to export from")
         
-        elif issubclass(processor_class, FileOpsBaseProcessor):
+        elif processor_kind == 'file_ops':
             # File operations handle their own validation in __init__
             # No standard stage requirements
             pass
@@ -367,6 +506,19 @@ class RecipeLoader:
 
         return {'errors': errors, 'warnings': warnings}
 
+    def _get_processor_kind(self, processor_type: str) -> str:
+        """Classify a processor as 'import', 'export', 'file_ops' or 'processing' by its base class."""
+        # Get the processor class without instantiating
+        processor_class = registry.get_processor_class(processor_type)
+        
+        if issubclass(processor_class, ImportBaseProcessor):
+            return 'import'
+        if issubclass(processor_class, ExportBaseProcessor):
+            return 'export'
+        if issubclass(processor_class, FileOpsBaseProcessor):
+            return 'file_ops'
+        return 'processing'
+
     def load_string(self, recipe_string: str, format_type: str = 'yaml') -> dict:
         """
         Load a recipe from a string.
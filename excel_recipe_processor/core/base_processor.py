@@ -6,6 +6,7 @@ Defines the interface and common functionality that all step processors must imp
 
 import pandas as pd
 import logging
+import importlib
 
 from abc import ABC, abstractmethod
 from typing import Any
@@ -29,6 +30,10 @@ class BaseStepProcessor(ABC):
     and implement the execute method.
     """
     
+    # Processors that only select, reorder or relabel columns (and never write
+    # into column values) set this so stage-to-stage runs skip the data copies
+    shares_column_data = False
+    
     def __init__(self, step_config: dict):
         """
         Initialize the step processor.
@@ -180,7 +185,7 @@ class BaseStepProcessor(ABC):
             raise StepProcessorError(f"Step '{self.step_name}' requires source_stage")
         
         from excel_recipe_processor.core.stage_manager import StageManager
-        return StageManager.load_stage(self.source_stage)
+        return StageManager.load_stage(self.source_stage, share_data=self.shares_column_data)
     
     def save_output_data(self, data) -> None:
         """Save output data to save_to_stage."""
@@ -193,7 +198,8 @@ class BaseStepProcessor(ABC):
             data=data,
             description=f"Result from '{self.step_name}'",
             step_name=self.step_name,
-            confirm_replacement=self.confirm_stage_replacement
+            confirm_replacement=self.confirm_stage_replacement,
+            share_data=self.shares_column_data
         )
     
     def execute_stage_to_stage(self) -> pd.DataFrame:
@@ -229,11 +235,17 @@ class StepProcessorRegistry:
     
     This allows the system to dynamically create the correct processor
     for each step type defined in a recipe.
+    
+    Processors can also be registered lazily by module path, so a processor
+    module (and whatever heavy libraries it imports) is only loaded the first
+    time its step type is used.
     """
     
     def __init__(self):
         """Initialize the registry."""
         self._processors = {}
+        self._lazy_processors = {}      # step_type -> (module_path, class_name)
+        self._step_types = {}           # Registration order of all step types (dict as ordered set)
     
     def register(self, step_type: str, processor_class: type) -> None:
         """
@@ -259,8 +271,56 @@ class StepProcessorRegistry:
             )
         
         self._processors[step_type] = processor_class
+        self._lazy_processors.pop(step_type, None)
+        self._step_types[step_type] = None
         logger.debug(f"Registered processor for step type: {step_type}")
     
+    def register_lazy(self, step_type: str, module_path: str, class_name: str) -> None:
+        """
+        Register a processor class by import path without importing it yet.
+        
+        Args:
+            step_type: String identifier for the step type
+            module_path: Dotted path of the module defining the processor
+            class_name: Name of the processor class in that module
+            
+        Raises:
+            StepProcessorError: If registration is invalid
+        """
+        # Guard clauses
+        if not isinstance(step_type, str) or not step_type.strip():
+            raise StepProcessorError("Step type must be a non-empty string")
+        
+        if not module_path or not class_name:
+            raise StepProcessorError("Lazy registration needs a module path and a class name")
+        
+        if step_type in self._processors:
+            return
+        
+        self._lazy_processors[step_type] = (module_path, class_name)
+        self._step_types[step_type] = None
+        logger.debug(f"Registered lazy processor for step type: {step_type}")
+    
+    def is_registered(self, step_type: str) -> bool:
+        """Check whether a step type is registered, loaded or not."""
+        return step_type in self._processors or step_type in self._lazy_processors
+    
+    def _load_lazy_processor(self, step_type: str) -> type:
+        """Import a lazily registered processor class and register it for real."""
+        module_path, class_name = self._lazy_processors[step_type]
+        
+        try:
+            module = importlib.import_module(module_path)
+            processor_class = getattr(module, class_name)
+        except (ImportError, AttributeError) as e:
+            raise StepProcessorError(
+                f"Could not load processor for step type '{step_type}' "
+                f"from {module_path}.{class_name}: {e}"
+            )
+        
+        self.register(step_type, processor_class)
+        return processor_class
+    
     def get_processor_class(self, step_type: str) -> type:
         """
         Get the processor class for a step type.
@@ -278,14 +338,17 @@ class StepProcessorRegistry:
         if not isinstance(step_type, str):
             raise StepProcessorError("Step type must be a string")
         
-        if step_type not in self._processors:
-            available_types = list(self._processors.keys())
-            raise StepProcessorError(
-                f"Unknown step type: {step_type}. "
-                f"Available types: {', '.join(available_types) if available_types else 'none'}"
-            )
+        if step_type in self._processors:
+            return self._processors[step_type]
+        
+        if step_type in self._lazy_processors:
+            return self._load_lazy_processor(step_type)
         
-        return self._processors[step_type]
+        available_types = self.get_registered_types()
+        raise StepProcessorError(
+            f"Unknown step type: {step_type}. "
+            f"Available types: {', '.join(available_types) if available_types else 'none'}"
+        )
     
     def create_processor(self, step_config: dict) -> BaseStepProcessor:
         """
@@ -322,7 +385,7 @@ class StepProcessorRegistry:
         Returns:
             List of registered step type strings
         """
-        return list(self._processors.keys())
+        return list(self._step_types)
 
 
 # Global registry instance
@@ -427,8 +490,19 @@ class FileOpsBaseProcessor(BaseStepProcessor):
     meaningful stage data - they just perform file operations as side effects.
     
     Examples: format_excel, convert_file_format, backup_files, create_charts
+    
+    Processors that open workbooks only through load_workbook(), save_workbook()
+    and close_workbook() can set uses_workbook_session = True. The pipeline then
+    hands consecutive steps of that kind one shared WorkbookSession, so a file
+    is parsed once and saved once for the whole run of steps.
     """
     
+    # True when every workbook access goes through the session-aware helpers below
+    uses_workbook_session = False
+    
+    # Set by the pipeline while a shared workbook session is active
+    workbook_session = None
+    
     def __init__(self, step_config: dict):
         super().__init__(step_config)
         
@@ -520,6 +594,59 @@ class FileOpsBaseProcessor(BaseStepProcessor):
         """
         pass
     
+    def load_workbook(self, filename, read_only: bool = False, data_only: bool = False,
+                      shared: bool = True):
+        """
+        Open an Excel workbook, reusing the shared session copy when possible.
+        
+        Editable formula loads come from the active WorkbookSession. Read-only,
+        cached-value and unshared loads always read the file, after any pending
+        session changes for it have been written, so they see what a sequential
+        run would see.
+        
+        Args:
+            filename: Path to the Excel file
+            read_only: Open in openpyxl read-only (streaming) mode
+            data_only: Read cached values instead of formulas
+            shared: Allow the shared session copy (False for steps that must see
+                    exactly what is on disk, such as exports of saved metadata)
+            
+        Returns:
+            openpyxl Workbook
+        """
+        session = self.workbook_session
+        
+        if session is not None and shared and not read_only and not data_only:
+            return session.open(filename)
+        
+        if session is not None:
+            session.flush_path(filename)
+        
+        import openpyxl
+        return openpyxl.load_workbook(filename, read_only=read_only, data_only=data_only)
+    
+    def save_workbook(self, workbook, filename) -> None:
+        """
+        Save a workbook opened with load_workbook().
+        
+        Shared session workbooks are only marked as changed; the session writes
+        them once the run of file-operation steps ends.
+        
+        Args:
+            workbook: Workbook to save
+            filename: Destination file
+        """
+        if self.workbook_session is not None:
+            self.workbook_session.save(workbook, filename)
+        else:
+            workbook.save(filename)
+    
+    def close_workbook(self, workbook) -> None:
+        """Close a workbook opened with load_workbook(), leaving shared session workbooks open."""
+        if self.workbook_session is not None and self.workbook_session.holds(workbook):
+            return
+        workbook.close()
+    
     def get_operation_type(self) -> str:
         """
         Get the type of file operation this processor performs.
@@ -83,6 +83,9 @@ class FileWriter:
             # Determine file format
             file_format = FileWriter._determine_format(filename, explicit_format)
             
+            # Sparse columns (e.g. from sparse pivot tables) are only expanded here
+            data = FileWriter._densify_sparse_columns(data)
+            
             # Delegate to appropriate writer based on logical format
             if file_format in FileWriter.EXCEL_FORMATS:
                 FileWriter._write_excel_file(data, filename, sheet_name, index)
@@ -142,6 +145,10 @@ class FileWriter:
             if create_backup:
                 FileWriter._create_backup_if_exists(filename)
             
+            sheets_data = {
+                sheet_name: FileWriter._densify_sparse_columns(df) for sheet_name, df in sheets_data.items()
+            }
+            
             # Use ExcelWriter for multi-sheet writing
             excel_writer = ExcelWriter()
             excel_writer.write_multiple_sheets(sheets_data, filename)
@@ -291,6 +298,22 @@ class FileWriter:
         if data.empty:
             logger.warning("Writing empty DataFrame")
     
+    @staticmethod
+    def _densify_sparse_columns(data):
+        """Return data with any SparseDtype columns converted to dense columns."""
+        sparse_positions = [
+            position for position, dtype in enumerate(data.dtypes) if isinstance(dtype, pd.SparseDtype)
+        ]
+        if not sparse_positions:
+            return data
+        
+        # Shallow copy so the caller's frame keeps its sparse columns
+        dense_data = data.copy(deep=False)
+        for position in sparse_positions:
+            dense_data.isetitem(position, data.iloc[:, position].sparse.to_dense())
+        
+        return dense_data
+    
     @staticmethod
     def _ensure_directory_exists(filename):
         """Ensure the output directory exists."""
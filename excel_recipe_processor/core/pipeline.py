@@ -17,6 +17,7 @@ from excel_recipe_processor.core.stage_manager import StageManager, StageError
 from excel_recipe_processor.core.base_processor import registry, StepProcessorError
 from excel_recipe_processor.config.recipe_loader import RecipeLoader, RecipeValidationError
 from excel_recipe_processor.core.variable_substitution import VariableSubstitution
+from excel_recipe_processor.utils.introspection_cache import get_cached
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +38,21 @@ class PipelineError(Exception):
 def get_system_capabilities() -> dict:
     """
     Get comprehensive system capabilities including all processors and their features.
+    Served from the introspection cache; rebuilt when processors or examples change.
+    
+    Returns:
+        Dictionary with system overview and detailed processor capabilities
+    """
+    return get_cached(
+        'system_capabilities',
+        _build_system_capabilities,
+        cacheable=lambda capabilities: 'error' not in capabilities['system_info']
+    )
+
+
+def _build_system_capabilities() -> dict:
+    """
+    Build system capabilities by instantiating every registered processor.
     Uses self-reported minimal configs from processors for accurate capability discovery.
     
     Returns:
@@ -57,14 +73,8 @@ def get_system_capabilities() -> dict:
         # Get capabilities for each registered processor using self-reported minimal config
         for processor_type in processor_types:
             try:
-                # Get the processor class from registry
-                processor_class = registry._processors.get(processor_type)
-                
-                if processor_class is None:
-                    capabilities['processors'][processor_type] = {
-                        'error': f'Could not get processor class for {processor_type}'
-                    }
-                    continue
+                # Get the processor class from registry (imports it on first use)
+                processor_class = registry.get_processor_class(processor_type)
                 
                 # Get minimal configuration from the processor class (if it has the method)
                 if hasattr(processor_class, 'get_minimal_config'):
@@ -122,6 +132,15 @@ def get_settings_usage_examples() -> dict:
     Returns:
         Dictionary with settings usage examples or error information
     """
+    return get_cached(
+        'settings_usage_examples',
+        _build_settings_usage_examples,
+        cacheable=lambda examples: examples.get('status') == 'available'
+    )
+
+
+def _build_settings_usage_examples() -> dict:
+    """Load and format the settings usage examples."""
     try:
         # Try to load from external YAML file first
         from excel_recipe_processor.utils.processor_examples_loader import load_settings_examples
@@ -281,6 +300,18 @@ def get_processor_usage_examples(processor_name: str) -> dict:
     Returns:
         Dictionary with usage examples or error information
     """
+    if not registry.is_registered(processor_name):
+        return None
+    
+    return get_cached(
+        f'processor_usage_examples:{processor_name}',
+        lambda: _build_processor_usage_examples(processor_name),
+        cacheable=lambda examples: examples is not None and examples.get('status') != 'error'
+    )
+
+
+def _build_processor_usage_examples(processor_name: str) -> dict:
+    """Instantiate a processor and format its usage examples."""
     try:
         from excel_recipe_processor.core.base_processor import registry
         
@@ -289,9 +320,10 @@ def get_processor_usage_examples(processor_name: str) -> dict:
             return None
         
         # Get the processor class
-        processor_class = registry._processors.get(processor_name)
-        if processor_class is None:
-            return {'error': f'Could not get processor class for {processor_name}'}
+        try:
+            processor_class = registry.get_processor_class(processor_name)
+        except StepProcessorError as e:
+            return {'error': f'Could not get processor class for {processor_name}: {e}'}
         
         # Try to get minimal config and create instance
         if not hasattr(processor_class, 'get_minimal_config'):
@@ -351,6 +383,15 @@ def get_all_usage_examples() -> dict:
     Returns:
         Dictionary with usage examples for all processors and system info
     """
+    return get_cached(
+        'all_usage_examples',
+        _build_all_usage_examples,
+        cacheable=lambda examples_data: 'error' not in examples_data['system_info']
+    )
+
+
+def _build_all_usage_examples() -> dict:
+    """Collect usage examples for every registered processor."""
     try:
         from excel_recipe_processor.core.base_processor import registry
         
@@ -489,74 +530,58 @@ def _format_usage_examples(processor_name: str, usage_examples: dict) -> dict:
     return formatted
 
 
-# Import processor classes
-from excel_recipe_processor.processors.add_calculated_column_processor  import AddCalculatedColumnProcessor
-from excel_recipe_processor.processors.add_subtotals_processor          import AddSubtotalsProcessor
-from excel_recipe_processor.processors.aggregate_data_processor         import AggregateDataProcessor
-from excel_recipe_processor.processors.clean_data_processor             import CleanDataProcessor
-from excel_recipe_processor.processors.combine_data_processor           import CombineDataProcessor
-from excel_recipe_processor.processors.copy_stage_processor             import CopyStageProcessor
-from excel_recipe_processor.processors.create_stage_processor           import CreateStageProcessor
-from excel_recipe_processor.processors.debug_breakpoint_processor       import DebugBreakpointProcessor
-from excel_recipe_processor.processors.diff_data_processor              import DiffDataProcessor
-from excel_recipe_processor.processors.export_file_processor            import ExportFileProcessor
-from excel_recipe_processor.processors.export_filter_step_processor     import ExportFilterStepProcessor
-from excel_recipe_processor.processors.fill_data_processor              import FillDataProcessor
-from excel_recipe_processor.processors.filter_data_processor            import FilterDataProcessor
-from excel_recipe_processor.processors.filter_terms_detector_processor  import FilterTermsDetectorProcessor
-from excel_recipe_processor.processors.format_excel_processor           import FormatExcelProcessor
-from excel_recipe_processor.processors.generate_column_config_processor import GenerateColumnConfigProcessor
-from excel_recipe_processor.processors.group_data_processor             import GroupDataProcessor
-from excel_recipe_processor.processors.import_file_processor            import ImportFileProcessor
-from excel_recipe_processor.processors.inject_formulas_processor        import InjectFormulasProcessor
-from excel_recipe_processor.processors.lookup_data_processor            import LookupDataProcessor
-from excel_recipe_processor.processors.manage_named_objects_processor   import ManageNamedObjectsProcessor
-from excel_recipe_processor.processors.merge_data_processor             import MergeDataProcessor
-from excel_recipe_processor.processors.pivot_table_processor            import PivotTableProcessor
-from excel_recipe_processor.processors.rename_columns_processor         import RenameColumnsProcessor
-from excel_recipe_processor.processors.seed_donor_formulas_processor    import SeedDonorFormulasProcessor
-from excel_recipe_processor.processors.select_columns_processor         import SelectColumnsProcessor
-from excel_recipe_processor.processors.slice_data_processor             import SliceDataProcessor
-from excel_recipe_processor.processors.sort_data_processor              import SortDataProcessor
-from excel_recipe_processor.processors.split_column_processor           import SplitColumnProcessor
+# Standard processors: step type -> (module in excel_recipe_processor.processors, class name).
+# Modules are imported the first time their step type is used, so startup does not
+# pay for every processor and its optional dependencies (scikit-learn, openpyxl, ...).
+STANDARD_PROCESSORS = {
+    'add_calculated_column':         ('add_calculated_column_processor',         'AddCalculatedColumnProcessor'),
+    'add_subtotals':                 ('add_subtotals_processor',                 'AddSubtotalsProcessor'),
+    'aggregate_data':                ('aggregate_data_processor',                'AggregateDataProcessor'),
+    'clean_data':                    ('clean_data_processor',                    'CleanDataProcessor'),
+    'combine_data':                  ('combine_data_processor',                  'CombineDataProcessor'),
+    'copy_stage':                    ('copy_stage_processor',                    'CopyStageProcessor'),
+    'create_stage':                  ('create_stage_processor',                  'CreateStageProcessor'),
+    'debug_breakpoint':              ('debug_breakpoint_processor',              'DebugBreakpointProcessor'),
+    'diff_data':                     ('diff_data_processor',                     'DiffDataProcessor'),
+    'export_file':                   ('export_file_processor',                   'ExportFileProcessor'),
+    'export_filter_step':            ('export_filter_step_processor',            'ExportFilterStepProcessor'),
+    'fill_data':                     ('fill_data_processor',                     'FillDataProcessor'),
+    'filter_data':                   ('filter_data_processor',                   'FilterDataProcessor'),
+    'filter_terms_detector':         ('filter_terms_detector_processor',         'FilterTermsDetectorProcessor'),
+    'format_excel':                  ('format_excel_processor',                  'FormatExcelProcessor'),
+    'generate_column_config':        ('generate_column_config_processor',        'GenerateColumnConfigProcessor'),
+    'group_data':                    ('group_data_processor',                    'GroupDataProcessor'),
+    'import_file':                   ('import_file_processor',                   'ImportFileProcessor'),
+    'inject_formulas':               ('inject_formulas_processor',               'InjectFormulasProcessor'),
+    'lookup_data':                   ('lookup_data_processor',                   'LookupDataProcessor'),
+    'manage_named_objects':          ('manage_named_objects_processor',          'ManageNamedObjectsProcessor'),
+    'merge_data':                    ('merge_data_processor',                    'MergeDataProcessor'),
+    'pivot_table':                   ('pivot_table_processor',                   'PivotTableProcessor'),
+    'rename_columns':                ('rename_columns_processor',                'RenameColumnsProcessor'),
+    'seed_donor_formulas':           ('seed_donor_formulas_processor',           'SeedDonorFormulasProcessor'),
+    'select_columns':                ('select_columns_processor',                'SelectColumnsProcessor'),
+    'slice_data':                    ('slice_data_processor',                    'SliceDataProcessor'),
+    'sort_data':                     ('sort_data_processor',                     'SortDataProcessor'),
+    'split_column':                  ('split_column_processor',                  'SplitColumnProcessor'),
+}
 
 
 def register_standard_processors():
-    """Register all standard processors with the registry."""
+    """Register all standard processors with the registry (imported on first use)."""
     
-    # Register existing processors
-    registry.register('add_calculated_column',          AddCalculatedColumnProcessor        )
-    registry.register('add_subtotals',                  AddSubtotalsProcessor               )
-    registry.register('aggregate_data',                 AggregateDataProcessor              )
-    registry.register('clean_data',                     CleanDataProcessor                  )
-    registry.register('combine_data',                   CombineDataProcessor                )
-    registry.register('copy_stage',                     CopyStageProcessor                  )
-    registry.register('create_stage',                   CreateStageProcessor                )
-    registry.register('debug_breakpoint',               DebugBreakpointProcessor            )
-    registry.register('diff_data',                      DiffDataProcessor                   )
-    registry.register('export_file',                    ExportFileProcessor                 )
-    registry.register('export_filter_step',             ExportFilterStepProcessor           )
-    registry.register('fill_data',                      FillDataProcessor                   )
-    registry.register('filter_data',                    FilterDataProcessor                 )
-    registry.register('filter_terms_detector',          FilterTermsDetectorProcessor        )
-    registry.register('format_excel',                   FormatExcelProcessor                )
-    registry.register('generate_column_config',         GenerateColumnConfigProcessor       )
-    registry.register('group_data',                     GroupDataProcessor                  )
-    registry.register('import_file',                    ImportFileProcessor                 )
-    registry.register('inject_formulas',                InjectFormulasProcessor             )
-    registry.register('lookup_data',                    LookupDataProcessor                 )
-    registry.register('manage_named_objects',           ManageNamedObjectsProcessor         )
-    registry.register('merge_data',                     MergeDataProcessor                  )
-    registry.register('pivot_table',                    PivotTableProcessor                 )
-    registry.register('rename_columns',                 RenameColumnsProcessor              )
-    registry.register('seed_donor_formulas',            SeedDonorFormulasProcessor          )
-    registry.register('select_columns',                 SelectColumnsProcessor              )
-    registry.register('slice_data',                     SliceDataProcessor                  )
-    registry.register('sort_data',                      SortDataProcessor                   )
-    registry.register('split_column',                   SplitColumnProcessor                )
+    for step_type, (module_name, class_name) in STANDARD_PROCESSORS.items():
+        registry.register_lazy(step_type, f'excel_recipe_processor.processors.{module_name}', class_name)
     
     logger.debug("Registered standard processors")
 
 
+def __getattr__(name: str):
+    """Keep processor classes importable from this module without loading them all up front."""
+    for step_type, (module_name, class_name) in STANDARD_PROCESSORS.items():
+        if class_name == name:
+            return registry.get_processor_class(step_type)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Auto-register processors when module is imported
 register_standard_processors()
@@ -24,6 +24,7 @@ from excel_recipe_processor.core.base_processor import (
 )
 from excel_recipe_processor.config.recipe_loader import RecipeLoader, RecipeValidationError
 from excel_recipe_processor.core.variable_substitution import VariableSubstitution
+from excel_recipe_processor.core.workbook_session import WorkbookSession, WorkbookSessionError
 from excel_recipe_processor.core.interactive_variables import (
     InteractiveVariablePrompt, InteractiveVariableError
 )
@@ -53,6 +54,7 @@ class RecipePipeline:
         self.variable_substitution = None
         self.steps_executed = 0
         self._global_on_error = ErrorAction.HALT  # Default error behavior
+        self._batch_workbook_operations = True    # Share open workbooks across file-operation steps
         
         # Track pipeline state
         self._recipe_path = None
@@ -76,6 +78,7 @@ class RecipePipeline:
             settings = self.recipe_data.get('settings', {})
             global_on_error = settings.get('on_error', 'halt')
             self._global_on_error = self._parse_error_action(global_on_error, "global settings")
+            self._batch_workbook_operations = bool(settings.get('batch_workbook_operations', True))
             
             # Initialize variable substitution
             self._initialize_variable_substitution()
@@ -178,6 +181,10 @@ class RecipePipeline:
         self.steps_executed = 0
         skipped_steps = 0
         
+        # Consecutive session-aware file operations share open workbooks
+        workbook_session = None
+        session_processors = []
+        
         for step_index, step_config in enumerate(recipe_steps):
             step_desc = step_config.get('step_description', f'Step {step_index + 1}')
             # processor_type = step_config.get('processor_type')
@@ -195,10 +202,21 @@ class RecipePipeline:
             else:
                 logger.info(f"📍 Step {step_index + 1}/{recipe_steps_cnt}: '{step_desc}'")
             
+            if workbook_session is not None:
+                workbook_session.begin_step()
+            
             try:
                 # Create processor with variable injection
                 processor = self._create_processor(step_config)
                 
+                if self._joins_workbook_session(processor):
+                    if workbook_session is None:
+                        workbook_session = WorkbookSession()
+                    processor.workbook_session = workbook_session
+                elif workbook_session is not None:
+                    # Other steps read and write files directly, so pending workbooks go to disk first
+                    self._close_workbook_session(workbook_session)
+                    workbook_session, session_processors = None, []
                 
                 # Execute based on processor type
                 if isinstance(processor, ImportBaseProcessor):
@@ -214,10 +232,20 @@ class RecipePipeline:
                     # DO NOT USE isinstance(processor, BaseStepProcessor) to fix this!!!!!!
                     processor.execute_stage_to_stage()
                 
+                if workbook_session is not None:
+                    if workbook_session.step_wrote_workbooks():
+                        # Earlier steps were saved before this one changed anything
+                        session_processors = []
+                    session_processors.append(processor)
+                
                 self.steps_executed += 1
                 logger.info(f"✅ Step {step_index + 1} completed successfully")
                 
             except (StageError, StepProcessorError, Exception) as e:
+                if workbook_session is not None:
+                    self._end_workbook_session_after_error(workbook_session, session_processors)
+                    workbook_session, session_processors = None, []
+                
                 # Handle error according to configured action
                 should_continue = self._handle_step_error(step_index, step_desc, e, step_on_error)
                 
@@ -226,6 +254,9 @@ class RecipePipeline:
                     skipped_steps = len(recipe_steps) - (step_index + 1)
                     break
         
+        if workbook_session is not None:
+            self._close_workbook_session(workbook_session)
+        
         print()     # blank line to separate from last step logging in recipe
         
         # Generate completion report
@@ -240,6 +271,57 @@ class RecipePipeline:
         
         return self._completion_report
 
+    def _joins_workbook_session(self, processor) -> bool:
+        """Check whether a step can work on workbooks shared with its neighbours."""
+        return (
+            self._batch_workbook_operations
+            and isinstance(processor, FileOpsBaseProcessor)
+            and processor.uses_workbook_session
+        )
+    
+    def _close_workbook_session(self, workbook_session: WorkbookSession) -> None:
+        """Write shared workbooks back to disk at the end of a run of file-operation steps."""
+        try:
+            workbook_session.close()
+        except WorkbookSessionError as e:
+            raise RecipePipelineError(str(e))
+    
+    def _end_workbook_session_after_error(self, workbook_session: WorkbookSession,
+                                          session_processors: list) -> None:
+        """
+        Leave files exactly as a step-by-step run would after a failed step.
+        
+        A failing step never reaches its own save, so the files should hold the
+        results of the earlier steps only. If the failed step was handed a shared
+        workbook, that copy may already contain part of its edits. The shared
+        copies are then dropped and the earlier steps of the run are replayed on
+        the saved files without a session.
+        
+        Args:
+            workbook_session: Session that was active when the step failed
+            session_processors: Processors that completed inside the session
+        """
+        if not workbook_session.step_opened_workbooks():
+            self._close_workbook_session(workbook_session)
+            return
+        
+        workbook_session.discard()
+        
+        if workbook_session.step_wrote_workbooks():
+            # Files were saved with the earlier results before the failed step made changes
+            session_processors = []
+        
+        if session_processors:
+            logger.warning(f"⚠️ Replaying {len(session_processors)} earlier file operation step(s) "
+                           f"without shared workbooks after the failure")
+        
+        for processor in session_processors:
+            processor.workbook_session = None
+            try:
+                processor.execute()
+            except Exception as e:
+                raise RecipePipelineError(f"Replaying step '{processor.step_name}' failed: {e}")
+    
     def collect_external_variables(self, cli_variables: dict = None) -> dict:
         """
         Collect external variables from CLI arguments and interactive prompts.
@@ -449,15 +531,15 @@ class RecipePipeline:
         """Create processor instance with variable injection."""
         processor_type = step_config.get('processor_type')
         
-        if processor_type not in registry._processors:
-            available_types = list(registry._processors.keys())
+        if not registry.is_registered(processor_type):
+            available_types = registry.get_registered_types()
             raise StepProcessorError(f"Unknown processor type: {processor_type}. Available: {available_types}")
         
         # APPLY RECURSIVE VARIABLE SUBSTITUTION TO STEP CONFIG BEFORE CREATING PROCESSOR
         processed_step_config = self._substitute_variables_in_config(step_config)
         
         # Create processor instance with substituted config
-        processor_class = registry._processors[processor_type]
+        processor_class = registry.get_processor_class(processor_type)
         processor = processor_class(processed_step_config)
         
         # Set variables on processor for use in dynamic configurations
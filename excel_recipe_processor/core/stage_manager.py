@@ -5,6 +5,7 @@ Provides the StageManager class for saving, loading, and managing
 intermediate data stages during recipe processing with friendly validation.
 """
 
+import numpy as np
 import pandas as pd
 import logging
 
@@ -19,6 +20,22 @@ class StageError(Exception):
     pass
 
 
+def copy_on_write_active() -> bool:
+    """
+    Check whether pandas copy-on-write is in effect.
+    
+    Sharing column data between stages is only safe under copy-on-write;
+    without it, a chained assignment on one frame can write into another.
+    It is always on from pandas 3.0 and opt-in on pandas 2.x.
+    """
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except Exception:
+        return False
+
+
 class StageManager:
     """
     Static utility class for managing data stages.
@@ -36,6 +53,10 @@ class StageManager:
     _max_stages: int        = 100               # Configurable limit
     _declared_stages: dict  = {}
     _protected_stages       = set()
+    _stage_indexes: dict    = {}                # dict[str, dict[tuple, pd.Series]]
+    
+    # How keys are normalized before indexing (see normalize_key_values)
+    KEY_MODES               = ('exact', 'string', 'lower', 'normalized')
     
     def __new__(cls):
         raise TypeError(f"{cls.__name__} is a static utility class. "
@@ -158,10 +179,15 @@ class StageManager:
     @classmethod
     def save_stage(cls, stage_name: str, data: pd.DataFrame, description: str = '',
                     step_name: str = '', overwrite: bool = False,
-                    confirm_replacement: bool = False) -> None:
+                    confirm_replacement: bool = False, share_data: bool = False) -> None:
         """
         Save a DataFrame to a named stage with protection checks.
         
+        Stored frames are never modified in place, so data that only consists
+        of columns of stored stages (or of columns nobody else holds) can be
+        saved with share_data=True to skip the copy. Sharing needs pandas
+        copy-on-write; without it the data is always copied.
+        
         Args:
             stage_name: Name for the stage
             data: DataFrame to save
@@ -169,6 +195,7 @@ class StageManager:
             step_name: Name of step creating this stage
             overwrite: Whether to overwrite existing stage
             confirm_replacement: Explicit confirmation for protected stages
+            share_data: Store the column data without copying it (copy-on-write only)
             
         Raises:
             StageError: If stage saving fails due to protection or other issues
@@ -205,8 +232,11 @@ class StageManager:
                 f"Current stages: {current_stages}"
             )
         
-        # Save the stage
-        cls._current_stages[stage_name] = data.copy()
+        share_data = share_data and copy_on_write_active()
+        
+        # Save the stage (key indexes built from the old data are no longer valid)
+        cls._current_stages[stage_name] = data.copy(deep=not share_data)
+        cls._stage_indexes.pop(stage_name, None)
         cls._stage_metadata[stage_name] = {
             'rows': len(data),
             'columns': len(data.columns),
@@ -214,7 +244,9 @@ class StageManager:
             'description': description,
             'step_name': step_name,
             'created_at': datetime.now(),
-            'memory_usage_mb': round(data.memory_usage(deep=True).sum() / (1024 * 1024), 2),
+            # Deep sizing scans every string; shared data adds no new strings, so size it shallowly
+            'memory_usage_mb': round(data.memory_usage(deep=not share_data).sum() / (1024 * 1024), 2),
+            'shares_data': share_data,
             'declared': stage_name in cls._declared_stages,
             'protected': stage_name in cls._protected_stages
         }
@@ -235,12 +267,20 @@ class StageManager:
             )
 
     @classmethod
-    def load_stage(cls, stage_name: str) -> pd.DataFrame:
+    def load_stage(cls, stage_name: str, share_data: bool = False) -> pd.DataFrame:
         """
         Load data from a named stage.
         
+        By default the caller gets its own copy and may modify it freely.
+        With share_data=True the returned frame shares column data with the
+        stored stage; the caller may select, reorder and relabel columns or
+        add new ones, but must never write into existing column values.
+        Without pandas copy-on-write the caller always gets a copy.
+        
         Args:
             stage_name: Name of stage to load
+            share_data: Return a view of the stored column data instead of a copy
+                        (copy-on-write only)
             
         Returns:
             DataFrame from the stage
@@ -250,27 +290,14 @@ class StageManager:
         """
         # Check if stage exists
         if stage_name not in cls._current_stages:
-            available_stages = list(cls._current_stages.keys())
-            
-            # Try to suggest similar stage names
-            suggestions = cls._suggest_similar_stage_names(stage_name, available_stages)
-            
-            error_msg = f"Stage '{stage_name}' not found."
-            if available_stages:
-                error_msg += f" Available stages: {available_stages}"
-                if suggestions:
-                    error_msg += f"\n💡 Did you mean: {', '.join(suggestions)}?"
-            else:
-                error_msg += " No stages have been created yet."
-                error_msg += "\n💡 Make sure an import_file or processing step created this stage first."
-            
-            raise StageError(error_msg)
+            raise cls._stage_not_found_error(stage_name)
         
         # Increment usage counter
         cls._stage_usage[stage_name] += 1
         
         # Get stage data
-        stage_data = cls._current_stages[stage_name].copy()
+        share_data = share_data and copy_on_write_active()
+        stage_data = cls._current_stages[stage_name].copy(deep=not share_data)
         
         # Log with declaration status
         if stage_name in cls._declared_stages:
@@ -286,6 +313,279 @@ class StageManager:
         
         return stage_data
 
+    @classmethod
+    def _stage_not_found_error(cls, stage_name: str) -> StageError:
+        """Build a StageError for a missing stage, with suggestions for typos."""
+        available_stages = list(cls._current_stages.keys())
+        
+        # Try to suggest similar stage names
+        suggestions = cls._suggest_similar_stage_names(stage_name, available_stages)
+        
+        error_msg = f"Stage '{stage_name}' not found."
+        if available_stages:
+            error_msg += f" Available stages: {available_stages}"
+            if suggestions:
+                error_msg += f"\n💡 Did you mean: {', '.join(suggestions)}?"
+        else:
+            error_msg += " No stages have been created yet."
+            error_msg += "\n💡 Make sure an import_file or processing step created this stage first."
+        
+        return StageError(error_msg)
+
+    @classmethod
+    def get_stage_columns(cls, stage_name: str) -> list:
+        """
+        Get the column names of a stage without copying its data.
+        
+        Args:
+            stage_name: Name of stage to inspect
+            
+        Returns:
+            List of column names
+            
+        Raises:
+            StageError: If stage not found
+        """
+        if stage_name not in cls._current_stages:
+            raise cls._stage_not_found_error(stage_name)
+        
+        return list(cls._current_stages[stage_name].columns)
+
+    # =============================================================================
+    # KEY INDEXES - Shared lookup structures built lazily per stage
+    # =============================================================================
+
+    @classmethod
+    def get_key_index(cls, stage_name: str, key_column,
+                      key_mode: str = 'exact', keep: str = 'first') -> pd.Series:
+        """
+        Get a hash index from the distinct keys of a stage column to row positions.
+        
+        The index is built on first request and reused by every later step that
+        asks for the same (column, key_mode, keep) combination, until the stage
+        is saved again. Missing keys are never indexed.
+        
+        A list of columns builds a composite key. Its index is a MultiIndex, so
+        the tuples are hashed through packed integer codes, and a key with any
+        missing part is not indexed.
+        
+        Args:
+            stage_name: Name of stage holding the keys
+            key_column: Column in the stage containing the keys, or list of columns
+            key_mode: Key normalization, one of KEY_MODES (see normalize_key_values)
+            keep: Which row wins for duplicate keys, 'first' or 'last'
+            
+        Returns:
+            Series of int64 row positions indexed by the unique normalized keys
+            
+        Raises:
+            StageError: If the stage or column is not found, or options are invalid
+        """
+        key_columns = cls._as_key_columns(key_column)
+        return cls._get_cached_index(
+            stage_name, ('keys', key_columns, key_mode, keep),
+            lambda frame: cls._build_key_index(stage_name, frame, key_columns, key_mode, keep)
+        )
+
+    @classmethod
+    def get_key_value_map(cls, stage_name: str, key_column, value_column: str,
+                          key_mode: str = 'exact', keep: str = 'first') -> pd.Series:
+        """
+        Get a key → value mapping between two stage columns.
+        
+        Built from get_key_index() and cached the same way. The result can be
+        passed straight to Series.map(), which reuses its hash index.
+        
+        Args:
+            stage_name: Name of stage holding the keys and values
+            key_column: Column in the stage containing the keys, or list of columns
+            value_column: Column in the stage containing the values
+            key_mode: Key normalization, one of KEY_MODES (see normalize_key_values)
+            keep: Which row wins for duplicate keys, 'first' or 'last'
+            
+        Returns:
+            Series of values indexed by the unique normalized keys
+            
+        Raises:
+            StageError: If the stage or columns are not found, or options are invalid
+        """
+        key_columns = cls._as_key_columns(key_column)
+        
+        def build(frame: pd.DataFrame) -> pd.Series:
+            if value_column not in frame.columns:
+                raise StageError(
+                    f"Column '{value_column}' not found in stage '{stage_name}'. "
+                    f"Available columns: {list(frame.columns)}"
+                )
+            key_index = cls._get_cached_index(
+                stage_name, ('keys', key_columns, key_mode, keep),
+                lambda frame: cls._build_key_index(stage_name, frame, key_columns, key_mode, keep),
+                count_usage=False
+            )
+            values = frame[value_column].take(key_index.to_numpy())
+            return pd.Series(values.to_numpy(), index=key_index.index, name=value_column)
+        
+        return cls._get_cached_index(stage_name, ('map', key_columns, value_column, key_mode, keep), build)
+
+    @classmethod
+    def take_stage_rows(cls, stage_name: str, positions, columns: list) -> pd.DataFrame:
+        """
+        Gather rows of selected stage columns by position.
+        
+        Only the requested rows and columns are copied, so processors can pull
+        a few columns out of a large stage without loading all of it.
+        
+        Args:
+            stage_name: Name of stage to read from
+            positions: Row positions, e.g. values from get_key_index()
+            columns: Stage columns to gather
+            
+        Returns:
+            DataFrame of the gathered rows with a fresh RangeIndex
+            
+        Raises:
+            StageError: If the stage or a column is not found
+        """
+        if stage_name not in cls._current_stages:
+            raise cls._stage_not_found_error(stage_name)
+        
+        frame = cls._current_stages[stage_name]
+        missing_columns = [col for col in columns if col not in frame.columns]
+        if missing_columns:
+            raise StageError(
+                f"Columns {missing_columns} not found in stage '{stage_name}'. "
+                f"Available columns: {list(frame.columns)}"
+            )
+        
+        positions = np.asarray(positions, dtype=np.int64)
+        gathered = pd.DataFrame({col: frame[col].take(positions) for col in columns})
+        gathered.index = pd.RangeIndex(len(positions))
+        return gathered
+
+    @classmethod
+    def get_duplicate_keys(cls, stage_name: str, key_column, limit: int = 5) -> list:
+        """
+        Get raw key values that occur more than once in a stage column.
+        
+        Args:
+            stage_name: Name of stage holding the keys
+            key_column: Column in the stage containing the keys, or list of columns
+            limit: Maximum number of duplicate keys to return
+            
+        Returns:
+            List of up to `limit` duplicated key values, as tuples for composite
+            keys (empty if keys are unique)
+            
+        Raises:
+            StageError: If the stage or column is not found
+        """
+        if stage_name not in cls._current_stages:
+            raise cls._stage_not_found_error(stage_name)
+        
+        frame = cls._current_stages[stage_name]
+        key_columns = cls._as_key_columns(key_column)
+        cls._check_key_columns(stage_name, frame, key_columns)
+        
+        if len(key_columns) == 1:
+            keys = frame[key_columns[0]]
+            return list(keys[keys.duplicated(keep=False)].unique()[:limit])
+        
+        keys = frame[list(key_columns)]
+        duplicated = keys[keys.duplicated(keep=False)].drop_duplicates()
+        return list(duplicated.itertuples(index=False, name=None))[:limit]
+
+    @staticmethod
+    def normalize_key_values(series: pd.Series, key_mode: str) -> pd.Series:
+        """
+        Normalize key values the way a key index of the given mode does.
+        
+        Processors use this on their own key column so it lines up with the index.
+        
+        Args:
+            series: Key values to normalize
+            key_mode: 'exact' (unchanged), 'string' (astype(str)),
+                      'lower' (astype(str).str.lower()), or 'normalized'
+                      (string, trailing '.0' removed, whitespace stripped, 'nan' → missing)
+            
+        Returns:
+            Normalized Series with the original index
+        """
+        if key_mode == 'exact':
+            return series
+        elif key_mode == 'string':
+            return series.astype(str)
+        elif key_mode == 'lower':
+            return series.astype(str).str.lower()
+        elif key_mode == 'normalized':
+            normalized = series.astype(str).str.replace(r'\.0+$', '', regex=True).str.strip()
+            return normalized.replace('nan', pd.NA)
+        else:
+            raise StageError(f"Invalid key_mode '{key_mode}'. Valid options: {list(StageManager.KEY_MODES)}")
+
+    @classmethod
+    def _get_cached_index(cls, stage_name: str, cache_key: tuple, build, count_usage: bool = True):
+        """Return a cached index for a stage, building it from the stored frame if needed."""
+        if stage_name not in cls._current_stages:
+            raise cls._stage_not_found_error(stage_name)
+        
+        if count_usage:
+            cls._stage_usage[stage_name] += 1
+        
+        stage_indexes = cls._stage_indexes.setdefault(stage_name, {})
+        if cache_key not in stage_indexes:
+            # Built from the stored frame directly - indexes never modify it, so no copy is needed
+            stage_indexes[cache_key] = build(cls._current_stages[stage_name])
+            logger.debug(f"Built {cache_key[0]} index on stage '{stage_name}' for {cache_key[1:]}")
+        
+        return stage_indexes[cache_key]
+
+    @staticmethod
+    def _as_key_columns(key_column) -> tuple:
+        """Turn a key column name or list of names into a hashable tuple."""
+        if isinstance(key_column, (list, tuple)):
+            return tuple(key_column)
+        return (key_column,)
+
+    @staticmethod
+    def _check_key_columns(stage_name: str, frame: pd.DataFrame, key_columns: tuple) -> None:
+        """Raise StageError if any key column is missing from a stage frame."""
+        for key_column in key_columns:
+            if key_column not in frame.columns:
+                raise StageError(
+                    f"Column '{key_column}' not found in stage '{stage_name}'. "
+                    f"Available columns: {list(frame.columns)}"
+                )
+
+    @classmethod
+    def _build_key_index(cls, stage_name: str, frame: pd.DataFrame, key_columns: tuple,
+                         key_mode: str, keep: str) -> pd.Series:
+        """Build the key → row position index for one stage column or column combination."""
+        cls._check_key_columns(stage_name, frame, key_columns)
+        
+        if keep not in ('first', 'last'):
+            raise StageError(f"Invalid keep '{keep}'. Valid options: first, last")
+        
+        key_parts = []
+        valid = np.ones(len(frame), dtype=bool)
+        for key_column in key_columns:
+            raw_keys = frame[key_column]
+            keys = cls.normalize_key_values(raw_keys, key_mode)
+            valid &= (raw_keys.notna() & keys.notna()).to_numpy()
+            key_parts.append(keys)
+        
+        positions = np.flatnonzero(valid)
+        
+        if len(key_columns) == 1:
+            keys = pd.Index(key_parts[0].to_numpy()[valid], name=key_columns[0])
+        else:
+            keys = pd.MultiIndex.from_arrays(
+                [part.to_numpy()[valid] for part in key_parts], names=list(key_columns)
+            )
+        
+        unique_mask = ~keys.duplicated(keep=keep)
+        
+        return pd.Series(positions[unique_mask], index=keys[unique_mask], name='row_position')
+
     @classmethod
     def _suggest_similar_stage_names(cls, target_name: str, available_names: list[str]) -> list:
         """Suggest similar stage names for typos."""
@@ -385,6 +685,7 @@ class StageManager:
         cls._current_stages.clear()
         cls._stage_metadata.clear()
         cls._stage_usage.clear()
+        cls._stage_indexes.clear()
         
         if stage_count > 0:
             logger.info(f"Cleaned up {stage_count} stages, freed ~{memory_freed:.1f}MB memory")
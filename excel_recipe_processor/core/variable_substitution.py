@@ -13,17 +13,133 @@ import logging
 
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Union
+from functools import lru_cache
+from typing import Any, Union, NamedTuple
 
 
 logger = logging.getLogger(__name__)
 
+# {type:variable} - typed variables, resolved first
+TYPED_VARIABLE_RE = re.compile(r'\{(\w+):(\w+)\}')
+# {variable} - untyped variables, resolved second
+SIMPLE_VARIABLE_RE = re.compile(r'\{([a-zA-Z_]\w*)\}')
+# {variable:format} - formatted variables like {date:MMDD}, resolved last
+FORMATTED_VARIABLE_RE = re.compile(r'\{(\w+):([^}]+)\}')
+# Any of the three slot forms, tried in the same order as the passes above
+TEMPLATE_SLOT_RE = re.compile(
+    r'\{(?:(?P<typed_type>\w+):(?P<typed_name>\w+)'
+    r'|(?P<simple_name>[a-zA-Z_]\w*)'
+    r'|(?P<format_name>\w+):(?P<format_spec>[^{}]+))\}'
+)
+
 
 class VariableSubstitutionError(Exception):
     """Raised when variable substitution fails."""
     pass
 
 
+class CompiledTemplate(NamedTuple):
+    """
+    A template string parsed once into literal text and variable slots.
+    
+    segments holds plain strings for literal text and tuples for slots:
+    ('typed', type_name, var_name, raw), ('simple', var_name, raw) or
+    ('formatted', var_name, format_spec, raw). When the template has braces
+    outside recognisable slots, segments is None and the template is
+    substituted with the regex passes instead.
+    """
+    template: str
+    typo_error: Union[str, None]
+    whole_typed: Union[tuple, None]
+    segments: Union[tuple, None]
+
+
+@lru_cache(maxsize=4096)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Parse a template into a CompiledTemplate, cached by template string.
+    
+    Args:
+        template: Template string with {variable} placeholders
+        
+    Returns:
+        CompiledTemplate for the string
+    """
+    typo_error = _find_variable_syntax_typo(template)
+    
+    whole_match = TYPED_VARIABLE_RE.fullmatch(template)
+    whole_typed = whole_match.groups() if whole_match else None
+    
+    segments = []
+    position = 0
+    for match in TEMPLATE_SLOT_RE.finditer(template):
+        if match.start() > position:
+            segments.append(template[position:match.start()])
+        raw = match.group(0)
+        if match.group('typed_type') is not None:
+            segments.append(('typed', match.group('typed_type'), match.group('typed_name'), raw))
+        elif match.group('simple_name') is not None:
+            segments.append(('simple', match.group('simple_name'), raw))
+        else:
+            segments.append(('formatted', match.group('format_name'), match.group('format_spec'), raw))
+        position = match.end()
+    if position < len(template):
+        segments.append(template[position:])
+    
+    # Stray braces in the literal text can pair up with substituted values,
+    # which only the sequential regex passes reproduce faithfully
+    if any(isinstance(segment, str) and ('{' in segment or '}' in segment) for segment in segments):
+        segments = None
+    else:
+        segments = tuple(segments)
+    
+    return CompiledTemplate(template, typo_error, whole_typed, segments)
+
+
+def _find_variable_syntax_typo(template: str) -> Union[str, None]:
+    """
+    Detect potential typos in variable syntax using simple checks.
+    
+    Args:
+        template: Template string to check for typos
+        
+    Returns:
+        Error message for the first likely typo, or None
+    """
+    # Simple check 1: If we see "word:word}" check if there's a "{" to the left
+    if ':' in template and '}' in template:
+        colon = template.find(':')
+        while colon != -1:
+            # Look for closing brace after this colon
+            closing = template.find('}', colon + 1)
+            if closing == -1:
+                break
+            # Check if there's an opening brace before the colon, nearer than any closing brace
+            if template.rfind('{', 0, colon) <= template.rfind('}', 0, colon):
+                # Extract the problematic part for error message
+                problem_part = template[max(0, colon - 10):closing + 1]
+                return (
+                    f"Missing opening brace: found '{problem_part}' - "
+                    f"add '{{' before the colon"
+                )
+            colon = template.find(':', colon + 1)
+    
+    # Simple check 2: Count braces to make sure they're balanced
+    open_count = template.count('{')
+    close_count = template.count('}')
+    if open_count != close_count:
+        return f"Unbalanced braces: {open_count} opening, {close_count} closing"
+    
+    # Simple check 3: Look for obviously empty patterns
+    if '{:' in template:
+        return f"Empty type name: found '{{:' - specify type like '{{list:variable}}'"
+    
+    if ':}' in template:
+        return f"Empty variable name: found ':}}' - specify variable like '{{type:variable}}'"
+    
+    return None
+
+
 class VariableSubstitution:
     """
     Handles variable substitution in strings and structures for dynamic naming.
@@ -88,6 +204,10 @@ class VariableSubstitution:
         self.custom_variables = custom_variables or {}
         self.now = datetime.now()
         
+        # Base variables keyed by (now, input_path, recipe_path) they were built from
+        self._base_variables_key = None
+        self._base_variables = {}
+        
         logger.debug(f"Initialized VariableSubstitution with {len(self.custom_variables)} custom variables")
     
     def substitute(self, template: str) -> str:
@@ -115,18 +235,17 @@ class VariableSubstitution:
             # No variables to substitute
             return template
         
+        compiled = compile_template(template)
+        
         try:
             # Check for potential typos before processing
-            self._detect_variable_syntax_typos(template)
+            if compiled.typo_error:
+                raise VariableSubstitutionError(compiled.typo_error)
             
-            # Handle typed variables first: {type:variable}
-            result = self._substitute_typed_variables_in_string(template)
+            result = self._render_compiled_template(compiled)
             
-            # Then handle untyped variables: {variable} (backwards compatible)
-            result = self._substitute_untyped_variables(result)
-            
-            # Finally handle formatted variables: {date:MMDD}
-            result = self._substitute_formatted_variables(result)
+            if result is None:
+                result = self._substitute_with_regex_passes(template)
             
             logger.debug(f"Variable substitution: '{template}' → '{result}'")
             return result
@@ -134,6 +253,93 @@ class VariableSubstitution:
         except Exception as e:
             raise VariableSubstitutionError(f"Error substituting variables in '{template}': {e}")
     
+    def _substitute_with_regex_passes(self, template: str) -> str:
+        """Substitute typed, untyped and formatted variables in three sequential passes."""
+        # Handle typed variables first: {type:variable}
+        result = self._substitute_typed_variables_in_string(template)
+        
+        # Then handle untyped variables: {variable} (backwards compatible)
+        result = self._substitute_untyped_variables(result)
+        
+        # Finally handle formatted variables: {date:MMDD}
+        return self._substitute_formatted_variables(result)
+    
+    def _render_compiled_template(self, compiled: CompiledTemplate) -> Union[str, None]:
+        """
+        Render a compiled template with the same results as the three regex passes.
+        
+        Returns:
+            Substituted string, or None when a substituted value contains braces
+            (the later passes would treat it as template text)
+        """
+        if compiled.segments is None:
+            return None
+        
+        # Pass 1: typed variables ({str:variable} only in string context)
+        pieces = []
+        for segment in compiled.segments:
+            if isinstance(segment, tuple) and segment[0] == 'typed' and segment[1] in self.SUPPORTED_TYPES:
+                value = self._typed_variable_as_string(segment[1], segment[2])
+                if '{' in value or '}' in value:
+                    return None
+                pieces.append(value)
+            else:
+                pieces.append(segment)
+        
+        # Pass 2: untyped variables, skipped when text after them starts with ':'
+        variables = None
+        for index, piece in enumerate(pieces):
+            if not isinstance(piece, tuple) or piece[0] != 'simple':
+                continue
+            following = next((p for p in pieces[index + 1:] if not isinstance(p, str) or p), '')
+            if isinstance(following, tuple):
+                following = following[-1]
+            if following.startswith(':'):
+                pieces[index] = piece[2]
+                continue
+            if variables is None:
+                variables = self._build_string_variable_dict()
+            if piece[1] not in variables:
+                pieces[index] = piece[2]
+                continue
+            value = variables[piece[1]]
+            if '{' in value or '}' in value:
+                return None
+            pieces[index] = value
+        
+        # Pass 3: formatted variables like {date:MMDD}, plus typed slots pass 1 left alone
+        for index, piece in enumerate(pieces):
+            if not isinstance(piece, tuple):
+                continue
+            var_name, format_spec, raw = piece[-3], piece[-2], piece[-1]
+            if var_name in ['date', 'time']:
+                pieces[index] = self._format_date_or_time(format_spec)
+            else:
+                if variables is None:
+                    variables = self._build_string_variable_dict()
+                pieces[index] = variables.get(var_name, raw)
+        
+        return ''.join(pieces)
+    
+    def _typed_variable_as_string(self, type_name: str, var_name: str) -> str:
+        """Resolve a {type:variable} slot in string context (only str type is allowed)."""
+        # Only string type allowed in string context
+        if type_name != 'str':
+            raise VariableSubstitutionError(
+                f"Cannot use {{{type_name}:{var_name}}} in string context. "
+                f"Only {{str:variable}} is allowed in strings."
+            )
+        
+        # Get variable value and convert to string
+        if var_name not in self.custom_variables:
+            available_vars = list(self.custom_variables.keys())
+            raise VariableSubstitutionError(
+                f"Unknown variable '{var_name}' in {{str:{var_name}}}. "
+                f"Available variables: {available_vars}"
+            )
+        
+        return str(self.custom_variables[var_name])
+    
     def substitute_variables(self, template: str) -> str:
         """
         Alias for substitute() method for backward compatibility.
@@ -162,11 +368,19 @@ class VariableSubstitution:
         if isinstance(value, str):
             return self._substitute_in_string_or_structure(value)
         elif isinstance(value, dict):
-            return {key: self.substitute_structure(val) for key, val in value.items()}
+            return {key: self._substitute_item(val) for key, val in value.items()}
         elif isinstance(value, list):
-            return [self.substitute_structure(item) for item in value]
+            return [self._substitute_item(item) for item in value]
         else:
             return value
+
+    def _substitute_item(self, value: Any) -> Any:
+        """Substitute one container item, passing plain scalars through without a call per cell."""
+        if isinstance(value, (dict, list)):
+            return self.substitute_structure(value)
+        if isinstance(value, str) and ('{' in value or '}' in value):
+            return self._substitute_in_string_or_structure(value)
+        return value
     
     def _substitute_in_string_or_structure(self, template: str) -> Any:
         """
@@ -178,16 +392,21 @@ class VariableSubstitution:
         if not isinstance(template, str):
             return template
         
+        # Plain strings (the bulk of inline data) cannot hold variables or typos
+        if '{' not in template and '}' not in template:
+            return template
+        
         # Check for potential typos in variable syntax
-        self._detect_variable_syntax_typos(template)
+        compiled = compile_template(template)
+        if compiled.typo_error:
+            raise VariableSubstitutionError(compiled.typo_error)
         
         if '{' not in template:
             return template
         
         # Check if entire string is a single typed variable: "{type:variable}"
-        typed_match = re.fullmatch(r'\{(\w+):(\w+)\}', template)
-        if typed_match:
-            type_name, var_name = typed_match.groups()
+        if compiled.whole_typed:
+            type_name, var_name = compiled.whole_typed
             return self._get_typed_variable_value(type_name, var_name)
         
         # Otherwise, do string substitution
@@ -212,27 +431,9 @@ class VariableSubstitution:
             if type_name not in self.SUPPORTED_TYPES:
                 return match.group(0)  # Return unchanged if not a supported type
             
-            # Only string type allowed in string context
-            if type_name != 'str':
-                raise VariableSubstitutionError(
-                    f"Cannot use {{{type_name}:{var_name}}} in string context. "
-                    f"Only {{str:variable}} is allowed in strings."
-                )
-            
-            # Get variable value and convert to string
-            if var_name not in self.custom_variables:
-                available_vars = list(self.custom_variables.keys())
-                raise VariableSubstitutionError(
-                    f"Unknown variable '{var_name}' in {{str:{var_name}}}. "
-                    f"Available variables: {available_vars}"
-                )
-            
-            value = self.custom_variables[var_name]
-            return str(value)
+            return self._typed_variable_as_string(type_name, var_name)
         
-        # Pattern for typed variables: {type:variable}
-        pattern = r'\{(\w+):(\w+)\}'
-        return re.sub(pattern, replace_typed_var, template)
+        return TYPED_VARIABLE_RE.sub(replace_typed_var, template)
 
     # def _substitute_untyped_variables(self, template: str) -> str:
     #     """
@@ -290,8 +491,7 @@ class VariableSubstitution:
                     return full_match
             
             # Pattern matches {word} but not {word:anything}
-            simple_pattern = r'\{([a-zA-Z_]\w*)\}'
-            result = re.sub(simple_pattern, replace_simple_variable, template)
+            result = SIMPLE_VARIABLE_RE.sub(replace_simple_variable, template)
             
             return result
             
@@ -376,56 +576,21 @@ class VariableSubstitution:
         Raises:
             VariableSubstitutionError: If likely typos are detected
         """
-        # Simple check 1: If we see "word:word}" check if there's a "{" to the left
-        if ':' in template and '}' in template:
-            for i in range(len(template)):
-                if template[i] == ':':
-                    # Look for closing brace after this colon
-                    for j in range(i + 1, len(template)):
-                        if template[j] == '}':
-                            # Found colon followed by closing brace
-                            # Check if there's an opening brace before the colon
-                            has_opening_brace = False
-                            for k in range(i - 1, -1, -1):
-                                if template[k] == '{':
-                                    has_opening_brace = True
-                                    break
-                                if template[k] == '}':
-                                    # Hit another closing brace first, stop looking
-                                    break
-                            
-                            if not has_opening_brace:
-                                # Extract the problematic part for error message
-                                start = max(0, i - 10)
-                                end = min(len(template), j + 1)
-                                problem_part = template[start:end]
-                                raise VariableSubstitutionError(
-                                    f"Missing opening brace: found '{problem_part}' - "
-                                    f"add '{{' before the colon"
-                                )
-                            break  # Found matching pattern, move to next colon
-        
-        # Simple check 2: Count braces to make sure they're balanced
-        open_count = template.count('{')
-        close_count = template.count('}')
-        if open_count != close_count:
-            raise VariableSubstitutionError(
-                f"Unbalanced braces: {open_count} opening, {close_count} closing"
-            )
-        
-        # Simple check 3: Look for obviously empty patterns
-        if '{:' in template:
-            raise VariableSubstitutionError(
-                f"Empty type name: found '{{:' - specify type like '{{list:variable}}'"
-            )
-        
-        if ':}' in template:
-            raise VariableSubstitutionError(
-                f"Empty variable name: found ':}}' - specify variable like '{{type:variable}}'"
-            )
+        typo_error = _find_variable_syntax_typo(template)
+        if typo_error:
+            raise VariableSubstitutionError(typo_error)
 
     def _build_base_variables(self) -> dict:
         """Build base date/time and file variables (always strings) - single source of truth."""
+        cache_key = (self.now, self.input_path, self.recipe_path)
+        if self._base_variables_key != cache_key:
+            self._base_variables = self._format_base_variables()
+            self._base_variables_key = cache_key
+        
+        return dict(self._base_variables)
+    
+    def _format_base_variables(self) -> dict:
+        """Format the date/time and file variables for the current instant and paths."""
         variables = {}
         
         # Legacy individual components (backward compatibility)
@@ -489,9 +654,6 @@ class VariableSubstitution:
 
     def _substitute_formatted_variables(self, text: str) -> str:
         """Handle formatted variables like {date:MMDD}."""
-        # Pattern to match {variable:format}
-        pattern = r'\{(\w+):([^}]+)\}'
-        
         def replace_formatted(match):
             var_name = match.group(1)
             format_spec = match.group(2)
@@ -503,7 +665,7 @@ class VariableSubstitution:
                 variables = self._build_string_variable_dict()
                 return variables.get(var_name, match.group(0))
         
-        return re.sub(pattern, replace_formatted, text)
+        return FORMATTED_VARIABLE_RE.sub(replace_formatted, text)
 
     def _format_date_or_time(self, format_spec: str) -> str:
         """Format date using master format definitions."""
@@ -534,7 +696,7 @@ class VariableSubstitution:
         unknown_vars = []
         
         # Find typed variables: {type:variable}
-        typed_vars = re.findall(r'\{(\w+):(\w+)\}', template)
+        typed_vars = TYPED_VARIABLE_RE.findall(template)
         for type_name, var_name in typed_vars:
             if type_name not in self.SUPPORTED_TYPES:
                 unknown_vars.append(f"unsupported_type:{type_name}")
@@ -553,8 +715,8 @@ class VariableSubstitution:
                     unknown_vars.append(var_name)
         
         # Also check for formatted variables: {variable:format}
-        formatted_vars = re.findall(r'\{(\w+):[^}]+\}', template)
-        for var_name in formatted_vars:
+        formatted_vars = FORMATTED_VARIABLE_RE.findall(template)
+        for var_name, _ in formatted_vars:
             if var_name not in available_vars and var_name not in ['date', 'time']:
                 unknown_vars.append(var_name)
         
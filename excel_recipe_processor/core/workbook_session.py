@@ -0,0 +1,197 @@
+"""
+Shared workbook session for consecutive file-operation steps.
+
+excel_recipe_processor/core/workbook_session.py
+
+Recipes often run several file operations (format_excel, inject_formulas,
+seed_donor_formulas, manage_named_objects) on the same workbook in a row.
+Loading and saving the file in every step means a full unzip, parse and
+serialize per step. A WorkbookSession keeps each workbook open across those
+steps and writes it back once when the run of steps ends.
+"""
+
+import logging
+
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+class WorkbookSessionError(Exception):
+    """Raised when a shared workbook cannot be saved back to disk."""
+    pass
+
+
+class WorkbookSession:
+    """
+    Editable openpyxl workbooks shared by consecutive file-operation steps.
+
+    Workbooks are keyed by resolved file path. A step gets the open workbook
+    from open(), and save() only records that the step finished its changes.
+    Nothing is written until flush() or close(). Reads that need the file on
+    disk (read-only or cached-value loads) call flush_path() first so they see
+    the same content a sequential run would have saved.
+    """
+
+    def __init__(self):
+        self._workbooks = {}                    # dict[Path, openpyxl.Workbook]
+        self._display_names = {}                # dict[Path, str] as given by the first step
+        self._dirty = set()                     # paths with changes not yet written
+        self._opened_this_step = set()          # paths handed out since begin_step()
+        self._wrote_this_step = False
+        self.loads_avoided = 0
+        self.saves_avoided = 0
+
+    @staticmethod
+    def _key(filename) -> Path:
+        """Normalize a file name so different spellings of one path share a workbook."""
+        return Path(filename).resolve()
+
+    def begin_step(self) -> None:
+        """Start tracking which workbooks the next step opens."""
+        self._opened_this_step = set()
+        self._wrote_this_step = False
+
+    def step_opened_workbooks(self) -> bool:
+        """Check whether the current step has been handed any shared workbook."""
+        return bool(self._opened_this_step)
+
+    def step_wrote_workbooks(self) -> bool:
+        """Check whether pending changes were written to disk during the current step."""
+        return self._wrote_this_step
+
+    def open(self, filename):
+        """
+        Get the shared editable workbook for a file, loading it on first use.
+
+        Args:
+            filename: Path to the Excel file
+
+        Returns:
+            openpyxl Workbook shared with the other steps in the session
+        """
+        key = self._key(filename)
+        self._opened_this_step.add(key)
+
+        workbook = self._workbooks.get(key)
+        if workbook is not None:
+            self.loads_avoided += 1
+            logger.debug(f"Reusing open workbook: {Path(filename).name}")
+            return workbook
+
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(filename)
+        self._workbooks[key] = workbook
+        self._display_names[key] = str(filename)
+        return workbook
+
+    def holds(self, workbook) -> bool:
+        """Check whether a workbook object belongs to this session."""
+        return any(workbook is shared for shared in self._workbooks.values())
+
+    def save(self, workbook, filename) -> None:
+        """
+        Record that a step finished changing a shared workbook.
+
+        Args:
+            workbook: Workbook returned by open()
+            filename: File the step would have saved to
+        """
+        key = self._key(filename)
+        shared = self._workbooks.get(key)
+
+        if shared is workbook:
+            self._settle(workbook)
+            if key in self._dirty:
+                self.saves_avoided += 1
+            self._dirty.add(key)
+            return
+
+        if shared is not None:
+            # Another workbook replaces this file, so the shared copy is out of date
+            self._release(key)
+        workbook.save(filename)
+
+    def flush_path(self, filename) -> None:
+        """
+        Write pending changes so a file can be read from disk.
+
+        All pending workbooks are written, not just the requested one, so the
+        files on disk always match one point in the sequential run.
+        """
+        if self._key(filename) in self._dirty:
+            self.flush()
+            self._wrote_this_step = True
+
+    def flush(self) -> None:
+        """Write every workbook with pending changes."""
+        for key in list(self._dirty):
+            self._write(key)
+
+    def close(self) -> None:
+        """Write pending changes and release all workbooks."""
+        try:
+            self.flush()
+        finally:
+            self.discard()
+
+        if self.loads_avoided or self.saves_avoided:
+            logger.debug(f"Workbook session avoided {self.loads_avoided} loads and {self.saves_avoided} saves")
+
+    def discard(self) -> None:
+        """Release all workbooks without writing pending changes."""
+        for workbook in self._workbooks.values():
+            workbook.close()
+        self._workbooks = {}
+        self._display_names = {}
+        self._dirty = set()
+
+    def pending_files(self) -> list:
+        """File names with changes that have not been written yet."""
+        return [self._display_names[key] for key in self._dirty]
+
+    @staticmethod
+    def _settle(workbook) -> None:
+        """
+        Drop cells a save/load round trip would drop.
+
+        Looking up a cell in openpyxl creates it. Saving skips cells with no
+        value, style or comment, so after a reload they are gone and
+        max_row/max_column shrink back. Removing them here gives the next step
+        the same sheet dimensions it would see after a real save and reload.
+        """
+        from openpyxl.cell.cell import MergedCell
+
+        for worksheet in workbook.worksheets:
+            cells = getattr(worksheet, '_cells', None)
+            if not cells:
+                continue
+            # Merged cells are rebuilt from the merge ranges on load, so they always stay
+            empty = [
+                position for position, cell in cells.items()
+                if cell._value is None and not isinstance(cell, MergedCell)
+                and cell._comment is None and not cell.has_style
+            ]
+            for position in empty:
+                del cells[position]
+
+    def _release(self, key: Path) -> None:
+        """Drop one shared workbook without writing it."""
+        self._workbooks.pop(key).close()
+        self._display_names.pop(key, None)
+        self._dirty.discard(key)
+
+    def _write(self, key: Path) -> None:
+        """Save one shared workbook to its file."""
+        filename = self._display_names[key]
+        try:
+            self._workbooks[key].save(filename)
+        except Exception as e:
+            raise WorkbookSessionError(f"Failed to save shared workbook '{filename}': {e}")
+        self._dirty.discard(key)
+        logger.debug(f"Saved shared workbook: {Path(filename).name}")
+
+
+# End of file #
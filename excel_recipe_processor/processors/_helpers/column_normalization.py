@@ -0,0 +1,156 @@
+"""
+Cached string and lowercase column views for processors.
+
+excel_recipe_processor/processors/_helpers/column_normalization.py
+
+Case-insensitive comparisons need `series.astype(str).str.lower()`, which runs
+a Python-level string operation per row. A processor that compares the same
+column several times in one step can hold a ColumnNormalizationCache so each
+view is computed once and reused. Low-cardinality columns are lowered through
+their unique values (or categories) and expanded back with the codes.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Lower through unique values when uniques are at most this fraction of rows
+LOW_CARDINALITY_RATIO = 0.5
+
+
+def to_str_series(series: pd.Series) -> pd.Series:
+    """
+    Stringify a Series the same way as `series.astype(str)`.
+
+    Args:
+        series: Series to stringify
+
+    Returns:
+        Series of strings with the original index
+    """
+    return _normalize_by_uniques(series, lambda values: values.astype(str))
+
+
+def to_lower_series(series: pd.Series) -> pd.Series:
+    """
+    Lowercase a Series the same way as `series.astype(str).str.lower()`.
+
+    Args:
+        series: Series to lowercase
+
+    Returns:
+        Series of lowercased strings with the original index
+    """
+    return _normalize_by_uniques(series, lambda values: values.astype(str).str.lower())
+
+
+def _normalize_by_uniques(series: pd.Series, normalize) -> pd.Series:
+    """
+    Apply a string normalization once per distinct value when that is cheaper.
+
+    Categorical columns always go through their categories. Other columns are
+    factorized first and only take the unique-value route when the number of
+    distinct values is small compared to the row count and every value is a
+    string. Factorizing merges equal non-strings that stringify differently
+    (1, 1.0 and True share a code), so mixed object columns are normalized
+    row by row.
+    """
+    if len(series) == 0:
+        return normalize(series)
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        uniques = pd.Series(series.cat.categories)
+    elif series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+        codes, unique_values = pd.factorize(series, sort=False)
+        if len(unique_values) > len(series) * LOW_CARDINALITY_RATIO:
+            return normalize(series)
+        if not all(isinstance(value, str) for value in unique_values):
+            return normalize(series)
+        uniques = pd.Series(unique_values)
+    else:
+        # Numeric, boolean and datetime columns stringify quickly in bulk
+        return normalize(series)
+
+    normalized_uniques = normalize(uniques).to_numpy(dtype=object)
+
+    result = np.empty(len(series), dtype=object)
+    valid = codes >= 0
+    result[valid] = normalized_uniques[codes[valid]]
+
+    # Missing values have no code, normalize them directly so 'nan'/'None' match astype(str)
+    if not valid.all():
+        result[~valid] = normalize(series[~valid]).to_numpy(dtype=object)
+
+    return pd.Series(result, index=series.index, name=series.name)
+
+
+class ColumnNormalizationCache:
+    """
+    Per-step cache of stringified and lowercased views of DataFrame columns.
+
+    The cache is bound to one DataFrame at a time. When a processor narrows
+    that frame with a boolean mask, it should call filter_frame() so cached
+    views are narrowed with it instead of being recomputed. Passing a
+    different frame to a lookup method resets the cache.
+    """
+
+    def __init__(self, data: pd.DataFrame = None):
+        """
+        Initialize the cache.
+
+        Args:
+            data: Optional DataFrame to bind the cache to
+        """
+        self._frame = data
+        self._views = {}                        # dict[(kind, column), pd.Series]
+
+    def as_str(self, data: pd.DataFrame, column: str) -> pd.Series:
+        """Get `data[column].astype(str)`, computing it at most once."""
+        return self._get_view(data, column, 'str', to_str_series)
+
+    def as_lower(self, data: pd.DataFrame, column: str) -> pd.Series:
+        """Get `data[column].astype(str).str.lower()`, computing it at most once."""
+        return self._get_view(data, column, 'lower', to_lower_series)
+
+    def filter_frame(self, data: pd.DataFrame, mask: pd.Series) -> pd.DataFrame:
+        """
+        Apply a boolean mask to the bound DataFrame and keep cached views aligned.
+
+        Args:
+            data: DataFrame to filter (normally the bound frame)
+            mask: Boolean mask aligned with data
+
+        Returns:
+            Filtered DataFrame, which becomes the new bound frame
+        """
+        filtered = data[mask]
+
+        if data is self._frame and self._views:
+            positions = np.asarray(mask, dtype=bool)
+            self._views = {key: view[positions] for key, view in self._views.items()}
+        else:
+            self._views = {}
+
+        self._frame = filtered
+        return filtered
+
+    def clear(self) -> None:
+        """Drop all cached views and the bound frame."""
+        self._frame = None
+        self._views = {}
+
+    def _get_view(self, data: pd.DataFrame, column: str, kind: str, build) -> pd.Series:
+        """Return a cached view, rebinding to a new frame if needed."""
+        if data is not self._frame:
+            self._frame = data
+            self._views = {}
+
+        key = (kind, column)
+        if key not in self._views:
+            self._views[key] = build(data[column])
+
+        return self._views[key]
+
+
+# End of file #
@@ -0,0 +1,154 @@
+"""
+Compiled multi-term substring matching for processors.
+
+excel_recipe_processor/processors/_helpers/multi_pattern_matcher.py
+
+Checks whether text contains any of a (possibly long) list of literal terms
+with a single regex scan per string. The terms are merged into a prefix trie
+and emitted as one nested alternation, so the regex engine only branches where
+terms actually diverge instead of trying every term at every position.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+
+class MultiPatternMatcher:
+    """
+    Match text against many literal terms at once.
+
+    Terms are treated as plain text, not regular expressions. A term that is
+    an extension of a shorter term is dropped, since the shorter term already
+    decides the match. An empty term matches every string, the same way
+    `str.contains('')` does.
+    """
+
+    def __init__(self, terms: list, case_sensitive: bool = False):
+        """
+        Compile the term list.
+
+        Args:
+            terms: Literal terms to search for (non-strings are converted with str())
+            case_sensitive: Whether matching respects case
+        """
+        self.case_sensitive = case_sensitive
+
+        normalized_terms = {str(term) if case_sensitive else str(term).lower() for term in terms}
+        self.term_count = len(normalized_terms)
+        self.matches_everything = '' in normalized_terms
+
+        pattern = build_trie_pattern(sorted(normalized_terms)) if normalized_terms else None
+        flags = 0 if case_sensitive else re.IGNORECASE
+        self._regex = re.compile(pattern, flags) if pattern else None
+
+    @property
+    def pattern(self) -> str:
+        """Compiled regex source (empty when nothing or everything matches)."""
+        return self._regex.pattern if self._regex is not None else ''
+
+    def search(self, text: str) -> bool:
+        """Return True if text contains any of the terms."""
+        if self.matches_everything:
+            return True
+        if self._regex is None:
+            return False
+        return self._regex.search(text) is not None
+
+    def match_series(self, series: pd.Series) -> pd.Series:
+        """
+        Build a boolean mask of rows containing any term.
+
+        Each distinct value is scanned once and the result is expanded back to
+        all rows, which pays off on the repetitive text columns typical of
+        exports. Missing values never match.
+
+        Args:
+            series: Series of strings to scan
+
+        Returns:
+            Boolean Series aligned with the input
+        """
+        if self.matches_everything:
+            return series.notna()
+
+        if self._regex is None:
+            return pd.Series(False, index=series.index, name=series.name)
+
+        codes, uniques = pd.factorize(series, sort=False)
+
+        search = self._regex.search
+        unique_hits = np.fromiter(
+            (search(str(value)) is not None for value in uniques),
+            dtype=bool,
+            count=len(uniques)
+        )
+
+        result = np.zeros(len(series), dtype=bool)
+        valid = codes >= 0
+        result[valid] = unique_hits[codes[valid]]
+
+        return pd.Series(result, index=series.index, name=series.name)
+
+
+def build_trie_pattern(terms: list) -> str:
+    """
+    Build a regex that matches any of the given literal terms.
+
+    Args:
+        terms: Non-empty list of literal strings
+
+    Returns:
+        Regex source string with shared prefixes factored out
+    """
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[None] = True                       # Marks the end of a complete term
+
+    return _node_pattern(trie)
+
+
+def _node_pattern(node: dict) -> str:
+    """Emit the regex for one trie node (iterative to cope with very long terms)."""
+    # Post-order walk: build children before their parents
+    stack = [(node, False)]
+    patterns = {}
+    while stack:
+        current, children_done = stack.pop()
+        if None in current:
+            # A complete term ends here, so nothing below can change the outcome
+            patterns[id(current)] = ''
+            continue
+        if not children_done:
+            stack.append((current, True))
+            for child in current.values():
+                stack.append((child, False))
+            continue
+
+        branches = []
+        single_chars = []
+        for char in sorted(current):
+            child_pattern = patterns[id(current[char])]
+            if child_pattern == '':
+                single_chars.append(re.escape(char))
+            else:
+                branches.append(re.escape(char) + child_pattern)
+
+        if len(single_chars) == 1:
+            branches.append(single_chars[0])
+        elif single_chars:
+            branches.append('[' + ''.join(single_chars) + ']')
+
+        if len(branches) == 1:
+            patterns[id(current)] = branches[0]
+        else:
+            patterns[id(current)] = '(?:' + '|'.join(branches) + ')'
+
+    return patterns[id(node)]
+
+
+# End of file #
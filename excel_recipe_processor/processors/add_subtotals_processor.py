@@ -4,16 +4,21 @@ Add subtotals step processor for Excel automation recipes.
 Handles inserting subtotal rows into grouped data with various aggregation functions.
 """
 
+import numpy as np
 import pandas as pd
 import logging
 
 from typing import Any, Union
 
 from excel_recipe_processor.core.base_processor import BaseStepProcessor, StepProcessorError
+from excel_recipe_processor.processors._helpers.multi_pattern_matcher import MultiPatternMatcher
 
 
 logger = logging.getLogger(__name__)
 
+# Text that marks a row as an existing (grand) total
+TOTAL_INDICATORS = ['Grand Total', 'Total', 'All', 'Grand_Total', 'TOTAL']
+
 
 class AddSubtotalsProcessor(BaseStepProcessor):
     """
@@ -62,9 +67,12 @@ class AddSubtotalsProcessor(BaseStepProcessor):
         subtotal_label = self.get_config_value('subtotal_label', 'Subtotal')
         position = self.get_config_value('position', 'after_group')
         preserve_totals = self.get_config_value('preserve_totals', True)
+        subtotal_levels = self.get_config_value('subtotal_levels', None)
         
         # Validate configuration
-        self._validate_subtotal_config(data, group_by, subtotal_columns, subtotal_functions, position)
+        self._validate_subtotal_config(
+            data, group_by, subtotal_columns, subtotal_functions, position, subtotal_levels
+        )
         
         try:
             # Detect and preserve existing grand totals if requested
@@ -75,7 +83,7 @@ class AddSubtotalsProcessor(BaseStepProcessor):
             # Add subtotals to the data
             result_data = self._add_subtotals_to_data(
                 data, group_by, subtotal_columns, subtotal_functions, 
-                subtotal_label, position, existing_totals
+                subtotal_label, position, existing_totals, subtotal_levels
             )
             
             subtotal_count = self._count_subtotal_rows(result_data, subtotal_label)
@@ -92,7 +100,7 @@ class AddSubtotalsProcessor(BaseStepProcessor):
     
     def _validate_subtotal_config(self, df: pd.DataFrame, group_by: list, 
                                  subtotal_columns: list, subtotal_functions: list, 
-                                 position: str) -> None:
+                                 position: str, subtotal_levels: Union[list, str, None] = None) -> None:
         """
         Validate subtotal configuration parameters.
         
@@ -102,6 +110,7 @@ class AddSubtotalsProcessor(BaseStepProcessor):
             subtotal_columns: Columns to calculate subtotals for
             subtotal_functions: Aggregation functions
             position: Where to place subtotals
+            subtotal_levels: Group columns that get their own subtotal rows
         """
         # Validate group_by
         if not isinstance(group_by, list) or len(group_by) == 0:
@@ -144,6 +153,18 @@ class AddSubtotalsProcessor(BaseStepProcessor):
         valid_positions = ['before_group', 'after_group']
         if position not in valid_positions:
             raise StepProcessorError(f"Position '{position}' not supported. Valid positions: {valid_positions}")
+        
+        # Validate subtotal_levels
+        if subtotal_levels is not None and subtotal_levels != 'all':
+            if not isinstance(subtotal_levels, list) or len(subtotal_levels) == 0:
+                raise StepProcessorError(
+                    "'subtotal_levels' must be 'all' or a non-empty list of group_by column names"
+                )
+            for col in subtotal_levels:
+                if col not in group_by:
+                    raise StepProcessorError(
+                        f"Subtotal level '{col}' is not one of the group_by columns: {group_by}"
+                    )
     
     def _extract_existing_totals(self, df: pd.DataFrame) -> Union[pd.DataFrame, None]:
         """
@@ -155,29 +176,28 @@ class AddSubtotalsProcessor(BaseStepProcessor):
         Returns:
             DataFrame with grand total rows, or None if none found
         """
-        # Look for common grand total indicators
-        total_indicators = ['Grand Total', 'Total', 'All', 'Grand_Total', 'TOTAL']
+        # Check if any rows contain common total indicators in the first few columns
+        total_mask = self._find_total_rows(df)
         
-        # Check if any rows contain these indicators in the first few columns
-        total_rows = []
-        for idx, row in df.iterrows():
-            row_values = [str(val).strip() for val in row.iloc[:3]]  # Check first 3 columns
-            if any(indicator in ' '.join(row_values) for indicator in total_indicators):
-                total_rows.append(idx)
-        
-        if total_rows:
-            logger.debug(f"Found {len(total_rows)} existing total rows to preserve")
-            return df.loc[total_rows].copy()
+        if total_mask.any():
+            logger.debug(f"Found {int(total_mask.sum())} existing total rows to preserve")
+            return df[total_mask].copy()
         
         return None
     
     def _add_subtotals_to_data(self, df: pd.DataFrame, group_by: list, 
                               subtotal_columns: list, subtotal_functions: list,
                               subtotal_label: str, position: str, 
-                              existing_totals: Union[pd.DataFrame, None]) -> pd.DataFrame:
+                              existing_totals: Union[pd.DataFrame, None],
+                              subtotal_levels: Union[list, str, None] = None) -> pd.DataFrame:
         """
         Add subtotal rows to the DataFrame.
         
+        Subtotal rows for every level are built with one groupby().agg() per
+        level and tagged with an ordering key (anchor row position, rank).
+        A single concat followed by a stable sort on that key interleaves them
+        with the data rows, so no rows are copied one at a time.
+        
         Args:
             df: Input DataFrame
             group_by: Columns to group by
@@ -186,57 +206,54 @@ class AddSubtotalsProcessor(BaseStepProcessor):
             subtotal_label: Label for subtotal rows
             position: Where to place subtotals
             existing_totals: Previously extracted total rows
+            subtotal_levels: Group columns that get their own subtotal rows,
+                'all' for every level, or None for one subtotal per full group
             
         Returns:
             DataFrame with subtotal rows added
         """
         # Remove existing totals temporarily if preserving them
-        working_df = df.copy()
+        working_df = df
         if existing_totals is not None:
-            # Remove total rows from working data
-            total_indicators = ['Grand Total', 'Total', 'All', 'Grand_Total', 'TOTAL']
-            mask = working_df.apply(
-                lambda row: not any(indicator in str(val) for val in row.iloc[:3] for indicator in total_indicators),
-                axis=1
-            )
-            working_df = working_df[mask]
+            working_df = df[~self._find_total_rows(df)]
         
-        # Sort by grouping columns to ensure proper grouping
-        sorted_df = working_df.sort_values(group_by)
+        # Stable sort keeps the original row order inside each group
+        sorted_df = working_df.sort_values(group_by, kind='stable', na_position='last')
+        sorted_df = sorted_df.reset_index(drop=True)
         
-        # Build result by processing groups
-        result_rows = []
-        
-        # Group by the specified columns
-        grouped = sorted_df.groupby(group_by, sort=False)
-        
-        for group_key, group_data in grouped:
-            # Add subtotal before group if requested
-            if position == 'before_group':
-                subtotal_row = self._create_subtotal_row(
-                    group_data, group_by, subtotal_columns, subtotal_functions, 
-                    subtotal_label, 0  # Use 0 for level since we're doing simple grouping
-                )
-                result_rows.append(subtotal_row)
+        if len(sorted_df) == 0:
+            result_df = sorted_df
+        else:
+            level_specs = self._resolve_level_specs(group_by, subtotal_levels)
+            max_depth = len(group_by)
             
-            # Add all data rows for this group
-            for _, row in group_data.iterrows():
-                result_rows.append(row.copy())
+            # Data rows keep their sorted position with rank 0
+            pieces = [sorted_df]
+            order_positions = [np.arange(len(sorted_df))]
+            order_ranks = [np.zeros(len(sorted_df), dtype=np.int64)]
             
-            # Add subtotal after group if requested
-            if position == 'after_group':
-                subtotal_row = self._create_subtotal_row(
-                    group_data, group_by, subtotal_columns, subtotal_functions, 
-                    subtotal_label, 0  # Use 0 for level since we're doing simple grouping
+            level_codes = [pd.factorize(sorted_df[col], sort=False)[0] for col in group_by]
+            
+            for depth, label_level in level_specs:
+                group_ids, starts, ends = self._contiguous_groups(level_codes[:depth])
+                
+                subtotal_rows = self._build_subtotal_rows(
+                    sorted_df, group_ids, starts, group_by, subtotal_columns,
+                    subtotal_functions, subtotal_label, label_level
                 )
-                result_rows.append(subtotal_row)
-        
-        # Create result DataFrame
-        if result_rows:
-            result_df = pd.DataFrame(result_rows)
-            result_df = result_df.reset_index(drop=True)
-        else:
-            result_df = working_df.copy()
+                pieces.append(subtotal_rows)
+                
+                # Before the group: outer levels first. After the group: inner levels first.
+                if position == 'before_group':
+                    order_positions.append(starts)
+                    order_ranks.append(np.full(len(starts), depth - max_depth - 1, dtype=np.int64))
+                else:
+                    order_positions.append(ends)
+                    order_ranks.append(np.full(len(ends), max_depth - depth + 1, dtype=np.int64))
+            
+            combined = pd.concat(pieces, ignore_index=True)
+            order = np.lexsort((np.concatenate(order_ranks), np.concatenate(order_positions)))
+            result_df = combined.take(order).reset_index(drop=True)
         
         # Re-add preserved totals at the end
         if existing_totals is not None:
@@ -244,68 +261,107 @@ class AddSubtotalsProcessor(BaseStepProcessor):
         
         return result_df
     
-    def _create_subtotal_row(self, group_data: pd.DataFrame, group_columns: list,
-                            subtotal_columns: list, subtotal_functions: list,
-                            subtotal_label: str, level: int) -> pd.Series:
+    def _resolve_level_specs(self, group_by: list,
+                             subtotal_levels: Union[list, str, None]) -> list:
         """
-        Create a single subtotal row for a group.
+        Turn the subtotal_levels setting into (group depth, label level) pairs.
         
         Args:
-            group_data: Data for the current group
-            group_columns: Columns that define the group
+            group_by: Columns to group by
+            subtotal_levels: Configured subtotal levels
+            
+        Returns:
+            List of (number of leading group columns, index of the labelled column)
+        """
+        if subtotal_levels is None:
+            # One subtotal per full group, labelled in the first group column
+            return [(len(group_by), 0)]
+        
+        if subtotal_levels == 'all':
+            level_columns = group_by
+        else:
+            level_columns = subtotal_levels
+        
+        levels = sorted({group_by.index(col) for col in level_columns})
+        return [(level + 1, level) for level in levels]
+    
+    def _contiguous_groups(self, key_codes: list) -> tuple:
+        """
+        Find the groups of a sorted frame from factorized key columns.
+        
+        Args:
+            key_codes: Factorized codes for each leading group column
+            
+        Returns:
+            Tuple of (group id per row, first row of each group, last row of each group)
+        """
+        row_count = len(key_codes[0])
+        boundaries = np.zeros(row_count, dtype=bool)
+        boundaries[0] = True
+        for codes in key_codes:
+            boundaries[1:] |= codes[1:] != codes[:-1]
+        
+        starts = np.flatnonzero(boundaries)
+        ends = np.append(starts[1:] - 1, row_count - 1)
+        group_ids = np.cumsum(boundaries) - 1
+        
+        return group_ids, starts, ends
+    
+    def _build_subtotal_rows(self, sorted_df: pd.DataFrame, group_ids: np.ndarray,
+                             starts: np.ndarray, group_columns: list,
+                             subtotal_columns: list, subtotal_functions: list,
+                             subtotal_label: str, level: int) -> pd.DataFrame:
+        """
+        Create the subtotal rows for every group of one level.
+        
+        Args:
+            sorted_df: Data sorted by the group columns
+            group_ids: Group id for each row of sorted_df
+            starts: Position of the first row of each group
+            group_columns: Columns that define the groups
             subtotal_columns: Columns to calculate subtotals for
             subtotal_functions: Functions to use for calculation
-            subtotal_label: Label for the subtotal row
-            level: Grouping level (0 = outermost)
+            subtotal_label: Label for the subtotal rows
+            level: Group column that carries the label (0 = outermost)
             
         Returns:
-            Series representing the subtotal row
+            DataFrame with one subtotal row per group
         """
-        # Start with the first row as a template
-        subtotal_row = group_data.iloc[0].copy()
+        # Start with the first row of each group as a template
+        subtotal_rows = sorted_df.take(starts).reset_index(drop=True)
         
         # Set group identification values
         for i, col in enumerate(group_columns):
             if i == level:
                 # This is the level we're subtotaling - use label
-                group_value = group_data.iloc[0][col]
-                subtotal_row[col] = f"{subtotal_label}: {group_value}"
-            elif i < level:
-                # Higher level - keep the group value
-                subtotal_row[col] = group_data.iloc[0][col]
-            else:
+                subtotal_rows[col] = [f"{subtotal_label}: {value}" for value in subtotal_rows[col]]
+            elif i > level:
                 # Lower level - clear the value
-                subtotal_row[col] = ""
+                subtotal_rows[col] = ""
         
-        # Calculate subtotals for specified columns
-        for col in subtotal_columns:
-            if col in group_data.columns:
-                # Use the first function if only one specified, otherwise try to match column to function
-                func_idx = min(subtotal_columns.index(col), len(subtotal_functions) - 1)
-                func = subtotal_functions[func_idx]
-                
+        # Use the first function if only one specified, otherwise match column to function
+        agg_spec = {
+            col: subtotal_functions[min(i, len(subtotal_functions) - 1)]
+            for i, col in enumerate(subtotal_columns)
+        }
+        
+        grouped = sorted_df[subtotal_columns].groupby(group_ids, sort=False)
+        try:
+            totals = grouped.agg(agg_spec)
+        except Exception:
+            # Fall back to column by column so one bad column doesn't sink the rest
+            totals = pd.DataFrame(index=range(len(starts)))
+            for col, func in agg_spec.items():
                 try:
-                    if func == 'sum':
-                        subtotal_row[col] = group_data[col].sum()
-                    elif func == 'count':
-                        subtotal_row[col] = group_data[col].count()
-                    elif func == 'mean':
-                        subtotal_row[col] = group_data[col].mean()
-                    elif func == 'min':
-                        subtotal_row[col] = group_data[col].min()
-                    elif func == 'max':
-                        subtotal_row[col] = group_data[col].max()
-                    elif func == 'nunique':
-                        subtotal_row[col] = group_data[col].nunique()
-                    elif func == 'std':
-                        subtotal_row[col] = group_data[col].std()
-                    elif func == 'var':
-                        subtotal_row[col] = group_data[col].var()
+                    totals[col] = grouped[col].agg(func).to_numpy()
                 except Exception as e:
                     logger.warning(f"Could not calculate {func} for column {col}: {e}")
-                    subtotal_row[col] = 0
+                    totals[col] = 0
         
-        return subtotal_row
+        for col in subtotal_columns:
+            subtotal_rows[col] = totals[col].to_numpy()
+        
+        return subtotal_rows
     
     def _count_subtotal_rows(self, df: pd.DataFrame, subtotal_label: str) -> int:
         """
@@ -318,12 +374,30 @@ class AddSubtotalsProcessor(BaseStepProcessor):
         Returns:
             Number of subtotal rows
         """
-        count = 0
-        for _, row in df.iterrows():
-            row_str = ' '.join(str(val) for val in row.iloc[:3])
-            if subtotal_label in row_str:
-                count += 1
-        return count
+        return int(self._rows_containing(df, [subtotal_label]).sum())
+    
+    def _find_total_rows(self, df: pd.DataFrame) -> pd.Series:
+        """Build a mask of rows that look like existing total rows."""
+        return self._rows_containing(df, TOTAL_INDICATORS)
+    
+    def _rows_containing(self, df: pd.DataFrame, terms: list) -> pd.Series:
+        """
+        Build a mask of rows whose first three columns contain any of the terms.
+        
+        Args:
+            df: DataFrame to scan
+            terms: Literal text to look for
+            
+        Returns:
+            Boolean Series aligned with df
+        """
+        matcher = MultiPatternMatcher(terms, case_sensitive=True)
+        mask = np.zeros(len(df), dtype=bool)
+        for i in range(min(3, len(df.columns))):
+            column = df.iloc[:, i]
+            # Missing values read as 'nan'/'None', which never holds a label
+            mask |= matcher.match_series(column).to_numpy()
+        return pd.Series(mask, index=df.index)
     
     def get_supported_functions(self) -> list:
         """
@@ -437,5 +511,6 @@ class SubtotalUtils:
             'subtotal_functions': ['sum'],
             'subtotal_label': 'Subtotal',
             'position': 'after_group',
-            'preserve_totals': True
+            'preserve_totals': True,
+            'subtotal_levels': None
         }
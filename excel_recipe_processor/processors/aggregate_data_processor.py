@@ -9,10 +9,15 @@ with support for:
 - Multiple aggregation source types and validation features
 """
 
-import pandas as pd
+import os
 import logging
+import multiprocessing
+
+import numpy as np
+import pandas as pd
 
 from typing import Any, Union
+from concurrent.futures import ProcessPoolExecutor
 
 from excel_recipe_processor.core.file_reader import FileReader, FileReaderError
 from excel_recipe_processor.core.stage_manager import StageManager, StageError
@@ -21,6 +26,29 @@ from excel_recipe_processor.core.base_processor import BaseStepProcessor, StepPr
 
 logger = logging.getLogger(__name__)
 
+# Frames smaller than this are aggregated serially unless parallel_min_rows says otherwise
+DEFAULT_PARALLEL_MIN_ROWS = 1_000_000
+
+
+# Input of the running parallel aggregation, inherited by forked workers instead of pickled
+_shared_partition_source = None
+
+
+def _aggregate_partition(values: pd.DataFrame, group_ids: np.ndarray, named_aggregations: dict) -> pd.DataFrame:
+    """
+    Aggregate one partition of rows by precomputed group id.
+    
+    Runs in a worker process, so it lives at module level to be picklable.
+    """
+    return values.groupby(group_ids, sort=True).agg(**named_aggregations)
+
+
+def _aggregate_shared_partition(partition: int, workers: int) -> pd.DataFrame:
+    """Select and aggregate one partition of the frame inherited from the parent process."""
+    values, group_ids, named_aggregations = _shared_partition_source
+    rows = np.flatnonzero((group_ids >= 0) & (group_ids % workers == partition))
+    return _aggregate_partition(values.take(rows), group_ids[rows], named_aggregations)
+
 
 class AggregateDataProcessor(BaseStepProcessor):
     """
@@ -75,6 +103,8 @@ class AggregateDataProcessor(BaseStepProcessor):
         keep_group_columns = self.get_config_value('keep_group_columns', True)
         sort_by_groups = self.get_config_value('sort_by_groups', True)
         reset_index = self.get_config_value('reset_index', True)
+        observed = self.get_config_value('observed', True)
+        parallel_workers = self.get_config_value('parallel_workers', 1)
         save_to_stage = self.get_config_value('save_to_stage', None)
         stage_overwrite = self.get_config_value('stage_overwrite', False)
         stage_description = self.get_config_value('stage_description', '')
@@ -86,14 +116,11 @@ class AggregateDataProcessor(BaseStepProcessor):
         # Validate configuration
         self._validate_aggregation_config(data, group_by, aggregations)
         
-        # Work on a copy
-        result_data = data.copy()
-        
         try:
-            # Perform the aggregation
+            # Perform the aggregation (groupby never modifies the input, so no copy is needed)
             result_data = self._perform_aggregation(
-                result_data, group_by, aggregations, keep_group_columns, 
-                sort_by_groups, reset_index
+                data, group_by, aggregations, keep_group_columns, 
+                sort_by_groups, reset_index, observed, parallel_workers
             )
             
             # Save to stage if requested
@@ -463,10 +490,14 @@ class AggregateDataProcessor(BaseStepProcessor):
     
     def _perform_aggregation(self, df: pd.DataFrame, group_by: Union[str, list], 
                            aggregations: list, keep_group_columns: bool,
-                           sort_by_groups: bool, reset_index: bool) -> pd.DataFrame:
+                           sort_by_groups: bool, reset_index: bool,
+                           observed: bool = True, parallel_workers: Union[int, str] = 1) -> pd.DataFrame:
         """
         Perform the actual aggregation operation.
         
+        Uses pandas named aggregation, so every result column gets its output
+        name directly and appears in the order the aggregations are listed.
+        
         Args:
             df: DataFrame to aggregate
             group_by: Column(s) to group by
@@ -474,6 +505,8 @@ class AggregateDataProcessor(BaseStepProcessor):
             keep_group_columns: Whether to keep group columns in result
             sort_by_groups: Whether to sort by group columns
             reset_index: Whether to reset index after grouping
+            observed: Only include observed combinations of categorical group columns
+            parallel_workers: Worker processes for large frames (1 = serial, 'auto' = all cores)
             
         Returns:
             Aggregated DataFrame
@@ -486,46 +519,30 @@ class AggregateDataProcessor(BaseStepProcessor):
         if isinstance(aggregations, dict):
             aggregations = [aggregations]
         
-        # Create the groupby object
-        grouped = df.groupby(group_by, sort=sort_by_groups)
-        
-        # Build aggregation dictionary for pandas
-        agg_dict = {}
-        column_renames = {}
-        
+        # Build named aggregations: output name -> (column, function)
+        named_aggregations = {}
         for agg in aggregations:
             column = agg['column']
             function = agg['function']
             # Support both 'new_column_name' and 'output_name' for backward compatibility
             new_name = agg.get('new_column_name', agg.get('output_name', f"{column}_{function}"))
             
-            # Handle multiple aggregations on the same column
-            if column not in agg_dict:
-                agg_dict[column] = []
-            
-            agg_dict[column].append(function)
+            if new_name in named_aggregations:
+                raise StepProcessorError(
+                    f"Duplicate aggregation output name '{new_name}'. "
+                    f"Set 'new_column_name' to give each aggregation a unique name"
+                )
             
-            # Track what to rename columns to
-            current_name = f"{column}_{function}" if len(agg_dict[column]) > 1 else column
-            column_renames[current_name] = new_name
+            named_aggregations[new_name] = pd.NamedAgg(column=column, aggfunc=function)
         
-        # Perform the aggregation
-        result = grouped.agg(agg_dict)
+        # Create the groupby object and perform the aggregation
+        grouped = df.groupby(group_by, sort=sort_by_groups, observed=observed)
         
-        # Flatten multi-level columns if necessary
-        if result.columns.nlevels > 1:
-            result.columns = ['_'.join(col).strip() for col in result.columns.values]
-        
-        # Apply column renames
-        rename_dict = {}
-        for old_name, new_name in column_renames.items():
-            # Find the actual column name in result
-            matching_cols = [col for col in result.columns if old_name in col]
-            if matching_cols:
-                rename_dict[matching_cols[0]] = new_name
-        
-        if rename_dict:
-            result = result.rename(columns=rename_dict)
+        workers = self._resolve_parallel_workers(df, group_by, observed, parallel_workers)
+        if workers > 1:
+            result = self._aggregate_in_parallel(df, grouped, group_by, named_aggregations, workers)
+        else:
+            result = grouped.agg(**named_aggregations)
         
         # Reset index if requested (brings group columns back as regular columns)
         if reset_index:
@@ -537,6 +554,135 @@ class AggregateDataProcessor(BaseStepProcessor):
         
         return result
     
+    def _resolve_parallel_workers(self, df: pd.DataFrame, group_by: list, observed: bool,
+                                  parallel_workers: Union[int, str]) -> int:
+        """
+        Decide how many worker processes to use for an aggregation.
+        
+        Args:
+            df: DataFrame to aggregate
+            group_by: Columns to group by
+            observed: Whether only observed categorical combinations are kept
+            parallel_workers: Configured worker count, or 'auto' for all cores
+            
+        Returns:
+            Number of workers, 1 meaning a serial aggregation
+        """
+        if parallel_workers == 'auto':
+            parallel_workers = os.cpu_count() or 1
+        
+        if isinstance(parallel_workers, bool) or not isinstance(parallel_workers, int) or parallel_workers < 1:
+            raise StepProcessorError(
+                f"'parallel_workers' must be a positive integer or 'auto', got: {parallel_workers}"
+            )
+        
+        if parallel_workers == 1:
+            return 1
+        
+        min_rows = self.get_config_value('parallel_min_rows', DEFAULT_PARALLEL_MIN_ROWS)
+        if len(df) < min_rows:
+            logger.debug(f"Aggregating {len(df)} rows serially (parallel_min_rows is {min_rows})")
+            return 1
+        
+        # Unobserved category combinations have no rows to partition
+        if not observed and any(isinstance(df[col].dtype, pd.CategoricalDtype) for col in group_by):
+            logger.debug("Aggregating serially because observed is false for categorical group columns")
+            return 1
+        
+        return parallel_workers
+    
+    def _aggregate_in_parallel(self, df: pd.DataFrame, grouped, group_by: list,
+                               named_aggregations: dict, workers: int) -> pd.DataFrame:
+        """
+        Aggregate row partitions in a process pool and combine the results.
+        
+        Rows are partitioned by group, so every group is aggregated whole by
+        one worker with its rows in their original order. Each partial result
+        is therefore identical to the serial one, for every function,
+        including floating point sums and means. Partials come back indexed by
+        group number and are put back in the serial group order.
+        
+        Args:
+            df: DataFrame to aggregate
+            grouped: Serial groupby object, used for group numbers and order
+            group_by: Columns to group by
+            named_aggregations: Output name -> NamedAgg specification
+            workers: Number of worker processes
+            
+        Returns:
+            Aggregated DataFrame indexed like the serial groupby result
+        """
+        # Rows with missing keys get no group number (NaN), mark them with -1
+        group_ids = grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+        group_count = grouped.ngroups
+        workers = min(workers, group_count)
+        
+        if workers < 2:
+            return grouped.agg(**named_aggregations)
+        
+        value_columns = list(dict.fromkeys(agg.column for agg in named_aggregations.values()))
+        values = df[value_columns]
+        
+        try:
+            partials = self._run_partitions(values, group_ids, named_aggregations, workers)
+        except Exception as e:
+            logger.warning(f"Parallel aggregation failed ({e}), aggregating serially")
+            return grouped.agg(**named_aggregations)
+        
+        result = pd.concat(partials).sort_index()
+        
+        # Rebuild the group key index from the first row of each group
+        first_rows = pd.Series(group_ids).drop_duplicates()
+        first_rows = first_rows[first_rows.to_numpy() >= 0]
+        key_positions = np.empty(group_count, dtype=np.int64)
+        key_positions[first_rows.to_numpy()] = first_rows.index.to_numpy()
+        
+        keys = df[group_by].take(key_positions)
+        if len(group_by) == 1:
+            result.index = pd.Index(keys[group_by[0]].to_numpy(), name=group_by[0], dtype=keys[group_by[0]].dtype)
+        else:
+            result.index = pd.MultiIndex.from_frame(keys)
+        
+        logger.debug(f"Aggregated {len(df)} rows into {group_count} groups with {workers} workers")
+        return result
+    
+    def _run_partitions(self, values: pd.DataFrame, group_ids: np.ndarray,
+                        named_aggregations: dict, workers: int) -> list:
+        """
+        Aggregate each partition of rows in its own worker process.
+        
+        Partition p holds the groups whose number modulo the worker count is
+        p, which spreads groups evenly. Rows with missing keys (group id -1)
+        are dropped, as in the serial groupby. Forked workers read the frame
+        inherited from this process and select their own rows; other start
+        methods receive their partition pickled.
+        
+        Returns:
+            List of partial results indexed by group number
+        """
+        global _shared_partition_source
+        
+        context = multiprocessing.get_context()
+        
+        if context.get_start_method() == 'fork':
+            _shared_partition_source = (values, group_ids, named_aggregations)
+            try:
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                    return list(pool.map(_aggregate_shared_partition, range(workers), [workers] * workers))
+            finally:
+                _shared_partition_source = None
+        
+        partition_of_row = np.where(group_ids >= 0, group_ids % workers, -1)
+        frames = []
+        partition_ids = []
+        for partition in range(workers):
+            rows = np.flatnonzero(partition_of_row == partition)
+            frames.append(values.take(rows))
+            partition_ids.append(group_ids[rows])
+        
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            return list(pool.map(_aggregate_partition, frames, partition_ids, [named_aggregations] * workers))
+    
     # =============================================================================
     # ENHANCED CAPABILITIES AND ANALYSIS METHODS
     # =============================================================================
@@ -567,7 +713,8 @@ class AggregateDataProcessor(BaseStepProcessor):
                 'single_column_grouping',
                 'multi_column_grouping',
                 'sorting_control',
-                'index_management'
+                'index_management',
+                'observed_only_categories'
             ],
             'output_features': [
                 'custom_column_naming',
@@ -10,7 +10,19 @@ logger = logging.getLogger(__name__)
 
 
 class CopyStageProcessor(BaseStepProcessor):
-    """Processor for saving current data as a named stage."""
+    """
+    Processor for saving current data as a named stage.
+    
+    In a recipe the copy shares column data with the source stage. Stored
+    stages are never modified in place, and steps that change data load
+    their own copy, so the stages stay independent without duplicating memory.
+    """
+    
+    shares_column_data = True
+    
+    def __init__(self, step_config: dict):
+        super().__init__(step_config)
+        self._stage_view = None                 # Frame handed out by load_input_data()
     
     @classmethod
     def get_minimal_config(cls) -> dict:
@@ -25,10 +37,14 @@ class CopyStageProcessor(BaseStepProcessor):
             raise StepProcessorError(f"Save stage step '{self.step_name}' requires a pandas DataFrame")
         
         self.validate_data_not_empty(data)
-        self.validate_required_fields(['stage_name'])
         
-        # Get configuration
-        stage_name = self.get_config_value('stage_name')
+        # Get configuration ('target_stage' is the name used in recipes)
+        stage_name = self.get_config_value('stage_name') or self.get_config_value('target_stage')
+        if not stage_name:
+            raise StepProcessorError(
+                f"Step '{self.step_name}' missing required fields: stage_name (or target_stage)"
+            )
+        
         overwrite = self.get_config_value('overwrite', False)
         description = self.get_config_value('description', '')
         
@@ -39,7 +55,9 @@ class CopyStageProcessor(BaseStepProcessor):
                 data=data,
                 overwrite=overwrite,
                 description=description,
-                step_name=self.step_name
+                step_name=self.step_name,
+                # Only a view of a stored stage is safe to keep without copying
+                share_data=data is self._stage_view
             )
             
             result_info = f"saved stage '{stage_name}' ({len(data)} rows, {len(data.columns)} columns)"
@@ -51,6 +69,16 @@ class CopyStageProcessor(BaseStepProcessor):
             # ✅ Convert StageError to StepProcessorError for consistency
             raise StepProcessorError(f"Error saving stage in step '{self.step_name}': {e}")
     
+    def load_input_data(self) -> pd.DataFrame:
+        """Load the source stage as a view of its stored column data."""
+        self._stage_view = super().load_input_data()
+        return self._stage_view
+    
+    def save_output_data(self, data) -> None:
+        """Also save the pass-through data when save_to_stage is given."""
+        if self.save_to_stage:
+            super().save_output_data(data)
+    
     def get_capabilities(self) -> dict:
         """Get processor capabilities information."""
         return {
@@ -8,6 +8,8 @@ between a baseline (reference) dataset and current (source) dataset.
 """
 
 import json
+import hashlib
+import numpy as np
 import pandas as pd
 import logging
 
@@ -60,6 +62,7 @@ class DiffDataProcessor(BaseStepProcessor):
         self.filtered_stage_prefix = self.get_config_value('filtered_stage_prefix', 'stg_diff')
         self.include_json_details = self.get_config_value('include_json_details', False)
         self.handle_deleted_rows = self.get_config_value('handle_deleted_rows', 'include')
+        self.row_hash_column = self.get_config_value('row_hash_column', None)
         
         # Validate configuration
         self._validate_config()
@@ -94,6 +97,12 @@ class DiffDataProcessor(BaseStepProcessor):
         # Validate exclude_columns is a list
         if not isinstance(self.exclude_columns, list):
             raise StepProcessorError("exclude_columns must be a list")
+        
+        # Validate row_hash_column is a column name
+        if self.row_hash_column is not None and not isinstance(self.row_hash_column, str):
+            raise StepProcessorError(
+                f"row_hash_column must be a column name string, got {type(self.row_hash_column)}"
+            )
     
     def execute(self, data: Any) -> pd.DataFrame:
         """
@@ -141,52 +150,84 @@ class DiffDataProcessor(BaseStepProcessor):
         """
         Perform the main diff analysis between current and reference data.
         
+        Rows are paired with one outer merge on the key columns. Paired rows whose
+        row hashes match are unchanged; the rest are compared a column at a time,
+        and change details are only formatted for the rows that actually changed.
+        
         Args:
             current_data: Current/source dataset
             reference_data: Reference/baseline dataset
             
         Returns:
-            DataFrame with all rows and diff metadata
+            DataFrame with all rows and diff metadata (current rows in their
+            original order, followed by deleted rows in reference order)
         """
         # Validate key columns exist in both datasets
         self._validate_key_columns(current_data, reference_data)
         
         # Create comparison datasets with standardized key handling
-        current_indexed = self._prepare_data_for_comparison(current_data, 'current')
-        reference_indexed = self._prepare_data_for_comparison(reference_data, 'reference')
+        current_rows = self._prepare_data_for_comparison(current_data, 'current')
+        reference_rows = self._prepare_data_for_comparison(reference_data, 'reference')
         
-        # Identify different types of rows
-        all_keys = self._get_all_keys(current_indexed, reference_indexed)
+        # Pair rows by key: positions into current_rows / reference_rows (-1 = missing)
+        current_positions, reference_positions = self._match_rows(current_rows, reference_rows)
         
-        results = []
+        in_current = current_positions >= 0
+        in_both = in_current & (reference_positions >= 0)
         
-        for key in all_keys:
-            current_row = current_indexed.get(key)
-            reference_row = reference_indexed.get(key)
-            
-            if current_row is not None and reference_row is not None:
-                # Row exists in both - check if changed
-                result_row = self._analyze_row_changes(current_row, reference_row, key)
-            elif current_row is not None:
-                # New row (exists only in current)
-                result_row = self._create_new_row_result(current_row)
-            else:
-                # Deleted row (exists only in reference)
-                if self.handle_deleted_rows != 'exclude':
-                    result_row = self._create_deleted_row_result(reference_row)
-                else:
-                    continue  # Skip deleted rows
-            
-            results.append(result_row)
+        if self.handle_deleted_rows == 'exclude':
+            current_positions = current_positions[in_current]
+            reference_positions = reference_positions[in_current]
+            in_both = in_both[in_current]
+            in_current = in_current[in_current]
         
-        # Convert results to DataFrame
-        if results:
-            diff_result = pd.concat(results, ignore_index=True)
-        else:
+        if len(current_positions) == 0:
             # Create empty result with correct structure
-            diff_result = self._create_empty_result_structure(current_data)
+            return self._create_empty_result_structure(current_data)
         
-        return diff_result
+        # Row hashes settle most paired rows, only the others are compared column by column
+        comparison_columns = self._get_comparison_columns(current_rows.columns)
+        current_hashes, reference_hashes = self._compute_row_hashes(current_rows, reference_rows, comparison_columns)
+        
+        both_current = current_positions[in_both]
+        both_reference = reference_positions[in_both]
+        if current_hashes is not None:
+            needs_comparison = current_hashes[both_current] != reference_hashes[both_reference]
+        else:
+            needs_comparison = np.ones(len(both_current), dtype=bool)
+        
+        logger.debug(f"Row hashes: {needs_comparison.sum()} of {len(both_current)} paired rows need column comparison")
+        
+        changes = np.zeros((len(both_current), len(comparison_columns)), dtype=bool)
+        changes[needs_comparison] = self._build_change_matrix(
+            current_rows, reference_rows, comparison_columns,
+            both_current[needs_comparison], both_reference[needs_comparison]
+        )
+        
+        # Current values for NEW/CHANGED/UNCHANGED rows, reference values for DELETED rows
+        result = pd.concat(
+            [
+                current_rows.take(current_positions[in_current]).set_axis(np.flatnonzero(in_current)),
+                reference_rows.take(reference_positions[~in_current]).set_axis(np.flatnonzero(~in_current))
+            ]
+        ).sort_index()
+        result.index = pd.RangeIndex(len(result))
+        
+        self._add_metadata_columns(
+            result, in_current, in_both, changes, comparison_columns,
+            current_rows, reference_rows, both_current, both_reference
+        )
+        
+        # Persist hashes so the next diff against this result can skip hashing it
+        if self.row_hash_column and current_hashes is not None:
+            row_hashes = np.where(
+                in_current,
+                current_hashes[np.maximum(current_positions, 0)],
+                reference_hashes[np.maximum(reference_positions, 0)]
+            )
+            result[self.row_hash_column] = self._format_row_hashes(row_hashes)
+        
+        return result
     
     def _validate_key_columns(self, current_data: pd.DataFrame, reference_data: pd.DataFrame):
         """Validate that key columns exist in both datasets."""
@@ -196,149 +237,289 @@ class DiffDataProcessor(BaseStepProcessor):
             if key_col not in reference_data.columns:
                 raise StepProcessorError(f"Key column '{key_col}' not found in reference data")
     
-    def _prepare_data_for_comparison(self, data: pd.DataFrame, data_type: str) -> dict:
+    def _prepare_data_for_comparison(self, data: pd.DataFrame, data_type: str) -> pd.DataFrame:
         """
-        Prepare data for comparison by creating a key-indexed dictionary.
+        Prepare data for comparison by making keys unique.
         
         Args:
             data: DataFrame to prepare
             data_type: 'current' or 'reference' for logging
             
         Returns:
-            Dictionary mapping composite keys to DataFrames (single row each)
+            DataFrame with one row per key (the last occurrence wins) and a RangeIndex
         """
-        indexed_data = {}
+        duplicated = data.duplicated(subset=self.key_columns, keep='last')
         
-        for idx, row in data.iterrows():
-            # Create composite key
+        if duplicated.any():
+            duplicate_keys = data.loc[duplicated, self.key_columns].drop_duplicates()
+            sample = list(duplicate_keys.head(5).itertuples(index=False, name=None))
             if len(self.key_columns) == 1:
-                key = row[self.key_columns[0]]
-            else:
-                key = tuple(row[col] for col in self.key_columns)
-            
-            # Check for duplicate keys
-            if key in indexed_data:
-                logger.warning(f"Duplicate key {key} found in {data_type} data")
-            
-            # Store row as single-row DataFrame to preserve column structure
-            indexed_data[key] = pd.DataFrame([row])
+                sample = [key[0] for key in sample]
+            logger.warning(
+                f"{len(duplicate_keys)} duplicate keys found in {data_type} data "
+                f"(last occurrence kept): {sample}"
+            )
+            data = data[~duplicated.to_numpy()]
         
-        logger.debug(f"Prepared {len(indexed_data)} unique keys from {data_type} data")
-        return indexed_data
-    
-    def _get_all_keys(self, current_indexed: dict, reference_indexed: dict) -> set:
-        """Get the union of all keys from both datasets."""
-        return set(current_indexed.keys()) | set(reference_indexed.keys())
+        data = data.reset_index(drop=True)
+        
+        logger.debug(f"Prepared {len(data)} unique keys from {data_type} data")
+        return data
     
-    def _analyze_row_changes(self, current_row: pd.DataFrame, reference_row: pd.DataFrame, key) -> pd.DataFrame:
+    def _match_rows(self, current_rows: pd.DataFrame, reference_rows: pd.DataFrame) -> tuple:
         """
-        Analyze changes between current and reference row.
+        Pair current and reference rows with an outer merge on the key columns.
         
         Args:
-            current_row: Single-row DataFrame from current data
-            reference_row: Single-row DataFrame from reference data
-            key: The composite key for this row
+            current_rows: Current data with unique keys
+            reference_rows: Reference data with unique keys
             
         Returns:
-            Single-row DataFrame with change analysis
+            Tuple of (current_positions, reference_positions) int arrays, -1 where
+            the row is missing on that side, ordered current rows first
         """
-        # Get the actual Series for comparison
-        current_series = current_row.iloc[0]
-        reference_series = reference_row.iloc[0]
+        current_keys = current_rows[self.key_columns]
+        reference_keys = reference_rows[self.key_columns]
+        
+        # Keys of different types (e.g. int vs str) never match, merge them as objects
+        for key_col in self.key_columns:
+            if current_keys[key_col].dtype != reference_keys[key_col].dtype:
+                current_keys = current_keys.astype({key_col: object})
+                reference_keys = reference_keys.astype({key_col: object})
+        
+        paired = current_keys.assign(_current_position=np.arange(len(current_keys))).merge(
+            reference_keys.assign(_reference_position=np.arange(len(reference_keys))),
+            on=self.key_columns, how='outer', indicator=True, sort=False
+        )
+        
+        current_positions = paired['_current_position'].fillna(-1).to_numpy(dtype=np.int64)
+        reference_positions = paired['_reference_position'].fillna(-1).to_numpy(dtype=np.int64)
         
-        # Find columns to compare (exclude key columns and excluded columns)
-        comparison_columns = self._get_comparison_columns(current_row.columns)
+        # Current rows keep their order, deleted rows follow in reference order
+        order = np.lexsort((reference_positions, np.where(current_positions >= 0, current_positions, len(current_rows))))
         
-        # Compare values and build change information
-        changed_fields = []
-        change_details = []
-        change_details_json = {}
+        status_counts = paired['_merge'].value_counts()
+        logger.debug(
+            f"Matched rows: {status_counts.get('both', 0)} in both, "
+            f"{status_counts.get('left_only', 0)} current only, {status_counts.get('right_only', 0)} reference only"
+        )
         
-        for col in comparison_columns:
-            current_val = current_series.get(col)
-            reference_val = reference_series.get(col)
+        return current_positions[order], reference_positions[order]
+    
+    def _compute_row_hashes(self, current_rows: pd.DataFrame, reference_rows: pd.DataFrame,
+                            comparison_columns: list) -> tuple:
+        """
+        Hash the comparison columns of every row on both sides.
+        
+        Reference hashes are read from row_hash_column when the reference data
+        carries them (e.g. saved by yesterday's diff), otherwise they are computed.
+        Hashes cover each cell's type as well as its value, so 1 and '1' never
+        share a hash; equal hashes mean equal values barring a 64-bit collision.
+        Stored hashes may be stale (the reference values can be edited after the
+        hash was saved), so a stored hash is only trusted when it differs from
+        every current hash: such rows are compared column by column anyway.
+        Rows whose stored hash matches a current hash are hashed again from
+        their reference values before that match is relied on.
+        
+        Returns:
+            Tuple of (current_hashes, reference_hashes) uint64 arrays, or
+            (None, None) when rows cannot be hashed and must all be compared
+        """
+        if not comparison_columns or any(col not in reference_rows.columns for col in comparison_columns):
+            return None, None
+        
+        try:
+            current_hashes = self._hash_rows(current_rows[comparison_columns])
             
-            # Handle potential NaN/None comparisons
-            if self._values_different(current_val, reference_val):
-                changed_fields.append(col)
+            if self.row_hash_column and self.row_hash_column in reference_rows.columns:
+                reference_hashes = self._parse_row_hashes(reference_rows[self.row_hash_column])
                 
-                # Format change detail
-                detail = f"{col}: '{reference_val}'→'{current_val}'"
-                change_details.append(detail)
-                
-                # JSON format
-                change_details_json[col] = {
-                    'old': str(reference_val) if reference_val is not None else None,
-                    'new': str(current_val) if current_val is not None else None
-                }
-        
-        # Determine row status
-        if changed_fields:
-            row_status = 'CHANGED'
-        else:
-            row_status = 'UNCHANGED'
+                # A matching stored hash would mark the row UNCHANGED, so check it against the values
+                matching = np.flatnonzero(np.isin(reference_hashes, current_hashes))
+                if len(matching):
+                    reference_hashes[matching] = self._hash_rows(reference_rows[comparison_columns].take(matching))
+                logger.debug(
+                    f"Using stored row hashes from reference column '{self.row_hash_column}' "
+                    f"({len(matching)} of {len(reference_hashes)} rehashed to verify a match)"
+                )
+            else:
+                reference_hashes = self._hash_rows(reference_rows[comparison_columns])
+        except TypeError as e:
+            # Unhashable cell values (e.g. lists) - fall back to comparing every row
+            logger.debug(f"Row hashing skipped: {e}")
+            return None, None
         
-        # Create result row based on current data
-        result_row = current_row.copy()
+        return current_hashes, reference_hashes
+    
+    @staticmethod
+    def _hash_rows(data: pd.DataFrame) -> np.ndarray:
+        """
+        Hash each row of a DataFrame (values only, not the index).
         
-        # Add metadata columns
-        result_row.loc[:, 'Row_Status'] = row_status
-        result_row.loc[:, 'Changed_Fields'] = ', '.join(changed_fields) if changed_fields else ''
-        result_row.loc[:, 'Change_Count'] = len(changed_fields)
-        result_row.loc[:, 'Change_Details'] = ' | '.join(change_details) if change_details else ''
+        Object cells are hashed by their string form, so every object column also
+        contributes a per-cell type name, and the column dtypes are folded into a
+        per-frame salt (bool True and int 1 would otherwise hash alike too).
+        """
+        tagged = {}
+        for position, col in enumerate(data.columns):
+            values = data.iloc[:, position]
+            tagged[position] = values
+            if values.dtype == object:
+                tagged[f'{position}_type'] = np.array([type(value).__name__ for value in values.tolist()], dtype=object)
+        
+        hashes = pd.util.hash_pandas_object(pd.DataFrame(tagged, index=data.index), index=False).to_numpy(dtype=np.uint64)
+        
+        dtype_names = '\0'.join(str(dtype) for dtype in data.dtypes).encode()
+        salt = np.uint64(int.from_bytes(hashlib.sha1(dtype_names).digest()[:8], 'little'))
+        return hashes ^ salt
+    
+    @staticmethod
+    def _json_detail_value(value: Any) -> Union[str, None]:
+        """Format a value for the JSON change details, missing values (None/NaN/NaT) become null."""
+        if value is None or (pd.api.types.is_scalar(value) and pd.isna(value)):
+            return None
+        return str(value)
+    
+    @staticmethod
+    def _format_row_hashes(hashes: np.ndarray) -> list:
+        """Format row hashes as 16-digit hex strings (safe to store in Excel)."""
+        return [f'{value:016x}' for value in hashes.tolist()]
+    
+    @staticmethod
+    def _parse_row_hashes(stored: pd.Series) -> np.ndarray:
+        """Parse stored hex row hashes, unreadable entries become 0 (never equal in practice)."""
+        parsed = np.zeros(len(stored), dtype=np.uint64)
+        for position, value in enumerate(stored.tolist()):
+            try:
+                parsed[position] = int(str(value), 16)
+            except (ValueError, OverflowError):
+                pass
+        return parsed
+    
+    def _build_change_matrix(self, current_rows: pd.DataFrame, reference_rows: pd.DataFrame,
+                             comparison_columns: list, current_positions: np.ndarray,
+                             reference_positions: np.ndarray) -> np.ndarray:
+        """
+        Build a boolean matrix of changed values for paired rows.
         
-        if self.include_json_details:
-            result_row.loc[:, 'Change_Details_JSON'] = json.dumps(change_details_json) if change_details_json else ''
+        Two missing values count as equal, one missing value counts as a change.
+        A column missing from the reference data counts as changed wherever the
+        current value is present.
+        
+        Returns:
+            Array of shape (paired rows, comparison columns)
+        """
+        changes = np.zeros((len(current_positions), len(comparison_columns)), dtype=bool)
         
-        return result_row
+        for col_index, col in enumerate(comparison_columns):
+            current_values = current_rows[col].take(current_positions).reset_index(drop=True)
+            
+            if col not in reference_rows.columns:
+                changes[:, col_index] = current_values.notna().to_numpy()
+                continue
+            
+            reference_values = reference_rows[col].take(reference_positions).reset_index(drop=True)
+            changes[:, col_index] = self._values_different(current_values, reference_values)
+        
+        return changes
     
-    def _values_different(self, val1, val2) -> bool:
+    def _values_different(self, current_values: pd.Series, reference_values: pd.Series) -> np.ndarray:
         """
-        Check if two values are different, handling NaN/None cases.
+        Compare two aligned Series element-wise, handling NaN/None cases.
         
         Args:
-            val1: First value
-            val2: Second value
+            current_values: Values from current data
+            reference_values: Values from reference data (same length and index)
             
         Returns:
-            True if values are different
+            Boolean array, True where the values are different
         """
-        # Handle NaN cases
-        if pd.isna(val1) and pd.isna(val2):
-            return False
-        if pd.isna(val1) or pd.isna(val2):
-            return True
-        
-        # Regular comparison
-        return val1 != val2
+        current_missing = current_values.isna().to_numpy()
+        reference_missing = reference_values.isna().to_numpy()
+        
+        # Exactly one side missing is a change, both missing is not
+        different = current_missing != reference_missing
+        
+        both_present = ~(current_missing | reference_missing)
+        if both_present.any():
+            current_present = current_values[both_present]
+            reference_present = reference_values[both_present]
+            try:
+                different[both_present] = (current_present != reference_present).to_numpy(dtype=bool)
+            except TypeError:
+                # Incomparable dtypes (e.g. categoricals with different categories)
+                different[both_present] = [
+                    current_value != reference_value
+                    for current_value, reference_value in zip(current_present.tolist(), reference_present.tolist())
+                ]
+        
+        return different
     
-    def _create_new_row_result(self, current_row: pd.DataFrame) -> pd.DataFrame:
-        """Create result for a new row (exists only in current data)."""
-        result_row = current_row.copy()
+    def _add_metadata_columns(self, result: pd.DataFrame, in_current: np.ndarray, in_both: np.ndarray,
+                              changes: np.ndarray, comparison_columns: list,
+                              current_rows: pd.DataFrame, reference_rows: pd.DataFrame,
+                              current_positions: np.ndarray, reference_positions: np.ndarray) -> None:
+        """Add Row_Status, Changed_Fields, Change_Count and Change_Details columns in place."""
         
-        result_row.loc[:, 'Row_Status'] = 'NEW'
-        result_row.loc[:, 'Changed_Fields'] = ''
-        result_row.loc[:, 'Change_Count'] = 0
-        result_row.loc[:, 'Change_Details'] = ''
+        change_count = changes.sum(axis=1)
+        changed = change_count > 0
         
-        if self.include_json_details:
-            result_row.loc[:, 'Change_Details_JSON'] = ''
+        row_status = np.where(in_current, 'NEW', 'DELETED').astype(object)
+        row_status[in_both] = np.where(changed, 'CHANGED', 'UNCHANGED')
         
-        return result_row
-    
-    def _create_deleted_row_result(self, reference_row: pd.DataFrame) -> pd.DataFrame:
-        """Create result for a deleted row (exists only in reference data)."""
-        result_row = reference_row.copy()
+        counts = np.zeros(len(result), dtype=np.int64)
+        counts[in_both] = change_count
         
-        result_row.loc[:, 'Row_Status'] = 'DELETED'
-        result_row.loc[:, 'Changed_Fields'] = ''
-        result_row.loc[:, 'Change_Count'] = 0
-        result_row.loc[:, 'Change_Details'] = ''
+        changed_fields = np.full(len(result), '', dtype=object)
+        change_details = np.full(len(result), '', dtype=object)
+        change_details_json = np.full(len(result), '', dtype=object)
         
-        if self.include_json_details:
-            result_row.loc[:, 'Change_Details_JSON'] = ''
+        if changed.any():
+            changed_rows = np.flatnonzero(changed)
+            result_rows = np.flatnonzero(in_both)[changed_rows]
+            
+            # Rows tend to share a handful of change patterns, join each pattern's names once
+            patterns, pattern_codes = np.unique(changes[changed_rows], axis=0, return_inverse=True)
+            pattern_names = [
+                ', '.join(col for col, is_changed in zip(comparison_columns, pattern) if is_changed)
+                for pattern in patterns
+            ]
+            changed_fields[result_rows] = [pattern_names[code] for code in pattern_codes.ravel()]
+            
+            # Value-level details are only formatted for changed cells
+            details = {row: [] for row in changed_rows}
+            details_json = {row: {} for row in changed_rows} if self.include_json_details else None
+            
+            for col_index, col in enumerate(comparison_columns):
+                rows = np.flatnonzero(changes[:, col_index])
+                if len(rows) == 0:
+                    continue
+                
+                current_values = current_rows[col].take(current_positions[rows]).tolist()
+                if col in reference_rows.columns:
+                    reference_values = reference_rows[col].take(reference_positions[rows]).tolist()
+                else:
+                    reference_values = [None] * len(rows)
+                
+                for row, reference_val, current_val in zip(rows, reference_values, current_values):
+                    details[row].append(f"{col}: '{reference_val}'→'{current_val}'")
+                    if details_json is not None:
+                        details_json[row][col] = {
+                            'old': self._json_detail_value(reference_val),
+                            'new': self._json_detail_value(current_val)
+                        }
+            
+            change_details[result_rows] = [' | '.join(details[row]) for row in changed_rows]
+            if details_json is not None:
+                change_details_json[result_rows] = [json.dumps(details_json[row]) for row in changed_rows]
+        
+        result['Row_Status'] = row_status
+        result['Changed_Fields'] = changed_fields
+        result['Change_Count'] = counts
+        result['Change_Details'] = change_details
         
-        return result_row
+        if self.include_json_details:
+            result['Change_Details_JSON'] = change_details_json
     
     def _get_comparison_columns(self, all_columns) -> list:
         """
@@ -351,6 +532,8 @@ class DiffDataProcessor(BaseStepProcessor):
             List of columns to compare (excluding keys and excluded columns)
         """
         excluded = set(self.key_columns + self.exclude_columns)
+        if self.row_hash_column:
+            excluded.add(self.row_hash_column)
         return [col for col in all_columns if col not in excluded]
     
     def _create_empty_result_structure(self, sample_data: pd.DataFrame) -> pd.DataFrame:
@@ -418,6 +601,7 @@ class DiffDataProcessor(BaseStepProcessor):
                 'Single or multiple key columns',
                 'Row-level change detection',
                 'Field-level change tracking',
+                'Row-hash prefilter for unchanged rows',
                 'Metadata column generation',
                 'Configurable column exclusions'
             ],
@@ -455,7 +639,8 @@ class DiffDataProcessor(BaseStepProcessor):
             ],
             'configuration_options': {
                 'required': ['reference_stage', 'key_columns', 'source_stage', 'save_to_stage'],
-                'optional': ['exclude_columns', 'create_filtered_stages', 'include_json_details', 'handle_deleted_rows']
+                'optional': ['exclude_columns', 'create_filtered_stages', 'include_json_details', 'handle_deleted_rows',
+                             'row_hash_column']
             }
         }
     
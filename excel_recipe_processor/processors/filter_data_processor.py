@@ -13,6 +13,10 @@ from tokenize import TokenError
 
 from excel_recipe_processor.core.stage_manager import StageManager, StageError
 from excel_recipe_processor.core.base_processor import BaseStepProcessor, StepProcessorError
+from excel_recipe_processor.processors._helpers.multi_pattern_matcher import MultiPatternMatcher
+from excel_recipe_processor.processors._helpers.column_normalization import (
+    ColumnNormalizationCache, to_lower_series
+)
 
 
 logger = logging.getLogger(__name__)
@@ -27,8 +31,19 @@ class FilterDataProcessor(BaseStepProcessor):
     - List operations: in_list, not_in_list
     - Stage-based filtering: in_stage, not_in_stage, stage_comparison
     - Can apply multiple filters in sequence with AND logic
+    
+    Stringified and lowercased column views are cached for the duration of a
+    step, so several case-insensitive filters on one column only normalize it once.
+    Stage-based conditions use StageManager's shared key indexes instead of
+    loading a copy of the referenced stage.
     """
     
+    def __init__(self, step_config: dict):
+        """Initialize the filter processor with an empty per-step column cache."""
+        super().__init__(step_config)
+        
+        self._column_cache = ColumnNormalizationCache()
+    
     @classmethod
     def get_minimal_config(cls) -> dict:
         return {
@@ -127,12 +142,18 @@ class FilterDataProcessor(BaseStepProcessor):
         filtered_data = data.copy()
         initial_row_count = len(filtered_data)
         
+        # Normalized column views are only valid for this step's data
+        self._column_cache = ColumnNormalizationCache(filtered_data)
+        
         # Apply each filter in sequence
-        for i, filter_rule in enumerate(filters):
-            try:
-                filtered_data = self._apply_filter(filtered_data, filter_rule, i)
-            except Exception as e:
-                raise StepProcessorError(f"Error applying filter {i+1} in step '{self.step_name}': {e}")
+        try:
+            for i, filter_rule in enumerate(filters):
+                try:
+                    filtered_data = self._apply_filter(filtered_data, filter_rule, i)
+                except Exception as e:
+                    raise StepProcessorError(f"Error applying filter {i+1} in step '{self.step_name}': {e}")
+        finally:
+            self._column_cache.clear()
         
         final_row_count = len(filtered_data)
         removed_count = initial_row_count - final_row_count
@@ -199,7 +220,7 @@ class FilterDataProcessor(BaseStepProcessor):
                     mask = df[column] == value
                 else:
                     # Case-insensitive equals comparison
-                    mask = df[column].astype(str).str.lower() == str(value).lower()
+                    mask = self._column_cache.as_lower(df, column) == str(value).lower()
                 
             elif condition == 'not_equals':
                 if value is None:
@@ -208,21 +229,21 @@ class FilterDataProcessor(BaseStepProcessor):
                     mask = df[column] != value
                 else:
                     # Case-insensitive not equals comparison
-                    mask = df[column].astype(str).str.lower() != str(value).lower()
+                    mask = self._column_cache.as_lower(df, column) != str(value).lower()
                 
             elif condition == 'contains':
                 if value is None:
                     raise StepProcessorError(f"Filter {filter_index + 1} with 'contains' condition requires a 'value'")
                 if not isinstance(value, str):
                     raise StepProcessorError(f"Filter {filter_index + 1} with 'contains' condition requires a string value")
-                mask = df[column].astype(str).str.contains(value, na=False, case=case_sensitive)
+                mask = self._column_cache.as_str(df, column).str.contains(value, na=False, case=case_sensitive)
                 
             elif condition == 'not_contains':
                 if value is None:
                     raise StepProcessorError(f"Filter {filter_index + 1} with 'not_contains' condition requires a 'value'")
                 if not isinstance(value, str):
                     raise StepProcessorError(f"Filter {filter_index + 1} with 'not_contains' condition requires a string value")
-                mask = ~df[column].astype(str).str.contains(value, na=False, case=case_sensitive)
+                mask = ~self._column_cache.as_str(df, column).str.contains(value, na=False, case=case_sensitive)
                 
             elif condition == 'starts_with':
                 if value is None:
@@ -230,9 +251,9 @@ class FilterDataProcessor(BaseStepProcessor):
                 if not isinstance(value, str):
                     raise StepProcessorError(f"Filter {filter_index + 1} with 'starts_with' condition requires a string value")
                 if case_sensitive:
-                    mask = df[column].astype(str).str.startswith(str(value), na=False)
+                    mask = self._column_cache.as_str(df, column).str.startswith(str(value), na=False)
                 else:
-                    mask = df[column].astype(str).str.lower().str.startswith(str(value).lower(), na=False)
+                    mask = self._column_cache.as_lower(df, column).str.startswith(str(value).lower(), na=False)
                     
             elif condition == 'not_starts_with':
                 if value is None:
@@ -240,9 +261,9 @@ class FilterDataProcessor(BaseStepProcessor):
                 if not isinstance(value, str):
                     raise StepProcessorError(f"Filter {filter_index + 1} with 'not_starts_with' condition requires a string value")
                 if case_sensitive:
-                    mask = ~df[column].astype(str).str.startswith(str(value), na=False)
+                    mask = ~self._column_cache.as_str(df, column).str.startswith(str(value), na=False)
                 else:
-                    mask = ~df[column].astype(str).str.lower().str.startswith(str(value).lower(), na=False)
+                    mask = ~self._column_cache.as_lower(df, column).str.startswith(str(value).lower(), na=False)
                 
             elif condition == 'ends_with':
                 if value is None:
@@ -250,9 +271,9 @@ class FilterDataProcessor(BaseStepProcessor):
                 if not isinstance(value, str):
                     raise StepProcessorError(f"Filter {filter_index + 1} with 'ends_with' condition requires a string value")
                 if case_sensitive:
-                    mask = df[column].astype(str).str.endswith(str(value), na=False)
+                    mask = self._column_cache.as_str(df, column).str.endswith(str(value), na=False)
                 else:
-                    mask = df[column].astype(str).str.lower().str.endswith(str(value).lower(), na=False)
+                    mask = self._column_cache.as_lower(df, column).str.endswith(str(value).lower(), na=False)
                     
             elif condition == 'not_ends_with':
                 if value is None:
@@ -260,9 +281,9 @@ class FilterDataProcessor(BaseStepProcessor):
                 if not isinstance(value, str):
                     raise StepProcessorError(f"Filter {filter_index + 1} with 'not_ends_with' condition requires a string value")
                 if case_sensitive:
-                    mask = ~df[column].astype(str).str.endswith(str(value), na=False)
+                    mask = ~self._column_cache.as_str(df, column).str.endswith(str(value), na=False)
                 else:
-                    mask = ~df[column].astype(str).str.lower().str.endswith(str(value).lower(), na=False)
+                    mask = ~self._column_cache.as_lower(df, column).str.endswith(str(value).lower(), na=False)
                 
             # Numeric comparison conditions
             elif condition == 'greater_than':
@@ -287,10 +308,10 @@ class FilterDataProcessor(BaseStepProcessor):
                 
             # Empty/null conditions
             elif condition == 'not_empty':
-                mask = df[column].notna() & (df[column].astype(str).str.strip() != '')
+                mask = df[column].notna() & (self._column_cache.as_str(df, column).str.strip() != '')
                 
             elif condition == 'is_empty':
-                mask = df[column].isna() | (df[column].astype(str).str.strip() == '')
+                mask = df[column].isna() | (self._column_cache.as_str(df, column).str.strip() == '')
                 
             # Original list membership conditions (backward compatible aliases)
             elif condition == 'in_list':
@@ -304,7 +325,7 @@ class FilterDataProcessor(BaseStepProcessor):
                 else:
                     # Case-insensitive list membership
                     value_lower = [str(v).lower() for v in value]
-                    mask = df[column].astype(str).str.lower().isin(value_lower)
+                    mask = self._column_cache.as_lower(df, column).isin(value_lower)
                 
             elif condition == 'not_in_list':
                 if value is None:
@@ -317,7 +338,7 @@ class FilterDataProcessor(BaseStepProcessor):
                 else:
                     # Case-insensitive list exclusion
                     value_lower = [str(v).lower() for v in value]
-                    mask = ~df[column].astype(str).str.lower().isin(value_lower)
+                    mask = ~self._column_cache.as_lower(df, column).isin(value_lower)
             
             # Enhanced list conditions with explicit min/max naming
             elif condition == 'equals_any_in_list':
@@ -330,7 +351,7 @@ class FilterDataProcessor(BaseStepProcessor):
                 else:
                     # Case-insensitive list membership
                     value_lower = [str(v).lower() for v in value]
-                    mask = df[column].astype(str).str.lower().isin(value_lower)
+                    mask = self._column_cache.as_lower(df, column).isin(value_lower)
                 
             elif condition == 'not_equals_any_in_list':
                 if value is None:
@@ -342,7 +363,7 @@ class FilterDataProcessor(BaseStepProcessor):
                 else:
                     # Case-insensitive list exclusion
                     value_lower = [str(v).lower() for v in value]
-                    mask = ~df[column].astype(str).str.lower().isin(value_lower)
+                    mask = ~self._column_cache.as_lower(df, column).isin(value_lower)
             
             # Text pattern list conditions
             elif condition == 'contains_any_in_list':
@@ -353,7 +374,7 @@ class FilterDataProcessor(BaseStepProcessor):
                 # Include if column contains ANY pattern from list (OR logic)
                 masks = []
                 for pattern in value:
-                    pattern_mask = df[column].astype(str).str.contains(str(pattern), na=False, case=case_sensitive)
+                    pattern_mask = self._column_cache.as_str(df, column).str.contains(str(pattern), na=False, case=case_sensitive)
                     masks.append(pattern_mask)
                 mask = pd.concat(masks, axis=1).any(axis=1)
                 
@@ -365,7 +386,7 @@ class FilterDataProcessor(BaseStepProcessor):
                 # Exclude if column contains ANY pattern from list (exclude if any match)
                 masks = []
                 for pattern in value:
-                    pattern_mask = df[column].astype(str).str.contains(str(pattern), na=False, case=case_sensitive)
+                    pattern_mask = self._column_cache.as_str(df, column).str.contains(str(pattern), na=False, case=case_sensitive)
                     masks.append(pattern_mask)
                 mask = ~pd.concat(masks, axis=1).any(axis=1)
                 
@@ -377,7 +398,7 @@ class FilterDataProcessor(BaseStepProcessor):
                 # Include if column contains ALL patterns from list (AND logic)
                 masks = []
                 for pattern in value:
-                    pattern_mask = df[column].astype(str).str.contains(str(pattern), na=False, case=case_sensitive)
+                    pattern_mask = self._column_cache.as_str(df, column).str.contains(str(pattern), na=False, case=case_sensitive)
                     masks.append(pattern_mask)
                 mask = pd.concat(masks, axis=1).all(axis=1)
                 
@@ -390,9 +411,9 @@ class FilterDataProcessor(BaseStepProcessor):
                 masks = []
                 for pattern in value:
                     if case_sensitive:
-                        pattern_mask = df[column].astype(str).str.startswith(str(pattern), na=False)
+                        pattern_mask = self._column_cache.as_str(df, column).str.startswith(str(pattern), na=False)
                     else:
-                        pattern_mask = df[column].astype(str).str.lower().str.startswith(str(pattern).lower(), na=False)
+                        pattern_mask = self._column_cache.as_lower(df, column).str.startswith(str(pattern).lower(), na=False)
                     masks.append(pattern_mask)
                 mask = pd.concat(masks, axis=1).any(axis=1)
                 
@@ -405,12 +426,31 @@ class FilterDataProcessor(BaseStepProcessor):
                 masks = []
                 for pattern in value:
                     if case_sensitive:
-                        pattern_mask = df[column].astype(str).str.endswith(str(pattern), na=False)
+                        pattern_mask = self._column_cache.as_str(df, column).str.endswith(str(pattern), na=False)
                     else:
-                        pattern_mask = df[column].astype(str).str.lower().str.endswith(str(pattern).lower(), na=False)
+                        pattern_mask = self._column_cache.as_lower(df, column).str.endswith(str(pattern).lower(), na=False)
                     masks.append(pattern_mask)
                 mask = pd.concat(masks, axis=1).any(axis=1)
                 
+            # Compiled multi-term conditions (literal terms, one scan per distinct value)
+            elif condition == 'contains_any':
+                if value is None:
+                    raise StepProcessorError(f"Filter {filter_index + 1} with 'contains_any' condition requires a 'value'")
+                if not isinstance(value, list):
+                    raise StepProcessorError(f"Filter {filter_index + 1} with 'contains_any' condition requires a list value")
+                # Include if column contains ANY literal term from list
+                matcher = MultiPatternMatcher(value, case_sensitive=case_sensitive)
+                mask = matcher.match_series(self._column_cache.as_str(df, column))
+                
+            elif condition == 'not_contains_any':
+                if value is None:
+                    raise StepProcessorError(f"Filter {filter_index + 1} with 'not_contains_any' condition requires a 'value'")
+                if not isinstance(value, list):
+                    raise StepProcessorError(f"Filter {filter_index + 1} with 'not_contains_any' condition requires a list value")
+                # Exclude if column contains ANY literal term from list
+                matcher = MultiPatternMatcher(value, case_sensitive=case_sensitive)
+                mask = ~matcher.match_series(self._column_cache.as_str(df, column))
+                
             # Numeric comparison list conditions (explicit min/max naming)
             elif condition == 'greater_than_min_in_list':
                 if value is None:
@@ -493,8 +533,8 @@ class FilterDataProcessor(BaseStepProcessor):
                     f"Available conditions: {', '.join(available_conditions)}"
                 )
             
-            # Apply the mask to filter the DataFrame
-            filtered_df = df[mask]
+            # Apply the mask to filter the DataFrame (cached column views follow along)
+            filtered_df = self._column_cache.filter_frame(df, mask)
             
             # Log the filter result
             rows_before = len(df)
@@ -550,28 +590,18 @@ class FilterDataProcessor(BaseStepProcessor):
             )
         
         try:
-            # Get stage data
-            stage_data = StageManager.load_stage(stage_name)
-
-            # Explicitly type check to be a DataFrame as expected
-            if not isinstance(stage_data, pd.DataFrame):
-                raise TypeError(f"Expected DataFrame from stage '{stage_name}', got {type(stage_data)}")
-            
-            # Check if stage column exists
-            if stage_column not in stage_data.columns:
-                available_columns = list(stage_data.columns)
+            # Check if stage column exists (without copying the stage)
+            stage_columns = StageManager.get_stage_columns(stage_name)
+            if stage_column not in stage_columns:
                 raise StepProcessorError(
                     f"Filter {filter_index + 1} stage column '{stage_column}' not found in stage '{stage_name}'. "
-                    f"Available columns: {available_columns}"
+                    f"Available columns: {stage_columns}"
                 )
             
-            # Get unique values from stage column
-            stage_series = stage_data[stage_column]
-
-            # Explicitly type check to be a pandas Series as expected (lights up dropna().unique())
-            if not isinstance(stage_series, pd.Series):
-                raise TypeError(f"Expected Series from stage '{stage_column}', got {type(stage_series)}")
-            stage_values = set(stage_series.dropna().unique())
+            # Distinct stage keys come from StageManager's shared index, built once per
+            # stage/column/case mode and reused by every step until the stage is saved again
+            key_mode = 'exact' if case_sensitive else 'lower'
+            stage_keys = StageManager.get_key_index(stage_name, stage_column, key_mode=key_mode).index
             
             # Get the column to compare from current data
             comparison_column = filter_rule['column']
@@ -586,24 +616,24 @@ class FilterDataProcessor(BaseStepProcessor):
             if case_sensitive:
                 # Case-sensitive matching (original behavior)
                 if include:
-                    mask = comparison_series.isin(stage_values)
+                    mask = comparison_series.isin(stage_keys)
                     operation = "in"
                 else:
-                    mask = ~comparison_series.isin(stage_values) 
+                    mask = ~comparison_series.isin(stage_keys) 
                     operation = "not in"
             else:
-                # Case-insensitive matching
-                stage_values_lower = {str(v).lower() for v in stage_values}
+                # Case-insensitive matching (stage keys are already lowercased by the index)
+                comparison_lower = self._column_cache.as_lower(df, comparison_column)
                 if include:
-                    mask = comparison_series.astype(str).str.lower().isin(stage_values_lower)
+                    mask = comparison_lower.isin(stage_keys)
                     operation = "in (case-insensitive)"
                 else:
-                    mask = ~comparison_series.astype(str).str.lower().isin(stage_values_lower)
+                    mask = ~comparison_lower.isin(stage_keys)
                     operation = "not in (case-insensitive)"
             
             logger.debug(
                 f"Stage filter: {comparison_column} {operation} stage '{stage_name}[{stage_column}]' "
-                f"({len(stage_values)} unique values)"
+                f"({len(stage_keys)} unique values)"
             )
             
             return mask
@@ -650,22 +680,22 @@ class FilterDataProcessor(BaseStepProcessor):
             )
         
         try:
-            # Get stage data
-            stage_data = StageManager.load_stage(stage_name)
+            # Get stage columns (without copying the stage)
+            stage_columns = StageManager.get_stage_columns(stage_name)
             
             # Validate columns exist
             if key_column not in df.columns:
                 raise StepProcessorError(f"Filter {filter_index + 1} key column '{key_column}' not found in current data")
                 
-            if stage_key_column not in stage_data.columns:
-                available_columns = list(stage_data.columns)
+            if stage_key_column not in stage_columns:
+                available_columns = stage_columns
                 raise StepProcessorError(
                     f"Filter {filter_index + 1} stage key column '{stage_key_column}' not found in stage '{stage_name}'. "
                     f"Available columns: {available_columns}"
                 )
                 
-            if stage_value_column not in stage_data.columns:
-                available_columns = list(stage_data.columns)
+            if stage_value_column not in stage_columns:
+                available_columns = stage_columns
                 raise StepProcessorError(
                     f"Filter {filter_index + 1} stage value column '{stage_value_column}' not found in stage '{stage_name}'. "
                     f"Available columns: {available_columns}"
@@ -677,20 +707,22 @@ class FilterDataProcessor(BaseStepProcessor):
             if not isinstance(key_series, pd.Series):
                 raise TypeError(f"Expected Series from column '{key_column}', got {type(key_series)}")
             
-            # NEW: Create lookup dictionary with case sensitivity handling
+            # Key → value maps are shared through StageManager (later duplicate keys win, as with dict())
             if case_sensitive:
                 # Case-sensitive matching (original behavior)
-                stage_lookup = dict(zip(stage_data[stage_key_column], stage_data[stage_value_column]))
+                stage_lookup = StageManager.get_key_value_map(
+                    stage_name, stage_key_column, stage_value_column, key_mode='exact', keep='last'
+                )
                 # stage_values = df[key_column].map(stage_lookup)
                 stage_values = key_series.map(stage_lookup)
             else:
                 # Case-insensitive key matching
-                stage_lookup_lower = {}
-                for key, value in zip(stage_data[stage_key_column], stage_data[stage_value_column]):
-                    stage_lookup_lower[str(key).lower()] = value
+                stage_lookup_lower = StageManager.get_key_value_map(
+                    stage_name, stage_key_column, stage_value_column, key_mode='lower', keep='last'
+                )
                 
                 # stage_values = df[key_column].astype(str).str.lower().map(stage_lookup_lower)
-                stage_values = key_series.astype(str).str.lower().map(stage_lookup_lower)
+                stage_values = self._column_cache.as_lower(df, key_column).map(stage_lookup_lower)
             
             # Get current column for comparison
             current_column = filter_rule['column']
@@ -708,14 +740,14 @@ class FilterDataProcessor(BaseStepProcessor):
                     mask = current_series == stage_values
                 else:
                     # mask = df[current_column].astype(str).str.lower() == stage_values.astype(str).str.lower()
-                    mask = current_series.astype(str).str.lower() == stage_values.astype(str).str.lower()
+                    mask = self._column_cache.as_lower(df, current_column) == to_lower_series(stage_values)
             elif comparison_operator == 'not_equals':
                 if case_sensitive:
                     # mask = df[current_column] != stage_values
                     mask = current_series != stage_values
                 else:
                     # mask = df[current_column].astype(str).str.lower() != stage_values.astype(str).str.lower()
-                    mask = current_series.astype(str).str.lower() != stage_values.astype(str).str.lower()
+                    mask = self._column_cache.as_lower(df, current_column) != to_lower_series(stage_values)
             elif comparison_operator == 'greater_than':
                 # mask = pd.to_numeric(df[current_column], errors='coerce') > pd.to_numeric(stage_values, errors='coerce')
                 mask = pd.to_numeric(current_series, errors='coerce') > pd.to_numeric(stage_values, errors='coerce')
@@ -759,7 +791,8 @@ class FilterDataProcessor(BaseStepProcessor):
             'not_starts_with', 'not_ends_with', 'greater_than', 'less_than', 'greater_equal', 
             'less_equal', 'not_empty', 'is_empty', 'in_list', 'not_in_list', 
             'contains_any_in_list', 'not_contains_any_in_list', 'contains_all_in_list', 
-            'starts_with_any_in_list', 'ends_with_any_in_list', 'greater_than_min_in_list', 
+            'starts_with_any_in_list', 'ends_with_any_in_list', 'contains_any', 'not_contains_any',
+            'greater_than_min_in_list', 
             'greater_than_max_in_list', 'less_than_min_in_list', 'less_than_max_in_list', 
             'greater_equal_min_in_list', 'greater_equal_max_in_list', 'less_equal_min_in_list', 
             'less_equal_max_in_list', 'in_stage', 'not_in_stage', 'stage_comparison'
@@ -782,7 +815,7 @@ class FilterDataProcessor(BaseStepProcessor):
             'stage_based_conditions': self.get_stage_based_conditions(),
             'filter_operations': [
                 'exact_matching', 'text_contains', 'numeric_comparisons',
-                'list_membership', 'null_checking', 'pattern_matching',
+                'list_membership', 'null_checking', 'pattern_matching', 'multi_term_matching',
                 'stage_inclusion', 'stage_exclusion', 'stage_value_comparison'
             ],
             'comparison_operators': ['equals', 'not_equals', 'greater_than', 'less_than', 'contains'],
@@ -792,6 +825,7 @@ class FilterDataProcessor(BaseStepProcessor):
             ],
             'examples': {
                 'basic_filter': "Product_Name contains 'CANNED'",
+                'multi_term_filter': "Description not_contains_any ['sample', 'test', 'demo', ...]",
                 'numeric_filter': "Price > 15.00",
                 'list_filter': "Department in ['Electronics', 'Tools']",
                 'stage_inclusion': "Customer_ID in stage 'Approved Customers'",
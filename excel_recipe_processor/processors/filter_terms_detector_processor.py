@@ -12,8 +12,6 @@ import logging
 
 from typing import Any, Optional
 
-from sklearn.feature_extraction.text import CountVectorizer
-
 from excel_recipe_processor.core.base_processor import BaseStepProcessor, StepProcessorError
 from excel_recipe_processor.core.stage_manager import StageManager
 
@@ -744,6 +742,12 @@ class FilterTermsDetectorProcessor(BaseStepProcessor):
         Returns:
             Dictionary with analysis results including enhanced scoring
         """
+        # scikit-learn is slow to import and only needed here, so load it on first use
+        try:
+            from sklearn.feature_extraction.text import CountVectorizer
+        except ImportError:
+            raise StepProcessorError("filter_terms_detector requires scikit-learn (pip install scikit-learn)")
+        
         try:
             logger.info(f"Starting enhanced n-gram analysis for column '{column_name}'")
             
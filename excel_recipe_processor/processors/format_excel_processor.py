@@ -12,11 +12,21 @@ import logging
 import openpyxl
 import webcolors
 
+import numpy as np
+import pandas as pd
+
 from pathlib import Path
 
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.indexed_list import IndexedList
+
+try:
+    from openpyxl.styles.cell_style import StyleArray
+except ImportError:
+    StyleArray = None  # CellStyleCache falls back to the public style attributes
 
+from excel_recipe_processor.core.stage_manager import StageManager
 from excel_recipe_processor.core.variable_substitution import VariableSubstitution
 from excel_recipe_processor.core.base_processor import FileOpsBaseProcessor, StepProcessorError
 
@@ -34,6 +44,8 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
     NEW: Supports reusable formatting templates to reduce configuration redundancy.
     """
     
+    uses_workbook_session = True
+    
     @classmethod
     def get_minimal_config(cls) -> dict:
         return {
@@ -268,6 +280,9 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
             'freeze_top_row', 'auto_filter', 'max_column_width', 'min_column_width',
             'row_heights',
             
+            # Auto-fit measurement controls
+            'auto_fit_stage', 'auto_fit_sample_rows', 'auto_fit_percentile',
+            
             # Phase 1 Enhanced: Header text formatting
             'header_text_color', 'header_font_size',
             
@@ -346,6 +361,21 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
             if not isinstance(width, (int, float)) or width <= 0:
                 raise StepProcessorError(f"min_column_width must be a positive number in {context}, got: {width}")
         
+        if 'auto_fit_stage' in sheet_config:
+            stage_name = sheet_config['auto_fit_stage']
+            if not isinstance(stage_name, str) or not stage_name.strip():
+                raise StepProcessorError(f"auto_fit_stage must be a non-empty stage name in {context}, got: {stage_name}")
+        
+        if 'auto_fit_sample_rows' in sheet_config:
+            sample_rows = sheet_config['auto_fit_sample_rows']
+            if sample_rows is not None and (isinstance(sample_rows, bool) or not isinstance(sample_rows, int) or sample_rows <= 0):
+                raise StepProcessorError(f"auto_fit_sample_rows must be a positive integer in {context}, got: {sample_rows}")
+        
+        if 'auto_fit_percentile' in sheet_config:
+            percentile = sheet_config['auto_fit_percentile']
+            if isinstance(percentile, bool) or not isinstance(percentile, (int, float)) or not 0 < percentile <= 100:
+                raise StepProcessorError(f"auto_fit_percentile must be a number between 0 (exclusive) and 100 in {context}, got: {percentile}")
+        
         # Validate row_heights
         if 'row_heights' in sheet_config:
             row_heights = sheet_config['row_heights']
@@ -572,7 +602,7 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
             logger.info(f"📝 Available templates: {template_names}")
         
         # Load workbook
-        workbook = openpyxl.load_workbook(filename)
+        workbook = self.load_workbook(filename)
         sheets_processed = 0
         total_sheets = len(workbook.worksheets)
         
@@ -581,7 +611,7 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         # Check if we have sheet configurations
         if not sheet_configs:
             logger.warning("⚠️ No sheet formatting configurations found - no formatting applied")
-            workbook.close()
+            self.close_workbook(workbook)
             return 0
             
         logger.info(f"🎯 Processing {len(sheet_configs)} explicit sheet configuration(s)")
@@ -589,7 +619,7 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         # Process each sheet configuration
         for i, sheet_config in enumerate(sheet_configs):
             if 'sheet' not in sheet_config:
-                workbook.close()
+                self.close_workbook(workbook)
                 raise StepProcessorError(f"Formatting entry {i+1} must have a 'sheet' key")
             
             sheet_spec = sheet_config['sheet']
@@ -623,8 +653,8 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         
         # Save workbook
         logger.info(f"💾 Saving formatted workbook...")
-        workbook.save(filename)
-        workbook.close()
+        self.save_workbook(workbook, filename)
+        self.close_workbook(workbook)
         
         logger.info(f"✅ Excel formatting completed: {sheets_processed}/{total_sheets} sheets processed")
         return sheets_processed
@@ -675,26 +705,29 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         sheet_name = worksheet.title
         applied_operations = []
         
+        # One cache per sheet so every distinct merged style is built only once
+        style_cache = CellStyleCache(worksheet.parent)
+        
         # STEP 1: Apply text formatting FIRST so auto-fit can measure correctly
         
         # Apply general formatting to all cells
         if self._has_general_formatting(formatting):
             logger.info(f"🎨 [{sheet_name}] Applying general cell formatting")
-            self._apply_general_formatting(worksheet, formatting)
+            self._apply_general_formatting(worksheet, formatting, style_cache)
             applied_operations.append("general formatting")
         
         # Enhanced header formatting (BEFORE auto-fit so it can measure bold/larger text)
         if self._has_header_formatting(formatting):
             header_details = self._get_header_formatting_details(formatting)
             logger.info(f"👑 [{sheet_name}] Header formatting: {header_details}")
-            self._apply_header_formatting(worksheet, formatting)
+            self._apply_header_formatting(worksheet, formatting, style_cache)
             applied_operations.append("header formatting")
         
         # Apply cell range specific formatting (BEFORE auto-fit)
         cell_ranges = formatting.get('cell_ranges', {})
         if cell_ranges:
             logger.info(f"🎯 [{sheet_name}] Applying cell range formatting to {len(cell_ranges)} ranges")
-            self._apply_cell_range_formatting(worksheet, cell_ranges)
+            self._apply_cell_range_formatting(worksheet, cell_ranges, style_cache)
             applied_operations.append(f"range formatting ({len(cell_ranges)} ranges)")
         
         # STEP 2: Set row heights (might affect auto-fit calculations)
@@ -768,13 +801,14 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         
         return ', '.join(details) if details else "basic"
 
-    def _apply_general_formatting(self, worksheet, formatting: dict) -> None:
+    def _apply_general_formatting(self, worksheet, formatting: dict, style_cache=None) -> None:
         """
         Apply general formatting to all data cells (excluding header row).
-        
+
         Args:
             worksheet: openpyxl worksheet object
             formatting: Formatting configuration
+            style_cache: CellStyleCache shared across the sheet, optional
         """
         # Check if any general formatting is needed
         needs_general_formatting = any([
@@ -815,49 +849,33 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         
         # Apply formatting to all data cells (excluding headers which are handled separately)
         start_row = 2 if worksheet.max_row > 1 else 1  # Skip header row if present
-        
-        for row in range(start_row, worksheet.max_row + 1):
-            for col in range(1, worksheet.max_column + 1):
-                cell = worksheet.cell(row=row, column=col)
-                
-                # Apply font formatting
-                if font_kwargs:
-                    # Merge with existing font properties to avoid overwriting header formatting
-                    existing_font = cell.font
-                    merged_font_kwargs = {
-                        'name': existing_font.name,
-                        'size': existing_font.size,
-                        'bold': existing_font.bold,
-                        'italic': existing_font.italic,
-                        'color': existing_font.color
-                    }
-                    # Override with general formatting
-                    merged_font_kwargs.update(font_kwargs)
-                    cell.font = Font(**merged_font_kwargs)
-                
-                # Apply alignment formatting
-                if alignment_kwargs:
-                    # Merge with existing alignment properties
-                    existing_alignment = cell.alignment
-                    merged_alignment_kwargs = {
-                        'horizontal': existing_alignment.horizontal,
-                        'vertical': existing_alignment.vertical,
-                        'text_rotation': existing_alignment.text_rotation,
-                        'wrap_text': existing_alignment.wrap_text,
-                        'shrink_to_fit': existing_alignment.shrink_to_fit,
-                        'indent': existing_alignment.indent
-                    }
-                    # Override with general alignment
-                    merged_alignment_kwargs.update(alignment_kwargs)
-                    cell.alignment = Alignment(**merged_alignment_kwargs)
-
-    def _apply_header_formatting(self, worksheet, formatting: dict) -> None:
+
+        if style_cache is None:
+            style_cache = CellStyleCache(worksheet.parent)
+
+        # Freeze the overrides once; the cache merges them into each distinct existing style
+        font_overrides = CellStyleCache.freeze_overrides(font_kwargs)
+        alignment_overrides = CellStyleCache.freeze_overrides(alignment_kwargs)
+
+        for row in worksheet.iter_rows(min_row=start_row, max_row=worksheet.max_row,
+                                       min_col=1, max_col=worksheet.max_column):
+            for cell in row:
+                # Merge with existing font properties to avoid overwriting header formatting
+                if font_overrides:
+                    style_cache.merge_font(cell, font_overrides)
+
+                # Merge with existing alignment properties
+                if alignment_overrides:
+                    style_cache.merge_alignment(cell, alignment_overrides)
+
+    def _apply_header_formatting(self, worksheet, formatting: dict, style_cache=None) -> None:
         """
         Apply enhanced header formatting to the first row.
         
         Args:
             worksheet: openpyxl worksheet object
             formatting: Formatting configuration
+            style_cache: CellStyleCache shared across the sheet, optional
         """
         if worksheet.max_row < 1:
             return  # No data to format
@@ -897,48 +915,38 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         if header_v_align:
             alignment_kwargs['vertical'] = header_v_align
         
+        if style_cache is None:
+            style_cache = CellStyleCache(worksheet.parent)
+        
+        font_overrides = CellStyleCache.freeze_overrides(font_kwargs)
+        alignment_overrides = CellStyleCache.freeze_overrides(alignment_kwargs)
+        
         # Apply to first row
         for cell in worksheet[1]:  # First row
-            # Apply font formatting
-            if font_kwargs:
-                # Preserve existing font properties and merge with new ones
-                existing_font = cell.font
-                merged_font_kwargs = {
-                    'name': existing_font.name,
-                    'size': existing_font.size,
-                    'bold': existing_font.bold,
-                    'italic': existing_font.italic,
-                    'color': existing_font.color
-                }
-                merged_font_kwargs.update(font_kwargs)
-                cell.font = Font(**merged_font_kwargs)
+            # Preserve existing font properties and merge with new ones
+            if font_overrides:
+                style_cache.merge_font(cell, font_overrides)
             
             # Apply background fill
             if fill:
-                cell.fill = fill
+                style_cache.assign(cell, 'fill', fill)
             
             # Apply alignment
-            if alignment_kwargs:
-                existing_alignment = cell.alignment
-                merged_alignment_kwargs = {
-                    'horizontal': existing_alignment.horizontal,
-                    'vertical': existing_alignment.vertical,
-                    'text_rotation': existing_alignment.text_rotation,
-                    'wrap_text': existing_alignment.wrap_text,
-                    'shrink_to_fit': existing_alignment.shrink_to_fit,
-                    'indent': existing_alignment.indent
-                }
-                merged_alignment_kwargs.update(alignment_kwargs)
-                cell.alignment = Alignment(**merged_alignment_kwargs)
-
-    def _apply_cell_range_formatting(self, worksheet, cell_ranges: dict) -> None:
+            if alignment_overrides:
+                style_cache.merge_alignment(cell, alignment_overrides)
+
+    def _apply_cell_range_formatting(self, worksheet, cell_ranges: dict, style_cache=None) -> None:
         """
         Apply formatting to specific cell ranges.
         
         Args:
             worksheet: openpyxl worksheet object
             cell_ranges: Dictionary of range specifications and their formatting
+            style_cache: CellStyleCache shared across the sheet, optional
         """
+        if style_cache is None:
+            style_cache = CellStyleCache(worksheet.parent)
+        
         for range_spec, range_formatting in cell_ranges.items():
             try:
                 # Get the range of cells
@@ -959,20 +967,39 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
                     # It's a single cell
                     cells_to_format = [cell_range]
                 
+                # Resolve colors and build fills/borders once for the whole range
+                cell_updates = self._build_cell_updates(range_formatting)
+                
                 # Apply formatting to each cell in the range
                 for cell in cells_to_format:
-                    self._apply_cell_formatting(cell, range_formatting)
+                    self._apply_cell_updates(cell, cell_updates, style_cache)
                     
             except Exception as e:
                 logger.warning(f"⚠️ Could not apply formatting to range '{range_spec}': {e}")
 
-    def _apply_cell_formatting(self, cell, formatting: dict) -> None:
+    def _apply_cell_formatting(self, cell, formatting: dict, style_cache=None) -> None:
         """
         Apply formatting to a single cell.
         
         Args:
             cell: openpyxl cell object
             formatting: Dictionary of formatting options
+            style_cache: CellStyleCache shared across the sheet, optional
+        """
+        if style_cache is None:
+            style_cache = CellStyleCache(cell.parent.parent)
+        
+        self._apply_cell_updates(cell, self._build_cell_updates(formatting), style_cache)
+
+    def _build_cell_updates(self, formatting: dict) -> dict:
+        """
+        Translate cell formatting options into style updates that can be applied to many cells.
+        
+        Args:
+            formatting: Dictionary of formatting options
+            
+        Returns:
+            Dictionary with frozen font/alignment overrides and ready-made fill/border objects
         """
         # Font formatting
         font_kwargs = {}
@@ -993,24 +1020,11 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         if 'italic' in formatting:
             font_kwargs['italic'] = formatting['italic']
         
-        if font_kwargs:
-            # Merge with existing font
-            existing_font = cell.font
-            merged_font_kwargs = {
-                'name': existing_font.name,
-                'size': existing_font.size,
-                'bold': existing_font.bold,
-                'italic': existing_font.italic,
-                'color': existing_font.color
-            }
-            merged_font_kwargs.update(font_kwargs)
-            cell.font = Font(**merged_font_kwargs)
-        
         # Background color
+        fill = None
         if 'background_color' in formatting:
             normalized_bg_color = self._normalize_color(formatting['background_color'])
             fill = PatternFill(start_color=normalized_bg_color, end_color=normalized_bg_color, fill_type="solid")
-            cell.fill = fill
         
         # Alignment
         alignment_kwargs = {}
@@ -1021,37 +1035,56 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         if 'alignment_vertical' in formatting:
             alignment_kwargs['vertical'] = formatting['alignment_vertical']
         
-        if alignment_kwargs:
-            existing_alignment = cell.alignment
-            merged_alignment_kwargs = {
-                'horizontal': existing_alignment.horizontal,
-                'vertical': existing_alignment.vertical,
-                'text_rotation': existing_alignment.text_rotation,
-                'wrap_text': existing_alignment.wrap_text,
-                'shrink_to_fit': existing_alignment.shrink_to_fit,
-                'indent': existing_alignment.indent
-            }
-            merged_alignment_kwargs.update(alignment_kwargs)
-            cell.alignment = Alignment(**merged_alignment_kwargs)
-        
         # Border formatting (simplified version)
+        border = None
         if 'border' in formatting:
             border_spec = formatting['border']
             if isinstance(border_spec, str):
                 # Simple border style for all sides
                 side = Side(style=border_spec)
-                cell.border = Border(top=side, bottom=side, left=side, right=side)
+                border = Border(top=side, bottom=side, left=side, right=side)
             elif isinstance(border_spec, dict):
                 # Complex border formatting
-                self._apply_complex_border(cell, border_spec)
+                border = self._build_complex_border(border_spec)
+        
+        return {
+            'font': CellStyleCache.freeze_overrides(font_kwargs),
+            'fill': fill,
+            'alignment': CellStyleCache.freeze_overrides(alignment_kwargs),
+            'border': border
+        }
 
-    def _apply_complex_border(self, cell, border_spec: dict) -> None:
+    def _apply_cell_updates(self, cell, cell_updates: dict, style_cache) -> None:
         """
-        Apply complex border formatting to a cell.
+        Apply style updates from _build_cell_updates to a single cell.
         
         Args:
             cell: openpyxl cell object
+            cell_updates: Updates built by _build_cell_updates
+            style_cache: CellStyleCache shared across the sheet
+        """
+        if cell_updates['font']:
+            # Merge with existing font
+            style_cache.merge_font(cell, cell_updates['font'])
+        
+        if cell_updates['fill'] is not None:
+            style_cache.assign(cell, 'fill', cell_updates['fill'])
+        
+        if cell_updates['alignment']:
+            style_cache.merge_alignment(cell, cell_updates['alignment'])
+        
+        if cell_updates['border'] is not None:
+            style_cache.assign(cell, 'border', cell_updates['border'])
+
+    def _build_complex_border(self, border_spec: dict):
+        """
+        Build a Border from a complex border specification.
+        
+        Args:
             border_spec: Dictionary specifying border formatting
+            
+        Returns:
+            openpyxl Border, or None if the specification sets no sides
         """
         border_kwargs = {}
         
@@ -1091,7 +1124,9 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
                 })
         
         if border_kwargs:
-            cell.border = Border(**border_kwargs)
+            return Border(**border_kwargs)
+        
+        return None
 
     def _apply_row_heights(self, worksheet, row_heights: dict) -> None:
         """
@@ -1108,6 +1143,14 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         """
         Auto-fit column widths based on content with optional constraints.
         
+        Text lengths are collected per column and scaled by font in bulk, using
+        each distinct font once. The first row counts as the header and is always
+        measured in full. Data rows can come from the stage that was exported to
+        the sheet (auto_fit_stage), be limited to an evenly spaced sample
+        (auto_fit_sample_rows), and be summarized by a percentile instead of the
+        maximum (auto_fit_percentile) so a few very long values do not stretch
+        the column.
+        
         Args:
             worksheet: openpyxl worksheet object
             formatting: Formatting configuration (may contain width constraints)
@@ -1118,6 +1161,8 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         
         max_width = formatting.get('max_column_width', 100)
         min_width = formatting.get('min_column_width', 8)
+        sample_rows = formatting.get('auto_fit_sample_rows')
+        percentile = formatting.get('auto_fit_percentile', 100)
         
         # Check if auto-filter is enabled (adds dropdown arrows that need space)
         has_auto_filter = (
@@ -1127,36 +1172,211 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         
         # Calculate total padding
         auto_filter_padding = AUTO_FILTER_EXTRA if has_auto_filter else 0
+        total_padding = BASE_PADDING + auto_filter_padding
+        
+        header_row = worksheet.min_row
+        first_data_row = header_row + 1
+        last_data_row = worksheet.max_row
+        sampled_rows = self._auto_fit_sample_positions(first_data_row, last_data_row, sample_rows)
+        
+        stage_lengths = {}
+        if formatting.get('auto_fit_stage'):
+            stage_lengths = self._stage_text_lengths(formatting['auto_fit_stage'], sample_rows)
+        
+        font_factors = {}                       # dict[font_id, (size_factor, is_bold)]
+        style_cache = CellStyleCache(worksheet.parent)
+        
+        for column_index in range(worksheet.min_column, worksheet.max_column + 1):
+            column_letter = get_column_letter(column_index)
+            header_cell = worksheet.cell(row=header_row, column=column_index)
+            header_length = self._length_percentile(
+                self._measure_cells([header_cell], style_cache, font_factors), 100
+            )
+            
+            stage_column = stage_lengths.get(str(header_cell.value)) if header_cell.value is not None else None
+            
+            if first_data_row > last_data_row:
+                data_cells = []
+            elif stage_column is not None:
+                data_cells = None
+            elif sampled_rows is None:
+                data_cells = next(worksheet.iter_cols(
+                    min_col=column_index, max_col=column_index,
+                    min_row=first_data_row, max_row=last_data_row
+                ))
+            else:
+                data_cells = [worksheet.cell(row=row, column=column_index) for row in sampled_rows]
+            
+            if data_cells is None:
+                # Stage text lengths use the font of the first data cell in the column
+                font_id = style_cache.font_id(worksheet.cell(row=first_data_row, column=column_index))
+                data_lengths = self._scale_lengths(
+                    stage_column, np.full(len(stage_column), font_id), style_cache, font_factors
+                )
+            else:
+                data_lengths = self._measure_cells(data_cells, style_cache, font_factors)
+            
+            content_length = max(header_length, self._length_percentile(data_lengths, percentile))
+            
+            # Calculate final width with all padding
+            adjusted_width = max(min_width, min(content_length + total_padding, max_width))
+            worksheet.column_dimensions[column_letter].width = adjusted_width
+
+    @staticmethod
+    def _auto_fit_sample_positions(first_row: int, last_row: int, sample_rows) -> list:
+        """
+        Pick evenly spaced data rows to measure.
         
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
+        Args:
+            first_row: First data row number
+            last_row: Last data row number
+            sample_rows: Maximum number of rows to measure, or None for all
             
-            for cell in column:
+        Returns:
+            List of row numbers, or None when every row should be measured
+        """
+        row_count = last_row - first_row + 1
+        if not sample_rows or row_count <= sample_rows:
+            return None
+        
+        return np.unique(np.linspace(first_row, last_row, sample_rows).round().astype(np.int64)).tolist()
+
+    def _stage_text_lengths(self, stage_name: str, sample_rows) -> dict:
+        """
+        Compute the displayed text length of every value in a stage, by column.
+        
+        Empty, missing, zero and False values are skipped the same way the
+        worksheet scan skips blank cells.
+        
+        Args:
+            stage_name: Stage holding the data written to the sheet
+            sample_rows: Maximum number of rows to measure, or None for all
+            
+        Returns:
+            Dictionary mapping str(column name) to an int array of text lengths
+        """
+        if not StageManager.stage_exists(stage_name):
+            available_stages = list(StageManager.list_stages().keys())
+            raise StepProcessorError(
+                f"Auto-fit stage '{stage_name}' not found. "
+                f"Available stages: {available_stages}"
+            )
+        
+        data = StageManager.load_stage(stage_name, share_data=True)
+        
+        positions = self._auto_fit_sample_positions(0, len(data) - 1, sample_rows)
+        if positions is not None:
+            data = data.take(positions)
+        
+        lengths = {}
+        for position in range(len(data.columns)):
+            series = data.iloc[:, position]
+            series = series[series.notna().to_numpy()]
+            if pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+                series = series[(series != 0).to_numpy(dtype=bool)]
+            elif series.dtype == object or pd.api.types.is_string_dtype(series.dtype):
+                series = series[((series != '') & (series != 0)).to_numpy(dtype=bool)]
+            values = series.tolist()
+            lengths[str(data.columns[position])] = np.fromiter(
+                map(len, map(str, values)), dtype=np.int64, count=len(values)
+            )
+        
+        return lengths
+
+    def _measure_cells(self, cells, style_cache, font_factors: dict) -> np.ndarray:
+        """
+        Measure font-adjusted text lengths for non-blank cells.
+        
+        Args:
+            cells: Iterable of openpyxl cells
+            style_cache: CellStyleCache of the workbook that owns the cells
+            font_factors: Per-font scaling cache shared across columns
+            
+        Returns:
+            Int array of adjusted lengths, one per non-blank cell
+        """
+        lengths = []
+        font_ids = []
+        for cell in cells:
+            value = cell.value
+            if value:
+                lengths.append(len(str(value)))
+                font_ids.append(style_cache.font_id(cell))
+        
+        return self._scale_lengths(
+            np.array(lengths, dtype=np.int64), np.array(font_ids, dtype=np.int64), style_cache, font_factors
+        )
+
+    @staticmethod
+    def _scale_lengths(lengths: np.ndarray, font_ids: np.ndarray, style_cache, font_factors: dict) -> np.ndarray:
+        """
+        Adjust raw text lengths for font size and bold, once per distinct font.
+        
+        Args:
+            lengths: Raw text lengths
+            font_ids: Font number (CellStyleCache.font_id) for each length
+            style_cache: CellStyleCache that numbered the fonts
+            font_factors: Per-font scaling cache shared across columns
+            
+        Returns:
+            Int array of adjusted lengths
+        """
+        if len(lengths) == 0:
+            return lengths
+        
+        adjusted = lengths
+        
+        for font_id in np.unique(font_ids):
+            if font_id not in font_factors:
+                size_factor, is_bold = None, False
                 try:
-                    if cell.value:
-                        # Consider font size for width calculation
-                        content_length = len(str(cell.value))
-                        
-                        # Adjust for font size (rough approximation)
-                        if hasattr(cell.font, 'size') and cell.font.size:
-                            size_factor = cell.font.size / 11  # 11 is default font size
-                            content_length = int(content_length * size_factor)
-                        
-                        # Adjust for bold text (roughly 10% wider)
-                        if hasattr(cell.font, 'bold') and cell.font.bold:
-                            content_length = int(content_length * 1.2)
-                        
-                        if content_length > max_length:
-                            max_length = content_length
-                            
+                    font = style_cache.font(font_id)
+                    # Consider font size for width calculation (11 is default font size)
+                    if getattr(font, 'size', None):
+                        size_factor = font.size / 11
+                    # Adjust for bold text (roughly 10% wider)
+                    is_bold = bool(getattr(font, 'bold', False))
                 except Exception:
-                    pass  # Skip cells that can't be measured
+                    pass  # Measure with the default font if the style can't be read
+                font_factors[font_id] = (size_factor, is_bold)
             
-            # Calculate final width with all padding
-            total_padding = BASE_PADDING + auto_filter_padding
-            adjusted_width = max(min_width, min(max_length + total_padding, max_width))
-            worksheet.column_dimensions[column_letter].width = adjusted_width
+            size_factor, is_bold = font_factors[font_id]
+            if size_factor is None and not is_bold:
+                continue
+            
+            if adjusted is lengths:
+                adjusted = lengths.copy()
+            
+            rows = font_ids == font_id
+            scaled = lengths[rows]
+            if size_factor is not None:
+                scaled = np.floor(scaled * size_factor).astype(np.int64)
+            if is_bold:
+                scaled = np.floor(scaled * 1.2).astype(np.int64)
+            adjusted[rows] = scaled
+        
+        return adjusted
+
+    @staticmethod
+    def _length_percentile(lengths: np.ndarray, percentile) -> int:
+        """
+        Pick the text length at a percentile (100 = longest), 0 when there are no values.
+        
+        Args:
+            lengths: Adjusted text lengths
+            percentile: Percentile in (0, 100]
+            
+        Returns:
+            Length of an actual value at or above the requested percentile
+        """
+        if len(lengths) == 0:
+            return 0
+        
+        if percentile >= 100:
+            return int(lengths.max())
+        
+        ordered = np.sort(lengths)
+        return int(ordered[int(np.ceil(percentile / 100 * (len(ordered) - 1)))])
 
     def _add_auto_filter(self, worksheet) -> None:
         """
@@ -1190,6 +1410,7 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
             'phase_2_enhancements': ['general_text_color', 'general_font_size', 'general_font_name', 'general_alignment_horizontal', 'general_alignment_vertical'],
             'phase_3_enhancements': ['cell_ranges', 'webcolors_integration', 'border_formatting', 'css_color_names', 'rgb_color_support'],
             'template_enhancements': ['reusable_templates', 'template_composition', 'template_override'],  # NEW
+            'auto_fit_options': ['auto_fit_stage', 'auto_fit_sample_rows', 'auto_fit_percentile'],
             'color_formats_supported': [
                 'hex_with_hash (#FF0000)', 'hex_without_hash (FF0000)', 'short_hex (#F00)', 
                 'css_color_names (red, blue, forestgreen)', 'rgb_format (rgb(255, 0, 0))'
@@ -1223,4 +1444,155 @@ class FormatExcelProcessor(FileOpsBaseProcessor):
         return load_processor_examples('format_excel')
 
 
+class CellStyleCache:
+    """
+    Build each distinct cell style once while formatting a worksheet.
+
+    Cells that start from the same font and receive the same overrides
+    always end up with the same merged font, so the cache remembers the
+    result per (starting style, overrides) pair. A sheet where every data
+    cell shares a handful of styles then builds a handful of style objects
+    instead of one per cell.
+
+    openpyxl stores fonts, fills, alignments and borders in workbook-level
+    lists and each cell only keeps the index of its entry. On openpyxl 3.x
+    the cache reads and writes those indexes directly, which also skips
+    hashing a style object per cell. Those attributes are private, so on
+    other versions (or if they are missing) it falls back to the public
+    cell.font / cell.alignment / cell.fill / cell.border attributes.
+    """
+
+    # Properties carried over from the existing style when merging
+    MERGED_FONT_FIELDS = ('name', 'size', 'bold', 'italic', 'color')
+    MERGED_ALIGNMENT_FIELDS = ('horizontal', 'vertical', 'text_rotation', 'wrap_text', 'shrink_to_fit', 'indent')
+
+    # Workbook style lists and the matching cell style index for each kind
+    STYLE_INDEXES = {
+        'font': ('_fonts', 'fontId'),
+        'fill': ('_fills', 'fillId'),
+        'border': ('_borders', 'borderId'),
+        'alignment': ('_alignments', 'alignmentId'),
+    }
+
+    def __init__(self, workbook):
+        """
+        Initialize the cache.
+
+        Args:
+            workbook: openpyxl workbook that owns the cells being formatted
+        """
+        self.workbook = workbook
+        self.uses_style_indexes = self.style_indexes_supported(workbook)
+        self._merged = {}                       # dict[(kind, source, overrides), style_id or style]
+        self._assigned = {}                     # dict[(kind, id(style)), (style, style_id)]
+        self._font_ids = {}                     # dict[(size, bold), font_id], public fallback only
+        self._fonts = []                        # list[font], public fallback only
+
+    @staticmethod
+    def style_indexes_supported(workbook) -> bool:
+        """Check that this openpyxl version keeps cell styles as the indexes the cache writes."""
+        if StyleArray is None or openpyxl.__version__.split('.')[0] != '3':
+            return False
+        return all(
+            isinstance(getattr(workbook, collection, None), IndexedList)
+            for collection, _ in CellStyleCache.STYLE_INDEXES.values()
+        )
+
+    @staticmethod
+    def freeze_overrides(overrides: dict) -> tuple:
+        """Turn a formatting kwargs dict into a hashable cache key."""
+        return tuple(sorted(overrides.items()))
+
+    def merge_font(self, cell, overrides: tuple) -> None:
+        """Merge frozen font overrides into the cell's existing font."""
+        self._merge(cell, overrides, 'font', Font, self.MERGED_FONT_FIELDS)
+
+    def merge_alignment(self, cell, overrides: tuple) -> None:
+        """Merge frozen alignment overrides into the cell's existing alignment."""
+        self._merge(cell, overrides, 'alignment', Alignment, self.MERGED_ALIGNMENT_FIELDS)
+
+    def assign(self, cell, kind: str, style) -> None:
+        """
+        Replace the cell's fill or border with a prepared style object.
+
+        Args:
+            cell: openpyxl cell object
+            kind: 'fill' or 'border'
+            style: PatternFill or Border shared by all cells receiving it
+        """
+        if not self.uses_style_indexes:
+            setattr(cell, kind, style)
+            return
+
+        collection, id_field = self.STYLE_INDEXES[kind]
+
+        key = (kind, id(style))
+        cached = self._assigned.get(key)
+        if cached is None:
+            # Keep a reference to the style so its id() cannot be reused while cached
+            cached = (style, getattr(self.workbook, collection).add(style))
+            self._assigned[key] = cached
+
+        setattr(self._style_array(cell), id_field, cached[1])
+
+    def font_id(self, cell) -> int:
+        """
+        Number the cell's font; cells whose fonts scale text alike share a number.
+
+        Args:
+            cell: openpyxl cell object
+
+        Returns:
+            Workbook font index, or a cache-local number in the public fallback
+        """
+        if self.uses_style_indexes:
+            return cell._style.fontId if cell._style is not None else 0
+
+        font = cell.font
+        key = (font.size, bool(font.bold))
+        font_id = self._font_ids.get(key)
+        if font_id is None:
+            font_id = self._font_ids[key] = len(self._fonts)
+            self._fonts.append(font)
+        return font_id
+
+    def font(self, font_id: int):
+        """Get the font numbered by font_id()."""
+        if self.uses_style_indexes:
+            return self.workbook._fonts[font_id]
+        return self._fonts[font_id]
+
+    def _merge(self, cell, overrides: tuple, kind: str, style_class, fields: tuple) -> None:
+        """Look up or build the merged style for this cell's current style."""
+        if self.uses_style_indexes:
+            collection, id_field = self.STYLE_INDEXES[kind]
+            style_array = self._style_array(cell)
+            key = (kind, getattr(style_array, id_field), overrides)
+        else:
+            existing = getattr(cell, kind)
+            key = (kind, tuple(getattr(existing, field) for field in fields), overrides)
+
+        merged = self._merged.get(key)
+        if merged is None:
+            existing = getattr(cell, kind)
+            merged_kwargs = {field: getattr(existing, field) for field in fields}
+            merged_kwargs.update(overrides)
+            merged = style_class(**merged_kwargs)
+            if self.uses_style_indexes:
+                merged = getattr(self.workbook, collection).add(merged)
+            self._merged[key] = merged
+
+        if self.uses_style_indexes:
+            setattr(style_array, id_field, merged)
+        else:
+            setattr(cell, kind, merged)
+
+    @staticmethod
+    def _style_array(cell):
+        """Return the cell's style record, creating it the way openpyxl does for unstyled cells."""
+        if cell._style is None:
+            cell._style = StyleArray()
+        return cell._style
+
+
 # End of file #
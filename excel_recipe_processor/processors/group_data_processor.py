@@ -8,9 +8,13 @@ Handles grouping individual values into categories with support for:
 - Multiple grouping source types and validation features
 """
 
-import pandas as pd
+import re
+import fnmatch
 import logging
 
+import numpy as np
+import pandas as pd
+
 from typing import Any
 
 from excel_recipe_processor.core.file_reader import FileReader, FileReaderError
@@ -73,6 +77,7 @@ class GroupDataProcessor(BaseStepProcessor):
         unmatched_action = self.get_config_value('unmatched_action', 'keep_original')
         unmatched_value = self.get_config_value('unmatched_value', 'Other')
         case_sensitive = self.get_config_value('case_sensitive', False)     # default to False!
+        match_mode = self.get_config_value('match_mode', 'exact')
         save_to_stage = self.get_config_value('save_to_stage', None)
         stage_description = self.get_config_value('stage_description', '')
         
@@ -80,19 +85,24 @@ class GroupDataProcessor(BaseStepProcessor):
         groups = self._load_group_definitions()
         
         # Validate configuration
-        self._validate_grouping_config(data, source_column, groups, target_column)
+        self._validate_grouping_config(data, source_column, groups, target_column, match_mode)
         
         # Work on a copy
         result_data = data.copy()
         
         try:
-            # Create the grouping mapping
-            value_to_group_map = self._create_mapping(groups, case_sensitive)
+            # Create the grouping mapping, or one matcher for pattern groups
+            if match_mode == 'exact':
+                value_to_group_map = self._create_mapping(groups, case_sensitive)
+                group_patterns = None
+            else:
+                value_to_group_map = {}
+                group_patterns = self._compile_group_patterns(groups, match_mode, case_sensitive)
             
             # Apply the grouping
             result_data = self._apply_grouping(
                 result_data, source_column, target_column, value_to_group_map,
-                unmatched_action, unmatched_value, case_sensitive
+                unmatched_action, unmatched_value, case_sensitive, group_patterns
             )
             
             # Replace source column if requested
@@ -441,7 +451,7 @@ class GroupDataProcessor(BaseStepProcessor):
             raise StepProcessorError(f"Failed to save grouping results to stage '{stage_name}': {e}")
     
     def _validate_grouping_config(self, df: pd.DataFrame, source_column: str, 
-                                groups: dict, target_column: str) -> None:
+                                groups: dict, target_column: str, match_mode: str = 'exact') -> None:
         """Validate grouping configuration parameters."""
         
         # Validate source column
@@ -475,6 +485,13 @@ class GroupDataProcessor(BaseStepProcessor):
         # Validate target column
         if not isinstance(target_column, str) or not target_column.strip():
             raise StepProcessorError("'target_column' must be a non-empty string")
+        
+        # Validate match mode
+        valid_match_modes = self.get_supported_match_modes()
+        if match_mode not in valid_match_modes:
+            raise StepProcessorError(
+                f"Unknown match_mode: '{match_mode}'. Valid options: {valid_match_modes}"
+            )
     
     def _create_mapping(self, groups: dict, case_sensitive: bool) -> dict:
         """Create a mapping from individual values to group names."""
@@ -502,36 +519,181 @@ class GroupDataProcessor(BaseStepProcessor):
         logger.debug(f"Created mapping for {len(value_to_group)} values across {len(groups)} groups")
         return value_to_group
     
+    def _compile_group_patterns(self, groups: dict, match_mode: str, case_sensitive: bool) -> tuple:
+        """
+        Compile wildcard or regex group definitions into one matcher.
+        
+        Every pattern becomes one alternative of a single regex, wrapped in its
+        own capturing group. A full match reports the outermost group that
+        matched, which identifies the pattern, and alternatives are tried in
+        definition order so the first matching group wins.
+        
+        Args:
+            groups: Dictionary mapping group names to lists of patterns
+            match_mode: 'wildcard' or 'regex'
+            case_sensitive: Whether matching respects case
+            
+        Returns:
+            Tuple of (compiled regex, dict of capture group index -> group name)
+        """
+        flags = 0 if case_sensitive else re.IGNORECASE
+        
+        seen_patterns = {}
+        alternatives = []
+        index_to_group = {}
+        next_index = 1
+        
+        for group_name, values in groups.items():
+            for value in values:
+                pattern_str = str(value)
+                
+                # Check for duplicates
+                seen_key = pattern_str if case_sensitive else pattern_str.lower()
+                if seen_key in seen_patterns:
+                    raise StepProcessorError(
+                        f"Pattern '{pattern_str}' appears in both group '{group_name}' "
+                        f"and group '{seen_patterns[seen_key]}'"
+                    )
+                seen_patterns[seen_key] = group_name
+                
+                regex_str = fnmatch.translate(pattern_str) if match_mode == 'wildcard' else pattern_str
+                
+                try:
+                    inner_groups = re.compile(regex_str, flags).groups
+                except re.error as e:
+                    raise StepProcessorError(
+                        f"Invalid {match_mode} pattern '{pattern_str}' in group '{group_name}': {e}"
+                    )
+                
+                alternatives.append(f"({regex_str})")
+                index_to_group[next_index] = group_name
+                next_index += 1 + inner_groups
+        
+        try:
+            combined = re.compile('|'.join(alternatives), flags)
+        except re.error as e:
+            # Patterns that compile alone can still clash, e.g. duplicate named groups
+            raise StepProcessorError(f"Could not combine group patterns: {e}")
+        
+        logger.debug(f"Compiled {len(alternatives)} {match_mode} patterns across {len(groups)} groups")
+        return combined, index_to_group
+    
     def _apply_grouping(self, df: pd.DataFrame, source_column: str, target_column: str,
                        value_to_group_map: dict, unmatched_action: str, 
-                       unmatched_value: str, case_sensitive: bool) -> pd.DataFrame:
-        """Apply the grouping mapping to the DataFrame."""
+                       unmatched_value: str, case_sensitive: bool,
+                       group_patterns: tuple = None) -> pd.DataFrame:
+        """
+        Apply the grouping mapping to the DataFrame.
+        
+        The source column is factorized so string conversion, case folding and
+        group lookup run once per distinct value, then the results are expanded
+        back to every row with the factorized codes.
         
-        def map_value(value):
-            """Map a single value to its group."""
-            if pd.isna(value):
-                return self._handle_unmatched(None, unmatched_action, unmatched_value)
+        Args:
+            df: DataFrame to add the group column to
+            source_column: Column holding the values to group
+            target_column: Column to write the groups to
+            value_to_group_map: Exact value (case folded if needed) -> group name
+            unmatched_action: How to handle values without a group
+            unmatched_value: Replacement for unmatched values with 'set_default'
+            case_sensitive: Whether matching respects case
+            group_patterns: Compiled (regex, index -> group) pair for pattern matching
+            
+        Returns:
+            DataFrame with the group column added
+        """
+        codes, uniques = self._factorize_source(df[source_column])
+        
+        unique_strings = [str(value) for value in uniques]
+        
+        if group_patterns is None:
+            lookup_keys = unique_strings if case_sensitive else [value.lower() for value in unique_strings]
+            unique_groups = pd.Series(lookup_keys, dtype=object).map(value_to_group_map).to_numpy(dtype=object)
+        else:
+            unique_groups = self._match_group_patterns(unique_strings, group_patterns)
+        
+        unique_matched = pd.notna(unique_groups)
+        
+        # Rows with missing values have code -1 and are always unmatched
+        row_unmatched = np.ones(len(codes), dtype=bool)
+        valid_rows = codes >= 0
+        row_unmatched[valid_rows] = ~unique_matched[codes[valid_rows]]
+        
+        missing_result = None
+        if row_unmatched.any():
+            # Report the first unmatched row, raising for 'error' and unknown actions
+            first_code = codes[int(np.argmax(row_unmatched))]
+            first_value = None if first_code < 0 else unique_strings[first_code]
+            self._handle_unmatched(first_value, unmatched_action, unmatched_value)
             
-            value_str = str(value)
-            lookup_key = value_str if case_sensitive else value_str.lower()
+            for position in np.flatnonzero(~unique_matched):
+                unique_groups[position] = self._handle_unmatched(
+                    unique_strings[position], unmatched_action, unmatched_value
+                )
             
-            if lookup_key in value_to_group_map:
-                return value_to_group_map[lookup_key]
-            else:
-                return self._handle_unmatched(value_str, unmatched_action, unmatched_value)
+            if not valid_rows.all():
+                missing_result = self._handle_unmatched(None, unmatched_action, unmatched_value)
         
-        # Apply the mapping
-        df[target_column] = df[source_column].apply(map_value)
+        # Expand the per-value results to every row
+        grouped_values = np.empty(len(codes), dtype=object)
+        grouped_values[valid_rows] = unique_groups[codes[valid_rows]]
+        grouped_values[~valid_rows] = missing_result
+        
+        df[target_column] = pd.Series(grouped_values, index=df.index)
         
         # Log mapping statistics
-        matched_count = df[target_column].isin(value_to_group_map.values()).sum()
         total_count = len(df)
-        unmatched_count = total_count - matched_count
+        unmatched_count = int(row_unmatched.sum())
+        matched_count = total_count - unmatched_count
         
         logger.debug(f"Grouping results: {matched_count} matched, {unmatched_count} unmatched")
         
         return df
     
+    def _factorize_source(self, series: pd.Series) -> tuple:
+        """
+        Factorize source values so each distinct value is processed once.
+        
+        Factorizing an object column merges equal numbers such as 1, 1.0 and
+        True into one code even though they stringify differently, so object
+        columns holding numbers are factorized on their string form instead.
+        
+        Returns:
+            Tuple of (codes with -1 for missing values, unique values)
+        """
+        codes, uniques = pd.factorize(series, sort=False)
+        
+        if series.dtype == object:
+            has_numbers = any(
+                isinstance(value, (int, float, complex, np.number, np.bool_)) for value in uniques
+            )
+            if has_numbers:
+                as_strings = series.where(series.isna(), series.astype(str))
+                codes, uniques = pd.factorize(as_strings, sort=False)
+        
+        return codes, uniques
+    
+    def _match_group_patterns(self, values: list, group_patterns: tuple) -> np.ndarray:
+        """
+        Find the group of each value with the compiled pattern matcher.
+        
+        Args:
+            values: Distinct source values as strings
+            group_patterns: Compiled (regex, index -> group) pair
+            
+        Returns:
+            Object array of group names, None where nothing matched
+        """
+        combined, index_to_group = group_patterns
+        fullmatch = combined.fullmatch
+        
+        groups = np.empty(len(values), dtype=object)
+        for position, value in enumerate(values):
+            match = fullmatch(value)
+            groups[position] = index_to_group[match.lastindex] if match is not None else None
+        
+        return groups
+    
     def _handle_unmatched(self, value: str, unmatched_action: str, unmatched_value: str):
         """Handle values that don't match any group."""
         
@@ -617,6 +779,10 @@ class GroupDataProcessor(BaseStepProcessor):
         """Get list of supported actions for unmatched values."""
         return ['keep_original', 'set_default', 'error']
     
+    def get_supported_match_modes(self) -> list:
+        """Get list of supported ways to match values against group definitions."""
+        return ['exact', 'wildcard', 'regex']
+    
     def get_supported_source_types(self) -> list:
         """Get list of supported group source types."""
         return ['inline', 'stage', 'file', 'lookup', 'predefined']
@@ -635,12 +801,14 @@ class GroupDataProcessor(BaseStepProcessor):
             'description': 'Group individual values into categories using various source types and advanced workflows',
             'source_types': self.get_supported_source_types(),
             'unmatched_actions': self.get_supported_unmatched_actions(),
+            'match_modes': self.get_supported_match_modes(),
             'file_formats': self.get_supported_file_formats(),
             'predefined_groups': self.get_predefined_group_types(),
             'grouping_features': [
                 'category_mapping', 'regional_grouping', 'case_sensitivity_control',
                 'unmatched_value_handling', 'duplicate_detection', 'source_column_replacement',
-                'stage_based_definitions', 'file_based_definitions', 'cross_reference_grouping'
+                'stage_based_definitions', 'file_based_definitions', 'cross_reference_grouping',
+                'wildcard_patterns', 'regex_patterns'
             ],
             'stage_integration': [
                 'stage_based_group_definitions', 'dynamic_group_updates', 
@@ -675,6 +843,7 @@ class GroupDataProcessor(BaseStepProcessor):
                 'unmatched_action': 'How to handle unmatched values',
                 'unmatched_value': 'Default value for unmatched items',
                 'case_sensitive': 'Whether matching is case sensitive',
+                'match_mode': 'Match group values exactly or as wildcard/regex patterns',
                 'save_to_stage': 'Save grouping results to stage',
                 'stage_description': 'Description for saved stage'
             }
@@ -8,12 +8,18 @@ and "dead" (text) formulas. Can work at the cell, range, or auto-scan level.
 Supports both stage-to-stage operations (dead formulas) and file operations (live/dead/awaken).
 """
 
+import os
 import re
 import pandas as pd
+import shutil
 import logging
+import zipfile
 import openpyxl
+import tempfile
 
 from pathlib import Path
+from html import unescape as xml_unescape
+from xml.sax.saxutils import escape as xml_escape
 
 # try:
 #     OPENPYXL_AVAILABLE = True
@@ -21,7 +27,8 @@ from pathlib import Path
 #     OPENPYXL_AVAILABLE = False
 
 from openpyxl.utils import get_column_letter, column_index_from_string
-from openpyxl.utils.cell import coordinate_from_string, column_index_from_string
+from openpyxl.utils.cell import coordinate_from_string, column_index_from_string, range_boundaries
+from openpyxl.formula.tokenizer import Tokenizer, Token
 
 from excel_recipe_processor.core.base_processor import FileOpsBaseProcessor, BaseStepProcessor, StepProcessorError
 
@@ -29,6 +36,30 @@ from excel_recipe_processor.core.base_processor import FileOpsBaseProcessor, Bas
 logger = logging.getLogger(__name__)
 
 
+# Parts of a range operand: a cell ($A$1), a whole column ($A) or a whole row ($1)
+CELL_PART_RE = re.compile(r'^(\$?)([A-Za-z]{1,3})(\$?)([0-9]+)$')
+COLUMN_PART_RE = re.compile(r'^(\$?)([A-Za-z]{1,3})$')
+ROW_PART_RE = re.compile(r'^(\$?)([0-9]+)$')
+
+MAX_EXCEL_ROW = 1048576
+MAX_EXCEL_COLUMN = 16384
+
+# Raw sheet XML patterns for the streaming awaken scan
+SHARED_STRING_CELL_RE = re.compile(
+    rb'<c\b([^>]*?)\st=["\']s["\']([^>]*)>\s*<v>\s*([0-9]+)\s*</v>\s*</c>'
+)
+INLINE_STRING_CELL_RE = re.compile(
+    rb'<c\b([^>]*?)\st=["\']inlineStr["\']([^>]*)>\s*<is>(.*?)</is>\s*</c>', re.DOTALL
+)
+INLINE_TEXT_RE = re.compile(rb'<t(?:\s[^>]*)?>(.*?)</t>', re.DOTALL)
+PREFIXED_CELL_RE = re.compile(rb'<[A-Za-z_][\w.-]*:c[\s>/]')
+CALC_PR_RE = re.compile(rb'<calcPr\b[^>]*?/?>')
+FULL_CALC_ON_LOAD_RE = re.compile(rb'\sfullCalcOnLoad=["\'][^"\']*["\']')
+WORKBOOK_PART = 'xl/workbook.xml'
+WORKBOOK_CALC_PR_PREDECESSORS = (b'</sheets>', b'</functionGroups>', b'<functionGroups/>',
+                                 b'</externalReferences>', b'</definedNames>')
+
+
 class InjectFormulasProcessor(FileOpsBaseProcessor):
     """
     Processor for injecting formulas into existing Excel files.
@@ -51,6 +82,8 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
     - live/awaken: File operations manipulating existing Excel files
     """
     
+    uses_workbook_session = True
+    
     def __init__(self, step_config: dict):
         # Initialize stage directives to None to detect what gets set
         self.source_stage = None
@@ -230,7 +263,7 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
         Returns:
             Description of operation performed
         """
-        workbook = openpyxl.load_workbook(filename)
+        workbook = self.load_workbook(filename)
         formulas_injected = 0
         sheets_processed = 0
         
@@ -250,8 +283,8 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
             logger.debug(f"Injected {sheet_formulas} formulas in sheet '{sheet_name}'")
         
         # Save the modified workbook
-        workbook.save(filename)
-        workbook.close()
+        self.save_workbook(workbook, filename)
+        self.close_workbook(workbook)
         
         mode_desc = "live" if mode == "live" else "dead"
         return f"injected {formulas_injected} {mode_desc} formulas across {sheets_processed} sheets in {filename}"
@@ -260,6 +293,13 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
         """
         Awaken dead formulas in the Excel file.
         
+        The default 'streaming' scan_mode works in two phases and never builds
+        cell objects. The shared-strings table is scanned for formula text
+        first; then only the sheet XML parts holding those strings are rewritten,
+        with every other part of the file copied as is. scan_mode 'full' loads
+        the workbook for editing and checks every cell. Inside a shared workbook
+        session the workbook is already in memory, so the full scan is used.
+        
         Args:
             filename: Excel file to modify
             sheets: Sheet selection
@@ -268,7 +308,20 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
         Returns:
             Description of operation performed
         """
-        workbook = openpyxl.load_workbook(filename)
+        scan_mode = self.get_config_value('scan_mode', 'streaming')
+        
+        if scan_mode not in ['streaming', 'full']:
+            raise StepProcessorError(f"Invalid scan_mode '{scan_mode}'. Must be 'streaming' or 'full'")
+        
+        if scan_mode == 'streaming' and self.workbook_session is None:
+            sheet_counts = self._awaken_formulas_streaming(filename, sheets)
+            if sheet_counts is not None:
+                formulas_awakened = sum(sheet_counts.values())
+                return (f"awakened {formulas_awakened} dead formulas across {len(sheet_counts)} sheets "
+                        f"in {filename}")
+            logger.debug(f"Streaming scan not possible for {filename}, using full scan")
+        
+        workbook = self.load_workbook(filename)
         formulas_awakened = 0
         sheets_processed = 0
         
@@ -285,11 +338,186 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
             logger.debug(f"Awakened {sheet_awakened} formulas in sheet '{sheet_name}'")
         
         # Save the modified workbook
-        workbook.save(filename)
-        workbook.close()
+        self.save_workbook(workbook, filename)
+        self.close_workbook(workbook)
         
         return f"awakened {formulas_awakened} dead formulas across {sheets_processed} sheets in {filename}"
     
+    def _awaken_formulas_streaming(self, filename: str, sheets):
+        """
+        Awaken dead formulas by rewriting only the affected sheet XML parts.
+        
+        Phase one opens the workbook read-only, which reads the shared-strings
+        table but no sheet data, and picks out the strings that hold formula
+        text. Phase two rewrites the string cells pointing at those entries (and
+        any inline string cells holding formula text) as formula cells.
+        
+        Args:
+            filename: Excel file to modify
+            sheets: Sheet selection
+            
+        Returns:
+            Dict of sheet name to formulas awakened, or None when the file
+            layout needs the full scan instead
+        """
+        workbook = self.load_workbook(filename, read_only=True)
+        
+        try:
+            sheet_parts = {}
+            shared_strings = None
+            for sheet_name in self._get_target_sheets(workbook, sheets):
+                worksheet = workbook[sheet_name]
+                part_name = getattr(worksheet, '_worksheet_path', None)
+                shared_strings = getattr(worksheet, '_shared_strings', None)
+                if part_name is None or shared_strings is None:
+                    return None
+                sheet_parts[sheet_name] = part_name
+        finally:
+            self.close_workbook(workbook)
+        
+        # Phase one: shared strings that are really formulas
+        string_formulas = {}
+        for index, value in enumerate(shared_strings or []):
+            if value.__class__ is str:
+                formula = self._dead_formula_text(value)
+                if formula is not None:
+                    string_formulas[str(index).encode()] = formula
+        
+        # Phase two: rewrite the cells that use them
+        sheet_counts = {sheet_name: 0 for sheet_name in sheet_parts}
+        new_parts = {}
+        
+        with zipfile.ZipFile(filename) as archive:
+            for sheet_name, part_name in sheet_parts.items():
+                sheet_xml = archive.read(part_name)
+                if not string_formulas and b'inlineStr' not in sheet_xml:
+                    continue
+                
+                if PREFIXED_CELL_RE.search(sheet_xml):
+                    return None
+                
+                new_xml, awakened = self._rewrite_dead_formula_cells(sheet_xml, string_formulas)
+                if awakened:
+                    new_parts[part_name] = new_xml
+                    sheet_counts[sheet_name] = awakened
+                    logger.debug(f"Awakened {awakened} formulas in sheet '{sheet_name}'")
+            
+            if not new_parts:
+                return sheet_counts
+            
+            if WORKBOOK_PART in archive.namelist():
+                new_parts[WORKBOOK_PART] = self._set_full_calc_on_load(archive.read(WORKBOOK_PART))
+            self._write_archive_parts(archive, filename, new_parts)
+        
+        return sheet_counts
+    
+    def _rewrite_dead_formula_cells(self, sheet_xml: bytes, string_formulas: dict) -> tuple:
+        """
+        Turn string cells holding formula text into formula cells.
+        
+        Args:
+            sheet_xml: Raw sheet XML part
+            string_formulas: Shared string index (as bytes) to formula text
+            
+        Returns:
+            Tuple of (new sheet XML, number of cells rewritten)
+        """
+        awakened = 0
+        
+        def formula_cell(attributes: bytes, formula: str) -> bytes:
+            nonlocal awakened
+            awakened += 1
+            body = xml_escape(formula[1:]).encode('utf-8')
+            return b'<c ' + attributes + b'><f>' + body + b'</f></c>'
+        
+        def replace_shared(match):
+            formula = string_formulas.get(match.group(3))
+            if formula is None:
+                return match.group(0)
+            return formula_cell(self._join_cell_attributes(match.group(1), match.group(2)), formula)
+        
+        def replace_inline(match):
+            text = ''.join(
+                xml_unescape(part.decode('utf-8')) for part in INLINE_TEXT_RE.findall(match.group(3))
+            )
+            formula = self._dead_formula_text(text)
+            if formula is None:
+                return match.group(0)
+            return formula_cell(self._join_cell_attributes(match.group(1), match.group(2)), formula)
+        
+        if string_formulas:
+            sheet_xml = SHARED_STRING_CELL_RE.sub(replace_shared, sheet_xml)
+        if b'inlineStr' in sheet_xml:
+            sheet_xml = INLINE_STRING_CELL_RE.sub(replace_inline, sheet_xml)
+        
+        return sheet_xml, awakened
+    
+    def _join_cell_attributes(self, before: bytes, after: bytes) -> bytes:
+        """Rebuild a cell's attribute list without its t attribute."""
+        return b' '.join(part.strip() for part in (before, after) if part.strip())
+    
+    def _set_full_calc_on_load(self, workbook_xml: bytes) -> bytes:
+        """
+        Ask Excel to recalculate on open, as a full openpyxl save does.
+        
+        New formula cells have no cached value, so without this Excel could
+        show them empty until the next recalculation.
+        """
+        calc_match = CALC_PR_RE.search(workbook_xml)
+        if calc_match is None:
+            # calcPr has to follow these elements in the schema order
+            positions = [workbook_xml.rfind(tag) + len(tag) for tag in WORKBOOK_CALC_PR_PREDECESSORS
+                         if tag in workbook_xml]
+            if not positions:
+                return workbook_xml
+            insert_at = max(positions)
+            return workbook_xml[:insert_at] + b'<calcPr fullCalcOnLoad="1"/>' + workbook_xml[insert_at:]
+        
+        calc_pr = FULL_CALC_ON_LOAD_RE.sub(b'', calc_match.group(0))
+        calc_pr = calc_pr.replace(b'<calcPr', b'<calcPr fullCalcOnLoad="1"', 1)
+        return workbook_xml[:calc_match.start()] + calc_pr + workbook_xml[calc_match.end():]
+    
+    def _write_archive_parts(self, archive, filename: str, new_parts: dict) -> None:
+        """
+        Write a copy of an xlsx archive with some parts replaced, then swap it in.
+        
+        Args:
+            archive: Open zipfile of the original file
+            filename: File to replace
+            new_parts: Dict of part name to new content
+        """
+        target_dir = Path(filename).resolve().parent
+        temp_fd, temp_path = tempfile.mkstemp(suffix='.xlsx', dir=target_dir)
+        os.close(temp_fd)
+        
+        try:
+            with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as output:
+                for info in archive.infolist():
+                    content = new_parts.get(info.filename)
+                    if content is None:
+                        content = archive.read(info)
+                    output.writestr(info, content)
+            shutil.copymode(filename, temp_path)
+            os.replace(temp_path, filename)
+        except Exception as e:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise StepProcessorError(f"Failed to write awakened formulas to '{filename}': {e}")
+    
+    def _dead_formula_text(self, value: str):
+        """
+        Get the live formula for a cell value holding formula text, or None.
+        
+        Uses the same rules as _awaken_sheet_formulas(): surrounding whitespace
+        and a leading single quote are dropped.
+        """
+        cell_value = value.strip()
+        if cell_value.startswith("'="):
+            return cell_value[1:]
+        if cell_value.startswith("="):
+            return cell_value
+        return None
+    
     def _get_target_sheets(self, workbook, sheets) -> list:
         """
         Determine which sheets to process.
@@ -349,7 +577,12 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
         if 'cell' in formula_def:
             return self._apply_formula_to_cell(worksheet, formula_def['cell'], formula, mode)
         elif 'range' in formula_def:
-            return self._apply_formula_to_range(worksheet, formula_def['range'], formula, mode)
+            adjust_references = formula_def.get(
+                'adjust_references', self.get_config_value('adjust_references', True)
+            )
+            return self._apply_formula_to_range(
+                worksheet, formula_def['range'], formula, mode, adjust_references
+            )
         else:
             raise StepProcessorError("Formula definition must include either 'cell' or 'range' key")
     
@@ -382,15 +615,21 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
         logger.debug(f"Set {mode} formula in {cell_ref}: {formula}")
         return 1
     
-    def _apply_formula_to_range(self, worksheet, range_ref: str, formula: str, mode: str) -> int:
+    def _apply_formula_to_range(self, worksheet, range_ref: str, formula: str, mode: str,
+                                adjust_references: bool = True) -> int:
         """
         Apply formula to a range of cells.
         
+        The formula is written as it should appear in the top-left cell of the
+        range. Relative references shift for every other cell the same way Excel
+        shifts them when a formula is filled across a range; $-anchored parts stay.
+        
         Args:
             worksheet: openpyxl worksheet
             range_ref: Range reference like 'A1:A10', 'B2:D5', etc.
-            formula: Base formula to inject (will be adjusted for each cell)
+            formula: Base formula for the top-left cell of the range
             mode: 'live' or 'dead'
+            adjust_references: Shift relative references for each cell
             
         Returns:
             Number of cells modified
@@ -399,44 +638,164 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
         if not self._is_valid_range_reference(range_ref):
             raise StepProcessorError(f"Invalid range reference: {range_ref}")
         
-        cells_modified = 0
-        
-        # Get the range
-        cell_range = worksheet[range_ref]
-        
-        # Handle both single row/column and multi-dimensional ranges
-        if hasattr(cell_range, '__iter__') and not hasattr(cell_range, 'value'):
-            # Multi-dimensional range
-            for row in cell_range:
-                if hasattr(row, '__iter__'):
-                    # Row is iterable (multiple cells)
-                    for cell in row:
-                        adjusted_formula = self._adjust_formula_for_cell(formula, cell.coordinate)
-                        if mode == 'live':
-                            cell.value = adjusted_formula
-                        else:
-                            cell.value = f"'{adjusted_formula}"
-                        cells_modified += 1
-                else:
-                    # Single cell in row
-                    adjusted_formula = self._adjust_formula_for_cell(formula, row.coordinate)
-                    if mode == 'live':
-                        row.value = adjusted_formula
-                    else:
-                        row.value = f"'{adjusted_formula}"
-                    cells_modified += 1
+        first_col, first_row, last_col, last_row = range_boundaries(range_ref)
+        min_col, max_col = sorted((first_col, last_col))
+        min_row, max_row = sorted((first_row, last_row))
+        row_count = max_row - min_row + 1
+        column_count = max_col - min_col + 1
+        
+        if adjust_references:
+            segments = self._compile_formula_template(formula)
         else:
-            # Single cell range
-            adjusted_formula = self._adjust_formula_for_cell(formula, cell_range.coordinate)
-            if mode == 'live':
-                cell_range.value = adjusted_formula
-            else:
-                cell_range.value = f"'{adjusted_formula}"
-            cells_modified += 1
+            segments = [formula if formula.startswith('=') else '=' + formula]
+        
+        references = [segment for segment in segments if isinstance(segment, tuple)]
+        self._check_shifted_references(references, row_count, column_count, range_ref)
+        
+        # Rows are the only part that changes along a column, so each column gets
+        # one pattern with its column letters filled in and slots for the rows
+        text_prefix = '' if mode == 'live' else "'"
+        patterns = [
+            text_prefix + self._resolve_template_columns(segments, col_offset)
+            for col_offset in range(column_count)
+        ]
+        relative_rows = [ref[2] for ref in references if ref[2] is not None and not ref[3]]
         
+        # Write row by row
+        for row_offset in range(row_count):
+            row_values = tuple(row + row_offset for row in relative_rows)
+            row_num = min_row + row_offset
+            for col_offset, pattern in enumerate(patterns):
+                worksheet.cell(row=row_num, column=min_col + col_offset).value = pattern % row_values
+        
+        cells_modified = row_count * column_count
         logger.debug(f"Applied {mode} formula to range {range_ref}: {cells_modified} cells")
         return cells_modified
     
+    def _compile_formula_template(self, formula: str) -> list:
+        """
+        Tokenize a formula once into literal text and reference parts.
+        
+        Every cell, whole-column or whole-row reference becomes a tuple of
+        (column_index, column_absolute, row, row_absolute), with None for the
+        part a whole-column or whole-row reference does not have. Names, text
+        and everything else stay literal strings.
+        
+        Args:
+            formula: Formula for the top-left cell of a range
+            
+        Returns:
+            List of str and tuple segments
+        """
+        if not formula.startswith('='):
+            formula = '=' + formula
+        
+        try:
+            tokens = Tokenizer(formula).items
+        except Exception:
+            # Not parseable as a formula (e.g. documentation text), so copy it unchanged
+            return [formula]
+        
+        segments = ['=']
+        for token in tokens:
+            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+                segments.extend(self._compile_reference(token.value))
+            else:
+                segments.append(token.value)
+        
+        return segments
+    
+    def _compile_reference(self, operand: str) -> list:
+        """
+        Split a range operand like 'Sheet1'!$A2:B$5, C:C or 3:4 into segments.
+        
+        Args:
+            operand: Range operand token from the formula tokenizer
+            
+        Returns:
+            List of str and tuple segments (the operand itself if it is a name)
+        """
+        sheet_end = operand.rfind('!') + 1
+        sheet_prefix, reference = operand[:sheet_end], operand[sheet_end:]
+        parts = reference.split(':')
+        
+        if len(parts) > 2:
+            return [operand]
+        
+        compiled = [self._compile_cell_part(part) for part in parts]
+        
+        if len(parts) == 2 and None in compiled:
+            # Whole columns (A:C) or whole rows (2:5)
+            column_parts = [COLUMN_PART_RE.match(part) for part in parts]
+            row_parts = [ROW_PART_RE.match(part) for part in parts]
+            if all(column_parts):
+                compiled = [
+                    (column_index_from_string(match.group(2).upper()), bool(match.group(1)), None, False)
+                    for match in column_parts
+                ]
+            elif all(row_parts):
+                compiled = [(None, False, int(match.group(2)), bool(match.group(1))) for match in row_parts]
+        
+        if None in compiled or any(ref[0] is not None and ref[0] > MAX_EXCEL_COLUMN for ref in compiled):
+            # Defined names, structured references and the like are left alone
+            return [operand]
+        
+        segments = [sheet_prefix, compiled[0]]
+        if len(compiled) == 2:
+            segments.extend([':', compiled[1]])
+        return segments
+    
+    def _compile_cell_part(self, part: str):
+        """Parse one cell reference like $A1 into a reference tuple, or None."""
+        match = CELL_PART_RE.match(part)
+        if not match:
+            return None
+        column_abs, column, row_abs, row = match.groups()
+        return (column_index_from_string(column.upper()), bool(column_abs), int(row), bool(row_abs))
+    
+    def _check_shifted_references(self, references: list, row_count: int, column_count: int,
+                                  range_ref: str) -> None:
+        """Make sure no relative reference moves past the edge of the sheet."""
+        for column, column_abs, row, row_abs in references:
+            if row is not None and not row_abs and row + row_count - 1 > MAX_EXCEL_ROW:
+                raise StepProcessorError(
+                    f"Filling formula over range {range_ref} moves row {row} past the last sheet row"
+                )
+            if column is not None and not column_abs and column + column_count - 1 > MAX_EXCEL_COLUMN:
+                raise StepProcessorError(
+                    f"Filling formula over range {range_ref} moves column "
+                    f"{get_column_letter(column)} past the last sheet column"
+                )
+    
+    def _resolve_template_columns(self, segments: list, col_offset: int) -> str:
+        """
+        Build a %-format pattern for one column of a range.
+        
+        Column letters are filled in for the given column offset. Relative rows
+        become %d slots, in template order; absolute rows are written as is.
+        
+        Args:
+            segments: Output of _compile_formula_template()
+            col_offset: Columns between this column and the first column of the range
+            
+        Returns:
+            Format pattern taking a tuple of shifted relative rows
+        """
+        pieces = []
+        for segment in segments:
+            if not isinstance(segment, tuple):
+                pieces.append(segment.replace('%', '%%'))
+                continue
+            
+            column, column_abs, row, row_abs = segment
+            if column is not None:
+                shifted = column if column_abs else column + col_offset
+                pieces.append(('$' if column_abs else '') + get_column_letter(shifted))
+            if row is not None:
+                pieces.append(f'${row}' if row_abs else '%d')
+        
+        return ''.join(pieces)
+    
     def _awaken_sheet_formulas(self, worksheet) -> int:
         """
         Scan a worksheet for dead formulas and awaken them.
@@ -471,29 +830,6 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
         
         return formulas_awakened
     
-    def _adjust_formula_for_cell(self, base_formula: str, cell_coord: str) -> str:
-        """
-        Adjust a base formula for a specific cell location.
-        
-        For now, this is a simple implementation. Could be enhanced
-        to automatically adjust relative references.
-        
-        Args:
-            base_formula: Base formula template
-            cell_coord: Target cell coordinate like 'A1', 'B5'
-            
-        Returns:
-            Adjusted formula for the specific cell
-        """
-        # Simple implementation - just return the base formula
-        # Future enhancement: parse and adjust relative references
-        
-        # Ensure formula starts with = if not already
-        if not base_formula.startswith('='):
-            return '=' + base_formula
-        
-        return base_formula
-    
     def _is_valid_cell_reference(self, cell_ref: str) -> bool:
         """Check if a string is a valid Excel cell reference."""
         try:
@@ -555,7 +891,9 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
             'operation_type': 'formula_injection',
             'supported_modes': ['live', 'dead', 'awaken'],
             'targeting_options': ['single_cell', 'cell_range', 'auto_scan'],
+            'range_fill': 'relative references shift per cell like an Excel fill (adjust_references: false to copy as is)',
             'sheet_support': ['single_sheet', 'multiple_sheets', 'all_sheets'],
+            'awaken_scan_modes': ['streaming', 'full'],
             'file_requirements': ['xlsx', 'xlsm'],
             'dependencies': ['openpyxl'],
             'stage_requirements': 'none',
@@ -590,7 +928,7 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
             },
             
             'range_example': {
-                'description': 'Apply formulas to ranges and multiple sheets',
+                'description': 'Apply formulas to ranges and multiple sheets (relative references shift per cell)',
                 'yaml': '''
   - step_description: "Add formulas to entire columns"
     processor_type: "inject_formulas"
@@ -599,9 +937,12 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
     sheets: ["Revenue", "Expenses"]
     formulas:
       - range: "D2:D50"
-        formula: "=B2*C2"
+        formula: "=B2*C2"               # D3 gets =B3*C3, D4 gets =B4*C4, ...
       - range: "E2:E50"
+        formula: "=D2*$H$1"             # $-anchored parts stay fixed
+      - range: "F2:F50"
         formula: "=D2*0.1"
+        adjust_references: false        # Same formula in every cell
       - cell: "D51"
         formula: "=SUM(D2:D50)"
 '''
@@ -616,6 +957,7 @@ class InjectFormulasProcessor(FileOpsBaseProcessor):
     mode: "awaken"
     sheets: "all"
     auto_scan: true
+    scan_mode: "streaming"   # Default; "full" checks every cell of an editable load
 '''
             },
             
@@ -7,9 +7,11 @@ Handles stage-to-stage lookups with focus on solving real matching problems:
 - Type and format normalization (numeric vs string, .0 issues, whitespace)
 - Clean pandas merge operations without architectural complexity
 - Simple column naming with prefix/suffix support
+- Composite keys and range lookups (quantity brackets, effective dates)
 - Enhanced logging for lookup success/failure analysis
 """
 
+import numpy as np
 import pandas as pd
 import logging
 
@@ -34,8 +36,18 @@ class LookupDataProcessor(BaseStepProcessor):
     - Missing value defaults with detailed logging
     
     Uses stage-to-stage workflow only - no file handling complexity.
+    
+    Left and inner joins are answered from StageManager's shared key index:
+    lookup columns are gathered by row position and attached to the main data,
+    so neither frame is copied in full. Right and outer joins use a merge.
     """
     
+    # Join types served by the key-index fast path (and by range lookups)
+    INDEXED_JOIN_TYPES = ('left', 'inner')
+    
+    # merge_asof directions for range lookups
+    RANGE_DIRECTIONS = ('backward', 'forward', 'nearest')
+    
     @classmethod
     def get_minimal_config(cls) -> dict:
         return {
@@ -67,26 +79,54 @@ class LookupDataProcessor(BaseStepProcessor):
         default_values = self.get_config_value('default_values', {})
         normalize_keys = self.get_config_value('normalize_keys', True)
         handle_duplicates = self.get_config_value('handle_duplicates', 'first')
+        range_col_in_main_data = self.get_config_value('range_col_in_main_data')
+        range_col_in_lookup_data = self.get_config_value('range_col_in_lookup_data')
+        range_end_col_in_lookup_data = self.get_config_value('range_end_col_in_lookup_data')
+        range_direction = self.get_config_value('range_direction', 'backward')
+        
+        # Single key columns and composite key lists are handled the same way
+        main_keys = self._as_key_list(match_col_in_main_data)
+        lookup_keys = self._as_key_list(match_col_in_lookup_data)
+        range_lookup = bool(range_col_in_main_data or range_col_in_lookup_data)
         
         # Validate configuration
-        self._validate_config(data, lookup_stage, match_col_in_lookup_data, match_col_in_main_data, lookup_columns, join_type)
+        self._validate_config(data, lookup_stage, lookup_keys, main_keys, lookup_columns, join_type, range_lookup)
+        if range_lookup:
+            self._validate_range_config(data, range_col_in_main_data, range_col_in_lookup_data, range_direction, join_type)
         
         try:
-            # Load lookup data from stage
-            lookup_data = self._load_lookup_stage(lookup_stage)
-            
-            # Validate lookup data structure
-            self._validate_lookup_data(lookup_data, match_col_in_lookup_data, lookup_columns)
-            
-            # Handle duplicates in lookup data
-            lookup_data = self._handle_lookup_duplicates(lookup_data, match_col_in_lookup_data, handle_duplicates)
+            # Validate lookup stage structure (without loading a copy of it)
+            required_lookup_keys = lookup_keys + [
+                col for col in (range_col_in_lookup_data, range_end_col_in_lookup_data) if col
+            ]
+            self._validate_lookup_data(lookup_stage, required_lookup_keys, lookup_columns)
             
-            # Normalize keys to handle real matching problems
-            if normalize_keys:
-                data, lookup_data = self._normalize_keys(data, lookup_data, match_col_in_main_data, match_col_in_lookup_data)
-            
-            # Perform the lookup merge
-            result = self._perform_lookup_merge(data, lookup_data, match_col_in_main_data, match_col_in_lookup_data, lookup_columns, join_type)
+            if range_lookup:
+                # Range lookup: nearest range start per (optional) exact key
+                result = self._perform_range_lookup(
+                    data, lookup_stage, main_keys, lookup_keys, range_col_in_main_data,
+                    range_col_in_lookup_data, range_end_col_in_lookup_data, range_direction,
+                    lookup_columns, join_type, normalize_keys, handle_duplicates
+                )
+            elif join_type in self.INDEXED_JOIN_TYPES:
+                # Fast path: every main row gets at most one lookup row
+                result = self._perform_indexed_lookup(
+                    data, lookup_stage, main_keys, lookup_keys,
+                    lookup_columns, join_type, normalize_keys, handle_duplicates
+                )
+            else:
+                # Load lookup data from stage
+                lookup_data = self._load_lookup_stage(lookup_stage)
+                
+                # Handle duplicates in lookup data
+                lookup_data = self._handle_lookup_duplicates(lookup_data, lookup_keys, handle_duplicates)
+                
+                # Normalize keys to handle real matching problems
+                if normalize_keys:
+                    data, lookup_data = self._normalize_keys(data, lookup_data, main_keys, lookup_keys)
+                
+                # Perform the lookup merge
+                result = self._perform_lookup_merge(data, lookup_data, main_keys, lookup_keys, lookup_columns, join_type)
             
             # Apply column naming (prefix/suffix)
             if prefix or suffix:
@@ -110,35 +150,78 @@ class LookupDataProcessor(BaseStepProcessor):
             else:
                 raise StepProcessorError(f"Lookup operation failed in step '{self.step_name}': {e}")
     
-    def _validate_config(self, data: pd.DataFrame, lookup_stage: str, match_col_in_lookup_data: str, 
-                        match_col_in_main_data: str, lookup_columns: list, join_type: str) -> None:
+    @staticmethod
+    def _as_key_list(key_config) -> list:
+        """Turn a key column setting (name or list of names) into a list."""
+        if not key_config:
+            return []
+        if isinstance(key_config, (list, tuple)):
+            return list(key_config)
+        return [key_config]
+    
+    def _validate_config(self, data: pd.DataFrame, lookup_stage: str, lookup_keys: list, 
+                        main_keys: list, lookup_columns: list, join_type: str,
+                        range_lookup: bool = False) -> None:
         """Validate configuration parameters."""
         
-        # Check required fields
+        # Check required fields (range lookups may match on the range alone)
         if not lookup_stage:
             raise StepProcessorError("lookup_stage is required")
         
-        if not match_col_in_lookup_data:
+        if not lookup_keys and not range_lookup:
             raise StepProcessorError("match_col_in_lookup_data is required")
         
-        if not match_col_in_main_data:
+        if not main_keys and not range_lookup:
             raise StepProcessorError("match_col_in_main_data is required")
         
+        if len(main_keys) != len(lookup_keys):
+            raise StepProcessorError(
+                f"match_col_in_main_data and match_col_in_lookup_data must list the same number of columns, "
+                f"got {main_keys} and {lookup_keys}"
+            )
+        
         if not lookup_columns or not isinstance(lookup_columns, list):
             raise StepProcessorError("lookup_columns must be a non-empty list")
         
-        # Check source key exists in main data
-        if match_col_in_main_data not in data.columns:
-            available = list(data.columns)
-            raise StepProcessorError(
-                f"Main data key '{match_col_in_main_data}' not found in main data. Available columns: {available}"
-            )
+        # Check source keys exist in main data
+        for main_key in main_keys:
+            if main_key not in data.columns:
+                available = list(data.columns)
+                raise StepProcessorError(
+                    f"Main data key '{main_key}' not found in main data. Available columns: {available}"
+                )
         
         # Validate join type
         valid_joins = ['left', 'right', 'inner', 'outer']
         if join_type not in valid_joins:
             raise StepProcessorError(f"Invalid join_type '{join_type}'. Valid options: {valid_joins}")
     
+    def _validate_range_config(self, data: pd.DataFrame, range_col_in_main_data: str,
+                               range_col_in_lookup_data: str, range_direction: str, join_type: str) -> None:
+        """Validate range lookup settings."""
+        
+        if not range_col_in_main_data or not range_col_in_lookup_data:
+            raise StepProcessorError(
+                "Range lookups require both range_col_in_main_data and range_col_in_lookup_data"
+            )
+        
+        if range_col_in_main_data not in data.columns:
+            available = list(data.columns)
+            raise StepProcessorError(
+                f"Main data range column '{range_col_in_main_data}' not found in main data. "
+                f"Available columns: {available}"
+            )
+        
+        if range_direction not in self.RANGE_DIRECTIONS:
+            raise StepProcessorError(
+                f"Invalid range_direction '{range_direction}'. Valid options: {list(self.RANGE_DIRECTIONS)}"
+            )
+        
+        if join_type not in self.INDEXED_JOIN_TYPES:
+            raise StepProcessorError(
+                f"Range lookups support join_type {list(self.INDEXED_JOIN_TYPES)}, got '{join_type}'"
+            )
+    
     def _load_lookup_stage(self, stage_name: str) -> pd.DataFrame:
         """Load lookup data from specified stage."""
         
@@ -156,99 +239,274 @@ class LookupDataProcessor(BaseStepProcessor):
         except StageError as e:
             raise StepProcessorError(f"Failed to load lookup stage '{stage_name}': {e}")
     
-    def _validate_lookup_data(self, lookup_data: pd.DataFrame, match_col_in_lookup_data: str, lookup_columns: list) -> None:
-        """Validate that lookup data has required columns."""
+    def _validate_lookup_data(self, stage_name: str, lookup_keys: list, lookup_columns: list) -> None:
+        """Validate that the lookup stage exists and has the required columns."""
         
-        if len(lookup_data) == 0:
-            raise StepProcessorError("Lookup stage contains no data")
-        
-        # Check lookup key exists
-        if match_col_in_lookup_data not in lookup_data.columns:
-            available = list(lookup_data.columns)
+        if not StageManager.stage_exists(stage_name):
+            available = list(StageManager.list_stages().keys())
             raise StepProcessorError(
-                f"Lookup data key '{match_col_in_lookup_data}' not found in lookup data. Available columns: {available}"
+                f"Lookup stage '{stage_name}' not found. Available stages: {available}"
             )
         
+        if StageManager.list_stages()[stage_name]['rows'] == 0:
+            raise StepProcessorError("Lookup stage contains no data")
+        
+        available = StageManager.get_stage_columns(stage_name)
+        
+        # Check lookup keys exist
+        for lookup_key in lookup_keys:
+            if lookup_key not in available:
+                raise StepProcessorError(
+                    f"Lookup data key '{lookup_key}' not found in lookup data. Available columns: {available}"
+                )
+        
         # Check lookup columns exist
-        missing_columns = [col for col in lookup_columns if col not in lookup_data.columns]
+        missing_columns = [col for col in lookup_columns if col not in available]
         if missing_columns:
-            available = list(lookup_data.columns)
             raise StepProcessorError(
                 f"Lookup columns not found: {missing_columns}. Available columns: {available}"
             )
     
-    def _handle_lookup_duplicates(self, lookup_data: pd.DataFrame, match_col_in_lookup_data: str, handle_method: str) -> pd.DataFrame:
+    def _handle_lookup_duplicates(self, lookup_data: pd.DataFrame, lookup_keys: list, handle_method: str) -> pd.DataFrame:
         """Handle duplicate keys in lookup data."""
         
         if handle_method == 'error':
-            duplicates = lookup_data[lookup_data.duplicated(subset=[match_col_in_lookup_data], keep=False)]
+            duplicates = lookup_data[lookup_data.duplicated(subset=lookup_keys, keep=False)]
             if len(duplicates) > 0:
-                duplicate_keys = duplicates[match_col_in_lookup_data].unique()[:5]  # Show first 5
+                if len(lookup_keys) == 1:
+                    duplicate_keys = list(duplicates[lookup_keys[0]].unique()[:5])  # Show first 5
+                else:
+                    duplicate_keys = list(duplicates[lookup_keys].drop_duplicates().head(5).itertuples(index=False, name=None))
                 raise StepProcessorError(
-                    f"Duplicate keys found in lookup data: {list(duplicate_keys)}... "
+                    f"Duplicate keys found in lookup data: {duplicate_keys}... "
                     f"Use handle_duplicates='first' or 'last' to resolve automatically."
                 )
         
         elif handle_method == 'first':
-            lookup_data = lookup_data.drop_duplicates(subset=[match_col_in_lookup_data], keep='first')
+            lookup_data = lookup_data.drop_duplicates(subset=lookup_keys, keep='first')
         
         elif handle_method == 'last':
-            lookup_data = lookup_data.drop_duplicates(subset=[match_col_in_lookup_data], keep='last')
+            lookup_data = lookup_data.drop_duplicates(subset=lookup_keys, keep='last')
         
         else:
             raise StepProcessorError(f"Invalid handle_duplicates '{handle_method}'. Valid options: first, last, error")
         
         return lookup_data
     
-    def _normalize_keys(self, data: pd.DataFrame, lookup_data: pd.DataFrame, 
-                       match_col_in_main_data: str, match_col_in_lookup_data: str) -> tuple[pd.DataFrame, pd.DataFrame]:
-        """Normalize keys to handle real matching problems."""
+    def _check_stage_duplicates(self, lookup_stage: str, lookup_keys: list, handle_duplicates: str) -> None:
+        """Validate handle_duplicates and enforce 'error' directly on the stage."""
+        
+        if handle_duplicates not in ('first', 'last', 'error'):
+            raise StepProcessorError(f"Invalid handle_duplicates '{handle_duplicates}'. Valid options: first, last, error")
+        
+        if handle_duplicates == 'error':
+            duplicate_keys = StageManager.get_duplicate_keys(lookup_stage, lookup_keys)
+            if duplicate_keys:
+                raise StepProcessorError(
+                    f"Duplicate keys found in lookup data: {duplicate_keys}... "
+                    f"Use handle_duplicates='first' or 'last' to resolve automatically."
+                )
+    
+    def _perform_indexed_lookup(self, data: pd.DataFrame, lookup_stage: str,
+                                main_keys: list, lookup_keys: list,
+                                lookup_columns: list, join_type: str, normalize_keys: bool,
+                                handle_duplicates: str) -> pd.DataFrame:
+        """Attach lookup columns by key → row position without merging or copying frames."""
+        
+        self._check_stage_duplicates(lookup_stage, lookup_keys, handle_duplicates)
+        
+        # The index is shared through StageManager, so repeated lookups against a stage reuse it
+        key_mode = 'normalized' if normalize_keys else 'exact'
+        keep = 'last' if handle_duplicates == 'last' else 'first'
+        key_index = StageManager.get_key_index(lookup_stage, lookup_keys, key_mode=key_mode, keep=keep)
+        
+        if len(main_keys) == 1:
+            # Normalize and probe each distinct main key once, then expand back to rows
+            codes, unique_keys = self._factorize_keys(data[main_keys[0]], key_mode)
+            unique_hits = key_index.index.get_indexer(unique_keys)
+            hits = np.where(codes >= 0, unique_hits[codes], -1)
+        else:
+            # Composite keys are probed as one MultiIndex (hashed via packed level codes)
+            key_parts = [self._normalize_main_keys(data[col], key_mode) for col in main_keys]
+            hits = key_index.index.get_indexer(pd.MultiIndex.from_arrays(key_parts))
+        
+        positions = np.where(hits >= 0, key_index.to_numpy()[hits], -1)
+        
+        logger.debug(f"Indexed lookup: {len(key_index)} unique lookup keys, "
+                     f"{(positions >= 0).sum()} of {len(data)} main rows matched")
+        
+        return self._attach_lookup_rows(data, lookup_stage, positions, lookup_columns, join_type)
+    
+    def _perform_range_lookup(self, data: pd.DataFrame, lookup_stage: str,
+                              main_keys: list, lookup_keys: list,
+                              range_col_in_main_data: str, range_col_in_lookup_data: str,
+                              range_end_col_in_lookup_data: str, range_direction: str,
+                              lookup_columns: list, join_type: str, normalize_keys: bool,
+                              handle_duplicates: str) -> pd.DataFrame:
+        """Match each main row to the lookup row with the nearest range start (merge_asof)."""
+        
+        key_mode = 'normalized' if normalize_keys else 'exact'
+        
+        # Only the key and range columns of the stage are read, lookup columns are gathered later
+        stage_columns = list(dict.fromkeys(
+            lookup_keys + [col for col in (range_col_in_lookup_data, range_end_col_in_lookup_data) if col]
+        ))
+        stage_rows = StageManager.list_stages()[lookup_stage]['rows']
+        bounds = StageManager.take_stage_rows(lookup_stage, np.arange(stage_rows), stage_columns)
+        
+        main_range, lookup_range = self._coerce_range_values(
+            data[range_col_in_main_data], bounds[range_col_in_lookup_data], range_col_in_lookup_data
+        )
+        
+        # Narrow frames with internal column names, so user columns can never collide
+        by_columns = [f'_key_{i}' for i in range(len(main_keys))]
+        left = pd.DataFrame(
+            {'_range': main_range.to_numpy(), '_row': np.arange(len(data)),
+             **{by: self._normalize_main_keys(data[col], key_mode) for by, col in zip(by_columns, main_keys)}}
+        )
+        right = pd.DataFrame(
+            {'_range': lookup_range.to_numpy(), '_position': np.arange(stage_rows),
+             **{by: StageManager.normalize_key_values(bounds[col], key_mode).to_numpy(dtype=object)
+                for by, col in zip(by_columns, lookup_keys)}}
+        )
+        if range_end_col_in_lookup_data:
+            _, range_end = self._coerce_range_values(
+                main_range, bounds[range_end_col_in_lookup_data], range_end_col_in_lookup_data
+            )
+            right['_range_end'] = range_end.to_numpy()
+        
+        # merge_asof cannot match missing values, drop them and sort both sides by range
+        left = left.dropna(subset=['_range'] + by_columns).sort_values('_range', kind='stable')
+        right = right.dropna(subset=['_range'] + by_columns).sort_values('_range', kind='stable')
         
-        # Make copies to avoid modifying original data
-        data = data.copy()
-        lookup_data = lookup_data.copy()
+        # Several lookup rows starting at the same point follow handle_duplicates
+        if handle_duplicates not in ('first', 'last', 'error'):
+            raise StepProcessorError(f"Invalid handle_duplicates '{handle_duplicates}'. Valid options: first, last, error")
+        tie_columns = by_columns + ['_range']
+        if handle_duplicates == 'error' and right.duplicated(subset=tie_columns).any():
+            raise StepProcessorError(
+                f"Duplicate range starts found in lookup column '{range_col_in_lookup_data}'. "
+                f"Use handle_duplicates='first' or 'last' to resolve automatically."
+            )
+        right = right.drop_duplicates(subset=tie_columns, keep='last' if handle_duplicates == 'last' else 'first')
+        
+        matched = pd.merge_asof(
+            left, right, on='_range', by=by_columns or None, direction=range_direction
+        )
+        
+        found = matched['_position'].notna()
+        if range_end_col_in_lookup_data:
+            # Values past the end of the matched bracket have no match (open-ended when blank)
+            found &= ~(matched['_range'] > matched['_range_end'])
+        
+        positions = np.full(len(data), -1, dtype=np.int64)
+        positions[matched.loc[found, '_row'].to_numpy()] = matched.loc[found, '_position'].to_numpy(dtype=np.int64)
+        
+        logger.debug(f"Range lookup ({range_direction}): {found.sum()} of {len(data)} main rows matched")
+        
+        return self._attach_lookup_rows(data, lookup_stage, positions, lookup_columns, join_type)
+    
+    def _coerce_range_values(self, main_values: pd.Series, lookup_values: pd.Series,
+                             lookup_column: str) -> tuple[pd.Series, pd.Series]:
+        """Convert both sides of a range comparison to float or datetime values."""
+        
+        converters = [
+            lambda values: pd.to_numeric(values, errors='coerce').astype('float64'),
+            lambda values: pd.to_datetime(values, errors='coerce').astype('datetime64[ns]')
+        ]
+        if pd.api.types.is_datetime64_any_dtype(lookup_values):
+            converters.reverse()
+        
+        for convert in converters:
+            converted = convert(lookup_values)
+            # Use the first conversion that keeps every lookup bound
+            if converted.notna().sum() == lookup_values.notna().sum():
+                return convert(main_values), converted
+        
+        raise StepProcessorError(
+            f"Range column '{lookup_column}' must contain numbers or dates"
+        )
+    
+    def _factorize_keys(self, series: pd.Series, key_mode: str) -> tuple:
+        """Factorize a main key column and normalize its distinct values."""
+        codes, uniques = pd.factorize(series, sort=False)
+        unique_keys = StageManager.normalize_key_values(pd.Series(uniques, dtype=object), key_mode)
+        return codes, unique_keys
+    
+    def _normalize_main_keys(self, series: pd.Series, key_mode: str) -> np.ndarray:
+        """Normalize a main key column row by row, working on its distinct values."""
+        codes, unique_keys = self._factorize_keys(series, key_mode)
+        unique_values = unique_keys.to_numpy(dtype=object)
+        normalized = np.full(len(series), None, dtype=object)
+        has_key = codes >= 0
+        normalized[has_key] = unique_values[codes[has_key]]
+        return normalized
+    
+    def _attach_lookup_rows(self, data: pd.DataFrame, lookup_stage: str, positions: np.ndarray,
+                            lookup_columns: list, join_type: str) -> pd.DataFrame:
+        """Gather lookup rows by position (-1 = no match) and attach them to the main data."""
         
-        # Convert both keys to string for consistent comparison
-        data[match_col_in_main_data] = data[match_col_in_main_data].astype(str)
-        lookup_data[match_col_in_lookup_data] = lookup_data[match_col_in_lookup_data].astype(str)
+        matched = positions >= 0
+        gathered = StageManager.take_stage_rows(lookup_stage, positions[matched], lookup_columns)
         
-        # Handle common numeric format issues (1001.0 -> 1001)
-        data[match_col_in_main_data] = data[match_col_in_main_data].str.replace(r'\.0+$', '', regex=True)
-        lookup_data[match_col_in_lookup_data] = lookup_data[match_col_in_lookup_data].str.replace(r'\.0+$', '', regex=True)
+        if join_type == 'inner':
+            result = data.take(matched.nonzero()[0])
+        else:
+            # Shallow copy: existing columns are shared with the input, not rewritten
+            result = data.copy(deep=False)
+            if not matched.all():
+                gathered.index = pd.Index(matched.nonzero()[0])
+                gathered = gathered.reindex(pd.RangeIndex(len(data)))
         
-        # Strip whitespace
-        data[match_col_in_main_data] = data[match_col_in_main_data].str.strip()
-        lookup_data[match_col_in_lookup_data] = lookup_data[match_col_in_lookup_data].str.strip()
+        # Merge results always carry a fresh RangeIndex, keep that contract
+        result.index = pd.RangeIndex(len(result))
+        gathered.index = result.index
         
-        # Handle 'nan' strings from null values
-        data[match_col_in_main_data] = data[match_col_in_main_data].replace('nan', pd.NA)
-        lookup_data[match_col_in_lookup_data] = lookup_data[match_col_in_lookup_data].replace('nan', pd.NA)
+        # Lookup columns replace same-named main columns in place, others are appended
+        for col in lookup_columns:
+            result[col] = gathered[col]
         
-        logger.debug(f"Normalized keys - main data: {data[match_col_in_main_data].nunique()} unique, "
-                    f"lookup data: {lookup_data[match_col_in_lookup_data].nunique()} unique")
+        return result
+    
+    def _normalize_keys(self, data: pd.DataFrame, lookup_data: pd.DataFrame, 
+                       main_keys: list, lookup_keys: list) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Normalize keys to handle real matching problems."""
+        
+        # Shallow copies: only the key columns are replaced, the rest stays shared
+        data = data.copy(deep=False)
+        lookup_data = lookup_data.copy(deep=False)
+        
+        # String conversion, .0 cleanup (1001.0 -> 1001), whitespace stripping and 'nan' -> NA
+        for main_key, lookup_key in zip(main_keys, lookup_keys):
+            data[main_key] = StageManager.normalize_key_values(data[main_key], 'normalized')
+            lookup_data[lookup_key] = StageManager.normalize_key_values(lookup_data[lookup_key], 'normalized')
+            
+            logger.debug(f"Normalized keys - main data: {data[main_key].nunique()} unique, "
+                        f"lookup data: {lookup_data[lookup_key].nunique()} unique")
         
         return data, lookup_data
     
     def _perform_lookup_merge(self, data: pd.DataFrame, lookup_data: pd.DataFrame,
-                             match_col_in_main_data: str, match_col_in_lookup_data: str, lookup_columns: list, 
+                             main_keys: list, lookup_keys: list, lookup_columns: list, 
                              join_type: str) -> pd.DataFrame:
         """Perform the core lookup merge operation."""
         
         # Select only the columns we need from lookup data
-        lookup_subset = lookup_data[[match_col_in_lookup_data] + lookup_columns].copy()
+        lookup_subset = lookup_data[lookup_keys + lookup_columns]
         
         # Use clean suffixes to handle any column name conflicts
         result = data.merge(
             lookup_subset,
-            left_on=match_col_in_main_data,
-            right_on=match_col_in_lookup_data,
+            left_on=main_keys,
+            right_on=lookup_keys,
             how=join_type,
             suffixes=('', '_FROM_LOOKUP')
         )
         
-        # Clean up duplicate key column if different names
-        if match_col_in_lookup_data != match_col_in_main_data and match_col_in_lookup_data in result.columns:
-            result = result.drop(columns=[match_col_in_lookup_data])
+        # Clean up duplicate key columns if different names
+        for main_key, lookup_key in zip(main_keys, lookup_keys):
+            if lookup_key != main_key and lookup_key in result.columns:
+                result = result.drop(columns=[lookup_key])
         
         # Handle any conflicts that got suffixed
         conflicted_columns = [col for col in result.columns if col.endswith('_FROM_LOOKUP')]
@@ -369,7 +627,10 @@ class LookupDataProcessor(BaseStepProcessor):
                 'per_column_default_values',
                 'duplicate_handling',
                 'detailed_match_statistics',
-                'clean_error_messages'
+                'clean_error_messages',
+                'indexed_left_inner_joins',
+                'composite_keys',
+                'range_lookups'
             ],
             'normalization_features': [
                 'handles_numeric_to_string_conversion',
@@ -385,15 +646,19 @@ class LookupDataProcessor(BaseStepProcessor):
             ],
             'configuration_options': {
                 'lookup_stage': 'Stage name containing lookup data',
-                'match_col_in_lookup_data': 'Key column in lookup data',
-                'match_col_in_main_data': 'Key column in main data',
+                'match_col_in_lookup_data': 'Key column in lookup data (or list of columns for a composite key)',
+                'match_col_in_main_data': 'Key column in main data (or list of columns, same order as lookup)',
                 'lookup_columns': 'List of columns to retrieve from lookup data',
                 'join_type': 'Type of join (default: left)',
                 'prefix': 'Prefix for lookup column names',
                 'suffix': 'Suffix for lookup column names',
                 'default_values': 'Dict of per-column default values for missing lookups',
                 'normalize_keys': 'Enable smart key normalization (default: true)',
-                'handle_duplicates': 'How to handle duplicate lookup keys (first/last/error)'
+                'handle_duplicates': 'How to handle duplicate lookup keys (first/last/error)',
+                'range_col_in_main_data': 'Main data column matched against lookup ranges (number or date)',
+                'range_col_in_lookup_data': 'Lookup column holding the start of each range',
+                'range_end_col_in_lookup_data': 'Optional lookup column holding the inclusive end of each range',
+                'range_direction': 'backward (default, start <= value), forward (start >= value), or nearest'
             }
         }
     
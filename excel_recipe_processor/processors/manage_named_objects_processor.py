@@ -37,6 +37,9 @@ class ManageNamedObjectsProcessor(FileOpsBaseProcessor):
     between Excel internal format and user-friendly syntax.
     """
     
+    # Reads saved files only, so it can sit inside a shared workbook session
+    uses_workbook_session = True
+    
     SUPPORTED_OPERATIONS = [
         'export_all', 'export_filtered', 'import_all', 'import_filtered',
         'list_objects', 'validate_yaml', 'copy_direct'
@@ -660,7 +663,7 @@ class ManageNamedObjectsProcessor(FileOpsBaseProcessor):
             raise StepProcessorError("At least one export file (export_file, vba_file, or export_formats) required")
         
         # Load workbook
-        workbook = openpyxl.load_workbook(source_file, data_only=False)
+        workbook = self.load_workbook(source_file, shared=False)
         
         try:
             # Extract all objects
@@ -688,7 +691,7 @@ class ManageNamedObjectsProcessor(FileOpsBaseProcessor):
             }
             
         finally:
-            workbook.close()
+            self.close_workbook(workbook)
     
     def _execute_list_objects(self) -> dict:
         """Execute list objects operation for inventory."""
@@ -697,7 +700,7 @@ class ManageNamedObjectsProcessor(FileOpsBaseProcessor):
         if not source_file:
             raise StepProcessorError("source_file required for list_objects operation")
         
-        workbook = openpyxl.load_workbook(source_file, data_only=False)
+        workbook = self.load_workbook(source_file, shared=False)
         
         try:
             objects_dict = self.extract_all_named_objects(workbook)
@@ -718,7 +721,7 @@ class ManageNamedObjectsProcessor(FileOpsBaseProcessor):
             return inventory
             
         finally:
-            workbook.close()
+            self.close_workbook(workbook)
     
     def _execute_export_filtered(self) -> dict:
         """Execute filtered export operation."""
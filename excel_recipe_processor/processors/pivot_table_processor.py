@@ -4,6 +4,7 @@ Pivot table step processor for Excel automation recipes.
 Handles creating pivot tables with various configurations and aggregation functions.
 """
 
+import numpy as np
 import pandas as pd
 import logging
 
@@ -60,11 +61,43 @@ class PivotTableProcessor(BaseStepProcessor):
         fill_value = self.get_config_value('fill_value', 0)
         margins = self.get_config_value('margins', False)
         dropna = self.get_config_value('dropna', True)
+        observed = self.get_config_value('observed', True)
+        output_format = self.get_config_value('output_format', 'wide')
+        max_output_cells = self.get_config_value('max_output_cells', None)
+        oversize_action = self.get_config_value('oversize_action', 'error')
         
         # Validate configuration
         self._validate_pivot_config(data, index, columns, values, aggfunc)
+        self._validate_output_config(output_format, max_output_cells, oversize_action)
+        
+        # Refuse or switch format before building a dense result that would not fit
+        if output_format == 'wide' and max_output_cells is not None:
+            output_format = self._check_output_size(
+                data, index, columns, values, aggfunc, observed, max_output_cells, oversize_action
+            )
+        
+        if output_format != 'wide':
+            self._validate_preaggregated_config(index, columns, values, aggfunc, margins, output_format)
         
         try:
+            if output_format != 'wide':
+                result_df = self._pivot_preaggregated(
+                    data, index, columns, values, aggfunc, fill_value, dropna, observed, output_format
+                )
+                
+                if self.get_config_value('sort_by_index', False):
+                    result_df = self._sort_by_first_column(result_df)
+                
+                if self.get_config_value('fill_blanks', False):
+                    result_df = self._fill_blank_cells(result_df)
+                
+                result_info = (
+                    f"created {output_format} pivot table: {len(result_df)} rows, {len(result_df.columns)} columns"
+                )
+                self.log_step_complete(result_info)
+                
+                return result_df
+            
             # Create the pivot table
             pivot_result = pd.pivot_table(
                 data=data,
@@ -74,7 +107,8 @@ class PivotTableProcessor(BaseStepProcessor):
                 aggfunc=aggfunc,
                 fill_value=fill_value,
                 margins=margins,
-                dropna=dropna
+                dropna=dropna,
+                observed=observed
             )
             
             # Convert to regular DataFrame and reset index
@@ -163,6 +197,234 @@ class PivotTableProcessor(BaseStepProcessor):
                 f"Valid options: {', '.join(valid_aggfuncs)}"
             )
     
+    def _validate_output_config(self, output_format: str, max_output_cells, oversize_action: str) -> None:
+        """
+        Validate output format and size limit settings.
+        
+        Args:
+            output_format: Requested result layout
+            max_output_cells: Largest allowed wide result, or None for no limit
+            oversize_action: What to do when the wide result would be too large
+        """
+        valid_formats = self.get_supported_output_formats()
+        if output_format not in valid_formats:
+            raise StepProcessorError(
+                f"Unknown output_format: '{output_format}'. Valid options: {', '.join(valid_formats)}"
+            )
+        
+        if max_output_cells is not None:
+            if isinstance(max_output_cells, bool) or not isinstance(max_output_cells, int) or max_output_cells < 1:
+                raise StepProcessorError(
+                    f"'max_output_cells' must be a positive integer or null, got: {max_output_cells}"
+                )
+        
+        valid_actions = ['error', 'sparse', 'long']
+        if oversize_action not in valid_actions:
+            raise StepProcessorError(
+                f"Unknown oversize_action: '{oversize_action}'. Valid options: {', '.join(valid_actions)}"
+            )
+    
+    def _validate_preaggregated_config(self, index, columns, values, aggfunc, margins, output_format) -> None:
+        """
+        Check that the configuration can be built through the pre-aggregated path.
+        
+        Args:
+            index: Index field(s)
+            columns: Column field(s)
+            values: Value field(s)
+            aggfunc: Aggregation function
+            margins: Whether totals were requested
+            output_format: 'sparse' or 'long'
+        """
+        if not index:
+            raise StepProcessorError(f"Pivot output_format '{output_format}' requires 'index' fields")
+        
+        if output_format == 'sparse' and not columns:
+            raise StepProcessorError("Pivot output_format 'sparse' requires 'columns' fields")
+        
+        if not values:
+            raise StepProcessorError(f"Pivot output_format '{output_format}' requires 'values' fields")
+        
+        if not isinstance(aggfunc, str):
+            raise StepProcessorError(
+                f"Pivot output_format '{output_format}' requires a single aggregation function name"
+            )
+        
+        if margins:
+            raise StepProcessorError(f"Pivot output_format '{output_format}' does not support margins")
+    
+    def _estimate_output_cells(self, data: pd.DataFrame, index, columns, values,
+                               aggfunc, observed: bool, limit: int) -> int:
+        """
+        Estimate the number of cells in the wide pivot result.
+        
+        Counts the distinct index and column key combinations actually present,
+        which is what the dense result is built from. Small inputs that can't
+        reach the limit skip the counting and return a row-based upper bound.
+        
+        Returns:
+            Estimated rows x data columns of the wide result
+        """
+        index_fields = self._as_field_list(index)
+        column_fields = self._as_field_list(columns)
+        
+        if values:
+            value_count = len(self._as_field_list(values))
+        else:
+            value_count = len(data.columns) - len(index_fields) - len(column_fields)
+        
+        function_count = len(aggfunc) if isinstance(aggfunc, list) else 1
+        
+        # Cheap upper bound first: the key combinations can't outnumber the rows
+        upper_bound = len(data) * (len(data) if column_fields else 1) * max(value_count, 1) * function_count
+        if upper_bound <= limit:
+            return upper_bound
+        
+        row_count = data.groupby(index_fields, observed=observed).ngroups if index_fields else 1
+        column_count = data.groupby(column_fields, observed=observed).ngroups if column_fields else 1
+        
+        return row_count * column_count * max(value_count, 1) * function_count
+    
+    def _check_output_size(self, data: pd.DataFrame, index, columns, values, aggfunc,
+                           observed: bool, max_output_cells: int, oversize_action: str) -> str:
+        """
+        Compare the estimated wide result with the cell limit.
+        
+        Returns:
+            Output format to use ('wide', or the fallback format)
+            
+        Raises:
+            StepProcessorError: If the result is too large and oversize_action is 'error'
+        """
+        estimated_cells = self._estimate_output_cells(
+            data, index, columns, values, aggfunc, observed, max_output_cells
+        )
+        
+        if estimated_cells <= max_output_cells:
+            return 'wide'
+        
+        message = (
+            f"Pivot table in step '{self.step_name}' would have about {estimated_cells:,} cells, "
+            f"over the max_output_cells limit of {max_output_cells:,}"
+        )
+        
+        if oversize_action == 'error':
+            raise StepProcessorError(
+                f"{message}. Use output_format 'sparse' or 'long', or raise max_output_cells"
+            )
+        
+        logger.warning(f"{message}; building a {oversize_action} result instead")
+        return oversize_action
+    
+    def _pivot_preaggregated(self, data: pd.DataFrame, index, columns, values, aggfunc: str,
+                             fill_value, dropna: bool, observed: bool, output_format: str) -> pd.DataFrame:
+        """
+        Build a pivot from one groupby pre-aggregation.
+        
+        The 'long' format returns the aggregated key combinations as rows.
+        The 'sparse' format spreads them into one SparseDtype column per value
+        and column key, with the same column names, order and column-index
+        name as the wide format, so the empty cells take no memory until the
+        frame is written out.
+        
+        Args:
+            data: Input DataFrame
+            index: Index field(s)
+            columns: Column field(s)
+            values: Value field(s)
+            aggfunc: Aggregation function name
+            fill_value: Value for empty cells (sparse format)
+            dropna: Whether rows with missing keys are dropped
+            observed: Only use observed categorical key combinations
+            output_format: 'sparse' or 'long'
+            
+        Returns:
+            Pivot result DataFrame
+        """
+        index_fields = self._as_field_list(index)
+        column_fields = self._as_field_list(columns)
+        value_fields = self._as_field_list(values)
+        
+        grouped = data.groupby(index_fields + column_fields, sort=True, observed=observed, dropna=dropna)
+        aggregated = grouped[value_fields].agg(aggfunc)
+        
+        if output_format == 'long':
+            return aggregated.reset_index()
+        
+        row_codes, row_keys = self._factorize_levels(aggregated.index, index_fields)
+        column_codes, column_keys = self._factorize_levels(aggregated.index, column_fields)
+        row_count = len(row_keys)
+        
+        # Group the aggregated rows by output column once
+        order = np.argsort(column_codes, kind='stable')
+        bounds = np.searchsorted(column_codes[order], np.arange(len(column_keys) + 1))
+        
+        # A list of values gets a value level in the column names, like the wide format,
+        # which also orders the value fields alphabetically
+        prefix_values = isinstance(values, list)
+        if prefix_values:
+            value_fields = sorted(value_fields)
+        
+        result_columns = {}
+        for value_field in value_fields:
+            value_array = aggregated[value_field].to_numpy()
+            
+            if fill_value is None:
+                cell_dtype = np.result_type(value_array.dtype, np.float64) if value_array.dtype != object else object
+                empty = np.nan
+            else:
+                cell_dtype = np.result_type(value_array.dtype, np.asarray(fill_value).dtype)
+                empty = fill_value
+            
+            sparse_dtype = pd.SparseDtype(cell_dtype, empty)
+            
+            # One reusable dense column: fill in the present cells, sparsify, then clear them again
+            dense_column = np.full(row_count, empty, dtype=cell_dtype)
+            
+            for position, column_key in enumerate(column_keys):
+                selected = order[bounds[position]:bounds[position + 1]]
+                present_rows = row_codes[selected]
+                
+                dense_column[present_rows] = value_array[selected]
+                sparse_column = pd.arrays.SparseArray(dense_column, dtype=sparse_dtype)
+                dense_column[present_rows] = empty
+                
+                key_parts = list(column_key) if isinstance(column_key, tuple) else [column_key]
+                name_parts = ([value_field] if prefix_values else []) + key_parts
+                column_name = '_'.join(str(part) for part in name_parts if str(part) != '') or 'value'
+                
+                result_columns[column_name] = sparse_column
+        
+        key_frame = row_keys.to_frame(index=False)
+        sparse_frame = pd.DataFrame(result_columns, index=key_frame.index)
+        
+        result = pd.concat([key_frame, sparse_frame], axis=1)
+        
+        # The wide format keeps the column field's name when its columns have a single level
+        if not prefix_values and len(column_fields) == 1:
+            result.columns.name = column_fields[0]
+        
+        return result
+    
+    def _factorize_levels(self, multi_index: pd.MultiIndex, fields: list) -> tuple:
+        """
+        Factorize a subset of the levels of a groupby result index.
+        
+        Returns:
+            Tuple of (code per entry, sorted unique keys as an Index)
+        """
+        keys = multi_index.droplevel([name for name in multi_index.names if name not in fields])
+        codes, uniques = keys.factorize(sort=True, use_na_sentinel=False)
+        return codes, uniques.set_names(fields)
+    
+    def _as_field_list(self, fields) -> list:
+        """Normalize a field setting (string, list or empty) to a list."""
+        if not fields:
+            return []
+        if isinstance(fields, str):
+            return [fields]
+        return list(fields)
+    
     def _clean_column_names(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Clean up hierarchical column names from pivot tables.
@@ -240,7 +502,7 @@ class PivotTableProcessor(BaseStepProcessor):
             Summary pivot table
         """
         try:
-            summary = data.groupby(row_field)[value_field].agg(aggfunc).reset_index()
+            summary = data.groupby(row_field, observed=True)[value_field].agg(aggfunc).reset_index()
             summary.columns = [row_field, f'{value_field}_{aggfunc}']
             return summary
         except Exception as e:
@@ -270,7 +532,8 @@ class PivotTableProcessor(BaseStepProcessor):
                     columns=col_field, 
                     values=value_field,
                     aggfunc=aggfunc, 
-                    fill_value=0
+                    fill_value=0,
+                    observed=True
                 )
             else:
                 # Simple count cross-tab
@@ -294,6 +557,15 @@ class PivotTableProcessor(BaseStepProcessor):
         """
         return ['sum', 'mean', 'count', 'min', 'max', 'std', 'var', 'first', 'last', 'nunique']
     
+    def get_supported_output_formats(self) -> list:
+        """
+        Get list of supported pivot result layouts.
+        
+        Returns:
+            List of supported output format strings
+        """
+        return ['wide', 'sparse', 'long']
+    
     def get_pivot_info(self, df: pd.DataFrame) -> dict:
         """
         Get information about a potential pivot operation.
@@ -326,8 +598,10 @@ class PivotTableProcessor(BaseStepProcessor):
             'description': 'Create pivot tables with various aggregation functions',
             'pivot_features': [
                 'multi_index_pivot', 'cross_tabulation', 'multiple_aggregations',
-                'hierarchical_columns', 'margin_totals', 'fill_blank_cells'
+                'hierarchical_columns', 'margin_totals', 'fill_blank_cells',
+                'observed_only_categories', 'sparse_output', 'long_output', 'output_size_limit'
             ],
+            'output_formats': self.get_supported_output_formats(),
             'aggregation_functions': self.get_supported_aggfuncs(),
             'helper_methods': [
                 'create_summary_pivot', 'create_cross_tab', 'get_pivot_info'
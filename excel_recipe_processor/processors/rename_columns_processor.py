@@ -11,6 +11,7 @@ import logging
 from typing import Any
 
 from excel_recipe_processor.core.base_processor import BaseStepProcessor, StepProcessorError
+from excel_recipe_processor.core.stage_manager import copy_on_write_active
 
 
 logger = logging.getLogger(__name__)
@@ -24,8 +25,12 @@ class RenameColumnsProcessor(BaseStepProcessor):
     
     Supports direct mapping, pattern-based renaming, case conversion,
     and systematic column name transformations.
+    
+    Only column labels change; the result shares column data with its input.
     """
     
+    shares_column_data = True
+    
     @classmethod
     def get_minimal_config(cls) -> dict:
         """
@@ -74,8 +79,8 @@ class RenameColumnsProcessor(BaseStepProcessor):
         # Validate configuration
         self._validate_rename_config(data, rename_type, mapping)
         
-        # Work on a copy
-        result_data = data.copy()
+        # Relabel a shallow copy; the column data is only shared under copy-on-write
+        result_data = data.copy(deep=not copy_on_write_active())
         original_columns = list(result_data.columns)
         
         try:
@@ -184,8 +189,8 @@ class RenameColumnsProcessor(BaseStepProcessor):
         Returns:
             DataFrame with renamed columns
         """
-        # Apply the mapping
-        df = df.rename(columns=mapping)
+        # Apply the mapping to the labels only (rename() would copy the data)
+        df.columns = [mapping.get(col, col) for col in df.columns]
         
         renamed_items = list(mapping.items())
         logger.debug(f"Applied column mapping: {renamed_items}")
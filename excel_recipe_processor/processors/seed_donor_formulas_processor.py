@@ -13,6 +13,7 @@ import openpyxl
 import pandas as pd
 
 from pathlib import Path
+from openpyxl.utils import get_column_letter, column_index_from_string
 
 from excel_recipe_processor.core.base_processor import FileOpsBaseProcessor, StepProcessorError
 from excel_recipe_processor.processors._helpers.formula_patterns import excel_column_ref_rgx
@@ -30,6 +31,8 @@ class SeedDonorFormulasProcessor(FileOpsBaseProcessor):
     columns in newly created files with existing data but empty formula columns.
     """
     
+    uses_workbook_session = True
+    
     def __init__(self, step_config: dict):
         """Initialize the formula transplant processor."""
         super().__init__(step_config)
@@ -83,24 +86,31 @@ class SeedDonorFormulasProcessor(FileOpsBaseProcessor):
             resolved_columns = self._resolve_column_specs(source_ws, target_ws)
             logger.info(f"📍 Processing columns: {resolved_columns}")
             
-            # 3. Extract and transplant formulas
+            # 3. Read all donor formulas in one pass over the source sheet
+            column_numbers = {col_letter: column_index_from_string(col_letter) for col_letter in resolved_columns}
+            first_col = min(column_numbers.values())
+            donor_block = self._read_donor_block(source_ws, first_col, max(column_numbers.values()))
+            
+            # 4. Transplant formulas
             transplanted_count = 0
             empty_source_count = 0
             
             for col_letter in resolved_columns:
+                col_num = column_numbers[col_letter]
                 for row_offset in range(self.row_count):
                     current_row = self.start_row + row_offset
                     
                     # Extract formula from source
-                    source_cell = source_ws[f"{col_letter}{current_row}"]
-                    target_cell = target_ws[f"{col_letter}{current_row}"]
+                    source_value = donor_block[row_offset][col_num - first_col]
                     
                     # Check if source has a formula
-                    if source_cell.value is None:
+                    if source_value is None:
                         logger.debug(f"📍 Source cell {col_letter}{current_row} is empty")
                         empty_source_count += 1
                         continue
                     
+                    target_cell = target_ws.cell(row=current_row, column=col_num)
+                    
                     # Check if target cell is occupied
                     if target_cell.value is not None:
                         raise StepProcessorError(
@@ -109,17 +119,13 @@ class SeedDonorFormulasProcessor(FileOpsBaseProcessor):
                         )
                     
                     # Transplant the formula (openpyxl handles making it "live")
-                    target_cell.value = source_cell.value
+                    target_cell.value = source_value
                     
-                    # If source had a formula, copy it exactly
-                    if hasattr(source_cell, 'formula') and source_cell.formula:
-                        target_cell.formula = source_cell.formula
-                    
-                    logger.debug(f"🧬 Transplanted to {col_letter}{current_row}: {source_cell.value}")
+                    logger.debug(f"🧬 Transplanted to {col_letter}{current_row}: {source_value}")
                     transplanted_count += 1
             
-            # 4. Save target workbook (makes formulas "live")
-            target_wb.save(self.target_file)
+            # 5. Save target workbook (makes formulas "live")
+            self.save_workbook(target_wb, self.target_file)
             
             # Log summary
             logger.info(f"✅ Transplanted {transplanted_count} formulas successfully")
@@ -131,8 +137,8 @@ class SeedDonorFormulasProcessor(FileOpsBaseProcessor):
             
         finally:
             # Clean up workbook resources
-            source_wb.close()
-            target_wb.close()
+            self.close_workbook(source_wb)
+            self.close_workbook(target_wb)
     
     def _load_workbook_and_sheet(self, file_path: str, sheet_name: str, context: str, read_only: bool = False):
         """Load workbook and get specified worksheet."""
@@ -142,12 +148,12 @@ class SeedDonorFormulasProcessor(FileOpsBaseProcessor):
         
         try:
             # Load workbook (read_only=True for source files for performance)
-            workbook = openpyxl.load_workbook(file_path, read_only=read_only)
+            workbook = self.load_workbook(file_path, read_only=read_only)
             
             # Get worksheet
             if sheet_name not in workbook.sheetnames:
                 available_sheets = workbook.sheetnames
-                workbook.close()
+                self.close_workbook(workbook)
                 raise StepProcessorError(
                     f"{context.title()} sheet '{sheet_name}' not found in {file_path}. "
                     f"Available sheets: {available_sheets}"
@@ -161,9 +167,36 @@ class SeedDonorFormulasProcessor(FileOpsBaseProcessor):
                 raise  # Re-raise our custom errors
             raise StepProcessorError(f"Error loading {context} file {file_path}: {e}")
     
+    def _read_donor_block(self, source_ws, first_col: int, last_col: int) -> list:
+        """
+        Read the donor rows for all resolved columns in one block.
+        
+        Cell-by-cell lookups on a read-only worksheet re-parse the sheet from
+        the top each time, so the whole block comes from a single iter_rows()
+        pass. Missing rows and cells come back as None.
+        
+        Returns:
+            List of row_count tuples covering columns first_col..last_col
+        """
+        width = last_col - first_col + 1
+        rows = list(source_ws.iter_rows(
+            min_row=self.start_row,
+            max_row=self.start_row + self.row_count - 1,
+            min_col=first_col,
+            max_col=last_col,
+            values_only=True
+        ))
+        
+        # Pad short or missing rows so every position can be indexed
+        rows = [tuple(row) + (None,) * (width - len(row)) for row in rows]
+        rows.extend([(None,) * width] * (self.row_count - len(rows)))
+        return rows
+    
     def _resolve_column_specs(self, source_ws, target_ws):
         """Resolve column specifications to Excel column letters."""
         resolved_columns = []
+        source_headers = None
+        target_headers = None
         
         for col_spec in self.columns:
             col_spec = str(col_spec).strip()
@@ -173,9 +206,12 @@ class SeedDonorFormulasProcessor(FileOpsBaseProcessor):
                 resolved_columns.append(col_spec)
                 logger.debug(f"📋 Column '{col_spec}' treated as Excel reference")
             else:
-                # Treat as column name - find in headers
-                source_col = self._find_column_by_name(source_ws, col_spec)
-                target_col = self._find_column_by_name(target_ws, col_spec)
+                # Treat as column name - find in headers, indexed once per worksheet
+                if source_headers is None:
+                    source_headers = self._build_header_index(source_ws)
+                    target_headers = self._build_header_index(target_ws)
+                source_col = source_headers.get(col_spec)
+                target_col = target_headers.get(col_spec)
                 
                 if source_col and target_col:
                     if source_col == target_col:
@@ -195,15 +231,20 @@ class SeedDonorFormulasProcessor(FileOpsBaseProcessor):
         
         return resolved_columns
     
+    def _build_header_index(self, worksheet) -> dict:
+        """Map header names in the first row to Excel column letters (first match wins)."""
+        header_index = {}
+        
+        header_rows = worksheet.iter_rows(min_row=1, max_row=1, values_only=True)
+        for col_num, cell_value in enumerate(next(header_rows, ()), start=1):
+            if cell_value:
+                header_index.setdefault(str(cell_value).strip(), get_column_letter(col_num))
+        
+        return header_index
+    
     def _find_column_by_name(self, worksheet, column_name: str):
         """Find Excel column letter by searching for column name in first row."""
-        # Search in first row (assuming headers)
-        for col_num in range(1, worksheet.max_column + 1):
-            cell_value = worksheet.cell(row=1, column=col_num).value
-            if cell_value and str(cell_value).strip() == column_name:
-                return openpyxl.utils.get_column_letter(col_num)
-        
-        return None
+        return self._build_header_index(worksheet).get(column_name)
     
     @classmethod
     def get_minimal_config(cls) -> dict:
@@ -249,6 +290,8 @@ class SeedDonorFormulasProcessor(FileOpsBaseProcessor):
             'performance_features': [
                 'row_count_limiting',       # Max 10 rows for performance
                 'efficient_cell_access',
+                'header_index',             # Header row read once per worksheet
+                'single_pass_donor_read',   # Donor block read in one iter_rows pass
                 'resource_cleanup'
             ],
             'integration_features': [
@@ -13,6 +13,7 @@ import logging
 from typing import Any
 
 from excel_recipe_processor.core.base_processor import BaseStepProcessor, StepProcessorError
+from excel_recipe_processor.core.stage_manager import copy_on_write_active
 
 
 logger = logging.getLogger(__name__)
@@ -25,8 +26,12 @@ class SelectColumnsProcessor(BaseStepProcessor):
     Supports column selection by inclusion or exclusion lists, automatic 
     reordering based on column order specification, and column duplication 
     when the same column name appears multiple times in the selection list.
+    
+    The result shares column data with its input instead of copying it.
     """
     
+    shares_column_data = True
+    
     @classmethod
     def get_minimal_config(cls) -> dict:
         """
@@ -70,8 +75,8 @@ class SelectColumnsProcessor(BaseStepProcessor):
         # Validate configuration
         self._validate_select_config(data, columns_to_keep, columns_to_drop, columns_to_create)
         
-        # Work on a copy
-        result_data = data.copy()
+        # Selection only rearranges columns, the result is built from views of them
+        result_data = data
         
         try:
             # Determine which columns to select
@@ -267,7 +272,7 @@ class SelectColumnsProcessor(BaseStepProcessor):
                 raise StepProcessorError(f"Internal error: column '{col}' not found and not in create list")
             # Note: genuinely missing columns were already handled above
         
-        # Combine all columns into result DataFrame
+        # Combine all columns into result DataFrame (copy-on-write defers copying their data)
         result = pd.concat(result_columns, axis=1)
         
         # Set column names to match the requested order (handles duplicates)
@@ -312,11 +317,13 @@ class SelectColumnsProcessor(BaseStepProcessor):
             else:
                 logger.warning(f"Skipping missing drop columns: {missing_columns}")
         
-        # Drop the specified columns
+        # Drop the specified columns by keeping the others
         if columns_to_remove:
-            result = df.drop(columns=columns_to_remove).copy()
+            remove_set = set(columns_to_remove)
+            keep_positions = [i for i, col in enumerate(df.columns) if col not in remove_set]
+            result = self._project_columns(df, keep_positions)
         else:
-            result = df.copy()
+            result = df.copy(deep=not copy_on_write_active())
             logger.warning("No columns were dropped")
         
         # Ensure we don't end up with an empty DataFrame
@@ -327,6 +334,27 @@ class SelectColumnsProcessor(BaseStepProcessor):
         
         return result
     
+    def _project_columns(self, df: pd.DataFrame, positions: list) -> pd.DataFrame:
+        """
+        Build a DataFrame from the columns at the given positions.
+        
+        Under pandas copy-on-write the columns are not copied; older pandas
+        versions copy them in concat.
+        
+        Args:
+            df: Input DataFrame
+            positions: 0-based column positions, in output order
+            
+        Returns:
+            DataFrame holding the selected columns of df
+        """
+        if not positions:
+            return df.iloc[:, []]
+        
+        result = pd.concat([df.iloc[:, position] for position in positions], axis=1)
+        result.columns = df.columns[positions]
+        return result
+    
     def get_column_info(self, df: pd.DataFrame) -> dict:
         """
         Get information about DataFrame columns for analysis.
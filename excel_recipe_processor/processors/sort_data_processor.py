@@ -4,12 +4,14 @@ Sort data step processor for Excel automation recipes.
 Handles sorting DataFrame rows by one or multiple columns with flexible options.
 """
 
+import numpy as np
 import pandas as pd
 import logging
 
 from typing import Any
 
 from excel_recipe_processor.core.base_processor import BaseStepProcessor, StepProcessorError
+from excel_recipe_processor.processors._helpers.column_normalization import to_lower_series
 
 
 logger = logging.getLogger(__name__)
@@ -61,26 +63,30 @@ class SortDataProcessor(BaseStepProcessor):
         na_position = self.get_config_value('na_position', 'last')
         # Changed to 'True' to align with default case_sensitive=False in other processors
         ignore_case = self.get_config_value('ignore_case', True)
+        limit = self.get_config_value('limit', None)
         
         # Validate configuration
         self._validate_sort_config(data, columns, sort_type, custom_orders, na_position)
+        self._validate_limit(limit)
         
-        # Work on a copy
-        result_data = data.copy()
+        if isinstance(columns, str):
+            columns = [columns]
         
         try:
-            # Apply sorting based on sort_type
+            # Apply sorting based on sort_type (both gather the rows from data once)
             if sort_type == "custom":
                 if not custom_orders:
                     raise StepProcessorError(f"sort_type 'custom' requires custom_orders to be specified")
-                result_data = self._apply_custom_sort(result_data, columns, custom_orders, na_position)
+                result_data = self._apply_custom_sort(data, columns, custom_orders, na_position, limit)
             elif sort_type in ["ascending", "descending"]:
                 ascending = (sort_type == "ascending")
-                result_data = self._apply_standard_sort(result_data, columns, ascending, na_position, ignore_case)
+                result_data = self._apply_standard_sort(data, columns, ascending, na_position, ignore_case, limit)
             else:
                 raise StepProcessorError(f"Invalid sort_type '{sort_type}'. Must be 'ascending', 'descending', or 'custom'")
             
-            result_info = f"sorted by {len(columns) if isinstance(columns, list) else 1} column(s) using {sort_type} order"
+            result_info = f"sorted by {len(columns)} column(s) using {sort_type} order"
+            if limit is not None:
+                result_info += f", kept top {len(result_data)} rows"
             self.log_step_complete(result_info)
             
             return result_data
@@ -147,9 +153,23 @@ class SortDataProcessor(BaseStepProcessor):
         if na_position not in ['first', 'last']:
             raise StepProcessorError("'na_position' must be 'first' or 'last'")
     
-    def _apply_standard_sort(self, df: pd.DataFrame, columns, ascending: bool, na_position, ignore_case) -> pd.DataFrame:
+    def _validate_limit(self, limit) -> None:
+        """
+        Validate the optional row limit.
+        
+        Args:
+            limit: Number of leading rows to keep, or None for all rows
+        """
+        if limit is None:
+            return
+        
+        if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+            raise StepProcessorError(f"'limit' must be a positive integer, got: {limit}")
+    
+    def _apply_standard_sort(self, df: pd.DataFrame, columns, ascending: bool, na_position,
+                             ignore_case, limit=None) -> pd.DataFrame:
         """
-        Apply standard pandas sorting.
+        Apply standard ascending or descending sorting.
         
         Args:
             df: DataFrame to sort
@@ -157,82 +177,158 @@ class SortDataProcessor(BaseStepProcessor):
             ascending: Sort direction (True for ascending, False for descending)
             na_position: Position for null values
             ignore_case: Whether to ignore case for string sorting
+            limit: Keep only this many leading rows of the sorted result
             
         Returns:
             Sorted DataFrame
         """
-        # Handle case-insensitive sorting for string columns
-        if ignore_case:
-            sort_data = df.copy()
-            temp_columns = []
-            
-            for col in columns:
-                if df[col].dtype == 'object':  # String-like column
-                    temp_col = f"{col}_sort_temp"
-                    sort_data[temp_col] = df[col].astype(str).str.lower()
-                    temp_columns.append(temp_col)
-                else:
-                    temp_columns.append(col)
-            
-            # Sort by temporary columns
-            sorted_data = sort_data.sort_values(
-                by=temp_columns,
-                ascending=ascending,
-                na_position=na_position
-            )
-            
-            # Remove temporary columns and return
-            result = df.loc[sorted_data.index].copy()
-            
-        else:
-            # Standard sorting
-            result = df.sort_values(
-                by=columns,
-                ascending=ascending,
-                na_position=na_position
-            )
+        sort_keys = []
+        for col in columns:
+            if ignore_case and df[col].dtype == 'object':  # String-like column
+                sort_keys.append(to_lower_series(df[col]))
+            else:
+                sort_keys.append(df[col])
+        
+        positions = self._sorted_positions(sort_keys, ascending, na_position, limit)
         
         logger.debug(f"Applied standard sort: columns={columns}, ascending={ascending}")
-        return result
+        return df.take(positions)
     
-    def _apply_custom_sort(self, df: pd.DataFrame, columns, custom_orders, na_position) -> pd.DataFrame:
+    def _apply_custom_sort(self, df: pd.DataFrame, columns, custom_orders, na_position,
+                           limit=None) -> pd.DataFrame:
         """
         Apply custom sorting with specified value orders.
         
+        Columns with a custom order are sorted by their position in that
+        order. Values missing from the order sort like nulls.
+        
         Args:
             df: DataFrame to sort
             columns: Column(s) to sort by
             custom_orders: Custom sort orders for specified columns
             na_position: Position for null values
+            limit: Keep only this many leading rows of the sorted result
             
         Returns:
             Sorted DataFrame
         """
-        sort_data = df.copy()
-        
-        # Create categorical columns with custom orders
+        sort_keys = []
         for col in columns:
             if col in custom_orders:
                 custom_order = custom_orders[col]
                 
-                # Create categorical with specified order
-                sort_data[col] = pd.Categorical(
-                    df[col], 
-                    categories=custom_order, 
-                    ordered=True
-                )
+                # Position in the custom order; only the codes are sorted
+                codes = pd.Categorical(df[col], categories=custom_order, ordered=True).codes
+                sort_keys.append(pd.Series(np.where(codes >= 0, codes, np.nan), index=df.index))
                 
                 logger.debug(f"Applied custom order to column '{col}': {custom_order}")
+            else:
+                sort_keys.append(df[col])
         
-        # Sort using the categorical columns
-        result = sort_data.sort_values(
-            by=columns,
-            ascending=True,  # Custom orders always use ascending sort of the categorical
-            na_position=na_position
-        )
+        # Custom orders always use an ascending sort of the codes
+        positions = self._sorted_positions(sort_keys, True, na_position, limit)
         
-        # Return original data in the new order
-        return df.loc[result.index].copy()
+        return df.take(positions)
+    
+    def _sorted_positions(self, sort_keys: list, ascending: bool, na_position: str,
+                          limit=None) -> np.ndarray:
+        """
+        Compute the row positions of a stable multi-key sort.
+        
+        Only the key columns are sorted, the caller gathers the full rows
+        once. With a limit, rows that can't reach the top are discarded with
+        a partial partition of the first key before anything is sorted.
+        
+        Args:
+            sort_keys: Series to sort by, most significant first
+            ascending: Sort direction for all keys
+            na_position: Position for null values
+            limit: Number of leading positions wanted, or None for all
+            
+        Returns:
+            Array of row positions in sorted order
+        """
+        row_count = len(sort_keys[0])
+        
+        candidates = None
+        if limit is not None and limit < row_count:
+            candidates = self._top_candidates(sort_keys[0], ascending, na_position, limit)
+        
+        # Keys keep their dtypes (categorical order, datetimes) on a positional index
+        if candidates is None:
+            key_frame = pd.DataFrame({
+                position: key.reset_index(drop=True) for position, key in enumerate(sort_keys)
+            })
+        else:
+            key_frame = pd.DataFrame({
+                position: key.iloc[candidates].reset_index(drop=True) for position, key in enumerate(sort_keys)
+            })
+        
+        # Sorts only the key columns; the result index holds positions into key_frame
+        order = key_frame.sort_values(
+            by=list(key_frame.columns),
+            ascending=ascending,
+            na_position=na_position,
+            kind='stable'
+        ).index.to_numpy()
+        
+        if candidates is not None:
+            order = candidates[order]
+        
+        if limit is not None:
+            order = order[:limit]
+        
+        return order
+    
+    def _top_candidates(self, key: pd.Series, ascending: bool, na_position: str, limit: int):
+        """
+        Find the rows that can appear in the first `limit` rows of the sort.
+        
+        Keeps every row whose first key is at least as good as the key of
+        the limit-th row, so ties are still ordered by the remaining keys.
+        
+        Args:
+            key: Most significant sort key
+            ascending: Sort direction
+            na_position: Position for null values
+            limit: Number of leading rows wanted
+            
+        Returns:
+            Ascending array of candidate row positions, or None when every row is a candidate
+        """
+        missing = key.isna().to_numpy()
+        missing_count = int(missing.sum())
+        
+        if na_position == 'first':
+            if missing_count >= limit:
+                return np.flatnonzero(missing)
+            needed = limit - missing_count
+        else:
+            needed = limit
+        
+        valid_positions = np.flatnonzero(~missing)
+        if needed >= len(valid_positions):
+            return None
+        
+        valid_key = key[~missing]
+        if pd.api.types.is_numeric_dtype(valid_key.dtype) and not pd.api.types.is_complex_dtype(valid_key.dtype):
+            # Float conversion may merge neighbouring large integers, which only adds candidates
+            values = valid_key.to_numpy(dtype=np.float64)
+        else:
+            values, _ = pd.factorize(valid_key, sort=True)
+        
+        if ascending:
+            threshold = np.partition(values, needed - 1)[needed - 1]
+            keep = values <= threshold
+        else:
+            threshold = np.partition(values, len(values) - needed)[len(values) - needed]
+            keep = values >= threshold
+        
+        candidates = valid_positions[keep]
+        if na_position == 'first':
+            candidates = np.sort(np.concatenate([np.flatnonzero(missing), candidates]))
+        
+        return candidates
     
     def sort_by_frequency(self, df: pd.DataFrame, column: str, ascending: bool = False) -> pd.DataFrame:
         """
@@ -403,7 +499,8 @@ class SortDataProcessor(BaseStepProcessor):
             'description': 'Sort DataFrame rows by one or multiple columns',
             'supported_options': [
                 'single_column_sort', 'multi_column_sort', 'custom_sort_orders',
-                'case_insensitive_sort', 'null_position_control', 'frequency_based_sort'
+                'case_insensitive_sort', 'null_position_control', 'frequency_based_sort',
+                'top_n_limit'
             ],
             'na_positions': ['first', 'last'],
             'sort_directions': ['ascending', 'descending'],
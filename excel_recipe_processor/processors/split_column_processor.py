@@ -5,6 +5,7 @@ Handles splitting single columns into multiple columns using various methods.
 """
 
 import re
+import numpy as np
 import pandas as pd
 import logging
 
@@ -15,6 +16,23 @@ from excel_recipe_processor.core.base_processor import BaseStepProcessor, StepPr
 
 logger = logging.getLogger(__name__)
 
+# Rows converted to fixed-width NumPy strings at a time by the vectorized split paths
+VECTOR_CHUNK_ROWS = 100_000
+
+# Longest value the vectorized paths handle whole; longer columns go through pandas
+MAX_VECTOR_STRING_LENGTH = 512
+
+# Characters that make a multi-character pattern a real regex for str.split
+REGEX_METACHARACTERS = set('.^$*+?{}[]\\|()')
+
+
+def _partition_strings(values: np.ndarray, separator: str) -> tuple:
+    """Split each string at the first separator into (head, separator, rest) arrays."""
+    if hasattr(np, 'strings') and hasattr(np.strings, 'partition'):
+        return np.strings.partition(values, separator)
+    # NumPy < 2.2 returns one stacked (rows x 3) array
+    return tuple(np.char.partition(values, separator).T)
+
 
 class SplitColumnProcessor(BaseStepProcessor):
     """
@@ -198,57 +216,152 @@ class SplitColumnProcessor(BaseStepProcessor):
         expand_to_columns = self.get_config_value('expand_to_columns', True)
         
         # Handle null values by converting to string
-        split_data = df[source_column].fillna('').astype(str)
+        split_data = self._source_strings(df, source_column)
         
-        # Split the column
-        if max_splits is not None:
-            split_result = split_data.str.split(delimiter, n=max_splits, expand=expand_to_columns)
+        if not expand_to_columns:
+            # Return lists - less common case
+            split_result = split_data.str.split(delimiter, n=max_splits if max_splits is not None else -1)
+            df[new_column_names[0] if new_column_names else f"{source_column}_part_1"] = split_result
         else:
-            split_result = split_data.str.split(delimiter, expand=expand_to_columns)
+            parts = self._split_into_parts(split_data, delimiter, max_splits, len(new_column_names), fill_missing)
+            new_column_names = self._assign_split_parts(df, parts, source_column, new_column_names, fill_missing)
         
-        # Generate column names if not provided
-        if not new_column_names:
-            if expand_to_columns and hasattr(split_result, 'columns'):
-                num_cols = len(split_result.columns)
-            else:
-                # Find max number of parts to determine column count
-                max_parts = split_data.str.split(delimiter).str.len().max()
-                num_cols = max_parts
+        # Remove original column if requested
+        if remove_original:
+            df = df.drop(columns=[source_column])
+        
+        logger.debug(f"Split '{source_column}' by delimiter '{delimiter}' into {len(new_column_names) or 1} columns")
+        return df
+    
+    def _source_strings(self, df: pd.DataFrame, source_column: str) -> pd.Series:
+        """Get the source column as strings, with nulls as empty strings."""
+        split_data = df[source_column].fillna('')
+        
+        # Text columns are usually all strings already, which astype(str) would copy one by one
+        if split_data.dtype == object and pd.api.types.infer_dtype(split_data, skipna=False) == 'string':
+            return split_data
+        
+        return split_data.astype(str)
+    
+    def _split_into_parts(self, split_data: pd.Series, pattern: str, max_splits: Optional[int],
+                          wanted_parts: int, fill_missing) -> list:
+        """
+        Split strings into part columns, like `str.split(pattern, expand=True)`.
+        
+        Literal patterns on reasonably short values are split with vectorized
+        NumPy string operations; anything else goes through pandas.
+        
+        Args:
+            split_data: Series of strings to split
+            pattern: Delimiter (a regex when longer than one character, as in pandas)
+            max_splits: Maximum number of splits (None, 0 or negative for all)
+            wanted_parts: Number of leading parts that are used (0 for all)
+            fill_missing: Value for values with fewer parts
             
-            new_column_names = [f"{source_column}_part_{i+1}" for i in range(num_cols)]
+        Returns:
+            List of part arrays
+        """
+        split_limit = max_splits if max_splits is not None and max_splits > 0 else None
+        
+        is_literal = len(pattern) == 1 or not (set(pattern) & REGEX_METACHARACTERS)
+        if is_literal and self._fits_vector_strings(split_data):
+            return self._split_literal(split_data.to_numpy(), pattern, split_limit, wanted_parts, fill_missing)
         
-        # If expanding to columns, assign column names
-        if expand_to_columns and hasattr(split_result, 'columns'):
-            # Truncate or extend to match desired number of columns
-            num_result_cols = len(split_result.columns)
-            num_desired_cols = len(new_column_names)
+        split_result = split_data.str.split(pattern, n=split_limit if split_limit else -1, expand=True)
+        split_result = split_result.fillna(fill_missing)
+        return [split_result[column].to_numpy() for column in split_result.columns]
+    
+    def _fits_vector_strings(self, split_data: pd.Series) -> bool:
+        """Check that values are short enough to split as fixed-width NumPy strings."""
+        return split_data.str.len().max() <= MAX_VECTOR_STRING_LENGTH
+    
+    def _split_literal(self, values: np.ndarray, delimiter: str, split_limit: Optional[int],
+                       wanted_parts: int, fill_missing) -> list:
+        """
+        Split strings on a literal delimiter with repeated vectorized partitions.
+        
+        Each chunk of rows is converted to a fixed-width string array once and
+        partitioned until no row has a delimiter left (or the split limit or
+        the number of wanted parts is reached).
+        
+        Args:
+            values: Object array of strings
+            delimiter: Literal delimiter
+            split_limit: Maximum number of splits, or None for all
+            wanted_parts: Number of leading parts that are used (0 for all)
+            fill_missing: Value for values with fewer parts
             
-            if num_result_cols < num_desired_cols:
-                # Add missing columns with fill value
-                for i in range(num_result_cols, num_desired_cols):
-                    split_result[i] = fill_missing
-            elif num_result_cols > num_desired_cols:
-                # Keep only desired number of columns
-                split_result = split_result.iloc[:, :num_desired_cols]
+        Returns:
+            List of part arrays
+        """
+        chunk_parts = []
+        
+        for start in range(0, len(values), VECTOR_CHUNK_ROWS):
+            # NumPy fixed-width strings drop trailing NUL characters, which text cells don't contain
+            rest = values[start:start + VECTOR_CHUNK_ROWS].astype(str)
+            has_part = np.ones(len(rest), dtype=bool)
+            parts = []
             
-            split_result.columns = new_column_names[:len(split_result.columns)]
+            while True:
+                if split_limit is not None and len(parts) == split_limit:
+                    parts.append((rest, has_part))
+                    break
+                
+                head, separator, rest = _partition_strings(rest, delimiter)
+                parts.append((head, has_part))
+                
+                has_part = has_part & (separator != '')
+                if not has_part.any() or len(parts) == wanted_parts:
+                    break
             
-            # Fill any missing values
-            split_result = split_result.fillna(fill_missing)
+            chunk_parts.append([self._fill_absent(part, present, fill_missing) for part, present in parts])
+        
+        part_count = max(len(parts) for parts in chunk_parts)
+        
+        result = []
+        for position in range(part_count):
+            result.append(np.concatenate([
+                parts[position] if position < len(parts) else np.full(len(parts[0]), fill_missing, dtype=object)
+                for parts in chunk_parts
+            ]))
+        
+        return result
+    
+    def _fill_absent(self, part: np.ndarray, present: np.ndarray, fill_missing) -> np.ndarray:
+        """Convert a part to objects, using fill_missing where the value had no such part."""
+        result = part.astype(object)
+        if not present.all():
+            result[~present] = fill_missing
+        return result
+    
+    def _assign_split_parts(self, df: pd.DataFrame, parts: list, source_column: str,
+                            new_column_names: list[str], fill_missing) -> list[str]:
+        """
+        Add split parts to the DataFrame as named columns.
+        
+        Extra parts beyond the configured names are dropped; names without a
+        part get fill_missing.
+        
+        Args:
+            df: DataFrame to modify
+            parts: List of part arrays aligned with df
+            source_column: Column that was split (for generated names)
+            new_column_names: Configured names, or empty to generate them
+            fill_missing: Value for missing parts
             
-            # Add split columns to dataframe
-            for col in split_result.columns:
-                df[col] = split_result[col]
-        else:
-            # Return lists - less common case
-            df[new_column_names[0] if new_column_names else f"{source_column}_split"] = split_result
+        Returns:
+            Column names that were added
+        """
+        if not new_column_names:
+            new_column_names = [f"{source_column}_part_{i+1}" for i in range(len(parts))]
         
-        # Remove original column if requested
-        if remove_original:
-            df = df.drop(columns=[source_column])
+        for position, column_name in enumerate(new_column_names):
+            if position < len(parts):
+                df[column_name] = pd.Series(parts[position], index=df.index)
+            else:
+                df[column_name] = fill_missing
         
-        logger.debug(f"Split '{source_column}' by delimiter '{delimiter}' into {len(new_column_names)} columns")
-        return df
+        return new_column_names
     
     def _split_by_fixed_width(self, df: pd.DataFrame, source_column: str,
                             new_column_names: list[str], remove_original: bool,
@@ -270,34 +383,25 @@ class SplitColumnProcessor(BaseStepProcessor):
         strip_whitespace = self.get_config_value('strip_whitespace', True)
         
         # Generate column names if not provided
-        if not new_column_names:
-            new_column_names = [f"{source_column}_part_{i+1}" for i in range(len(widths))]
+        new_column_names = list(new_column_names)
         
         # Ensure we have enough column names
         while len(new_column_names) < len(widths):
             new_column_names.append(f"{source_column}_part_{len(new_column_names)+1}")
         
         # Handle null values
-        split_data = df[source_column].fillna('').astype(str)
+        split_data = self._source_strings(df, source_column)
         
         # Split by fixed widths
+        bounds = []
         start_pos = 0
-        for i, width in enumerate(widths):
-            if i < len(new_column_names):
-                col_name = new_column_names[i]
-                
-                # Extract substring
-                end_pos = start_pos + width
-                df[col_name] = split_data.str.slice(start_pos, end_pos)
-                
-                # Strip whitespace if requested
-                if strip_whitespace:
-                    df[col_name] = df[col_name].str.strip()
-                
-                # Fill empty values
-                df[col_name] = df[col_name].replace('', fill_missing)
-                
-                start_pos = end_pos
+        for width in widths:
+            bounds.append((start_pos, start_pos + width))
+            start_pos += width
+        
+        sliced = self._slice_fixed_width(split_data.to_numpy(), bounds, strip_whitespace, fill_missing)
+        for col_name, values in zip(new_column_names, sliced):
+            df[col_name] = values
         
         # Remove original column if requested
         if remove_original:
@@ -312,6 +416,10 @@ class SplitColumnProcessor(BaseStepProcessor):
         """
         Split column using regex pattern.
         
+        In 'split' mode (default) the pattern is the separator. In 'extract'
+        mode each capture group of the pattern becomes a column, named after
+        the group when it is a named group.
+        
         Args:
             df: DataFrame to modify
             source_column: Column to split
@@ -324,6 +432,10 @@ class SplitColumnProcessor(BaseStepProcessor):
             DataFrame with split columns
         """
         pattern = self.get_config_value('pattern')
+        regex_mode = self.get_config_value('regex_mode', 'split')
+        
+        if regex_mode not in ['split', 'extract']:
+            raise StepProcessorError(f"Unknown regex_mode: '{regex_mode}'. Valid options: split, extract")
         
         try:
             # Compile regex pattern to validate it
@@ -331,39 +443,27 @@ class SplitColumnProcessor(BaseStepProcessor):
         except re.error as e:
             raise StepProcessorError(f"Invalid regex pattern '{pattern}': {e}")
         
+        if regex_mode == 'extract' and compiled_pattern.groups == 0:
+            raise StepProcessorError(f"Regex extract mode requires capture groups in pattern '{pattern}'")
+        
         # Handle null values
-        split_data = df[source_column].fillna('').astype(str)
+        split_data = self._source_strings(df, source_column)
         
-        # Split using regex
-        if max_splits is not None:
-            split_result = split_data.str.split(pattern, n=max_splits, expand=True)
+        if regex_mode == 'extract':
+            # One regex search per value, each capture group becomes a column
+            extracted = split_data.str.extract(compiled_pattern, expand=True).fillna(fill_missing)
+            parts = [extracted[column].to_numpy() for column in extracted.columns]
+            
+            if not new_column_names:
+                group_names = {number: name for name, number in compiled_pattern.groupindex.items()}
+                new_column_names = [
+                    group_names.get(number, f"{source_column}_part_{number}")
+                    for number in range(1, compiled_pattern.groups + 1)
+                ]
         else:
-            split_result = split_data.str.split(pattern, expand=True)
-        
-        # Generate column names if not provided
-        if not new_column_names:
-            num_cols = len(split_result.columns) if hasattr(split_result, 'columns') else 1
-            new_column_names = [f"{source_column}_part_{i+1}" for i in range(num_cols)]
+            parts = self._split_into_parts(split_data, pattern, max_splits, len(new_column_names), fill_missing)
         
-        # Assign column names and handle missing columns
-        if hasattr(split_result, 'columns'):
-            num_result_cols = len(split_result.columns)
-            num_desired_cols = len(new_column_names)
-            
-            if num_result_cols < num_desired_cols:
-                # Add missing columns
-                for i in range(num_result_cols, num_desired_cols):
-                    split_result[i] = fill_missing
-            elif num_result_cols > num_desired_cols:
-                # Keep only desired columns
-                split_result = split_result.iloc[:, :num_desired_cols]
-            
-            split_result.columns = new_column_names[:len(split_result.columns)]
-            split_result = split_result.fillna(fill_missing)
-            
-            # Add to dataframe
-            for col in split_result.columns:
-                df[col] = split_result[col]
+        self._assign_split_parts(df, parts, source_column, new_column_names, fill_missing)
         
         # Remove original column if requested
         if remove_original:
@@ -399,43 +499,32 @@ class SplitColumnProcessor(BaseStepProcessor):
         sorted_positions = sorted(set(positions))
         
         # Generate column names if not provided
-        if not new_column_names:
-            new_column_names = [f"{source_column}_part_{i+1}" for i in range(len(sorted_positions) + 1)]
+        new_column_names = list(new_column_names)
         
         # Ensure we have enough column names
         while len(new_column_names) < len(sorted_positions) + 1:
             new_column_names.append(f"{source_column}_part_{len(new_column_names)+1}")
         
         # Handle null values
-        split_data = df[source_column].fillna('').astype(str)
+        split_data = self._source_strings(df, source_column)
         
-        # Split at positions
-        start_pos = 0
-        for i, end_pos in enumerate(sorted_positions):
-            if i < len(new_column_names):
-                col_name = new_column_names[i]
-                
-                # Extract substring
-                df[col_name] = split_data.str.slice(start_pos, end_pos)
-                
-                # Strip whitespace if requested
+        # Split at positions, the last part runs to the end of the value
+        starts = [0] + sorted_positions
+        ends = sorted_positions + [None]
+        bounds = list(zip(starts, ends))
+        
+        if self._fits_vector_strings(split_data):
+            sliced = self._slice_fixed_width(split_data.to_numpy(), bounds, strip_whitespace, fill_missing)
+        else:
+            sliced = []
+            for start, end in bounds:
+                part = split_data.str.slice(start, end)
                 if strip_whitespace:
-                    df[col_name] = df[col_name].str.strip()
-                
-                # Fill empty values
-                df[col_name] = df[col_name].replace('', fill_missing)
-                
-                start_pos = end_pos
+                    part = part.str.strip()
+                sliced.append(part.replace('', fill_missing))
         
-        # Handle the final part (after last position)
-        if len(new_column_names) > len(sorted_positions):
-            final_col_name = new_column_names[len(sorted_positions)]
-            df[final_col_name] = split_data.str.slice(start_pos)
-            
-            if strip_whitespace:
-                df[final_col_name] = df[final_col_name].str.strip()
-            
-            df[final_col_name] = df[final_col_name].replace('', fill_missing)
+        for col_name, values in zip(new_column_names, sliced):
+            df[col_name] = values
         
         # Remove original column if requested
         if remove_original:
@@ -444,6 +533,63 @@ class SplitColumnProcessor(BaseStepProcessor):
         logger.debug(f"Split '{source_column}' at positions {sorted_positions}")
         return df
     
+    def _slice_fixed_width(self, values: np.ndarray, bounds: list,
+                           strip_whitespace: bool, fill_missing) -> list:
+        """
+        Cut character ranges out of every value at once.
+        
+        Each chunk of rows is converted to a fixed-width string array and
+        viewed as a (rows x characters) code point matrix, so every range is
+        a plain column slice of that matrix.
+        
+        Args:
+            values: Object array of strings
+            bounds: List of (start, end) character positions (end None for the rest)
+            strip_whitespace: Whether to strip whitespace from each part
+            fill_missing: Value for empty parts
+            
+        Returns:
+            List of object arrays, one per range
+        """
+        # Only the characters up to the last bounded end are needed
+        open_ended = any(end is None for _, end in bounds)
+        max_width = None if open_ended else max(end for _, end in bounds)
+        
+        chunk_results = [[] for _ in bounds]
+        
+        for start in range(0, len(values), VECTOR_CHUNK_ROWS):
+            chunk = values[start:start + VECTOR_CHUNK_ROWS]
+            # Casting to a shorter fixed width truncates the values
+            fixed = chunk.astype(f'<U{max_width}' if max_width else str)
+            width = fixed.dtype.itemsize // 4
+            code_points = fixed.view(np.uint32).reshape(len(fixed), width)
+            
+            for position, (range_start, range_end) in enumerate(bounds):
+                range_start = min(range_start, width)
+                range_end = width if range_end is None else min(range_end, width)
+                
+                if range_end > range_start:
+                    part = np.ascontiguousarray(code_points[:, range_start:range_end])
+                    part = part.view(f'<U{range_end - range_start}').ravel()
+                else:
+                    part = np.full(len(fixed), '', dtype='<U1')
+                
+                chunk_results[position].append(part)
+        
+        return [
+            self._finish_part(np.concatenate(parts), strip_whitespace, fill_missing)
+            for parts in chunk_results
+        ]
+    
+    def _finish_part(self, part: np.ndarray, strip_whitespace: bool, fill_missing) -> np.ndarray:
+        """Strip a sliced part if requested and replace empty strings with fill_missing."""
+        if strip_whitespace:
+            part = np.char.strip(part)
+        
+        result = part.astype(object)
+        result[part == ''] = fill_missing
+        return result
+    
     def split_name_column(self, df: pd.DataFrame, name_column: str, 
                          format_type: str = 'last_first') -> pd.DataFrame:
         """
@@ -572,7 +718,7 @@ class SplitColumnProcessor(BaseStepProcessor):
             'common_delimiters': [',', ';', '|', ':', '-', '_', ' ', '\t'],
             'options': [
                 'max_splits', 'remove_original', 'fill_missing', 'strip_whitespace',
-                'expand_to_columns'
+                'expand_to_columns', 'regex_mode'
             ],
             'examples': {
                 'name_splitting': "Split 'Smith, John' into First_Name and Last_Name",
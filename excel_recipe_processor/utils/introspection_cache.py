@@ -0,0 +1,194 @@
+"""
+Cached index for the CLI introspection commands.
+
+excel_recipe_processor/utils/introspection_cache.py
+
+Capability listings, usage examples and processor kinds only change when the
+package changes, but building them imports and instantiates every processor
+and parses every examples YAML file. This module keeps the results in memory
+and in a cache file on disk, keyed by a fingerprint of the package version,
+the registered processor types and the modification times of the processor
+modules and example files. Any change to those invalidates the whole index.
+The fingerprint is computed once per process (and again only when the set of
+registered step types changes), so lookups do not re-stat the watched files;
+edits made while a process is running are picked up by the next process.
+
+The cache file lives in $EXCEL_RECIPE_PROCESSOR_CACHE_DIR, or else in
+$XDG_CACHE_HOME/excel_recipe_processor (~/.cache/excel_recipe_processor).
+Set EXCEL_RECIPE_PROCESSOR_NO_CACHE=1 to turn the disk caches off.
+"""
+
+import os
+import copy
+import pickle
+import hashlib
+import logging
+import tempfile
+
+from typing import Any, Callable
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV_VAR = 'EXCEL_RECIPE_PROCESSOR_CACHE_DIR'
+NO_CACHE_ENV_VAR = 'EXCEL_RECIPE_PROCESSOR_NO_CACHE'
+CACHE_FILE_NAME = 'introspection_cache.pickle'
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+
+# Files whose changes can alter capabilities or examples (relative to the package)
+WATCHED_PATTERNS = [
+    'processors/*.py',
+    'processors/_helpers/*.py',
+    'processors/_examples/*.yaml',
+    'config/_examples/*.yaml',
+    'core/base_processor.py',
+    'core/pipeline.py',
+    'utils/processor_examples_loader.py',
+]
+
+# In-process copy of the index: {'fingerprint': str, 'step_types': tuple, 'entries': dict}
+_memory_index = {'fingerprint': None, 'step_types': None, 'entries': {}}
+
+
+def get_cached(key: str, builder: Callable[[], Any], cacheable: Callable[[Any], bool] = None) -> Any:
+    """
+    Get an introspection result from the cache, building it on a miss.
+
+    Args:
+        key: Cache entry name (e.g. 'system_capabilities')
+        builder: Function producing the value when it is not cached
+        cacheable: Optional check; values it rejects are returned but not stored
+
+    Returns:
+        A private copy of the cached or newly built value
+    """
+    from excel_recipe_processor.core.base_processor import registry
+
+    # Processors registered after the first lookup change capabilities, so recheck them
+    step_types = tuple(registry.get_registered_types())
+
+    if _memory_index['fingerprint'] is None or _memory_index['step_types'] != step_types:
+        fingerprint = _fingerprint(step_types)
+        _memory_index['fingerprint'] = fingerprint
+        _memory_index['step_types'] = step_types
+        _memory_index['entries'] = _read_disk_entries(fingerprint)
+
+    fingerprint = _memory_index['fingerprint']
+    entries = _memory_index['entries']
+    if key in entries:
+        return copy.deepcopy(entries[key])
+
+    value = builder()
+
+    if cacheable is None or cacheable(value):
+        entries[key] = copy.deepcopy(value)
+        _write_disk_entries(fingerprint, entries)
+
+    return value
+
+
+def clear_introspection_cache() -> None:
+    """Drop the in-memory index and fingerprint and delete the cache file."""
+    _memory_index['fingerprint'] = None
+    _memory_index['step_types'] = None
+    _memory_index['entries'] = {}
+
+    cache_file = get_cache_file_path()
+    if cache_file is not None:
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+
+
+def get_cache_directory():
+    """
+    Get the per-user cache directory shared by the package's disk caches.
+
+    Returns:
+        Path to the cache directory, or None when disk caches are turned off
+    """
+    if os.environ.get(NO_CACHE_ENV_VAR, '').strip().lower() in ('1', 'true', 'yes'):
+        return None
+
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if not cache_dir:
+        xdg_cache = os.environ.get('XDG_CACHE_HOME') or str(Path.home() / '.cache')
+        cache_dir = str(Path(xdg_cache) / 'excel_recipe_processor')
+
+    return Path(cache_dir)
+
+
+def get_cache_file_path():
+    """
+    Get the path of the on-disk cache file.
+
+    Returns:
+        Path to the cache file, or None when the disk cache is turned off
+    """
+    cache_dir = get_cache_directory()
+    return cache_dir / CACHE_FILE_NAME if cache_dir is not None else None
+
+
+def _fingerprint(step_types: tuple) -> str:
+    """Hash the package version, registered step types and watched file stats."""
+    from excel_recipe_processor._version import __version__
+
+    digest = hashlib.sha1()
+    digest.update(__version__.encode())
+    digest.update('\0'.join(step_types).encode())
+
+    for pattern in WATCHED_PATTERNS:
+        for path in sorted(PACKAGE_DIR.glob(pattern)):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            digest.update(f'{path.relative_to(PACKAGE_DIR)}:{stat.st_mtime_ns}:{stat.st_size}\n'.encode())
+
+    return digest.hexdigest()
+
+
+def _read_disk_entries(fingerprint: str) -> dict:
+    """Load cached entries from disk if they belong to the current fingerprint."""
+    cache_file = get_cache_file_path()
+    if cache_file is None or not cache_file.exists():
+        return {}
+
+    try:
+        with open(cache_file, 'rb') as f:
+            stored = pickle.load(f)
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable introspection cache {cache_file}: {e}")
+        return {}
+
+    if not isinstance(stored, dict) or stored.get('fingerprint') != fingerprint:
+        return {}
+
+    return stored.get('entries', {})
+
+
+def _write_disk_entries(fingerprint: str, entries: dict) -> None:
+    """Store the entries on disk; failures only cost the next process a rebuild."""
+    cache_file = get_cache_file_path()
+    if cache_file is None:
+        return
+
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=cache_file.parent, suffix='.tmp')
+        try:
+            with os.fdopen(temp_fd, 'wb') as f:
+                pickle.dump({'fingerprint': fingerprint, 'entries': entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_file)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+    except Exception as e:
+        logger.debug(f"Could not write introspection cache {cache_file}: {e}")
+
+
+# End of file #
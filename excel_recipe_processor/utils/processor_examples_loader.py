@@ -9,6 +9,8 @@ error cases gracefully and provides consistent error messaging.
 from typing import Any
 from pathlib import Path
 
+from excel_recipe_processor.utils.introspection_cache import get_cached
+
 
 def load_processor_examples(processor_name: str) -> dict[str, Any]:
     """
@@ -25,6 +27,15 @@ def load_processor_examples(processor_name: str) -> dict[str, Any]:
         >>> if 'error' not in examples:
         ...     print(examples['description'])
     """
+    return get_cached(
+        f'processor_examples:{processor_name}',
+        lambda: _read_processor_examples(processor_name),
+        cacheable=lambda examples: 'error' not in examples
+    )
+
+
+def _read_processor_examples(processor_name: str) -> dict[str, Any]:
+    """Read and validate a processor's examples YAML file."""
     try:
         import yaml
     except ImportError:
@@ -292,6 +303,15 @@ def load_settings_examples() -> dict[str, Any]:
         >>> if 'error' not in examples:
         ...     print(examples['description'])
     """
+    return get_cached(
+        'settings_examples',
+        _read_settings_examples,
+        cacheable=lambda examples: 'error' not in examples
+    )
+
+
+def _read_settings_examples() -> dict[str, Any]:
+    """Read the recipe settings examples YAML file."""
     try:
         import yaml
     except ImportError:
@@ -0,0 +1,27 @@
+"""
+Shared pytest setup.
+
+tests/conftest.py
+
+Points the package's disk caches (introspection index, compiled recipes) at a
+temporary directory so test runs never write to the user's cache directory.
+Tests that check the caches themselves switch to their own empty directory.
+"""
+
+import os
+import shutil
+import tempfile
+
+from excel_recipe_processor.utils.introspection_cache import CACHE_DIR_ENV_VAR
+
+
+_test_cache_dir = tempfile.mkdtemp(prefix='excel_recipe_processor_cache_')
+os.environ[CACHE_DIR_ENV_VAR] = _test_cache_dir
+
+
+def pytest_unconfigure(config):
+    """Remove the temporary cache directory after the test run."""
+    shutil.rmtree(_test_cache_dir, ignore_errors=True)
+
+
+# End of file #
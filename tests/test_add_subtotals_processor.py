@@ -541,6 +541,86 @@ def test_edge_cases():
     return True
 
 
+def test_multi_level_subtotals():
+    """Test subtotal rows for every grouping level with subtotal_levels."""
+    
+    print("\nTesting multi-level subtotals...")
+    
+    hier_df = create_hierarchical_data()
+    
+    step_config = {
+        'processor_type': 'add_subtotals',
+        'step_description': 'Division and region subtotals',
+        'group_by': ['Division', 'Region'],
+        'subtotal_columns': ['Revenue'],
+        'subtotal_label': 'Total',
+        'subtotal_levels': 'all'
+    }
+    
+    processor = AddSubtotalsProcessor(step_config)
+    result = processor.execute(hier_df)
+    
+    # 8 data rows + 4 region subtotals + 2 division subtotals
+    if len(result) != 14:
+        print(f"✗ Expected 14 rows, got {len(result)}")
+        return False
+    
+    expected_order = [
+        ('North', 'NE'), ('North', 'NE'), ('North', 'Total: NE'),
+        ('North', 'NW'), ('North', 'NW'), ('North', 'Total: NW'),
+        ('Total: North', ''),
+        ('South', 'SE'), ('South', 'SE'), ('South', 'Total: SE'),
+        ('South', 'SW'), ('South', 'SW'), ('South', 'Total: SW'),
+        ('Total: South', '')
+    ]
+    actual_order = list(zip(result['Division'], result['Region']))
+    if actual_order != expected_order:
+        print(f"✗ Unexpected row order: {actual_order}")
+        return False
+    
+    north_total = result.loc[result['Division'] == 'Total: North', 'Revenue'].iloc[0]
+    ne_total = result.loc[result['Region'] == 'Total: NE', 'Revenue'].iloc[0]
+    if north_total != 5500 or ne_total != 2500:
+        print(f"✗ Wrong subtotal values: North={north_total}, NE={ne_total}")
+        return False
+    
+    print("✓ Region subtotals follow their rows and division subtotals close each division")
+    
+    # Before the group, the outer subtotal comes first
+    step_config['position'] = 'before_group'
+    step_config['subtotal_levels'] = ['Division', 'Region']
+    result = AddSubtotalsProcessor(step_config).execute(hier_df)
+    
+    first_rows = list(zip(result['Division'], result['Region']))[:3]
+    if first_rows != [('Total: North', ''), ('North', 'Total: NE'), ('North', 'NE')]:
+        print(f"✗ Unexpected leading rows for before_group: {first_rows}")
+        return False
+    
+    print("✓ before_group places outer subtotals ahead of inner ones")
+    
+    # Only the division level
+    step_config['position'] = 'after_group'
+    step_config['subtotal_levels'] = ['Division']
+    result = AddSubtotalsProcessor(step_config).execute(hier_df)
+    
+    if len(result) != 10 or result['Region'].str.startswith('Total').any():
+        print(f"✗ Division-only subtotals wrong: {len(result)} rows")
+        return False
+    
+    print("✓ Division-only subtotals created")
+    
+    # Levels must come from group_by
+    step_config['subtotal_levels'] = ['Product']
+    try:
+        AddSubtotalsProcessor(step_config).execute(hier_df)
+        print("✗ Should have rejected a level outside group_by")
+        return False
+    except StepProcessorError as e:
+        print(f"✓ Caught invalid level: {e}")
+    
+    return True
+
+
 if __name__ == '__main__':
     success = True
     
@@ -553,6 +633,7 @@ if __name__ == '__main__':
     success &= test_real_world_scenario()
     success &= test_utility_functions()
     success &= test_edge_cases()
+    success &= test_multi_level_subtotals()
     test_error_handling()
     
     if success:
@@ -223,6 +223,111 @@ def test_multiple_functions_same_column():
         return False
 
 
+def test_named_output_and_observed_groups():
+    """Test output naming/order and observed-only categorical groups."""
+    
+    print("\nTesting named outputs and observed categorical groups...")
+    
+    test_df = pd.DataFrame({
+        'Region': pd.Categorical(['West', 'West', 'East'], categories=['East', 'North', 'West']),
+        'Sales': [100, 200, 50],
+        'Sales_Target': [150, 150, 75]
+    })
+    
+    step_config = {
+        'processor_type': 'aggregate_data',
+        'group_by': 'Region',
+        'aggregations': [
+            {'column': 'Sales_Target', 'function': 'max', 'new_column_name': 'Target'},
+            {'column': 'Sales', 'function': 'sum', 'new_column_name': 'Total'},
+            {'column': 'Sales_Target', 'function': 'min'}
+        ]
+    }
+    
+    result = AggregateDataProcessor(step_config).execute(test_df)
+    
+    # Outputs keep the configured order and names; 'Sales' must not be confused with 'Sales_Target'
+    if list(result.columns) != ['Region', 'Target', 'Total', 'Sales_Target_min']:
+        print(f"✗ Unexpected columns: {list(result.columns)}")
+        return False
+    
+    if result['Total'].tolist() != [50, 300] or result['Target'].tolist() != [75, 150]:
+        print(f"✗ Unexpected values: {result.to_dict('list')}")
+        return False
+    
+    # The unused 'North' category is left out unless observed is turned off
+    if 'North' in result['Region'].tolist():
+        print("✗ Unobserved category included by default")
+        return False
+    
+    step_config['observed'] = False
+    result_all = AggregateDataProcessor(step_config).execute(test_df)
+    if len(result_all) != 3:
+        print(f"✗ Expected all 3 categories with observed=False, got {len(result_all)}")
+        return False
+    
+    # Two aggregations with the same output name are rejected
+    step_config['aggregations'] = [
+        {'column': 'Sales', 'function': 'sum', 'new_column_name': 'Value'},
+        {'column': 'Sales_Target', 'function': 'sum', 'new_column_name': 'Value'}
+    ]
+    try:
+        AggregateDataProcessor(step_config).execute(test_df)
+        print("✗ Should have rejected duplicate output names")
+        return False
+    except StepProcessorError:
+        pass
+    
+    print("✓ Named outputs and observed categorical groups work correctly")
+    return True
+
+
+def test_parallel_aggregation_matches_serial():
+    """Test that partitioned parallel aggregation reproduces the serial result exactly."""
+    
+    print("\nTesting parallel aggregation...")
+    
+    rows = 3000
+    test_df = pd.DataFrame({
+        'Region': [['West', 'East', None, 'North'][i % 4] for i in range(rows)],
+        'Rep': [f'Rep_{i % 37}' for i in range(rows)],
+        'Sales': [(i * 7919 % 1000) / 3.0 for i in range(rows)],
+        'Customer': [f'C{i % 101}' for i in range(rows)]
+    })
+    
+    step_config = {
+        'processor_type': 'aggregate_data',
+        'group_by': ['Region', 'Rep'],
+        'aggregations': [
+            {'column': 'Sales', 'function': 'sum', 'new_column_name': 'Total'},
+            {'column': 'Sales', 'function': 'mean', 'new_column_name': 'Average'},
+            {'column': 'Sales', 'function': 'std', 'new_column_name': 'Spread'},
+            {'column': 'Customer', 'function': 'nunique', 'new_column_name': 'Customers'}
+        ]
+    }
+    
+    serial = AggregateDataProcessor(step_config).execute(test_df)
+    
+    parallel_config = dict(step_config, parallel_workers=2, parallel_min_rows=0)
+    parallel = AggregateDataProcessor(parallel_config).execute(test_df)
+    
+    try:
+        pd.testing.assert_frame_equal(serial, parallel, check_exact=True)
+    except AssertionError as e:
+        print(f"✗ Parallel result differs from serial: {e}")
+        return False
+    
+    try:
+        AggregateDataProcessor(dict(step_config, parallel_workers=0)).execute(test_df)
+        print("✗ Should have rejected parallel_workers=0")
+        return False
+    except StepProcessorError:
+        pass
+    
+    print(f"✓ Parallel aggregation matches serial result ({len(parallel)} groups)")
+    return True
+
+
 def test_configuration_options():
     """Test various configuration options."""
     
@@ -821,6 +926,8 @@ if __name__ == '__main__':
     success &= test_single_column_aggregation()
     success &= test_multi_column_aggregation()
     success &= test_multiple_functions_same_column()
+    success &= test_named_output_and_observed_groups()
+    success &= test_parallel_aggregation_matches_serial()
     success &= test_configuration_options()
     
     # Stage-based aggregation tests
@@ -2,9 +2,10 @@
 Test the CopyStageProcessor functionality.
 """
 
+import numpy as np
 import pandas as pd
 
-from excel_recipe_processor.core.stage_manager import StageManager
+from excel_recipe_processor.core.stage_manager import StageManager, copy_on_write_active
 from excel_recipe_processor.core.base_processor import StepProcessorError
 from excel_recipe_processor.processors.copy_stage_processor import CopyStageProcessor
 
@@ -380,6 +381,69 @@ def test_data_isolation():
         StageManager.cleanup_stages()
 
 
+def test_stage_to_stage_shares_column_data():
+    """Test that copy, select and rename steps share column data between stages."""
+    
+    print("\nTesting shared column data between stages...")
+    
+    from excel_recipe_processor.processors.rename_columns_processor import RenameColumnsProcessor
+    from excel_recipe_processor.processors.select_columns_processor import SelectColumnsProcessor
+    
+    StageManager.initialize_stages(max_stages=10)
+    
+    try:
+        StageManager.save_stage('Source', create_sample_data())
+        
+        CopyStageProcessor({
+            'processor_type': 'copy_stage',
+            'source_stage': 'Source',
+            'target_stage': 'Backup'
+        }).execute_stage_to_stage()
+        
+        SelectColumnsProcessor({
+            'processor_type': 'select_columns',
+            'source_stage': 'Backup',
+            'columns_to_keep': ['Order_Value', 'Customer_ID'],
+            'save_to_stage': 'Selected'
+        }).execute_stage_to_stage()
+        
+        RenameColumnsProcessor({
+            'processor_type': 'rename_columns',
+            'source_stage': 'Selected',
+            'mapping': {'Order_Value': 'Value'},
+            'save_to_stage': 'Renamed'
+        }).execute_stage_to_stage()
+        
+        stored = StageManager._current_stages
+        source_values = stored['Source']['Order_Value'].to_numpy()
+        
+        # Column data is only shared under pandas copy-on-write
+        expect_shared = copy_on_write_active()
+        
+        for stage_name, column in [('Backup', 'Order_Value'), ('Selected', 'Order_Value'), ('Renamed', 'Value')]:
+            if np.shares_memory(stored[stage_name][column].to_numpy(), source_values) != expect_shared:
+                print(f"✗ Stage '{stage_name}' {'copied' if expect_shared else 'shared'} the column data")
+                return False
+        
+        if list(stored['Renamed'].columns) != ['Value', 'Customer_ID']:
+            print(f"✗ Unexpected renamed columns: {list(stored['Renamed'].columns)}")
+            return False
+        
+        # A normal load is a private copy, so changing it leaves every stage intact
+        loaded = StageManager.load_stage('Renamed')
+        loaded.loc[0, 'Value'] = -1
+        
+        if stored['Source'].loc[0, 'Order_Value'] != 1000 or stored['Renamed'].loc[0, 'Value'] != 1000:
+            print("✗ Modifying a loaded stage changed the stored stages")
+            return False
+        
+        print("✓ Stages shared column data and stayed isolated")
+        return True
+        
+    finally:
+        StageManager.cleanup_stages()
+
+
 if __name__ == '__main__':
     success = True
     
@@ -390,6 +454,7 @@ if __name__ == '__main__':
     success &= test_error_handling()
     success &= test_stage_limit_enforcement()
     success &= test_data_isolation()
+    success &= test_stage_to_stage_shares_column_data()
     
     if success:
         print("\n✓ All copy stage processor tests passed!")
@@ -398,6 +398,168 @@ def test_configuration_validation():
     return True
 
 
+def test_missing_values_and_row_order():
+    """Test NaN-aware comparison and the order of result rows."""
+    print("\nTesting missing values and row order...")
+    
+    setup_test_stages()
+    
+    baseline_data = pd.DataFrame({
+        'item_id': ['I1', 'I2', 'I3', 'I4'],
+        'price': [1.5, None, 3.0, 4.0],
+        'note': [None, 'old', None, 'gone']
+    })
+    current_data = pd.DataFrame({
+        'item_id': ['I3', 'I5', 'I2', 'I1'],
+        'price': [3.0, 9.0, 2.0, 1.5],
+        'note': [None, None, 'old', 'added']
+    })
+    StageManager.save_stage('baseline_items', baseline_data, 'Baseline items')
+    
+    step_config = {
+        'processor_type': 'diff_data',
+        'step_description': 'Test missing values',
+        'reference_stage': 'baseline_items',
+        'key_columns': 'item_id',
+        'include_json_details': True
+    }
+    
+    result = DiffDataProcessor(step_config).execute(current_data)
+    
+    # Current rows keep their order, deleted rows come last
+    assert result['item_id'].tolist() == ['I3', 'I5', 'I2', 'I1', 'I4'], \
+        f"Unexpected row order: {result['item_id'].tolist()}"
+    
+    assert result['Row_Status'].tolist() == ['UNCHANGED', 'NEW', 'CHANGED', 'CHANGED', 'DELETED'], \
+        f"Unexpected statuses: {result['Row_Status'].tolist()}"
+    
+    # Both-missing is unchanged, one side missing is a change
+    i2 = result[result['item_id'] == 'I2'].iloc[0]
+    i1 = result[result['item_id'] == 'I1'].iloc[0]
+    assert i2['Changed_Fields'] == 'price' and i1['Changed_Fields'] == 'note' and i1['Change_Count'] == 1, \
+        f"Wrong changed fields: I2={i2['Changed_Fields']!r}, I1={i1['Changed_Fields']!r}"
+    
+    assert json.loads(i1['Change_Details_JSON']) == {'note': {'old': None, 'new': 'added'}}, \
+        f"Wrong JSON details: {i1['Change_Details_JSON']}"
+    
+    assert result.loc[result['Row_Status'] == 'UNCHANGED', 'Change_Details_JSON'].iloc[0] == '', \
+        "Unchanged rows should have no JSON details"
+    
+    print("✓ Missing values and row order passed")
+    return True
+
+
+def test_row_hash_column():
+    """Test saving row hashes and reusing them from the reference data."""
+    print("\nTesting row hash column...")
+    
+    setup_test_stages()
+    
+    baseline_data = create_baseline_test_data()
+    current_data = create_current_test_data()
+    StageManager.save_stage('baseline_hashes', baseline_data, 'Baseline for hash test')
+    
+    step_config = {
+        'processor_type': 'diff_data',
+        'step_description': 'Test row hashes',
+        'reference_stage': 'baseline_hashes',
+        'key_columns': 'customer_id',
+        'row_hash_column': 'Row_Hash'
+    }
+    
+    first_result = DiffDataProcessor(step_config).execute(current_data)
+    
+    hashes = first_result['Row_Hash']
+    if not hashes.str.fullmatch(r'[0-9a-f]{16}').all():
+        print(f"✗ Row hashes should be 16-digit hex strings: {hashes.tolist()}")
+        return False
+    
+    if first_result['Row_Status'].value_counts().to_dict() != {'NEW': 2, 'CHANGED': 2, 'UNCHANGED': 1, 'DELETED': 2}:
+        print(f"✗ Hashing changed the diff outcome: {first_result['Row_Status'].value_counts().to_dict()}")
+        return False
+    
+    # Tomorrow: today's data (with stored hashes) becomes the reference
+    tomorrow_reference = current_data.assign(Row_Hash=hashes[first_result['Row_Status'] != 'DELETED'].tolist())
+    tomorrow_reference.loc[0, 'Row_Hash'] = 'not-a-hash'    # Stale entries are simply compared in full
+    StageManager.save_stage('baseline_hashes', tomorrow_reference, 'Reference with stored hashes', overwrite=True)
+    
+    tomorrow_data = current_data.copy()
+    tomorrow_data.loc[1, 'status'] = 'Inactive'
+    second_result = DiffDataProcessor(step_config).execute(tomorrow_data)
+    
+    if second_result['Row_Status'].tolist() != ['UNCHANGED', 'CHANGED', 'UNCHANGED', 'UNCHANGED', 'UNCHANGED']:
+        print(f"✗ Stored hashes gave wrong statuses: {second_result['Row_Status'].tolist()}")
+        return False
+    
+    if 'Row_Hash' in second_result.loc[1, 'Changed_Fields']:
+        print("✗ Row hash column should not be compared")
+        return False
+    
+    print("✓ Row hash column passed")
+    return True
+
+
+def test_row_hash_value_types():
+    """Test that values with equal string forms but different types are still CHANGED."""
+    print("\nTesting row hashes with mixed value types...")
+    
+    setup_test_stages()
+    
+    reference_data = pd.DataFrame({'item_id': ['I1', 'I2', 'I3'], 'code': [1, 'A', True]}, dtype=object)
+    current_data = pd.DataFrame({'item_id': ['I1', 'I2', 'I3'], 'code': ['1', 'A', 'True']}, dtype=object)
+    StageManager.save_stage('baseline_types', reference_data, 'Baseline with mixed types')
+    
+    step_config = {
+        'processor_type': 'diff_data',
+        'step_description': 'Test mixed types',
+        'reference_stage': 'baseline_types',
+        'key_columns': 'item_id'
+    }
+    
+    result = DiffDataProcessor(step_config).execute(current_data)
+    
+    assert result['Row_Status'].tolist() == ['CHANGED', 'UNCHANGED', 'CHANGED'], \
+        f"1 vs '1' and True vs 'True' should be changes: {result['Row_Status'].tolist()}"
+    
+    print("✓ Mixed value types passed")
+    return True
+
+
+def test_row_hash_edited_reference_values():
+    """Test that reference values edited after their hash was stored are still reported."""
+    print("\nTesting row hashes with edited reference values...")
+    
+    setup_test_stages()
+    
+    data = pd.DataFrame({'sku': ['S1', 'S2', 'S3'], 'Price': [10.0, 20.0, 30.0]})
+    StageManager.save_stage('baseline_edited', data, 'Baseline for edited hash test')
+    
+    step_config = {
+        'processor_type': 'diff_data',
+        'step_description': 'Test edited reference values',
+        'reference_stage': 'baseline_edited',
+        'key_columns': 'sku',
+        'row_hash_column': 'Row_Hash'
+    }
+    
+    first_result = DiffDataProcessor(step_config).execute(data)
+    
+    # The stored hashes still describe Price 20.0 after the reference row is edited
+    edited_reference = data.assign(Row_Hash=first_result['Row_Hash'].tolist())
+    edited_reference.loc[1, 'Price'] = 25.0
+    StageManager.save_stage('baseline_edited', edited_reference, 'Edited reference', overwrite=True)
+    
+    result = DiffDataProcessor(step_config).execute(data)
+    
+    assert result['Row_Status'].tolist() == ['UNCHANGED', 'CHANGED', 'UNCHANGED'], \
+        f"Edited reference row should be CHANGED: {result['Row_Status'].tolist()}"
+    assert 'Price' in result.loc[1, 'Changed_Fields'], \
+        f"Price should be reported as changed: {result.loc[1, 'Changed_Fields']}"
+    
+    print("✓ Edited reference values passed")
+    return True
+
+
 def main():
     """Run all tests and report results."""
     print("🧪 Testing DiffDataProcessor functionality...")
@@ -409,7 +571,11 @@ def main():
         test_filtered_stages_creation,
         test_json_details_option,
         test_handle_deleted_rows_options,
-        test_configuration_validation
+        test_configuration_validation,
+        test_missing_values_and_row_order,
+        test_row_hash_column,
+        test_row_hash_value_types,
+        test_row_hash_edited_reference_values
     ]
     
     passed = 0
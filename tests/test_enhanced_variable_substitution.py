@@ -12,6 +12,7 @@ import json
 from excel_recipe_processor.core.variable_substitution import (
     VariableSubstitution, 
     VariableSubstitutionError,
+    compile_template,
     substitute_variables,
     substitute_structure
 )
@@ -338,6 +339,75 @@ def test_convenience_functions():
     return success == tests
 
 
+def test_compiled_templates():
+    """Test that compiled templates are cached and match the regex passes."""
+    print("\nTesting compiled templates...")
+    
+    custom_vars = {
+        'region': 'West',
+        'nested': '{date}',
+        'prefix': ':tag'
+    }
+    var_sub = VariableSubstitution(input_path='data/sales.xlsx', custom_variables=custom_vars)
+    
+    success = 0
+    tests = 0
+    
+    # Same template string compiles once
+    tests += 1
+    template = '{str:region}_{input_basename}_{date:YYYY_MM}.xlsx'
+    if compile_template(template) is compile_template(template):
+        print(f"  ✓ Template compiled once and reused")
+        success += 1
+    else:
+        print(f"  ✗ Template was recompiled")
+    
+    # Compiled rendering agrees with the three sequential regex passes
+    templates = [
+        template,
+        'Report {region} for {date:MMDD} at {time:HHMM}',
+        '{str:nested}',           # Value with braces is substituted again by later passes
+        '{region}{str:prefix}',   # Untyped variable followed by ':' is left alone
+        '{unknown} and {foo:bar baz}',
+        '{{str:region}}',         # Stray braces outside slots
+    ]
+    for template in templates:
+        tests += 1
+        compiled_result = var_sub.substitute(template)
+        regex_result = var_sub._substitute_with_regex_passes(template)
+        if compiled_result == regex_result:
+            print(f"  ✓ '{template}' → '{compiled_result}'")
+            success += 1
+        else:
+            print(f"  ✗ '{template}': compiled '{compiled_result}' vs regex passes '{regex_result}'")
+    
+    # Plain strings in large inline data pass through untouched
+    tests += 1
+    rows = [[f'Customer {i}', i, 'North'] for i in range(1000)]
+    result = var_sub.substitute_structure({'data': rows, 'name': '{str:region}'})
+    if result['data'] == rows and result['data'] is not rows and result['name'] == 'West':
+        print(f"  ✓ Inline data copied without substitution")
+        success += 1
+    else:
+        print(f"  ✗ Inline data changed: {result['data'][:2]}")
+    
+    # Typos are still reported for cached templates
+    tests += 1
+    try:
+        var_sub.substitute_structure({'file': 'name_str:region}'})
+        var_sub.substitute_structure({'file': 'name_str:region}'})
+        print(f"  ✗ Missing opening brace not detected")
+    except VariableSubstitutionError as e:
+        if 'Missing opening brace' in str(e):
+            print(f"  ✓ Typo detected: {e}")
+            success += 1
+        else:
+            print(f"  ✗ Wrong typo error: {e}")
+    
+    print(f"  Compiled templates: {success}/{tests} tests passed")
+    return success == tests
+
+
 def main():
     """Run all tests and return pass/fail status."""
     print("Enhanced Variable Substitution Tests")
@@ -351,6 +421,7 @@ def main():
     test_results.append(test_nested_structure_substitution())
     test_results.append(test_type_validation())
     test_results.append(test_convenience_functions())
+    test_results.append(test_compiled_templates())
     
     passed = sum(test_results)
     total = len(test_results)
@@ -689,6 +689,173 @@ def test_empty_pandas_expression():
             return False
 
 
+def test_case_insensitive_filters_on_categorical_column():
+    """Test repeated case-insensitive filters on a low-cardinality categorical column."""
+    print("\nTesting case-insensitive filters on categorical column...")
+    
+    test_df = pd.DataFrame({
+        'Department': pd.Categorical(['Grocery', 'GROCERY', None, 'Frozen', 'grocery', 'Seafood'] * 3),
+        'Product_Name': ['CANNED BEANS', 'canned soup', 'Fresh Fish', 'Canned Corn', 'FROZEN PEAS', 'canned tuna'] * 3
+    })
+    
+    step_config = {
+        'processor_type': 'filter_data',
+        'step_description': 'Grocery cans, ignoring case',
+        'filters': [
+            {'column': 'Department', 'condition': 'not_equals', 'value': 'seafood'},
+            {'column': 'Department', 'condition': 'in_list', 'value': ['grocery', 'frozen']},
+            {'column': 'Product_Name', 'condition': 'starts_with', 'value': 'canned'},
+            {'column': 'Department', 'condition': 'equals', 'value': 'GROCERY'}
+        ]
+    }
+    
+    processor = FilterDataProcessor(step_config)
+    result = processor.execute(test_df)
+    
+    expected = test_df[
+        test_df['Department'].astype(str).str.lower().eq('grocery') &
+        test_df['Product_Name'].str.lower().str.startswith('canned')
+    ]
+    
+    if len(result) == 6 and result.index.equals(expected.index):
+        print("✓ Cached lowercase views give the same rows as uncached filtering")
+        return True
+    else:
+        print(f"✗ Expected rows {list(expected.index)}, got {list(result.index)}")
+        return False
+
+
+def test_case_insensitive_filters_on_mixed_type_column():
+    """Test that 1, True and 1.0 in one object column keep their own string forms."""
+    print("\nTesting case-insensitive filters on mixed-type column...")
+    
+    test_df = pd.DataFrame({'Flag': pd.Series([1, True, 1.0, 'yes', 1, True, 1.0, 'yes'], dtype=object)})
+    
+    for value, expected_rows in [('1', [0, 4]), ('TRUE', [1, 5]), ('1.0', [2, 6])]:
+        step_config = {
+            'processor_type': 'filter_data',
+            'step_description': f'Flag equals {value}',
+            'filters': [{'column': 'Flag', 'condition': 'equals', 'value': value}]
+        }
+        result = FilterDataProcessor(step_config).execute(test_df)
+        assert list(result.index) == expected_rows, \
+            f"equals {value!r}: expected rows {expected_rows}, got {list(result.index)}"
+    
+    print("✓ Mixed-type values compare by their own string forms")
+    return True
+
+
+def test_stage_comparison_case_insensitive_keys():
+    """Test case-insensitive stage comparison matches keys regardless of case."""
+    print("\nTesting case-insensitive stage comparison keys...")
+    
+    StageManager.initialize_stages(max_stages=10)
+    StageManager.save_stage(
+        stage_name='Expected Status',
+        data=pd.DataFrame({
+            'Order_ID': ['o001', 'O002', 'o003'],
+            'Expected': ['SHIPPED', 'pending', 'Shipped']
+        })
+    )
+    
+    test_df = pd.DataFrame({
+        'Order_ID': ['O001', 'O002', 'O003', 'O004'],
+        'Status': ['shipped', 'Pending', 'Cancelled', 'Shipped']
+    })
+    
+    step_config = {
+        'processor_type': 'filter_data',
+        'step_description': 'Orders matching expected status',
+        'filters': [
+            {
+                'column': 'Status',
+                'condition': 'stage_comparison',
+                'stage_name': 'Expected Status',
+                'key_column': 'Order_ID',
+                'stage_key_column': 'Order_ID',
+                'stage_value_column': 'Expected',
+                'comparison_operator': 'equals'
+            },
+            {
+                'column': 'Order_ID',
+                'condition': 'in_stage',
+                'stage_name': 'Expected Status',
+                'stage_column': 'Order_ID'
+            }
+        ]
+    }
+    
+    processor = FilterDataProcessor(step_config)
+    result = processor.execute(test_df)
+    
+    StageManager.cleanup_stages()
+    
+    if list(result['Order_ID']) == ['O001', 'O002']:
+        print("✓ Case-insensitive stage comparison works correctly")
+        return True
+    else:
+        print(f"✗ Expected ['O001', 'O002'], got {list(result['Order_ID'])}")
+        return False
+
+
+def test_contains_any_conditions():
+    """Test multi-term contains_any and not_contains_any conditions."""
+    print("\nTesting contains_any and not_contains_any conditions...")
+    
+    test_df = create_test_data()
+    success = True
+    
+    # Literal terms: the '.' must not act as a regex wildcard
+    terms = ['beans', 'FISH', 'c.rn', 'nothing-matches-this']
+    
+    processor = FilterDataProcessor({
+        'processor_type': 'filter_data',
+        'step_description': 'Contains any term',
+        'filters': [{'column': 'Product_Name', 'condition': 'contains_any', 'value': terms}]
+    })
+    result = processor.execute(test_df)
+    
+    if list(result['Product_ID']) == ['P001', 'P002']:
+        print("✓ contains_any matches literal terms case-insensitively")
+    else:
+        print(f"✗ contains_any expected ['P001', 'P002'], got {list(result['Product_ID'])}")
+        success = False
+    
+    processor = FilterDataProcessor({
+        'processor_type': 'filter_data',
+        'step_description': 'Contains no term (case-sensitive)',
+        'filters': [{
+            'column': 'Product_Name',
+            'condition': 'not_contains_any',
+            'value': ['CANNED', 'fish'],
+            'case_sensitive': True
+        }]
+    })
+    result = processor.execute(test_df)
+    
+    if list(result['Product_ID']) == ['P002', 'P005']:
+        print("✓ not_contains_any honors case_sensitive")
+    else:
+        print(f"✗ not_contains_any expected ['P002', 'P005'], got {list(result['Product_ID'])}")
+        success = False
+    
+    try:
+        FilterDataProcessor({
+            'processor_type': 'filter_data',
+            'filters': [{'column': 'Product_Name', 'condition': 'contains_any', 'value': 'CANNED'}]
+        }).execute(test_df)
+        print("✗ contains_any should require a list value")
+        success = False
+    except StepProcessorError as e:
+        if 'list value' in str(e):
+            print("✓ contains_any rejects non-list values")
+        else:
+            print(f"✗ Unexpected error: {e}")
+            success = False
+    
+    return success
+
+
 if __name__ == '__main__':
     print("Testing FilterDataProcessor refactoring...")
     success = True
@@ -716,6 +883,10 @@ if __name__ == '__main__':
     success &= test_stage_filter_error_handling()
     success &= test_capabilities_include_stage_features()
     success &= test_backward_compatibility()
+    success &= test_case_insensitive_filters_on_categorical_column()
+    success &= test_case_insensitive_filters_on_mixed_type_column()
+    success &= test_stage_comparison_case_insensitive_keys()
+    success &= test_contains_any_conditions()
     
     print("Testing FilterDataProcessor pandas_expression feature...")
     success = True
@@ -328,6 +328,82 @@ def test_corporate_branding_scenario():
             os.unlink(test_file)
 
 
+def test_shared_styles_keep_existing_properties():
+    """Test that cached general styles still merge with each cell's own style."""
+    print("\n7. Testing shared style reuse across many cells...")
+    
+    import openpyxl
+    from openpyxl.styles import Font, Alignment
+    
+    rows = 500
+    test_df = pd.DataFrame({f'Col{i}': range(rows) for i in range(10)})
+    
+    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as temp_file:
+        test_file = temp_file.name
+    
+    try:
+        test_df.to_excel(test_file, index=False, sheet_name='Data')
+        
+        # Give a few cells their own font and alignment before general formatting runs
+        workbook = openpyxl.load_workbook(test_file)
+        worksheet = workbook['Data']
+        worksheet['B3'].font = Font(bold=True, italic=True, size=14)
+        worksheet['C4'].alignment = Alignment(wrap_text=True, indent=2)
+        workbook.save(test_file)
+        workbook.close()
+        
+        step_config = {
+            'processor_type': 'format_excel',
+            'target_file': test_file,
+            'formatting': [{
+                'sheet': 'Data',
+                'general_text_color': 'navy',
+                'general_font_name': 'Arial',
+                'general_alignment_horizontal': 'right',
+                'cell_ranges': {
+                    'A2:J50': {'background_color': 'lightyellow', 'border': 'thin'}
+                }
+            }]
+        }
+        
+        processor = FormatExcelProcessor(step_config)
+        processor.execute()
+        
+        workbook = openpyxl.load_workbook(test_file)
+        worksheet = workbook['Data']
+        plain = worksheet['D10']
+        bold = worksheet['B3']
+        wrapped = worksheet['C4']
+        
+        checks = [
+            plain.font.name == 'Arial' and plain.font.color.rgb == '00000080',
+            plain.alignment.horizontal == 'right',
+            bold.font.name == 'Arial' and bold.font.bold and bold.font.italic and bold.font.size == 14,
+            wrapped.alignment.horizontal == 'right' and wrapped.alignment.wrap_text and wrapped.alignment.indent == 2,
+            worksheet['J50'].fill.fgColor.rgb == worksheet['A2'].fill.fgColor.rgb != '00000000',
+            worksheet['J50'].border.left.style == 'thin',
+            worksheet['J51'].border.left.style is None,
+            # Thousands of formatted cells should only add a handful of distinct styles
+            len(workbook._fonts) <= 5 and len(workbook._alignments) <= 5
+        ]
+        workbook.close()
+        
+        if all(checks):
+            print("  ✓ Shared styles reused while keeping per-cell properties")
+            return True
+        
+        print(f"  ✗ Unexpected formatting results: {checks}")
+        return False
+        
+    except Exception as e:
+        print(f"  ✗ Shared style test failed: {e}")
+        return False
+        
+    finally:
+        if os.path.exists(test_file):
+            os.unlink(test_file)
+
+
 def main():
     """Run all Phase 2 enhancement tests."""
     print("🚀 Format Excel Processor - Phase 2 Enhancement Tests")
@@ -342,7 +418,8 @@ def main():
         test_general_alignment,
         test_invalid_alignment_values,
         test_comprehensive_formatting,
-        test_corporate_branding_scenario
+        test_corporate_branding_scenario,
+        test_shared_styles_keep_existing_properties
     ]
     
     passed = 0
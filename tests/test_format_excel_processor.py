@@ -14,7 +14,8 @@ except ImportError:
     OPENPYXL_AVAILABLE = False
 
 from excel_recipe_processor.core.base_processor import StepProcessorError
-from excel_recipe_processor.processors.format_excel_processor import FormatExcelProcessor
+from excel_recipe_processor.core.stage_manager import StageManager
+from excel_recipe_processor.processors.format_excel_processor import FormatExcelProcessor, CellStyleCache
 
 
 def create_sample_data():
@@ -282,6 +283,120 @@ def test_column_and_row_sizing():
             os.unlink(test_file)
 
 
+def test_auto_fit_sampling_and_stage_lengths():
+    """Test auto-fit from sampled rows, percentiles and stage data."""
+    
+    if not OPENPYXL_AVAILABLE:
+        print("Skipping auto-fit sampling test - openpyxl not available")
+        return True
+    
+    print("\nTesting auto-fit sampling and stage lengths...")
+    
+    # One very long outlier among many short names
+    names = ['Short name'] * 199 + ['X' * 60]
+    test_df = pd.DataFrame({'Name': names, 'Value': range(200)})
+    test_file = create_test_excel_file(test_df, 'autofit_sampling_test.xlsx')
+    
+    StageManager.initialize_stages()
+    
+    try:
+        StageManager.save_stage('autofit_source', test_df)
+        
+        def column_widths(sheet_options):
+            config = {'sheet': 'TestData', 'auto_fit_columns': True, 'header_bold': True}
+            config.update(sheet_options)
+            FormatExcelProcessor({
+                'processor_type': 'format_excel',
+                'target_file': test_file,
+                'formatting': [config]
+            }).execute()
+            workbook = openpyxl.load_workbook(test_file)
+            worksheet = workbook['TestData']
+            widths = (worksheet.column_dimensions['A'].width, worksheet.column_dimensions['B'].width)
+            workbook.close()
+            return widths
+        
+        full_scan = column_widths({})
+        percentile = column_widths({'auto_fit_percentile': 90})
+        from_stage = column_widths({'auto_fit_stage': 'autofit_source'})
+        stage_percentile = column_widths({'auto_fit_stage': 'autofit_source', 'auto_fit_percentile': 90})
+        sampled = column_widths({'auto_fit_sample_rows': 10})
+        
+        # 'X' * 60 or 'Short name' plus padding; column B is sized by its bold 'Value' header
+        assert full_scan == (64, 10), f"Unexpected full-scan widths: {full_scan}"
+        assert percentile == (14, 10), f"Unexpected percentile widths: {percentile}"
+        assert from_stage == full_scan, f"Stage widths {from_stage} differ from full scan {full_scan}"
+        assert stage_percentile == percentile, \
+            f"Stage percentile widths {stage_percentile} differ from {percentile}"
+        # Evenly spaced sample includes the last row, so the outlier is still seen
+        assert sampled == full_scan, f"Sampled widths {sampled} differ from full scan {full_scan}"
+        
+        try:
+            column_widths({'auto_fit_stage': 'missing_stage'})
+            raise AssertionError("Missing auto_fit_stage should raise StepProcessorError")
+        except StepProcessorError as e:
+            assert 'missing_stage' in str(e), f"Error should name the missing stage: {e}"
+        
+        print("✓ Auto-fit sampling, percentiles and stage lengths worked correctly")
+        return True
+        
+    finally:
+        StageManager.cleanup_stages()
+        if os.path.exists(test_file):
+            os.unlink(test_file)
+
+
+def test_public_style_fallback():
+    """Test that the public style attributes give the same result as the style index fast path."""
+    
+    if not OPENPYXL_AVAILABLE:
+        print("Skipping style fallback test - openpyxl not available")
+        return True
+    
+    print("\nTesting public style attribute fallback...")
+    
+    formatting = {
+        'auto_fit_columns': True,
+        'header_bold': True,
+        'header_background': True,
+        'header_font_size': 14,
+        'general_text_color': 'blue',
+        'general_alignment_horizontal': 'center',
+        'cell_ranges': {'B2:B4': {'italic': True, 'background_color': 'yellow', 'border': 'thin'}}
+    }
+    
+    def format_sheet():
+        workbook = openpyxl.Workbook()
+        worksheet = workbook.active
+        for row in [['Product', 'Value'], ['Widget', 10], ['Gadget', 200], ['Long product name', 3000]]:
+            worksheet.append(row)
+        FormatExcelProcessor({
+            'processor_type': 'format_excel',
+            'target_file': 'unused.xlsx'
+        })._apply_sheet_formatting(worksheet, formatting)
+        return [
+            (repr(cell.font), repr(cell.fill), repr(cell.border), repr(cell.alignment))
+            for row in worksheet.iter_rows() for cell in row
+        ], (worksheet.column_dimensions['A'].width, worksheet.column_dimensions['B'].width)
+    
+    fast_styles, fast_widths = format_sheet()
+    
+    # Keep the raw staticmethod object; the class attribute lookup would unwrap it
+    original_check = CellStyleCache.__dict__['style_indexes_supported']
+    CellStyleCache.style_indexes_supported = staticmethod(lambda workbook: False)
+    try:
+        assert not CellStyleCache(openpyxl.Workbook()).uses_style_indexes
+        public_styles, public_widths = format_sheet()
+    finally:
+        CellStyleCache.style_indexes_supported = original_check
+    
+    assert public_styles == fast_styles, "Public style attributes produced different cell styles"
+    assert public_widths == fast_widths, f"Column widths differ: {public_widths} vs {fast_widths}"
+    
+    print("✓ Public style attributes matched the style index fast path")
+    return True
+
+
 def test_auto_filter():
     """Test auto-filter functionality."""
     
@@ -543,6 +658,8 @@ if __name__ == '__main__':
     success &= test_freeze_panes()
     success &= test_multiple_sheets()
     success &= test_column_and_row_sizing()
+    success &= test_auto_fit_sampling_and_stage_lengths()
+    success &= test_public_style_fallback()
     success &= test_auto_filter()
     success &= test_error_handling()
     success &= test_variable_substitution()
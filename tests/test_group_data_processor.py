@@ -227,6 +227,64 @@ def test_unmatched_value_handling():
     return True
 
 
+def test_pattern_and_missing_values():
+    """Test wildcard/regex groups and missing source values."""
+    print("\nTesting pattern groups and missing values...")
+    
+    test_data = pd.DataFrame({
+        'Code': ['WID-100', 'wid-200', 'GX12', 'GAD-7', 'ZZZ', None, 'WID-100']
+    })
+    
+    config = {
+        'processor_type': 'group_data',
+        'source_column': 'Code',
+        'match_mode': 'wildcard',
+        'groups': {
+            'Widgets': ['WID-*'],
+            'Gadgets': ['GAD-*', 'GX??']
+        },
+        'unmatched_action': 'set_default',
+        'unmatched_value': 'Other'
+    }
+    
+    result = GroupDataProcessor(config).execute(test_data)
+    expected = ['Widgets', 'Widgets', 'Gadgets', 'Gadgets', 'Other', 'Other', 'Widgets']
+    assert result['Code_Group'].tolist() == expected, f"Wildcard grouping wrong: {result['Code_Group'].tolist()}"
+    
+    # Regex patterns must match the whole value, first group wins on overlap
+    config['match_mode'] = 'regex'
+    config['groups'] = {
+        'Hundreds': [r'WID-\d00'],
+        'AnyWidget': [r'WID-.*'],
+        'Short': [r'[A-Z]{2}\d+']
+    }
+    config['case_sensitive'] = True
+    result = GroupDataProcessor(config).execute(test_data)
+    expected = ['Hundreds', 'Other', 'Short', 'Other', 'Other', 'Other', 'Hundreds']
+    assert result['Code_Group'].tolist() == expected, f"Regex grouping wrong: {result['Code_Group'].tolist()}"
+    
+    # Missing values stay missing with keep_original
+    config_exact = {
+        'processor_type': 'group_data',
+        'source_column': 'Code',
+        'groups': {'Widgets': ['wid-100', 'wid-200']}
+    }
+    result = GroupDataProcessor(config_exact).execute(test_data)
+    assert pd.isna(result['Code_Group'].iloc[5]) and result['Code_Group'].iloc[4] == 'ZZZ', \
+        f"keep_original wrong: {result['Code_Group'].tolist()}"
+    
+    # Invalid patterns are reported with their group
+    config['groups'] = {'Broken': ['WID-(']}
+    try:
+        GroupDataProcessor(config).execute(test_data)
+        raise AssertionError("Should have rejected an invalid regex")
+    except StepProcessorError as e:
+        assert 'Broken' in str(e), f"Error should name the group: {e}"
+    
+    print("✓ Pattern groups and missing values work correctly")
+    return True
+
+
 def test_stage_based_grouping():
     """Test grouping using data from StageManager."""
     print("\nTesting stage-based grouping...")
@@ -423,6 +481,7 @@ def main():
         test_case_sensitivity_default,
         test_case_sensitive_explicit,
         test_unmatched_value_handling,
+        test_pattern_and_missing_values,
         test_stage_based_grouping,
         test_file_based_grouping,
         test_error_handling,
@@ -257,10 +257,10 @@ def test_range_formula_injection():
         
         workbook.close()
         
-        # All should have the same base formula (simple implementation for now)
+        # Relative references shift down the range like an Excel fill
         if (formula_d2 == '=B2*C2' and 
-            formula_d3 == '=B2*C2' and 
-            formula_d6 == '=B2*C2'):
+            formula_d3 == '=B3*C3' and 
+            formula_d6 == '=B6*C6'):
             print("✓ Range formulas injected successfully")
             return True
         else:
@@ -277,6 +277,134 @@ def test_range_formula_injection():
             Path(excel_file).unlink()
 
 
+def test_range_reference_translation():
+    """Test relative, absolute and whole-column references across a 2-D range."""
+    print("Testing range reference translation...")
+    
+    test_data = pd.DataFrame({
+        'Product': [f'Product {i}' for i in range(1, 4)],
+        'Price': [10.0, 20.0, 15.0],
+        'Quantity': [100, 50, 75],
+        'Total': [0] * 3,
+        'Share': [0] * 3
+    })
+    excel_file = create_test_excel_file(test_data, 'range_translation_test.xlsx')
+    
+    try:
+        step_config = {
+            'processor_type': 'inject_formulas',
+            'target_file': excel_file,
+            'mode': 'live',
+            'formulas': [
+                {
+                    'range': 'D2:E4',
+                    'formula': '=B2*$C2/SUM(B$2:B$4)+COUNTIF(A:A,"A1")'
+                },
+                {
+                    'range': 'F2:F3',
+                    'formula': '=B2*2',
+                    'adjust_references': False
+                }
+            ]
+        }
+        
+        processor = InjectFormulasProcessor(step_config)
+        processor.execute()
+        
+        workbook = openpyxl.load_workbook(excel_file)
+        worksheet = workbook.active
+        
+        expected = {
+            'D2': '=B2*$C2/SUM(B$2:B$4)+COUNTIF(A:A,"A1")',
+            'E2': '=C2*$C2/SUM(C$2:C$4)+COUNTIF(B:B,"A1")',
+            'D4': '=B4*$C4/SUM(B$2:B$4)+COUNTIF(A:A,"A1")',
+            'E4': '=C4*$C4/SUM(C$2:C$4)+COUNTIF(B:B,"A1")',
+            'F2': '=B2*2',
+            'F3': '=B2*2'
+        }
+        actual = {coord: worksheet[coord].value for coord in expected}
+        workbook.close()
+        
+        if actual == expected:
+            print("✓ Range references translated correctly")
+            return True
+        else:
+            print(f"✗ Range reference translation failed: {actual}")
+            return False
+    
+    except Exception as e:
+        print(f"✗ Range reference translation failed: {e}")
+        return False
+    
+    finally:
+        if Path(excel_file).exists():
+            Path(excel_file).unlink()
+
+
+def test_awaken_scan_modes():
+    """Test that streaming and full awaken scans give the same workbook."""
+    print("Testing awaken scan modes...")
+    
+    def build_workbook(path):
+        workbook = openpyxl.Workbook()
+        worksheet = workbook.active
+        worksheet.title = 'Template'
+        worksheet['A1'] = 'Label'
+        worksheet['B1'] = 5
+        worksheet['B2'] = "'=B1*2"
+        worksheet['C5'] = '  =SUM(B1:B2)'
+        worksheet['AA300'] = "'=B1+1"
+        worksheet['D1'] = 'Total = B1'
+        workbook.create_sheet('Other')['A1'] = "'=1+1"
+        workbook.save(path)
+    
+    results = {}
+    excel_files = []
+    
+    try:
+        for scan_mode in ['streaming', 'full']:
+            excel_file = create_test_excel_file(pd.DataFrame(), f'awaken_{scan_mode}_test.xlsx')
+            excel_files.append(excel_file)
+            build_workbook(excel_file)
+            
+            processor = InjectFormulasProcessor({
+                'processor_type': 'inject_formulas',
+                'target_file': excel_file,
+                'mode': 'awaken',
+                'sheets': 'all',
+                'scan_mode': scan_mode
+            })
+            processor.execute()
+            
+            workbook = openpyxl.load_workbook(excel_file)
+            results[scan_mode] = {
+                (sheet.title, cell.coordinate): (cell.value, cell.data_type)
+                for sheet in workbook.worksheets
+                for row in sheet.iter_rows() for cell in row
+            }
+            workbook.close()
+        
+        streaming = results['streaming']
+        if (streaming == results['full'] and
+            streaming[('Template', 'B2')] == ('=B1*2', 'f') and
+            streaming[('Template', 'AA300')] == ('=B1+1', 'f') and
+            streaming[('Template', 'D1')] == ('Total = B1', 's')):
+            print("✓ Streaming scan matches full scan")
+            return True
+        else:
+            print(f"✗ Scan modes differ: streaming={streaming}, full={results['full']}")
+            return False
+    
+    except Exception as e:
+        print(f"✗ Awaken scan mode test failed: {e}")
+        return False
+    
+    finally:
+        for excel_file in excel_files:
+            if Path(excel_file).exists():
+                Path(excel_file).unlink()
+
+
 def test_configuration_validation():
     """Test processor configuration validation."""
     print("Testing configuration validation...")
@@ -341,6 +469,8 @@ def main():
         test_basic_live_formula_injection,
         test_dead_formula_injection,
         test_range_formula_injection,
+        test_range_reference_translation,
+        test_awaken_scan_modes,
     ]
     
     passed = 0
@@ -0,0 +1,229 @@
+"""
+Test the cached introspection index used by the CLI commands.
+
+tests/test_introspection_cache.py
+
+Capabilities, usage examples and processor kinds are cached in memory and on
+disk; the cache must be reused between calls and processes, and rebuilt when
+the package version or a watched file changes. The fingerprint is computed
+once per process, so tests drop it to simulate a new process.
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+from pathlib import Path
+
+# Add project root to Python path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import excel_recipe_processor._version as version_module
+
+from excel_recipe_processor.core.pipeline import get_system_capabilities, get_processor_usage_examples
+from excel_recipe_processor.utils import introspection_cache
+from excel_recipe_processor.utils.introspection_cache import (
+    get_cached,
+    get_cache_file_path,
+    clear_introspection_cache,
+    CACHE_DIR_ENV_VAR,
+)
+
+
+def with_temp_cache_dir(test_func):
+    """Run a test against an empty cache directory."""
+    def wrapper():
+        previous = os.environ.get(CACHE_DIR_ENV_VAR)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.environ[CACHE_DIR_ENV_VAR] = cache_dir
+            clear_introspection_cache()
+            try:
+                return test_func()
+            finally:
+                clear_introspection_cache()
+                if previous is None:
+                    os.environ.pop(CACHE_DIR_ENV_VAR, None)
+                else:
+                    os.environ[CACHE_DIR_ENV_VAR] = previous
+    wrapper.__name__ = test_func.__name__
+    wrapper.__doc__ = test_func.__doc__
+    return wrapper
+
+
+@with_temp_cache_dir
+def test_cache_reuse():
+    """Test that cached values are reused in memory and from disk."""
+    print("Testing introspection cache reuse...")
+
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return {'value': [1, 2, 3]}
+
+    first = get_cached('reuse_check', builder)
+    first['value'].append(4)  # Callers get private copies
+    second = get_cached('reuse_check', builder)
+
+    if len(calls) != 1 or second != {'value': [1, 2, 3]}:
+        print(f"✗ Expected one build and an unmodified copy, got {len(calls)} builds and {second}")
+        return False
+
+    if not get_cache_file_path().exists():
+        print("✗ Cache file was not written")
+        return False
+
+    # Simulate a new process: drop the memory copy and read back from disk
+    simulate_new_process()
+    third = get_cached('reuse_check', builder)
+
+    if len(calls) != 1 or third != {'value': [1, 2, 3]}:
+        print("✗ Cache file was not reused")
+        return False
+
+    get_cached('rejected_check', builder, cacheable=lambda value: False)
+    get_cached('rejected_check', builder, cacheable=lambda value: False)
+    if len(calls) != 3:
+        print("✗ Rejected values should not be cached")
+        return False
+
+    print("✓ Cache reused in memory and from disk")
+    return True
+
+
+def simulate_new_process():
+    """Drop the in-memory index and fingerprint, keeping the cache file."""
+    introspection_cache._memory_index['fingerprint'] = None
+
+
+@with_temp_cache_dir
+def test_cache_invalidation():
+    """Test that a version bump or a touched examples file rebuilds the cache."""
+    print("Testing introspection cache invalidation...")
+
+    calls = []
+
+    def builder():
+        calls.append(1)
+        return len(calls)
+
+    get_cached('invalidation_check', builder)
+
+    original_version = version_module.__version__
+    version_module.__version__ = original_version + '.test'
+    try:
+        simulate_new_process()
+        get_cached('invalidation_check', builder)
+    finally:
+        version_module.__version__ = original_version
+
+    if len(calls) != 2:
+        print("✗ Version change did not invalidate the cache")
+        return False
+
+    simulate_new_process()
+    get_cached('invalidation_check', builder)
+    examples_file = Path(introspection_cache.PACKAGE_DIR) / 'processors' / '_examples' / 'sort_data_examples.yaml'
+    stat = examples_file.stat()
+    try:
+        os.utime(examples_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        # The running process keeps its fingerprint; the next one sees the change
+        same_process_value = get_cached('invalidation_check', builder)
+        simulate_new_process()
+        value = get_cached('invalidation_check', builder)
+    finally:
+        os.utime(examples_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    if same_process_value != 3:
+        print("✗ Watched files were checked again within the same process")
+        return False
+
+    if value != len(calls) or len(calls) != 4:
+        print(f"✗ Touched examples file did not invalidate the cache ({len(calls)} builds)")
+        return False
+
+    print("✓ Version change and file change both rebuild the cache")
+    return True
+
+
+@with_temp_cache_dir
+def test_cached_introspection_results():
+    """Test that cached capabilities and examples match a fresh build and are faster."""
+    print("Testing cached capabilities and usage examples...")
+
+    start = time.perf_counter()
+    cold_capabilities = get_system_capabilities()
+    cold_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    warm_capabilities = get_system_capabilities()
+    warm_seconds = time.perf_counter() - start
+
+    if warm_capabilities != cold_capabilities:
+        print("✗ Cached capabilities differ from the built ones")
+        return False
+
+    if 'sort_data' not in warm_capabilities['processors']:
+        print("✗ sort_data missing from capabilities")
+        return False
+
+    examples = get_processor_usage_examples('sort_data')
+    if examples.get('status') != 'available' or get_processor_usage_examples('sort_data') != examples:
+        print(f"✗ Unexpected sort_data usage examples: {examples.get('error')}")
+        return False
+
+    if get_processor_usage_examples('no_such_processor') is not None:
+        print("✗ Unknown processor should return None")
+        return False
+
+    print(f"  Capabilities built in {cold_seconds:.3f}s, served from cache in {warm_seconds:.4f}s")
+
+    if warm_seconds >= cold_seconds:
+        print("✗ Cached capabilities were not faster")
+        return False
+
+    print("✓ Cached capabilities and usage examples match fresh results")
+    return True
+
+
+def main():
+    """Run all introspection cache tests."""
+    print("🧪 TESTING INTROSPECTION CACHE")
+    print("=" * 50)
+
+    tests = [
+        test_cache_reuse,
+        test_cache_invalidation,
+        test_cached_introspection_results,
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_func in tests:
+        print(f"\n📋 {test_func.__name__}")
+        try:
+            if test_func():
+                passed += 1
+            else:
+                print(f"❌ {test_func.__name__} failed")
+        except Exception as e:
+            print(f"❌ {test_func.__name__} crashed: {e}")
+
+    print(f"\n🏁 RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("✅ All tests passed!")
+    else:
+        print("❌ Some tests failed!")
+
+    return passed == total
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
+
+
+# End of file #
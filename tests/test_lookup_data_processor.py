@@ -326,6 +326,184 @@ def test_error_handling():
         StageManager.cleanup_stages()
 
 
+def test_indexed_lookup_preserves_main_data():
+    """Test that the indexed left/inner path attaches columns without rewriting main data."""
+    print("\nTesting indexed lookup fast path...")
+    
+    StageManager.initialize_stages()
+    
+    try:
+        main_data = create_messy_key_data()
+        main_data.index = [10, 20, 30, 40]
+        original_keys = main_data['Customer_ID'].tolist()
+        
+        lookup_data = create_clean_lookup()
+        lookup_data.loc[len(lookup_data)] = ['1002', 'Bobby', 'Closed']   # Duplicate key
+        StageManager.save_stage('clean_lookup', lookup_data, 'Clean lookup data')
+        
+        config = {
+            'processor_type': 'lookup_data',
+            'step_description': 'Test indexed lookup',
+            'lookup_stage': 'clean_lookup',
+            'match_col_in_lookup_data': 'Customer_ID',
+            'match_col_in_main_data': 'Customer_ID',
+            'lookup_columns': ['Name', 'Status'],
+            'handle_duplicates': 'last'
+        }
+        
+        result = LookupDataProcessor(config).execute(main_data)
+        
+        if result['Name'].tolist() != ['Alice', 'Bobby', 'Charlie', 'David']:
+            print(f"✗ Wrong lookup values: {result['Name'].tolist()}")
+            return False
+        
+        if result['Customer_ID'].tolist() != original_keys or main_data['Customer_ID'].tolist() != original_keys:
+            print("✗ Main key column was rewritten by the lookup")
+            return False
+        
+        if list(result.index) != [0, 1, 2, 3] or list(main_data.index) != [10, 20, 30, 40]:
+            print("✗ Result index should be a fresh RangeIndex, input index untouched")
+            return False
+        
+        # Inner join drops unmatched rows
+        inner_data = create_main_data()
+        StageManager.save_stage('customers', create_customer_lookup(), 'Customer lookup')
+        config.update({
+            'lookup_stage': 'customers',
+            'lookup_columns': ['Region'],
+            'join_type': 'inner',
+            'handle_duplicates': 'first'
+        })
+        inner_result = LookupDataProcessor(config).execute(inner_data)
+        
+        if inner_result['Region'].tolist() != ['West', 'East', 'Central']:
+            print(f"✗ Inner join wrong: {inner_result['Region'].tolist()}")
+            return False
+        
+        print("✓ Indexed lookup keeps main data intact for left and inner joins")
+        return True
+        
+    finally:
+        StageManager.cleanup_stages()
+
+
+def test_composite_key_lookup():
+    """Test lookups on a key made of several columns."""
+    print("\nTesting composite key lookup...")
+    
+    StageManager.initialize_stages()
+    
+    try:
+        main_data = pd.DataFrame({
+            'SKU': ['A1', 'A1', 'B2', 'B2'],
+            'Region': ['West', 'East', 'West', 'North'],
+            'Quantity': [5, 20, 60, 150]
+        })
+        pricing = pd.DataFrame({
+            'Product_Code': ['A1', 'A1', 'B2'],
+            'Sales_Region': ['West', 'East', 'West'],
+            'Regional_Price': [10.0, 11.0, 25.0]
+        })
+        StageManager.save_stage('pricing', pricing, 'Regional pricing')
+        
+        config = {
+            'processor_type': 'lookup_data',
+            'step_description': 'Test composite key',
+            'lookup_stage': 'pricing',
+            'match_col_in_lookup_data': ['Product_Code', 'Sales_Region'],
+            'match_col_in_main_data': ['SKU', 'Region'],
+            'lookup_columns': ['Regional_Price']
+        }
+        
+        result = LookupDataProcessor(config).execute(main_data)
+        prices = result['Regional_Price'].fillna(0).tolist()
+        
+        if prices != [10.0, 11.0, 25.0, 0]:
+            print(f"✗ Composite key lookup wrong: {prices}")
+            return False
+        
+        # Right joins go through the merge path with the same composite key
+        config['join_type'] = 'right'
+        merged = LookupDataProcessor(config).execute(main_data)
+        if sorted(merged['Regional_Price'].tolist()) != [10.0, 11.0, 25.0]:
+            print(f"✗ Composite key merge wrong: {merged['Regional_Price'].tolist()}")
+            return False
+        
+        print("✓ Composite key lookup working")
+        return True
+        
+    finally:
+        StageManager.cleanup_stages()
+
+
+def test_range_lookup():
+    """Test bracket and effective-date range lookups."""
+    print("\nTesting range lookup...")
+    
+    StageManager.initialize_stages()
+    
+    try:
+        main_data = pd.DataFrame({
+            'SKU': ['A1', 'A1', 'A1', 'B2'],
+            'Quantity': [5, 20, 150, 50],
+            'Order_Date': pd.to_datetime(['2024-01-15', '2024-07-01', '2023-05-01', '2025-02-01'])
+        })
+        tiers = pd.DataFrame({
+            'SKU': ['A1', 'A1', 'A1', 'B2'],
+            'Min_Qty': [0, 10, 100, 0],
+            'Max_Qty': [9, 99, None, 40],
+            'Discount': [0.0, 0.05, 0.15, 0.02]
+        })
+        rates = pd.DataFrame({
+            'Effective_Date': pd.to_datetime(['2024-01-01', '2024-06-01']),
+            'Tax_Rate': [0.07, 0.08]
+        })
+        StageManager.save_stage('tiers', tiers, 'Quantity brackets')
+        StageManager.save_stage('rates', rates, 'Tax rates by effective date')
+        
+        tier_config = {
+            'processor_type': 'lookup_data',
+            'step_description': 'Test quantity brackets',
+            'lookup_stage': 'tiers',
+            'match_col_in_lookup_data': 'SKU',
+            'match_col_in_main_data': 'SKU',
+            'lookup_columns': ['Discount'],
+            'range_col_in_main_data': 'Quantity',
+            'range_col_in_lookup_data': 'Min_Qty',
+            'range_end_col_in_lookup_data': 'Max_Qty'
+        }
+        
+        result = LookupDataProcessor(tier_config).execute(main_data)
+        discounts = result['Discount'].fillna(-1).tolist()
+        
+        # B2 quantity 50 is past the end of its only bracket
+        if discounts != [0.0, 0.05, 0.15, -1]:
+            print(f"✗ Bracket lookup wrong: {discounts}")
+            return False
+        
+        rate_config = {
+            'processor_type': 'lookup_data',
+            'step_description': 'Test effective dates',
+            'lookup_stage': 'rates',
+            'lookup_columns': ['Tax_Rate'],
+            'range_col_in_main_data': 'Order_Date',
+            'range_col_in_lookup_data': 'Effective_Date'
+        }
+        
+        result = LookupDataProcessor(rate_config).execute(main_data)
+        rates_found = result['Tax_Rate'].fillna(-1).tolist()
+        
+        if rates_found != [0.07, 0.08, -1, 0.08]:
+            print(f"✗ Effective-date lookup wrong: {rates_found}")
+            return False
+        
+        print("✓ Range lookups working")
+        return True
+        
+    finally:
+        StageManager.cleanup_stages()
+
+
 def main():
     """Run all tests."""
     print("🔍 Testing Clean Lookup Data Processor")
@@ -337,7 +515,10 @@ def main():
         test_column_naming,
         test_default_values,
         test_join_types,
-        test_error_handling
+        test_error_handling,
+        test_indexed_lookup_preserves_main_data,
+        test_composite_key_lookup,
+        test_range_lookup
     ]
     
     passed = 0
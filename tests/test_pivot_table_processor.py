@@ -5,6 +5,7 @@ Test the PivotTableProcessor functionality.
 import pandas as pd
 
 from excel_recipe_processor.core.base_processor import StepProcessorError
+from excel_recipe_processor.core.file_writer import FileWriter
 from excel_recipe_processor.processors.pivot_table_processor import PivotTableProcessor
 
 
@@ -350,6 +351,110 @@ def test_pivot_info():
         return False
 
 
+def test_observed_categories():
+    """Test that unused categories are left out of the pivot by default."""
+    
+    print("\nTesting observed-only categorical pivot...")
+    
+    test_df = create_van_report_test_data()
+    test_df['Carrier'] = pd.Categorical(
+        test_df['Carrier'], categories=['Carrier_A', 'Carrier_B', 'Carrier_C', 'Carrier_Z']
+    )
+    
+    step_config = {
+        'processor_type': 'pivot_table',
+        'index': ['Product_Origin'],
+        'columns': ['Carrier'],
+        'values': ['Quantity'],
+        'aggfunc': 'sum'
+    }
+    
+    result = PivotTableProcessor(step_config).execute(test_df)
+    if any('Carrier_Z' in str(col) for col in result.columns):
+        print(f"✗ Unused category included: {list(result.columns)}")
+        return False
+    
+    expected = PivotTableProcessor(dict(step_config, observed=False)).execute(
+        test_df.assign(Carrier=test_df['Carrier'].astype(str))
+    )
+    if result['Quantity_Carrier_A'].tolist() != expected['Quantity_Carrier_A'].tolist():
+        print("✗ Categorical pivot values differ from the text pivot")
+        return False
+    
+    print("✓ Observed-only categorical pivot worked correctly")
+    return True
+
+
+def test_sparse_and_long_output():
+    """Test sparse and long pivot output and the output size limit."""
+    
+    print("\nTesting sparse and long pivot output...")
+    
+    test_df = create_van_report_test_data()
+    
+    step_config = {
+        'processor_type': 'pivot_table',
+        'index': ['Product_Origin'],
+        'columns': ['Carrier'],
+        'values': ['Quantity'],
+        'aggfunc': 'sum'
+    }
+    
+    wide = PivotTableProcessor(step_config).execute(test_df)
+    sparse = PivotTableProcessor(dict(step_config, output_format='sparse')).execute(test_df)
+    
+    if list(sparse.columns) != list(wide.columns):
+        print(f"✗ Sparse columns differ: {list(sparse.columns)}")
+        return False
+    
+    if not isinstance(sparse['Quantity_Carrier_A'].dtype, pd.SparseDtype):
+        print(f"✗ Expected sparse value columns, got {sparse['Quantity_Carrier_A'].dtype}")
+        return False
+    
+    # Sparse columns hold only the cells that have data
+    present_cells = test_df.drop_duplicates(['Product_Origin', 'Carrier'])['Carrier'].eq('Carrier_A').sum()
+    assert sparse['Quantity_Carrier_A'].sparse.npoints == present_cells, \
+        f"Expected {present_cells} stored cells, got {sparse['Quantity_Carrier_A'].sparse.npoints}"
+    
+    densified = FileWriter._densify_sparse_columns(sparse)
+    if not densified.equals(wide):
+        print("✗ Densified sparse pivot differs from the wide pivot")
+        return False
+    
+    # Several value fields and a single named column level match the wide layout too
+    for layout in [{'values': ['Value', 'Quantity']}, {'values': 'Quantity', 'columns': 'Carrier'}]:
+        layout_config = dict(step_config, **layout)
+        layout_wide = PivotTableProcessor(layout_config).execute(test_df)
+        layout_sparse = PivotTableProcessor(dict(layout_config, output_format='sparse')).execute(test_df)
+        assert list(layout_sparse.columns) == list(layout_wide.columns), \
+            f"Sparse column order {list(layout_sparse.columns)} differs from {list(layout_wide.columns)}"
+        assert layout_sparse.columns.name == layout_wide.columns.name, \
+            f"Sparse columns name {layout_sparse.columns.name!r} differs from {layout_wide.columns.name!r}"
+        assert FileWriter._densify_sparse_columns(layout_sparse).equals(layout_wide), \
+            f"Densified sparse pivot differs from the wide pivot for {layout}"
+    
+    long_result = PivotTableProcessor(dict(step_config, output_format='long')).execute(test_df)
+    expected_pairs = len(test_df.drop_duplicates(['Product_Origin', 'Carrier']))
+    if len(long_result) != expected_pairs or list(long_result.columns) != ['Product_Origin', 'Carrier', 'Quantity']:
+        print(f"✗ Long pivot has unexpected shape: {long_result.shape}")
+        return False
+    
+    try:
+        PivotTableProcessor(dict(step_config, max_output_cells=5)).execute(test_df)
+        print("✗ Oversized pivot should have been refused")
+        return False
+    except StepProcessorError as e:
+        print(f"✓ Refused oversized pivot: {e}")
+    
+    fallback = PivotTableProcessor(dict(step_config, max_output_cells=5, oversize_action='long')).execute(test_df)
+    if not fallback.equals(long_result):
+        print("✗ Oversize fallback did not produce the long result")
+        return False
+    
+    print("✓ Sparse and long pivot output worked correctly")
+    return True
+
+
 if __name__ == '__main__':
     success = True
     
@@ -361,6 +466,8 @@ if __name__ == '__main__':
     success &= test_fill_blanks_option()
     success &= test_cross_tabulation()
     success &= test_pivot_info()
+    success &= test_observed_categories()
+    success &= test_sparse_and_long_output()
     test_error_handling()
     
     if success:
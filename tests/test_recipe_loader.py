@@ -0,0 +1,188 @@
+"""
+Test recipe file loading and the compiled recipe cache.
+
+tests/test_recipe_loader.py
+
+Recipes are parsed with the libyaml loader when available and must keep their
+section order. With the compiled cache enabled, a validated copy is stored in
+the per-user cache directory and reused until the recipe content or package
+version changes.
+"""
+
+import os
+import sys
+import tempfile
+
+from pathlib import Path
+from collections import OrderedDict
+
+# Add project root to Python path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import excel_recipe_processor.config.recipe_loader as recipe_loader_module
+
+from excel_recipe_processor.config.recipe_loader import RecipeLoader, RecipeValidationError
+from excel_recipe_processor.utils.introspection_cache import CACHE_DIR_ENV_VAR
+
+
+RECIPE_TEXT = """
+recipe:
+  - processor_type: import_file
+    step_description: Import sales
+    input_file: "sales_{date}.xlsx"
+    save_to_stage: raw_sales
+  - processor_type: sort_data
+    step_description: Sort sales
+    source_stage: raw_sales
+    save_to_stage: sorted_sales
+    columns: [Region, Amount]
+
+settings:
+  description: Loader cache test recipe
+"""
+
+
+def write_recipe(directory: str, text: str = RECIPE_TEXT) -> Path:
+    """Write a recipe file into the directory."""
+    recipe_path = Path(directory) / 'loader_test.yaml'
+    recipe_path.write_text(text, encoding='utf-8')
+    return recipe_path
+
+
+def with_temp_cache_dir(test_func):
+    """Run a test against an empty cache directory."""
+    def wrapper():
+        previous = os.environ.get(CACHE_DIR_ENV_VAR)
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.environ[CACHE_DIR_ENV_VAR] = cache_dir
+            try:
+                return test_func()
+            finally:
+                if previous is None:
+                    os.environ.pop(CACHE_DIR_ENV_VAR, None)
+                else:
+                    os.environ[CACHE_DIR_ENV_VAR] = previous
+    wrapper.__name__ = test_func.__name__
+    wrapper.__doc__ = test_func.__doc__
+    return wrapper
+
+
+@with_temp_cache_dir
+def test_yaml_loading_preserves_order():
+    """Test that recipes keep section order and reject invalid structure."""
+    print("Testing YAML recipe loading...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        loader = RecipeLoader(use_compiled_cache=False)
+        recipe_data = loader.load_recipe_file(write_recipe(temp_dir))
+
+        if not isinstance(recipe_data, OrderedDict) or list(recipe_data.keys()) != ['recipe', 'settings']:
+            print(f"✗ Section order lost: {type(recipe_data).__name__} {list(recipe_data.keys())}")
+            return False
+
+        if recipe_data['recipe'][1]['columns'] != ['Region', 'Amount']:
+            print(f"✗ Wrong step data: {recipe_data['recipe'][1]}")
+            return False
+
+        if loader.get_compiled_cache_path().exists():
+            print("✗ Compiled copy written with the cache disabled")
+            return False
+
+        try:
+            loader.load_recipe_file(write_recipe(temp_dir, "settings:\n  description: No steps\n"))
+            print("✗ Recipe without steps was accepted")
+            return False
+        except RecipeValidationError:
+            pass
+
+    print(f"✓ Recipe loaded with {recipe_loader_module.BaseYAMLLoader.__name__}, section order kept")
+    return True
+
+
+@with_temp_cache_dir
+def test_compiled_recipe_cache():
+    """Test that the compiled copy is reused and rebuilt when the recipe changes."""
+    print("Testing compiled recipe cache...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        recipe_path = write_recipe(temp_dir)
+
+        first = RecipeLoader(use_compiled_cache=True).load_recipe_file(recipe_path)
+        cache_path = RecipeLoader().get_compiled_cache_path(recipe_path)
+
+        if not cache_path.exists():
+            print(f"✗ Compiled copy not written to {cache_path}")
+            return False
+
+        if cache_path.parent.parent != Path(os.environ[CACHE_DIR_ENV_VAR]) or list(Path(temp_dir).iterdir()) != [recipe_path]:
+            print(f"✗ Compiled copy stored outside the cache directory: {cache_path}")
+            return False
+
+        # A cache hit must not parse the YAML again
+        original_load = recipe_loader_module.yaml.load
+
+        def fail_load(*args, **kwargs):
+            raise AssertionError("recipe was parsed despite a valid compiled copy")
+
+        recipe_loader_module.yaml.load = fail_load
+        try:
+            loader = RecipeLoader(use_compiled_cache=True)
+            second = loader.load_recipe_file(recipe_path)
+        finally:
+            recipe_loader_module.yaml.load = original_load
+
+        if second != first or loader._original_section_order != ['recipe', 'settings']:
+            print("✗ Compiled copy differs from the parsed recipe")
+            return False
+
+        # Changing the recipe invalidates the compiled copy
+        write_recipe(temp_dir, RECIPE_TEXT.replace('Region, Amount', 'Amount'))
+        third = RecipeLoader(use_compiled_cache=True).load_recipe_file(recipe_path)
+
+        if third['recipe'][1]['columns'] != ['Amount']:
+            print(f"✗ Stale compiled copy used: {third['recipe'][1]['columns']}")
+            return False
+
+    print("✓ Compiled copy reused and rebuilt after the recipe changed")
+    return True
+
+
+def main():
+    """Run all recipe loader tests."""
+    print("🧪 TESTING RECIPE LOADER")
+    print("=" * 50)
+
+    tests = [
+        test_yaml_loading_preserves_order,
+        test_compiled_recipe_cache,
+    ]
+
+    passed = 0
+    total = len(tests)
+
+    for test_func in tests:
+        print(f"\n📋 {test_func.__name__}")
+        try:
+            if test_func():
+                passed += 1
+            else:
+                print(f"❌ {test_func.__name__} failed")
+        except Exception as e:
+            print(f"❌ {test_func.__name__} crashed: {e}")
+
+    print(f"\n🏁 RESULTS: {passed}/{total} tests passed")
+
+    if passed == total:
+        print("✅ All tests passed!")
+    else:
+        print("❌ Some tests failed!")
+
+    return passed == total
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
+
+
+# End of file #
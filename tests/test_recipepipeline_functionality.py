@@ -267,6 +267,131 @@ recipe:
         return False
 
 
+def test_batched_workbook_operations():
+    """Test that batched file operations produce the same workbook as separate steps."""
+    print("Testing batched workbook operations...")
+    
+    import openpyxl
+    
+    from excel_recipe_processor.core.stage_manager import StageManager
+    
+    try:
+        test_data = pd.DataFrame({
+            'Product': ['Widget A', 'Widget B', 'Widget C'],
+            'Price': [10.0, 20.0, 15.0],
+            'Quantity': [5, 3, 8]
+        })
+        
+        def run_recipe(temp_path, batch):
+            input_file = temp_path / 'input.xlsx'
+            donor_file = temp_path / 'donor.xlsx'
+            test_data.to_excel(input_file, index=False)
+            
+            donor = openpyxl.Workbook()
+            donor.active.title = 'Data'
+            donor.active['E1'] = 'Discount'
+            for row in range(2, 5):
+                donor.active[f'E{row}'] = f'=D{row}*0.1'
+            donor.save(donor_file)
+            
+            recipe_content = f"""
+settings:
+  description: "Batched workbook operations test"
+  batch_workbook_operations: {str(batch).lower()}
+  stages:
+    - stage_name: "raw_data"
+      description: "Raw imported test data"
+      protected: false
+
+recipe:
+  - step_description: "Import test data"
+    processor_type: "import_file"
+    input_file: "{input_file}"
+    save_to_stage: "raw_data"
+    
+  - step_description: "Export results"
+    processor_type: "export_file"
+    source_stage: "raw_data"
+    output_file: "{temp_path}/report.xlsx"
+    sheet_name: "Data"
+    
+  - step_description: "Format header"
+    processor_type: "format_excel"
+    target_file: "{temp_path}/report.xlsx"
+    formatting:
+      - sheet: "Data"
+        header_bold: true
+        header_background: true
+        
+  - step_description: "Add totals"
+    processor_type: "inject_formulas"
+    target_file: "{temp_path}/report.xlsx"
+    mode: "live"
+    formulas:
+      - range: "D2:D4"
+        formula: "=B2*C2"
+      - cell: "D5"
+        formula: "=SUM(D2:D4)"
+        
+  - step_description: "Seed discount formulas"
+    processor_type: "seed_donor_formulas"
+    source_file: "{donor_file}"
+    source_sheet: "Data"
+    target_file: "{temp_path}/report.xlsx"
+    target_sheet: "Data"
+    columns: ["E"]
+    start_row: 1
+    row_count: 4
+    
+  - step_description: "Fit columns"
+    processor_type: "format_excel"
+    target_file: "{temp_path}/report.xlsx"
+    formatting:
+      - sheet: "Data"
+        auto_fit_columns: true
+"""
+            recipe_file = temp_path / 'recipe.yaml'
+            with open(recipe_file, 'w') as f:
+                f.write(recipe_content)
+            
+            completion_report = RecipePipeline().run_complete_recipe(recipe_file)
+            StageManager.cleanup_stages()
+            if not completion_report.get('execution_successful', False):
+                return None
+            
+            workbook = openpyxl.load_workbook(temp_path / 'report.xlsx')
+            worksheet = workbook['Data']
+            contents = {
+                'dimensions': worksheet.dimensions,
+                'cells': [(cell.coordinate, cell.value, cell.font.b, cell.fill.fgColor.rgb)
+                          for row in worksheet.iter_rows() for cell in row],
+                'widths': {key: dim.width for key, dim in worksheet.column_dimensions.items()}
+            }
+            workbook.close()
+            return contents
+        
+        with tempfile.TemporaryDirectory() as batched_dir, tempfile.TemporaryDirectory() as sequential_dir:
+            batched = run_recipe(Path(batched_dir), True)
+            sequential = run_recipe(Path(sequential_dir), False)
+        
+        if batched is None or sequential is None:
+            print("✗ Recipe execution failed")
+            return False
+        
+        if batched != sequential:
+            print("✗ Batched workbook differs from sequential run")
+            print(f"  Batched: {batched}")
+            print(f"  Sequential: {sequential}")
+            return False
+        
+        print(f"✓ Batched run matches sequential run ({batched['dimensions']})")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Test failed: {e}")
+        return False
+
+
 def main():
     """Run all tests."""
     print("RecipePipeline Test Suite")
@@ -276,6 +401,7 @@ def main():
         test_basic_recipe_execution,
         test_variable_substitution,
         test_multiple_imports_exports,
+        test_batched_workbook_operations,
     ]
     
     passed = 0
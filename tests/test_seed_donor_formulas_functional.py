@@ -522,6 +522,61 @@ def test_collision_detection():
             return False
 
 
+def test_sparse_columns_and_short_donor():
+    """Test non-adjacent columns and donor rows that run past the source data."""
+    print("\nTesting sparse columns and short donor rows...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Source has 4 data rows; asking for 6 rows reaches past the end
+        source_file = str(Path(temp_dir) / "source_sparse.xlsx")
+        create_source_excel_file(source_file)
+        
+        target_file = str(Path(temp_dir) / "target_sparse.xlsx")
+        create_target_excel_file(target_file)
+        
+        step_config = {
+            'processor_type': 'seed_donor_formulas',
+            'step_description': 'Test sparse columns',
+            'source_file': source_file,
+            'source_sheet': 'Budget',
+            'target_file': target_file,
+            'target_sheet': 'Budget',
+            'columns': ['Grand_Total', 'D'],
+            'start_row': 2,
+            'row_count': 6
+        }
+        
+        try:
+            processor = SeedDonorFormulasProcessor(step_config)
+            result = processor.perform_file_operation()
+            print(f"✓ Sparse seeding completed: {result}")
+            
+            expected_formulas = {
+                'F2': '=D2+E2',
+                'F5': '=D5+E5',
+                'D2': '=B2*C2',
+                'D5': '=B5*C5'
+            }
+            
+            if not verify_formulas_transplanted(target_file, expected_formulas):
+                return False
+            
+            workbook = openpyxl.load_workbook(target_file)
+            worksheet = workbook.active
+            untouched = [worksheet['E2'].value, worksheet['D6'].value, worksheet['F7'].value]
+            workbook.close()
+            
+            if untouched != [None, None, None]:
+                print(f"✗ Cells outside the seeded columns or donor rows changed: {untouched}")
+                return False
+            
+            return "transplanted 8 formulas" in result
+            
+        except Exception as e:
+            print(f"✗ Sparse seeding failed: {e}")
+            return False
+
+
 def main():
     """Run all functional tests."""
     
@@ -533,6 +588,7 @@ def main():
         test_basic_formula_transplant,
         test_column_name_matching,
         test_collision_detection,
+        test_sparse_columns_and_short_donor,
         test_create_verification_file
     ]
     
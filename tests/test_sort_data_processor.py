@@ -477,6 +477,61 @@ def test_real_world_scenario():
         return False
 
 
+def test_top_n_limit():
+    """Test keeping only the top rows of a sort."""
+    
+    print("\nTesting top-N limit...")
+    
+    test_df = pd.DataFrame({
+        'Region': ['West', 'East', 'West', None, 'North', 'East', 'West', 'North'],
+        'Sales': [500, 900, 900, 700, None, 300, 100, 900],
+        'Rep': ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
+    })
+    
+    base_config = {
+        'processor_type': 'sort_data',
+        'columns': ['Sales', 'Rep'],
+        'sort_type': 'descending'
+    }
+    
+    full_result = SortDataProcessor(base_config).execute(test_df)
+    
+    for limit in [1, 3, 5, 20]:
+        limited = SortDataProcessor(dict(base_config, limit=limit)).execute(test_df)
+        if not limited.equals(full_result.head(limit)):
+            print(f"✗ limit {limit} differs from head of full sort: {limited['Rep'].tolist()}")
+            return False
+    
+    # Ties on the first key are still ordered by the second key
+    top_three = SortDataProcessor(dict(base_config, limit=3)).execute(test_df)
+    if top_three['Rep'].tolist() != ['H', 'C', 'B']:
+        print(f"✗ Unexpected top three: {top_three['Rep'].tolist()}")
+        return False
+    
+    custom_config = {
+        'processor_type': 'sort_data',
+        'columns': ['Region', 'Rep'],
+        'sort_type': 'custom',
+        'custom_orders': {'Region': ['North', 'West', 'East']},
+        'na_position': 'first',
+        'limit': 2
+    }
+    custom_result = SortDataProcessor(custom_config).execute(test_df)
+    if custom_result['Rep'].tolist() != ['D', 'E']:
+        print(f"✗ Unexpected custom top two: {custom_result['Rep'].tolist()}")
+        return False
+    
+    try:
+        SortDataProcessor(dict(base_config, limit=0)).execute(test_df)
+        print("✗ Should have rejected limit 0")
+        return False
+    except StepProcessorError as e:
+        print(f"✓ Caught expected error: {e}")
+    
+    print("✓ Top-N limit worked correctly")
+    return True
+
+
 if __name__ == '__main__':
     success = True
     
@@ -490,6 +545,7 @@ if __name__ == '__main__':
     success &= test_sort_analysis()
     success &= test_capabilities_method()
     success &= test_real_world_scenario()
+    success &= test_top_n_limit()
     test_error_handling()
     
     if success:
@@ -680,6 +680,76 @@ def test_real_world_scenario():
         return False
 
 
+def test_regex_extract_and_vectorized_splits():
+    """Test regex extract mode and the vectorized delimiter/fixed-width paths."""
+    
+    print("\nTesting regex extract and vectorized splits...")
+    
+    test_df = pd.DataFrame({
+        'Address': [
+            '123 Main St, Anchorage, AK 99501',
+            '9 Harbor Rd, Kodiak, AK 99615',
+            'General Delivery',
+            None
+        ]
+    })
+    
+    step_config = {
+        'processor_type': 'split_column',
+        'source_column': 'Address',
+        'split_type': 'regex',
+        'regex_mode': 'extract',
+        'pattern': r'^(?P<Street>[^,]+),\s*(?P<City>[^,]+),\s*(?P<State>[A-Z]{2})\s+(?P<Zip>\d{5})$',
+        'fill_missing': 'UNPARSED'
+    }
+    
+    result = SplitColumnProcessor(step_config).execute(test_df)
+    
+    if list(result.columns) != ['Address', 'Street', 'City', 'State', 'Zip']:
+        print(f"✗ Unexpected extract columns: {list(result.columns)}")
+        return False
+    
+    if result['City'].tolist() != ['Anchorage', 'Kodiak', 'UNPARSED', 'UNPARSED']:
+        print(f"✗ Unexpected cities: {result['City'].tolist()}")
+        return False
+    
+    try:
+        SplitColumnProcessor(dict(step_config, pattern=r'\d+')).execute(test_df)
+        print("✗ Extract without groups should fail")
+        return False
+    except StepProcessorError as e:
+        print(f"✓ Caught expected error: {e}")
+    
+    delimiter_config = {
+        'processor_type': 'split_column',
+        'source_column': 'Address',
+        'split_type': 'delimiter',
+        'delimiter': ', ',
+        'max_splits': 1,
+        'fill_missing': '-'
+    }
+    split_result = SplitColumnProcessor(delimiter_config).execute(test_df)
+    expected_rest = ['Anchorage, AK 99501', 'Kodiak, AK 99615', '-', '-']
+    if split_result['Address_part_2'].tolist() != expected_rest:
+        print(f"✗ Unexpected delimiter split: {split_result['Address_part_2'].tolist()}")
+        return False
+    
+    fixed_config = {
+        'processor_type': 'split_column',
+        'source_column': 'Address',
+        'split_type': 'fixed_width',
+        'widths': [4, 7],
+        'new_column_names': ['Number', 'Street']
+    }
+    fixed_result = SplitColumnProcessor(fixed_config).execute(test_df)
+    if fixed_result['Number'].tolist() != ['123', '9 Ha', 'Gene', ''] or fixed_result['Street'].iloc[0] != 'Main St':
+        print(f"✗ Unexpected fixed-width split: {fixed_result[['Number', 'Street']].values.tolist()}")
+        return False
+    
+    print("✓ Regex extract and vectorized splits worked correctly")
+    return True
+
+
 if __name__ == '__main__':
     success = True
     
@@ -695,6 +765,7 @@ if __name__ == '__main__':
     success &= test_auto_column_naming()
     success &= test_capabilities_method()
     success &= test_real_world_scenario()
+    success &= test_regex_extract_and_vectorized_splits()
     test_error_handling()
     
     if success:
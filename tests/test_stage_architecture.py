@@ -35,6 +35,49 @@ def test_new_stage_methods():
     finally:
         StageManager.cleanup_stages()
 
+def test_stage_key_index():
+    """Test that stage key indexes are shared and rebuilt when a stage is saved."""
+    
+    import pandas as pd
+    
+    StageManager.initialize_stages()
+    
+    try:
+        StageManager.save_stage('customers', pd.DataFrame({
+            'Customer': ['ACME', 'Beta', 'acme', None],
+            'Region': ['West', 'East', 'North', 'South']
+        }))
+        
+        exact_index = StageManager.get_key_index('customers', 'Customer')
+        if list(exact_index.index) != ['ACME', 'Beta', 'acme'] or list(exact_index) != [0, 1, 2]:
+            print(f"✗ Exact key index wrong: {exact_index.to_dict()}")
+            return False
+        
+        if StageManager.get_key_index('customers', 'Customer') is not exact_index:
+            print("✗ Key index was rebuilt instead of reused")
+            return False
+        print("✓ Key index built once and reused")
+        
+        region_map = StageManager.get_key_value_map('customers', 'Customer', 'Region', key_mode='lower', keep='last')
+        if region_map.to_dict() != {'acme': 'North', 'beta': 'East'}:
+            print(f"✗ Case-insensitive key map wrong: {region_map.to_dict()}")
+            return False
+        print("✓ Case-insensitive key map keeps last duplicate")
+        
+        StageManager.save_stage('customers', pd.DataFrame({
+            'Customer': ['Gamma'], 'Region': ['West']
+        }), overwrite=True)
+        
+        if list(StageManager.get_key_index('customers', 'Customer').index) != ['Gamma']:
+            print("✗ Key index not invalidated when stage was saved")
+            return False
+        print("✓ Key index invalidated on save")
+        
+        return True
+        
+    finally:
+        StageManager.cleanup_stages()
+
 def test_recipe_pipeline():
     """Test new RecipePipeline class."""
     
@@ -60,6 +103,7 @@ if __name__ == '__main__':
     
     tests = [
         test_new_stage_methods,
+        test_stage_key_index,
         test_recipe_pipeline
     ]
     
@@ -0,0 +1,177 @@
+"""
+Startup time benchmark for the excel_recipe_processor package.
+
+tests/test_startup_time.py
+
+Importing the package should register every processor type without importing
+the processor modules or their heavy optional dependencies (scikit-learn,
+openpyxl). Each check runs in a fresh interpreter so earlier imports in the
+test session do not hide the cost.
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+from pathlib import Path
+
+# Add project root to Python path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ['sklearn', 'scipy', 'openpyxl']
+
+STARTUP_SCRIPT = """
+import sys, time, json
+start = time.perf_counter()
+import excel_recipe_processor
+from excel_recipe_processor.core.base_processor import registry
+import_seconds = time.perf_counter() - start
+
+loaded_heavy = [name for name in {heavy!r} if name in sys.modules]
+loaded_processors = [name for name in sys.modules if name.startswith('excel_recipe_processor.processors.')
+                     and not name.startswith('excel_recipe_processor.processors._')]
+step_types = registry.get_registered_types()
+
+start = time.perf_counter()
+if {load_all!r}:
+    for step_type in step_types:
+        registry.get_processor_class(step_type)
+load_seconds = time.perf_counter() - start
+
+print(json.dumps({{
+    'import_seconds': import_seconds,
+    'load_seconds': load_seconds,
+    'loaded_heavy': loaded_heavy,
+    'loaded_processors': loaded_processors,
+    'step_types': step_types,
+}}))
+"""
+
+
+def run_startup_probe(load_all: bool = False) -> dict:
+    """Import the package in a fresh interpreter and report what it loaded."""
+    script = STARTUP_SCRIPT.format(heavy=HEAVY_MODULES, load_all=load_all)
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        capture_output=True, text=True, cwd=str(PROJECT_ROOT), env=env, timeout=300
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup probe failed: {result.stderr.strip()}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_import_skips_processor_modules():
+    """Test that importing the package registers processors without importing them."""
+    print("Testing lazy processor registration at import...")
+    
+    probe = run_startup_probe()
+    
+    if probe['loaded_processors']:
+        print(f"✗ Processor modules imported at startup: {probe['loaded_processors']}")
+        return False
+    
+    if probe['loaded_heavy']:
+        print(f"✗ Heavy dependencies imported at startup: {probe['loaded_heavy']}")
+        return False
+    
+    expected_types = ['filter_terms_detector', 'format_excel', 'import_file', 'sort_data']
+    missing = [step_type for step_type in expected_types if step_type not in probe['step_types']]
+    if missing:
+        print(f"✗ Step types not registered: {missing}")
+        return False
+    
+    print(f"✓ {len(probe['step_types'])} processor types registered in {probe['import_seconds']:.2f}s "
+          f"with no processor modules loaded")
+    return True
+
+
+def test_processor_loads_on_first_use():
+    """Test that a lazily registered processor resolves to its class on first use."""
+    print("Testing processor loading on first use...")
+    
+    from excel_recipe_processor.core.base_processor import registry
+    
+    processor_class = registry.get_processor_class('sort_data')
+    step_config = processor_class.get_minimal_config()
+    step_config['processor_type'] = 'sort_data'
+    step_config['step_description'] = 'Lazy load check'
+    processor = registry.create_processor(step_config)
+    
+    if processor.__class__.__name__ != 'SortDataProcessor':
+        print(f"✗ Wrong processor class: {processor.__class__.__name__}")
+        return False
+    
+    if not registry.is_registered('sort_data') or registry.is_registered('no_such_step'):
+        print("✗ is_registered() gave the wrong answer")
+        return False
+    
+    print("✓ sort_data processor loaded on first use")
+    return True
+
+
+def test_startup_benchmark():
+    """Benchmark package import against importing every processor."""
+    print("Benchmarking startup time...")
+    
+    lazy_runs = [run_startup_probe() for _ in range(3)]
+    eager_runs = [run_startup_probe(load_all=True) for _ in range(3)]
+    
+    lazy_seconds = min(run['import_seconds'] for run in lazy_runs)
+    eager_seconds = min(run['import_seconds'] + run['load_seconds'] for run in eager_runs)
+    
+    print(f"  Package import:               {lazy_seconds:.3f}s")
+    print(f"  Import plus every processor:  {eager_seconds:.3f}s")
+    
+    if lazy_seconds >= eager_seconds:
+        print("✗ Lazy startup is not faster than loading every processor")
+        return False
+    
+    print(f"✓ Startup avoids {eager_seconds - lazy_seconds:.3f}s of processor imports")
+    return True
+
+
+def main():
+    """Run all startup tests."""
+    print("🧪 TESTING PACKAGE STARTUP")
+    print("=" * 50)
+    
+    tests = [
+        test_import_skips_processor_modules,
+        test_processor_loads_on_first_use,
+        test_startup_benchmark,
+    ]
+    
+    passed = 0
+    total = len(tests)
+    
+    for test_func in tests:
+        print(f"\n📋 {test_func.__name__}")
+        try:
+            if test_func():
+                passed += 1
+            else:
+                print(f"❌ {test_func.__name__} failed")
+        except Exception as e:
+            print(f"❌ {test_func.__name__} crashed: {e}")
+    
+    print(f"\n🏁 RESULTS: {passed}/{total} tests passed")
+    
+    if passed == total:
+        print("✅ All tests passed!")
+    else:
+        print("❌ Some tests failed!")
+    
+    return passed == total
+
+
+if __name__ == '__main__':
+    success = main()
+    sys.exit(0 if success else 1)
+
+
+# End of file #